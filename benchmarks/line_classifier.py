@@ -0,0 +1,99 @@
+"""
+Micro-benchmark of per-line classification in the text parsers.
+
+Compares the separate checks the parsers used to run on every line
+(bank keyword/IBAN/SWIFT searches, summary regex, HS code, number and
+date parsing) with one ``classify_line`` scan, cold and with the
+per-line cache warm (parsers check the same lines several times).
+
+Usage:
+    python -m benchmarks.line_classifier [--corpus DIR] [--repeat N]
+"""
+
+import argparse
+import re
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src.infrastructure.parsers.base import (
+    BANK_PATTERN,
+    IBAN_PATTERN,
+    SUMMARY_REGEX,
+    SWIFT_PATTERN,
+    classify_line,
+    parse_date,
+    parse_number,
+)
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+
+_NUMBER = re.compile(r"[\d,]+(?:\.\d+)?")
+
+
+def load_lines(corpus_dir: Path) -> list[str]:
+    """All lines of the corpus's .txt files."""
+    lines: list[str] = []
+    for path in sorted(corpus_dir.glob("*.txt")):
+        lines.extend(path.read_text(encoding="utf-8").splitlines())
+    return lines
+
+
+def separate_checks(line: str) -> None:
+    """The per-line work before the classifier, one regex pass per question."""
+    lower = line.strip().lower()
+    _ = BANK_PATTERN.search(lower) or IBAN_PATTERN.search(line) or SWIFT_PATTERN.search(line)
+    _ = SUMMARY_REGEX.match(line.strip())
+    _ = re.search(r"\b(\d{6,10})\b", line.replace(".", ""))
+    for value in _NUMBER.findall(line):
+        parse_number(value)
+    parse_date(line)
+
+
+def single_scan(line: str) -> None:
+    info = classify_line(line)
+    _ = (info.is_bank, info.is_summary, info.hs_code, info.numbers, info.date)
+
+
+def _time(fn: Callable[[str], None], lines: list[str], repeat: int, clear: bool) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if clear:
+            classify_line.cache_clear()
+        start = time.perf_counter()
+        for line in lines:
+            fn(line)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--passes", type=int, default=3, help="times parsers revisit each line")
+    args = parser.parse_args()
+
+    lines = load_lines(args.corpus)
+    if not lines:
+        raise SystemExit(f"No .txt files in {args.corpus}")
+    revisited = lines * args.passes
+
+    results = {
+        "separate checks": _time(separate_checks, revisited, args.repeat, clear=False),
+        "classify_line (cold)": _time(single_scan, lines, args.repeat, clear=True),
+        "classify_line (cached)": _time(single_scan, revisited, args.repeat, clear=True),
+    }
+
+    print(f"{len(lines)} lines, each visited {args.passes}x, best of {args.repeat}")
+    baseline = results["separate checks"]
+    for name, seconds in results.items():
+        per_line = seconds / (len(revisited) if name != "classify_line (cold)" else len(lines))
+        print(
+            f"  {name:<24} {seconds * 1000:8.2f} ms  {per_line * 1e6:6.2f} us/line"
+            f"  x{baseline / seconds:5.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
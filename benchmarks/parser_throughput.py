@@ -0,0 +1,388 @@
+"""
+Throughput and accuracy benchmark of the parser chain.
+
+Runs a ParserRegistry (template, table-aware, vision) over the invoice
+texts in the corpus directory plus generated synthetic invoices and
+reports per-parser docs/sec and latency, the early-stop and
+vision-fallback rates, and field-level accuracy against golden JSON
+(``<name>.json`` next to ``<name>.txt``; documents without one are timed
+but not scored).
+
+The vision model is stubbed so the benchmark runs headless: it answers
+after ``--vision-latency`` seconds with an empty extraction. Vision
+results are therefore never correct; the fallback rate is what counts.
+
+Usage:
+    python -m benchmarks.parser_throughput [--corpus DIR] [--synthetic N]
+        [--workers N] [--vision-latency S] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.core.entities import RowType
+from src.core.interfaces import HealthStatus, IVisionProvider, ParserResult, VisionResponse
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+
+HEADER_FIELDS = ("invoice_no", "invoice_date", "currency", "total_amount")
+ITEM_FIELDS = ("hs_code", "quantity", "unit", "unit_price", "total_price")
+
+
+class StubVisionProvider(IVisionProvider):
+    """Vision model stand-in returning an empty extraction after a delay."""
+
+    def __init__(self, latency: float = 0.0):
+        self._latency = latency
+        self.calls = 0
+
+    async def analyze_image(
+        self, image_path: str, prompt: str, max_tokens: int = 2048
+    ) -> VisionResponse:
+        self.calls += 1
+        await asyncio.sleep(self._latency)
+        return VisionResponse(text='{"items": []}', model="stub")
+
+    async def analyze_image_base64(
+        self, image_data: str, prompt: str, max_tokens: int = 2048
+    ) -> VisionResponse:
+        return await self.analyze_image("", prompt, max_tokens)
+
+    async def check_health(self) -> HealthStatus:
+        return HealthStatus(available=True, provider="stub", model="stub")
+
+
+@dataclass
+class Document:
+    """One benchmark input and its expected fields (None: not scored)."""
+
+    name: str
+    text: str
+    path: str
+    golden: dict[str, Any] | None = None
+
+
+def load_corpus(corpus_dir: Path) -> list[Document]:
+    """The corpus's .txt files with their golden .json files."""
+    documents = []
+    for path in sorted(corpus_dir.glob("*.txt")):
+        golden_path = path.with_suffix(".json")
+        golden = (
+            json.loads(golden_path.read_text(encoding="utf-8")) if golden_path.exists() else None
+        )
+        documents.append(Document(path.stem, path.read_text(encoding="utf-8"), str(path), golden))
+    return documents
+
+
+# ============================================================================
+# Synthetic invoices
+# ============================================================================
+
+_PRODUCTS = [
+    ("Gate valve DN{n} PN16 cast iron", "8481.80.90", "pcs"),
+    ("Steel pipe {n}mm sch40 galvanized", "7306.30.00", "m"),
+    ("Copper cable 3x{n}mm2 PVC sheathed", "8544.49.90", "m"),
+    ("Polyester woven fabric {n}cm dyed", "5407.52.00", "m"),
+    ("LED panel light {n}W 4000K", "9405.42.00", "pcs"),
+    ("Hex bolt M{n} zinc plated", "7318.15.00", "pcs"),
+    ("PVC conduit {n}mm 3m length", "3917.23.00", "pcs"),
+    ("Ceramic floor tile {n}x60 matt", "6907.21.00", "m2"),
+]
+_SELLERS = ["ACME BUILDING MATERIALS LLC", "NORTHWIND TRADING FZE", "EXAMPLE STEEL CO., LTD."]
+
+
+def synthetic_invoice(rng: random.Random, number: int) -> tuple[str, dict[str, Any]]:
+    """A columnar invoice text and its golden fields."""
+    invoice_no = f"SYN-{number:06d}"
+    day, month = rng.randint(1, 28), rng.randint(1, 12)
+    currency = rng.choice(["AED", "USD", "EUR"])
+    items = []
+    rows = []
+    for line_no in range(1, rng.randint(3, 40) + 1):
+        template, hs_code, unit = rng.choice(_PRODUCTS)
+        description = template.format(n=rng.choice([10, 16, 20, 25, 40, 50]))
+        quantity = rng.randint(1, 500)
+        unit_price = round(rng.uniform(0.5, 900), 2)
+        total = round(quantity * unit_price, 2)
+        rows.append(
+            f"{line_no:<5} {description:<36} {hs_code:<12} {quantity:<6} {unit:<6} "
+            f"{unit_price:>10,.2f}  {total:>12,.2f}"
+        )
+        items.append(
+            {
+                "description": description,
+                "hs_code": hs_code.replace(".", ""),
+                "quantity": quantity,
+                "unit": unit,
+                "unit_price": unit_price,
+                "total_price": total,
+            }
+        )
+    total_amount = round(sum(i["total_price"] for i in items), 2)
+    text = "\n".join(
+        [
+            "--- Page 1 ---",
+            rng.choice(_SELLERS),
+            "TAX INVOICE",
+            f"Invoice No: {invoice_no}",
+            f"Date: {day:02d}/{month:02d}/2024",
+            f"Currency: {currency}",
+            "",
+            f"{'No.':<5} {'Description':<36} {'HS Code':<12} {'Qty':<6} {'Unit':<6} "
+            f"{'Unit Price':>10}  {'Amount':>12}",
+            *rows,
+            "",
+            f"Grand Total ({currency}): {total_amount:,.2f}",
+            "Bank: Example National Bank   IBAN: AE070331234567890123456",
+        ]
+    )
+    golden = {
+        "invoice_no": invoice_no,
+        "invoice_date": f"2024-{month:02d}-{day:02d}",
+        "currency": currency,
+        "total_amount": total_amount,
+        "items": items,
+    }
+    return text, golden
+
+
+def synthetic_corpus(count: int, seed: int = 0) -> Iterator[Document]:
+    """``count`` reproducible synthetic invoices."""
+    rng = random.Random(seed)
+    for number in range(count):
+        text, golden = synthetic_invoice(rng, number)
+        yield Document(f"synthetic-{number}", text, f"synthetic-{number}.txt", golden)
+
+
+# ============================================================================
+# Scoring
+# ============================================================================
+
+
+def _same(expected: Any, actual: Any) -> bool:
+    if isinstance(expected, (int, float)):
+        try:
+            return abs(float(actual) - expected) < 0.01
+        except (TypeError, ValueError):
+            return False
+    return str(actual or "").strip().casefold() == str(expected).strip().casefold()
+
+
+def score(golden: dict[str, Any], result: ParserResult) -> dict[str, tuple[int, int]]:
+    """
+    (correct, expected) per field.
+
+    Header fields with a null golden value are not scored. Golden items
+    are matched to extracted line items by total price (then quantity and
+    unit price); a golden item without a match gets every field wrong.
+    """
+    invoice = result.invoice if result.success else None
+    scores: dict[str, tuple[int, int]] = {}
+    for name in HEADER_FIELDS:
+        if golden.get(name) is None:
+            continue
+        actual = getattr(invoice, name, None) if invoice is not None else None
+        scores[name] = (int(_same(golden[name], actual)), 1)
+
+    extracted = (
+        [item for item in (result.items or []) if item.row_type == RowType.LINE_ITEM]
+        if result.success
+        else []
+    )
+    correct: Counter[str] = Counter()
+    expected: Counter[str] = Counter()
+    for gold in golden.get("items", []):
+        match = next(
+            (i for i in extracted if _same(gold["total_price"], i.total_price)),
+            None,
+        ) or next(
+            (
+                i
+                for i in extracted
+                if _same(gold["quantity"], i.quantity) and _same(gold["unit_price"], i.unit_price)
+            ),
+            None,
+        )
+        if match is not None:
+            extracted.remove(match)
+        expected["items"] += 1
+        correct["items"] += match is not None
+        for name in ITEM_FIELDS:
+            if gold.get(name) is None:
+                continue
+            expected[f"item.{name}"] += 1
+            correct[f"item.{name}"] += match is not None and _same(gold[name], getattr(match, name))
+    for name in expected:
+        scores[name] = (correct[name], expected[name])
+    return scores
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+
+@dataclass
+class Report:
+    """Aggregated benchmark results."""
+
+    documents: int = 0
+    seconds: float = 0.0
+    early_stops: int = 0
+    failures: int = 0
+    winners: Counter[str] = field(default_factory=Counter)
+    latencies_ms: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    fields: dict[str, list[int]] = field(default_factory=lambda: defaultdict(lambda: [0, 0]))
+    registry_stats: dict[str, Any] = field(default_factory=dict)
+
+    def add(self, document: Document, result: ParserResult) -> None:
+        metadata = result.metadata or {}
+        self.documents += 1
+        if not result.success:
+            self.failures += 1
+        elif not metadata.get("below_threshold"):
+            self.early_stops += 1
+        self.winners[result.parser_name if result.success else "failed"] += 1
+        for timing in metadata.get("timings", []):
+            self.latencies_ms[timing["parser"]].append(timing["duration_ms"])
+        if document.golden is not None:
+            for name, (correct, expected) in score(document.golden, result).items():
+                self.fields[name][0] += correct
+                self.fields[name][1] += expected
+
+    def to_dict(self) -> dict[str, Any]:
+        parsers = {}
+        for name, latencies in sorted(self.latencies_ms.items()):
+            ordered = sorted(latencies)
+            busy = sum(ordered) / 1000
+            parsers[name] = {
+                "attempts": len(ordered),
+                "wins": self.winners.get(name, 0),
+                "docs_per_sec": round(len(ordered) / busy, 1) if busy else None,
+                "p50_ms": round(ordered[len(ordered) // 2], 2),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+            }
+        return {
+            "documents": self.documents,
+            "seconds": round(self.seconds, 3),
+            "docs_per_sec": round(self.documents / self.seconds, 1) if self.seconds else None,
+            "early_stop_rate": round(self.early_stops / self.documents, 4) if self.documents else 0,
+            "vision_fallback_rate": self.registry_stats.get("vision_fallback_rate", 0.0),
+            "failure_rate": round(self.failures / self.documents, 4) if self.documents else 0,
+            "parsers": parsers,
+            "accuracy": {
+                name: round(correct / expected, 4)
+                for name, (correct, expected) in sorted(self.fields.items())
+                if expected
+            },
+        }
+
+
+async def run(
+    documents: list[Document],
+    workers: int = 0,
+    vision_latency: float = 0.0,
+    concurrency: int = 1,
+) -> Report:
+    """Parse every document through a fresh registry and aggregate."""
+    from src.infrastructure.parsers.parser_pool import ParserPool
+    from src.infrastructure.parsers.registry import ParserRegistry
+    from src.infrastructure.parsers.table_aware_parser import TableAwareParser
+    from src.infrastructure.parsers.template_parser import get_template_parser
+    from src.infrastructure.parsers.vision_parser import VisionParser
+
+    pool = ParserPool(workers) if workers > 0 else None
+    registry = ParserRegistry(pool=pool)
+    table_parser = TableAwareParser()
+    registry.register(get_template_parser())
+    registry.register(table_parser)
+    registry.register(
+        VisionParser(text_parser=table_parser, provider=StubVisionProvider(vision_latency))
+    )
+
+    report = Report()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def parse(document: Document) -> None:
+        async with semaphore:
+            # Uploaded files always carry a file hint, which makes vision eligible
+            result = await registry.parse(
+                document.text, document.name, {"image_path": document.path}
+            )
+        report.add(document, result)
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(parse(d) for d in documents))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    report.seconds = time.perf_counter() - start
+    report.registry_stats = registry.get_stats()
+    return report
+
+
+def _print(report: dict[str, Any]) -> None:
+    print(
+        f"{report['documents']} documents in {report['seconds']:.2f}s "
+        f"({report['docs_per_sec']} docs/sec)"
+    )
+    print(
+        f"early stop {report['early_stop_rate']:.1%}   "
+        f"vision fallback {report['vision_fallback_rate']:.1%}   "
+        f"failed {report['failure_rate']:.1%}"
+    )
+    print(
+        f"\n  {'parser':<12} {'attempts':>8} {'wins':>6} {'docs/sec':>10} {'p50 ms':>8} {'p95 ms':>8}"
+    )
+    for name, stats in report["parsers"].items():
+        print(
+            f"  {name:<12} {stats['attempts']:>8} {stats['wins']:>6} "
+            f"{stats['docs_per_sec'] or 0:>10} {stats['p50_ms']:>8} {stats['p95_ms']:>8}"
+        )
+    print(f"\n  {'field':<18} {'accuracy':>8}")
+    for name, accuracy in report["accuracy"].items():
+        print(f"  {name:<18} {accuracy:>8.1%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR)
+    parser.add_argument("--synthetic", type=int, default=200, help="generated invoices to add")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=0, help="parser processes (0: event loop)")
+    parser.add_argument("--concurrency", type=int, default=1, help="documents in flight")
+    parser.add_argument("--vision-latency", type=float, default=0.0, help="stub seconds per call")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    # Headless: no response cache database, only warnings on the console
+    os.environ.setdefault("CACHE_VISION_CACHE_ENABLED", "false")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    from src.config.logging import configure_logging
+
+    configure_logging()
+
+    documents = load_corpus(args.corpus) + list(synthetic_corpus(args.synthetic, args.seed))
+    if not documents:
+        raise SystemExit(f"No documents in {args.corpus} and --synthetic 0")
+    report = asyncio.run(
+        run(documents, args.workers, args.vision_latency, args.concurrency)
+    ).to_dict()
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print(report)
+
+
+if __name__ == "__main__":
+    main()
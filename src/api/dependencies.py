@@ -25,6 +25,7 @@ from src.application.use_cases import (
     IngestMaterialUseCase,
     IssueStockUseCase,
     ReceiveStockUseCase,
+    ReprocessInvoicesUseCase,
     SearchDocumentsUseCase,
     UploadInvoiceUseCase,
 )
@@ -104,6 +105,11 @@ def get_audit_invoice_use_case() -> AuditInvoiceUseCase:
     return AuditInvoiceUseCase()
 
 
+def get_reprocess_invoices_use_case() -> ReprocessInvoicesUseCase:
+    """Get reprocess invoices use case."""
+    return ReprocessInvoicesUseCase()
+
+
 def get_search_documents_use_case() -> SearchDocumentsUseCase:
     """Get search documents use case."""
     return SearchDocumentsUseCase()
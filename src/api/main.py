@@ -82,6 +82,15 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception as e:
         logger.warning("vector_store_init_failed", error=str(e))
 
+    # Open the Ollama connection pool (also serves vision under llama_cpp)
+    try:
+        from src.infrastructure.llm import get_ollama_provider
+
+        await get_ollama_provider().start()
+
+    except Exception as e:
+        logger.warning("ollama_client_init_failed", error=str(e))
+
     # Warm up LLM provider (optional)
     if settings.llm.warmup_on_start:
         try:
@@ -101,6 +110,23 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Shutdown
     logger.info("application_stopping")
 
+    # Finish background work while the pool is still open
+    try:
+        from src.application.services import flush_item_indexing
+
+        await flush_item_indexing()
+
+    except Exception as e:
+        logger.warning("item_indexing_flush_failed", error=str(e))
+
+    try:
+        from src.application.services import flush_memory_extraction
+
+        await flush_memory_extraction()
+
+    except Exception as e:
+        logger.warning("memory_extraction_flush_failed", error=str(e))
+
     # Close connection pool
     try:
         from src.infrastructure.storage.sqlite import close_connection_pool
@@ -111,6 +137,42 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception as e:
         logger.warning("connection_pool_close_failed", error=str(e))
 
+    # Close the Ollama connection pool
+    try:
+        from src.infrastructure.llm import close_ollama_provider
+
+        await close_ollama_provider()
+
+    except Exception as e:
+        logger.warning("ollama_client_close_failed", error=str(e))
+
+    # Stop embedding inference worker
+    try:
+        from src.infrastructure.embeddings import shutdown_inference_executor
+
+        shutdown_inference_executor()
+
+    except Exception as e:
+        logger.warning("inference_executor_shutdown_failed", error=str(e))
+
+    # Stop PDF page render processes
+    try:
+        from src.infrastructure.parsers import shutdown_page_renderer
+
+        shutdown_page_renderer()
+
+    except Exception as e:
+        logger.warning("page_renderer_shutdown_failed", error=str(e))
+
+    # Stop CPU-bound parser processes
+    try:
+        from src.infrastructure.parsers import shutdown_parser_pool
+
+        shutdown_parser_pool()
+
+    except Exception as e:
+        logger.warning("parser_pool_shutdown_failed", error=str(e))
+
     # Save vector index
     try:
         from src.infrastructure.storage.vector import get_faiss_store
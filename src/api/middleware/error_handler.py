@@ -62,6 +62,7 @@ HINT_MAP: dict[str, str] = {
     "LLM_UNAVAILABLE": "The LLM provider is offline. Retry later or disable LLM features.",
     "LLM_TIMEOUT": "The LLM request timed out. Retry with a shorter document.",
     "CIRCUIT_BREAKER_OPEN": "Too many LLM failures. Wait for cooldown before retrying.",
+    "LLM_OVERLOADED": "The LLM is busy with higher-priority work. Retry shortly.",
     "INDEX_NOT_READY": "The search index is not built. Run POST /api/documents/index first.",
     "EMBEDDING_ERROR": "Embedding generation failed. Check the embedding provider status.",
     "AUDIT_FAILED": "The audit could not complete. Check the invoice data.",
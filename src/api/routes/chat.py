@@ -2,19 +2,65 @@
 Chat endpoints.
 """
 
-from collections.abc import AsyncIterator
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
 
 from src.api.dependencies import get_chat_use_case
 from src.application.dto.requests import ChatRequest
 from src.application.dto.responses import ChatResponse, ErrorResponse
 from src.application.use_cases import ChatWithContextUseCase
+from src.config import get_logger
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
+_logger = get_logger(__name__)
+
+# Seconds between client disconnect checks while a response streams
+DISCONNECT_POLL_INTERVAL = 0.5
+
+
+async def _until_disconnected(
+    http_request: Request,
+    stream: AsyncIterator[str],
+) -> AsyncGenerator[str, None]:
+    """
+    Relay ``stream`` until it ends or the client goes away.
+
+    On disconnect the pending read is cancelled, which cancels the
+    provider call underneath it (closing the upstream HTTP stream or
+    stopping the llama.cpp worker) and frees the model slot at once
+    instead of after the next generated token.
+    """
+
+    async def watch() -> None:
+        while not await http_request.is_disconnected():
+            await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
+
+    watcher = asyncio.create_task(watch())
+    step: asyncio.Future[str] | None = None
+    try:
+        while True:
+            step = asyncio.ensure_future(anext(stream))
+            await asyncio.wait({step, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            if not step.done():
+                _logger.info("chat_stream_client_disconnected")
+                return
+            try:
+                chunk = step.result()
+            except StopAsyncIteration:
+                return
+            yield chunk
+    finally:
+        watcher.cancel()
+        if step is not None and not step.done():
+            step.cancel()
+            await asyncio.gather(step, return_exceptions=True)
+
 
 @router.post(
     "",
@@ -25,6 +71,7 @@ router = APIRouter(prefix="/api/chat", tags=["chat"])
 )
 async def chat(
     request: ChatRequest,
+    http_request: Request,
     use_case: ChatWithContextUseCase = Depends(get_chat_use_case),
 ) -> ChatResponse | StreamingResponse:
     """
@@ -35,7 +82,7 @@ async def chat(
     """
     if request.stream:
         # Redirect to streaming endpoint
-        return await chat_stream(request, use_case)
+        return await chat_stream(request, http_request, use_case)
 
     result = await use_case.execute(request)
     return use_case.to_response(result)
@@ -46,18 +93,24 @@ async def chat(
 )
 async def chat_stream(
     request: ChatRequest,
+    http_request: Request,
     use_case: ChatWithContextUseCase = Depends(get_chat_use_case),
 ) -> StreamingResponse:
     """
     Stream a chat response.
 
-    Returns Server-Sent Events with response chunks.
+    Returns Server-Sent Events with response chunks. If the client
+    disconnects, generation is cancelled and the partial answer is kept.
     """
 
-    async def generate() -> AsyncIterator[str]:
+    async def generate() -> AsyncGenerator[str, None]:
         try:
-            async for chunk in use_case.stream(request):
-                yield f"data: {chunk}\n\n"
+            async with (
+                aclosing(use_case.stream(request)) as stream,
+                aclosing(_until_disconnected(http_request, stream)) as relay,
+            ):
+                async for chunk in relay:
+                    yield f"data: {chunk}\n\n"
             yield "data: [DONE]\n\n"
         except Exception as e:
             yield f"data: [ERROR] {str(e)}\n\n"
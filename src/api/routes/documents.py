@@ -4,7 +4,7 @@ Document management endpoints.
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile, status
 
 from src.api.dependencies import get_doc_store, get_indexer
 from src.application.dto.requests import IndexDocumentRequest
@@ -14,11 +14,15 @@ from src.application.dto.responses import (
     ErrorResponse,
     IndexingStatsResponse,
 )
+from src.config import get_logger
+from src.core.exceptions import IndexingError
 from src.core.services import DocumentIndexerService
 from src.infrastructure.storage.sqlite import SQLiteDocumentStore
 
 router = APIRouter(prefix="/api/documents", tags=["documents"])
 
+_logger = get_logger(__name__)
+
 
 def _doc_to_response(doc: Any) -> DocumentResponse:
     """Map a Document entity to DocumentResponse DTO."""
@@ -235,6 +239,48 @@ async def index_directory(
     return results
 
 
+async def _rebuild_chunk_index(indexer: DocumentIndexerService) -> None:
+    """Background task: rebuild the chunk index into a new generation."""
+    try:
+        result = await indexer.rebuild_index(index_name="chunks")
+        _logger.info("chunk_index_rebuilt", **result)
+    except IndexingError as e:
+        _logger.error("chunk_index_rebuild_failed", error=str(e))
+
+
+@router.post(
+    "/index/rebuild",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        409: {"model": ErrorResponse, "description": "Index is already being built"},
+    },
+)
+async def rebuild_chunk_index(
+    background_tasks: BackgroundTasks,
+    indexer: DocumentIndexerService = Depends(get_indexer),
+) -> dict[str, Any]:
+    """
+    Rebuild the chunk index in the background.
+
+    Search keeps serving from the current index generation until the
+    rebuilt one is swapped in; poll /api/health/search for the new
+    generation number.
+    """
+    stats = await indexer.get_indexing_stats()
+    if stats["chunks"]["is_building"]:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Index chunks is already being built",
+        )
+
+    background_tasks.add_task(_rebuild_chunk_index, indexer)
+    return {
+        "status": "accepted",
+        "index": "chunks",
+        "current_generation": stats["vector_index"].get("generation"),
+    }
+
+
 @router.get(
     "",
     response_model=DocumentListResponse,
@@ -49,10 +49,19 @@ async def llm_health() -> HealthResponse:
         health_result = await llm.check_health()
         latency = (time.time() - start) * 1000
 
+        details = {}
+        for key, stats in (
+            ("pool", "pool_stats"),
+            ("workers", "worker_stats"),
+            ("scheduler", "scheduler_stats"),
+        ):
+            if callable(getattr(llm, stats, None)):
+                details[key] = getattr(llm, stats)()
         llm_status = ProviderHealthResponse(
             name=llm.__class__.__name__,
             available=health_result.available,
             latency_ms=latency,
+            details=details or None,
         )
 
     except Exception as e:
@@ -129,6 +138,7 @@ async def search_health() -> HealthResponse:
     try:
         store = get_faiss_store()
         start = time.time()
+        generations = {name: await store.get_generation(name) for name in ("chunks", "items")}
         count = store.count()
         latency = (time.time() - start) * 1000
 
@@ -136,6 +146,7 @@ async def search_health() -> HealthResponse:
             name=f"faiss ({count} vectors)",
             available=True,
             latency_ms=latency,
+            details={"generations": generations},
         )
 
     except Exception as e:
@@ -153,6 +164,30 @@ async def search_health() -> HealthResponse:
     )
 
 
+@router.get("/parsers", response_model=HealthResponse)
+async def parser_health() -> HealthResponse:
+    """
+    Invoice parser statistics.
+
+    Reports which parser handled each document and the vision fallback rate.
+    """
+    from src.infrastructure.parsers import get_parser_registry
+
+    registry = get_parser_registry()
+    parser_status = ProviderHealthResponse(
+        name="parser_registry",
+        available=bool(registry.get_parsers()),
+        details=registry.get_stats(),
+    )
+
+    return HealthResponse(
+        status="healthy" if parser_status.available else "degraded",
+        version="1.0.0",
+        uptime_seconds=time.time() - _start_time,
+        parsers=parser_status,
+    )
+
+
 @router.get("/full", response_model=HealthResponse)
 async def full_health_check() -> HealthResponse:
     """
@@ -4,7 +4,7 @@ Invoice management endpoints.
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile, status
 from fastapi.responses import Response
 
 from src.api.dependencies import (
@@ -13,11 +13,13 @@ from src.api.dependencies import (
     get_generate_proforma_pdf_use_case,
     get_inv_store,
     get_mat_store,
+    get_reprocess_invoices_use_case,
     get_upload_invoice_use_case,
 )
 from src.application.dto.requests import (
     AuditInvoiceRequest,
     ManualMatchRequest,
+    ReprocessInvoicesRequest,
     UploadInvoiceRequest,
 )
 from src.application.dto.responses import (
@@ -29,6 +31,7 @@ from src.application.dto.responses import (
     ErrorResponse,
     InvoiceResponse,
     LineItemResponse,
+    ReprocessJobResponse,
     UnmatchedItemResponse,
     UnmatchedItemsResponse,
 )
@@ -36,7 +39,9 @@ from src.application.use_cases import (
     AddToCatalogUseCase,
     AuditInvoiceUseCase,
     GenerateProformaPdfUseCase,
+    ReprocessInvoicesUseCase,
     UploadInvoiceUseCase,
+    get_reprocess_job,
 )
 from src.core.entities.invoice import RowType
 from src.infrastructure.storage.sqlite import SQLiteInvoiceStore, SQLiteMaterialStore
@@ -97,6 +102,50 @@ async def upload_invoice(
     return use_case.to_response(result)
 
 
+@router.post(
+    "/reprocess",
+    response_model=ReprocessJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def reprocess_invoices(
+    request: ReprocessInvoicesRequest,
+    background_tasks: BackgroundTasks,
+    use_case: ReprocessInvoicesUseCase = Depends(get_reprocess_invoices_use_case),
+) -> ReprocessJobResponse:
+    """
+    Re-parse stored invoices in the background.
+
+    Parses the selected invoices again from their stored page text and
+    stores changed results as new invoice versions; with dry_run only
+    the differences are reported. Poll /api/invoices/reprocess/{job_id}
+    for progress.
+    """
+    job = await use_case.start(request)
+    background_tasks.add_task(use_case.run, job, request)
+    return use_case.to_response(job)
+
+
+@router.get(
+    "/reprocess/{job_id}",
+    response_model=ReprocessJobResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Job not found"},
+    },
+)
+async def get_reprocess_status(
+    job_id: str,
+    use_case: ReprocessInvoicesUseCase = Depends(get_reprocess_invoices_use_case),
+) -> ReprocessJobResponse:
+    """Get progress and per-invoice results of a reprocessing job."""
+    job = get_reprocess_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Reprocess job not found: {job_id}",
+        )
+    return use_case.to_response(job)
+
+
 @router.post(
     "/{invoice_id}/audit",
     response_model=AuditResultResponse,
@@ -288,6 +337,7 @@ async def get_invoice(
         source_file=None,
         parsed_at=invoice.created_at,
         confidence=invoice.confidence,
+        parser_used=invoice.parser_name,
     )
 
 
@@ -406,6 +456,7 @@ async def list_invoices(
                 source_file=None,  # Not in entity
                 parsed_at=inv.created_at,
                 confidence=inv.confidence,
+                parser_used=inv.parser_name,
             ).model_dump()
             for inv in invoices
         ],
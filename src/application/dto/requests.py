@@ -4,9 +4,10 @@ Pydantic v2 models for API request validation.
 These are the ONLY contracts between API and use cases.
 """
 
-from typing import Any
+from datetime import date
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class UploadInvoiceRequest(BaseModel):
@@ -78,6 +79,53 @@ class AuditInvoiceRequest(BaseModel):
     )
 
 
+class ReprocessInvoicesRequest(BaseModel):
+    """Request to re-parse stored invoices from their page text.
+
+    Selects invoice_ids when given, otherwise the latest invoices that
+    match every filter. At least one of them is required.
+    """
+
+    invoice_ids: list[int] | None = Field(
+        default=None,
+        description="Invoices to reprocess (filters are ignored)",
+    )
+    company_key: str | None = Field(default=None, description="Company key to match")
+    seller_name: str | None = Field(default=None, description="Substring of the seller name")
+    date_from: date | None = Field(default=None, description="Earliest invoice date")
+    date_to: date | None = Field(default=None, description="Latest invoice date")
+    parser_name: str | None = Field(
+        default=None,
+        description="Parser that produced the stored invoice",
+        examples=["template", "table_aware", "vision"],
+    )
+    limit: int = Field(default=500, ge=1, le=5000, description="Maximum invoices selected")
+    dry_run: bool = Field(
+        default=False,
+        description="Report what would change without storing anything",
+    )
+    re_audit: bool = Field(default=False, description="Audit each reprocessed invoice")
+    use_llm: bool = Field(default=False, description="Use LLM analysis when re-auditing")
+    read_source_file: bool = Field(
+        default=False,
+        description="Also read the source PDF (layout word boxes, vision page rendering)",
+    )
+    workers: int | None = Field(
+        default=None,
+        ge=1,
+        le=16,
+        description="Invoices processed concurrently (default: PARSER_REPROCESS_WORKERS)",
+    )
+
+    @model_validator(mode="after")
+    def require_selection(self) -> Self:
+        if not self.invoice_ids and not any(
+            (self.company_key, self.seller_name, self.date_from, self.date_to, self.parser_name)
+        ):
+            raise ValueError("Select invoices by invoice_ids or at least one filter")
+        return self
+
+
 class SearchDocumentsRequest(BaseModel):
     """Request for document search.
 
@@ -82,6 +82,47 @@ class UploadInvoiceResponse(BaseModel):
     indexed: bool = Field(default=False, description="Whether document was indexed")
 
 
+class ReprocessInvoiceResult(BaseModel):
+    """Outcome of reprocessing one invoice."""
+
+    invoice_id: int = Field(..., description="Reprocessed invoice ID")
+    status: str = Field(
+        ...,
+        description="changed, unchanged, skipped or failed",
+        pattern="^(changed|unchanged|skipped|failed)$",
+    )
+    new_invoice_id: int | None = Field(
+        default=None, description="ID of the stored new version (not in dry runs)"
+    )
+    parser_name: str | None = Field(default=None, description="Parser of the new result")
+    changes: dict[str, dict[str, Any]] = Field(
+        default_factory=dict, description="Changed header fields with old and new values"
+    )
+    items_added: int = Field(default=0, description="Line items only in the new result")
+    items_removed: int = Field(default=0, description="Line items only in the stored invoice")
+    audit_passed: bool | None = Field(default=None, description="Re-audit outcome")
+    error: str | None = Field(default=None, description="Why reprocessing failed or was skipped")
+
+
+class ReprocessJobResponse(BaseModel):
+    """Progress and results of a reprocessing job."""
+
+    job_id: str = Field(..., description="Job ID to poll")
+    status: str = Field(..., description="running, completed or failed")
+    dry_run: bool = Field(..., description="Whether results were stored")
+    total: int = Field(..., description="Invoices selected")
+    processed: int = Field(default=0, description="Invoices done so far")
+    changed: int = Field(default=0, description="Invoices whose result changed")
+    unchanged: int = Field(default=0, description="Invoices parsed to the same result")
+    skipped: int = Field(default=0, description="Invoices that are no longer the latest version")
+    failed: int = Field(default=0, description="Invoices that could not be reprocessed")
+    started_at: datetime = Field(..., description="Job start time")
+    finished_at: datetime | None = Field(default=None, description="Job end time")
+    results: list[ReprocessInvoiceResult] = Field(
+        default_factory=list, description="Per-invoice outcomes, in completion order"
+    )
+
+
 class AuditFindingResponse(BaseModel):
     """Individual audit finding."""
 
@@ -248,6 +289,7 @@ class ProviderHealthResponse(BaseModel):
     available: bool
     latency_ms: float | None = None
     error: str | None = None
+    details: dict[str, Any] | None = None
 
 
 class HealthResponse(BaseModel):
@@ -260,6 +302,7 @@ class HealthResponse(BaseModel):
     embedding: ProviderHealthResponse | None = None
     database: ProviderHealthResponse | None = None
     vector_store: ProviderHealthResponse | None = None
+    parsers: ProviderHealthResponse | None = None
 
 
 class ErrorResponse(BaseModel):
@@ -7,8 +7,10 @@ implementations to core services. Use cases should import from here.
 Clean Architecture: Application layer orchestrates DI, not core layer.
 """
 
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, cast
 
+from src.config import get_settings
 from src.core.interfaces import (
     IHybridSearcher,
     IProductPageFetcher,
@@ -16,13 +18,16 @@ from src.core.interfaces import (
     ISearchCache,
 )
 from src.core.services import (
+    CharChunker,
     ChatService,
+    ContextPacker,
     DocumentIndexerService,
     InvoiceAuditorService,
     InvoiceParserService,
     MaterialIngestionService,
     ProformaPdfService,
     SearchService,
+    TokenChunker,
 )
 
 if TYPE_CHECKING:
@@ -54,6 +59,7 @@ def get_invoice_parser_service(
     parser_registry: "IParserRegistry | None" = None,
     document_store: "IDocumentStore | None" = None,
     invoice_store: "IInvoiceStore | None" = None,
+    item_indexer: Callable[[], Awaitable[DocumentIndexerService]] | None = None,
 ) -> InvoiceParserService:
     """
     Get or create InvoiceParserService instance.
@@ -65,6 +71,8 @@ def get_invoice_parser_service(
         parser_registry: Optional parser registry override
         document_store: Optional document store override
         invoice_store: Optional invoice store override
+        item_indexer: Optional provider of the indexer scheduled after
+            invoices are saved (default: the indexer singleton)
 
     Returns:
         Configured InvoiceParserService
@@ -76,16 +84,20 @@ def get_invoice_parser_service(
 
     # Lazy import infrastructure to avoid circular imports
     from src.infrastructure.parsers import get_parser_registry
+    from src.infrastructure.storage.sqlite import SQLiteInvoiceStore
 
     registry = parser_registry or get_parser_registry()
     # Note: These are async but we handle sync for now
     doc_store = document_store
-    inv_store = invoice_store
+    # The invoice store holds no state, so it can be created here
+    inv_store = invoice_store or SQLiteInvoiceStore()
 
     service = InvoiceParserService(
         parser_registry=registry,
         document_store=doc_store,
         invoice_store=inv_store,
+        # Resolved on the first save, whenever the indexer gets created
+        item_indexer=item_indexer or get_document_indexer_service,
     )
 
     if parser_registry is None:
@@ -178,10 +190,11 @@ async def get_document_indexer_service(
         return _document_indexer_service
 
     # Lazy import infrastructure
-    from src.infrastructure.embeddings import get_embedding_provider
+    from src.infrastructure.embeddings import get_embedding_provider, get_inference_executor
     from src.infrastructure.storage.sqlite import (
         get_document_store as get_doc_store,
         get_indexing_state_store as get_idx_state_store,
+        get_invoice_store,
     )
     from src.infrastructure.storage.vector import get_vector_store
 
@@ -190,11 +203,26 @@ async def get_document_indexer_service(
     vec_store = vector_store or get_vector_store()
     idx_state_store = indexing_state_store or await get_idx_state_store()
 
+    search_settings = get_settings().search
+    chunker: CharChunker | TokenChunker
+    if search_settings.chunk_strategy == "tokens":
+        chunker = TokenChunker(
+            embedder.count_tokens,
+            max_tokens=search_settings.chunk_max_tokens,
+            overlap_tokens=search_settings.chunk_overlap_tokens,
+        )
+    else:
+        chunker = CharChunker(search_settings.chunk_size, search_settings.chunk_overlap)
+
     service = DocumentIndexerService(
         document_store=doc_store,
         embedding_provider=embedder,
         vector_store=vec_store,
         indexing_state_store=idx_state_store,
+        executor=get_inference_executor(),
+        invoice_store=await get_invoice_store(),
+        chunker=chunker,
+        persist_rows=get_settings().storage.index_persist_rows,
     )
 
     if document_store is None:
@@ -203,6 +231,23 @@ async def get_document_indexer_service(
     return service
 
 
+def _rag_token_counter() -> Callable[[list[str]], list[int]]:
+    """
+    Token counter for RAG context: the LLM's tokenizer when the provider
+    exposes one (llama.cpp), otherwise the embedding model's.
+    """
+    from src.infrastructure.embeddings import get_embedding_provider
+    from src.infrastructure.llm import get_llm_provider
+
+    def count(texts: list[str]) -> list[int]:
+        counts = get_llm_provider().count_tokens(texts)
+        if counts is None:
+            counts = get_embedding_provider().count_tokens(texts)
+        return counts
+
+    return count
+
+
 def get_search_service(
     searcher: "IHybridSearcher | None" = None,
     reranker: "IReranker | None" = None,
@@ -247,10 +292,18 @@ def get_search_service(
         except Exception:
             search_cache = None
 
+    search_settings = get_settings().search
+    packer = ContextPacker(
+        _rag_token_counter(),
+        max_tokens=search_settings.rag_context_tokens,
+        duplicate_threshold=search_settings.rag_duplicate_threshold,
+    )
+
     service = SearchService(
         searcher=hybrid_searcher,
         reranker=result_reranker,
         cache=search_cache,
+        context_packer=packer,
     )
 
     if searcher is None:
@@ -384,6 +437,18 @@ def get_material_ingestion_service(
     return service
 
 
+async def flush_item_indexing() -> None:
+    """Wait for background item indexing on the shared indexer, if any."""
+    if _document_indexer_service is not None:
+        await _document_indexer_service.flush_item_indexing()
+
+
+async def flush_memory_extraction() -> None:
+    """Wait for background memory fact extraction on the shared chat service, if any."""
+    if _chat_service is not None:
+        await _chat_service.flush_memory_extraction()
+
+
 def reset_services() -> None:
     """
     Reset all singleton service instances.
@@ -416,6 +481,9 @@ __all__ = [
     "get_chat_service",
     "get_proforma_pdf_service",
     "get_material_ingestion_service",
+    # Lifecycle
+    "flush_item_indexing",
+    "flush_memory_extraction",
     # Reset
     "reset_services",
 ]
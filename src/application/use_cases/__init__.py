@@ -17,6 +17,11 @@ from src.application.use_cases.generate_proforma_pdf import GenerateProformaPdfU
 from src.application.use_cases.ingest_material import IngestMaterialUseCase
 from src.application.use_cases.issue_stock import IssueStockUseCase
 from src.application.use_cases.receive_stock import ReceiveStockUseCase
+from src.application.use_cases.reprocess_invoices import (
+    ReprocessInvoicesUseCase,
+    ReprocessJob,
+    get_reprocess_job,
+)
 from src.application.use_cases.search_documents import SearchDocumentsUseCase
 from src.application.use_cases.upload_invoice import UploadInvoiceUseCase
 
@@ -37,4 +42,7 @@ __all__ = [
     "IssueStockUseCase",
     "CreateSalesInvoiceUseCase",
     "CreateSalesPdfUseCase",
+    "ReprocessInvoicesUseCase",
+    "ReprocessJob",
+    "get_reprocess_job",
 ]
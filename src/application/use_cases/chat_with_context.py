@@ -4,7 +4,8 @@ Chat With Context Use Case.
 Handles RAG-powered chat conversations.
 """
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from dataclasses import dataclass
 
 from src.application.dto.requests import ChatRequest, CreateSessionRequest
@@ -17,7 +18,7 @@ from src.application.dto.responses import (
 from src.application.services import get_chat_service
 from src.config import get_logger
 from src.core.entities.session import ChatSession, Message
-from src.core.services import ChatService
+from src.core.services import ChatService, SessionInfo
 
 logger = get_logger(__name__)
 
@@ -26,7 +27,7 @@ logger = get_logger(__name__)
 class ChatResultDTO:
     """Chat result data transfer object."""
 
-    session: ChatSession
+    session: SessionInfo
     message: Message
     context_chunks: int = 0
 
@@ -65,12 +66,7 @@ class ChatWithContextUseCase:
 
         chat = await self._get_chat()
 
-        # Get or create session
-        session = None
-        if request.session_id:
-            session = await chat.get_session(request.session_id)
-
-        # Send message
+        # Send message (creates the session when no id is given)
         response = await chat.chat(
             message=request.message,
             session_id=request.session_id,
@@ -78,9 +74,8 @@ class ChatWithContextUseCase:
             top_k=request.top_k,
         )
 
-        # Get updated session
-        if session is None:
-            session = await chat.get_session(response.session_id)
+        # Id, title and message count from the chat turn window
+        session = await chat.get_session_info(response.session_id)
 
         context_chunks = 0
         context_used = getattr(response, "context_used", None)
@@ -93,7 +88,7 @@ class ChatWithContextUseCase:
 
         logger.info(
             "chat_complete",
-            session_id=session.id,
+            session_id=session.session_id,
             response_length=len(response.content),
         )
 
@@ -103,7 +98,7 @@ class ChatWithContextUseCase:
             context_chunks=context_chunks,
         )
 
-    async def stream(self, request: ChatRequest) -> AsyncIterator[str]:
+    async def stream(self, request: ChatRequest) -> AsyncGenerator[str, None]:
         """
         Stream chat response.
 
@@ -111,13 +106,16 @@ class ChatWithContextUseCase:
         """
         chat = await self._get_chat()
 
-        async for chunk in chat.chat_stream(
-            message=request.message,
-            session_id=request.session_id,
-            use_rag=request.use_rag,
-            top_k=request.top_k,
-        ):
-            yield chunk
+        async with aclosing(
+            chat.chat_stream(
+                message=request.message,
+                session_id=request.session_id,
+                use_rag=request.use_rag,
+                top_k=request.top_k,
+            )
+        ) as stream:
+            async for chunk in stream:
+                yield chunk
 
     async def create_session(
         self,
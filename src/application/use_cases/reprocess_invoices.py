@@ -0,0 +1,355 @@
+"""
+Reprocess Invoices Use Case.
+
+Re-parses stored invoices from their extracted page text, without
+re-reading the source files unless asked to, and optionally re-audits them.
+"""
+
+import asyncio
+import uuid
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any
+
+from src.application.dto.requests import ReprocessInvoicesRequest
+from src.application.dto.responses import ReprocessInvoiceResult, ReprocessJobResponse
+from src.application.services import (
+    get_document_indexer_service,
+    get_invoice_auditor_service,
+    get_invoice_parser_service,
+)
+from src.config import get_logger, get_settings
+from src.core.entities.invoice import Invoice
+from src.core.exceptions import InvoiceNotLatestError, ParserError
+from src.core.interfaces import IDocumentStore, IInvoiceStore
+from src.core.services import DocumentIndexerService, InvoiceAuditorService, InvoiceParserService
+
+logger = get_logger(__name__)
+
+# Header fields compared between the stored and the re-parsed invoice
+DIFF_FIELDS = (
+    "invoice_no",
+    "invoice_date",
+    "seller_name",
+    "buyer_name",
+    "company_key",
+    "currency",
+    "total_amount",
+    "subtotal",
+    "tax_amount",
+    "template_id",
+)
+
+# Finished jobs kept for polling; the oldest are dropped first and
+# running jobs are never dropped
+MAX_JOBS = 20
+
+_jobs: "OrderedDict[str, ReprocessJob]" = OrderedDict()
+
+
+@dataclass
+class ReprocessJob:
+    """Progress of one reprocessing run."""
+
+    job_id: str
+    invoice_ids: list[int]
+    dry_run: bool
+    status: str = "running"
+    results: list[ReprocessInvoiceResult] = field(default_factory=list)
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: datetime | None = None
+
+    def count(self, status: str) -> int:
+        return sum(1 for r in self.results if r.status == status)
+
+
+def get_reprocess_job(job_id: str) -> ReprocessJob | None:
+    """Get a running or recently finished job by ID."""
+    return _jobs.get(job_id)
+
+
+def _value(invoice: Invoice, name: str) -> Any:
+    value = getattr(invoice, name)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float):
+        return round(value, 4)
+    return value
+
+
+def _item_keys(invoice: Invoice) -> Counter[tuple[Any, ...]]:
+    return Counter(
+        (
+            item.item_name,
+            item.hs_code,
+            item.unit,
+            round(item.quantity, 4),
+            round(item.unit_price, 4),
+            round(item.total_price, 4),
+            item.row_type.value,
+        )
+        for item in invoice.items
+    )
+
+
+class ReprocessInvoicesUseCase:
+    """
+    Use case for re-running parsing over stored invoices.
+
+    Parses each selected invoice again from its stored pages, bypassing
+    the parser result cache, and stores the result as a new invoice
+    version when it differs. A dry run only reports the differences.
+    """
+
+    def __init__(
+        self,
+        parser_service: InvoiceParserService | None = None,
+        auditor_service: InvoiceAuditorService | None = None,
+        invoice_store: IInvoiceStore | None = None,
+        document_store: IDocumentStore | None = None,
+        indexer_service: DocumentIndexerService | None = None,
+    ):
+        """
+        Initialize use case with optional service overrides.
+
+        Args:
+            parser_service: Invoice parser service
+            auditor_service: Invoice auditor service
+            invoice_store: Invoice persistence store
+            document_store: Document persistence store
+            indexer_service: Indexer embedding new line items
+        """
+        self._parser = parser_service
+        self._auditor = auditor_service
+        self._invoice_store = invoice_store
+        self._document_store = document_store
+        self._indexer = indexer_service
+
+    def _get_parser(self) -> InvoiceParserService:
+        if self._parser is None:
+            self._parser = get_invoice_parser_service()
+        return self._parser
+
+    def _get_auditor(self) -> InvoiceAuditorService:
+        if self._auditor is None:
+            self._auditor = get_invoice_auditor_service()
+        return self._auditor
+
+    async def _get_invoice_store(self) -> IInvoiceStore:
+        if self._invoice_store is None:
+            # Lazy import to avoid circular imports
+            from src.infrastructure.storage.sqlite import get_invoice_store
+
+            self._invoice_store = await get_invoice_store()
+        return self._invoice_store
+
+    async def _get_document_store(self) -> IDocumentStore:
+        if self._document_store is None:
+            from src.infrastructure.storage.sqlite import get_document_store
+
+            self._document_store = await get_document_store()
+        return self._document_store
+
+    async def _get_indexer(self) -> DocumentIndexerService:
+        if self._indexer is None:
+            self._indexer = await get_document_indexer_service()
+        return self._indexer
+
+    async def start(self, request: ReprocessInvoicesRequest) -> ReprocessJob:
+        """
+        Select the invoices and register a job for them.
+
+        Args:
+            request: Selection and options
+
+        Returns:
+            ReprocessJob to pass to run()
+        """
+        if request.invoice_ids:
+            invoice_ids = list(dict.fromkeys(request.invoice_ids))[: request.limit]
+        else:
+            store = await self._get_invoice_store()
+            invoice_ids = await store.find_invoice_ids(
+                company_key=request.company_key,
+                seller_name=request.seller_name,
+                date_from=request.date_from,
+                date_to=request.date_to,
+                parser_name=request.parser_name,
+                limit=request.limit,
+            )
+
+        job = ReprocessJob(
+            job_id=uuid.uuid4().hex,
+            invoice_ids=invoice_ids,
+            dry_run=request.dry_run,
+        )
+        _jobs[job.job_id] = job
+        finished = [job_id for job_id, j in _jobs.items() if j.finished_at is not None]
+        for job_id in finished[: max(0, len(_jobs) - MAX_JOBS)]:
+            del _jobs[job_id]
+
+        logger.info(
+            "reprocess_invoices_started",
+            job_id=job.job_id,
+            invoices=len(invoice_ids),
+            dry_run=request.dry_run,
+        )
+        return job
+
+    async def run(self, job: ReprocessJob, request: ReprocessInvoicesRequest) -> ReprocessJob:
+        """
+        Reprocess the job's invoices on a bounded number of workers.
+
+        Progress is visible on the job while it runs.
+        """
+        workers = request.workers or get_settings().parser.reprocess_workers
+        semaphore = asyncio.Semaphore(max(1, workers))
+
+        async def worker(invoice_id: int) -> None:
+            async with semaphore:
+                try:
+                    result = await self._reprocess_one(invoice_id, request)
+                except Exception as e:
+                    # One bad invoice must not stop the rest of the job
+                    logger.error("invoice_reprocess_error", invoice_id=invoice_id, error=str(e))
+                    result = ReprocessInvoiceResult(
+                        invoice_id=invoice_id, status="failed", error=str(e)
+                    )
+            job.results.append(result)
+
+        try:
+            await asyncio.gather(*(worker(i) for i in job.invoice_ids))
+            job.status = "completed"
+        except Exception as e:
+            job.status = "failed"
+            logger.error("reprocess_invoices_failed", job_id=job.job_id, error=str(e))
+        finally:
+            job.finished_at = datetime.utcnow()
+
+        if not job.dry_run and job.count("changed"):
+            try:
+                indexer = await self._get_indexer()
+                indexer.schedule_item_indexing()
+            except Exception as e:
+                logger.warning("reprocess_indexing_not_scheduled", error=str(e))
+
+        logger.info(
+            "reprocess_invoices_complete",
+            job_id=job.job_id,
+            changed=job.count("changed"),
+            unchanged=job.count("unchanged"),
+            skipped=job.count("skipped"),
+            failed=job.count("failed"),
+        )
+        return job
+
+    async def _reprocess_one(
+        self,
+        invoice_id: int,
+        request: ReprocessInvoicesRequest,
+    ) -> ReprocessInvoiceResult:
+        """Re-parse one invoice and store or report the difference."""
+        store = await self._get_invoice_store()
+        old = await store.get_invoice(invoice_id)
+        if old is None:
+            return ReprocessInvoiceResult(
+                invoice_id=invoice_id, status="failed", error="Invoice not found"
+            )
+        if not old.is_latest:
+            return ReprocessInvoiceResult(
+                invoice_id=invoice_id, status="skipped", error="Invoice is not the latest version"
+            )
+        if old.doc_id is None:
+            return ReprocessInvoiceResult(
+                invoice_id=invoice_id, status="failed", error="Invoice has no source document"
+            )
+
+        doc_store = await self._get_document_store()
+        document = await doc_store.get_document(old.doc_id)
+        if document is None:
+            return ReprocessInvoiceResult(
+                invoice_id=invoice_id, status="failed", error="Source document not found"
+            )
+
+        hints: dict[str, Any] = {"no_cache": True}
+        if not request.read_source_file:
+            # An explicit None keeps parse_document from pointing the layout
+            # and vision parsers at the source PDF
+            hints["pdf_path"] = None
+
+        try:
+            pages = await doc_store.get_pages(old.doc_id)
+            parsed = await self._get_parser().parse_document(
+                document, pages, hints, save_result=False
+            )
+        except ParserError as e:
+            logger.warning("invoice_reprocess_failed", invoice_id=invoice_id, error=str(e))
+            return ReprocessInvoiceResult(invoice_id=invoice_id, status="failed", error=str(e))
+
+        new = parsed.invoice
+        if new is None:
+            return ReprocessInvoiceResult(
+                invoice_id=invoice_id, status="failed", error="Parser returned no invoice"
+            )
+        if not new.items and parsed.items:
+            new.items = parsed.items
+
+        changes = {
+            name: {"old": _value(old, name), "new": _value(new, name)}
+            for name in DIFF_FIELDS
+            if _value(old, name) != _value(new, name)
+        }
+        old_items, new_items = _item_keys(old), _item_keys(new)
+        added = sum((new_items - old_items).values())
+        removed = sum((old_items - new_items).values())
+        changed = bool(changes or added or removed)
+
+        result = ReprocessInvoiceResult(
+            invoice_id=invoice_id,
+            status="changed" if changed else "unchanged",
+            parser_name=new.parser_name,
+            changes=changes,
+            items_added=added,
+            items_removed=removed,
+        )
+
+        target = old
+        if changed:
+            target = new
+            if not request.dry_run:
+                try:
+                    target = await store.replace_invoice(invoice_id, new)
+                except InvoiceNotLatestError:
+                    # Replaced by an overlapping job since it was read
+                    result.status = "skipped"
+                    result.error = "Invoice is not the latest version"
+                    return result
+                result.new_invoice_id = target.id
+
+        if request.re_audit:
+            audit = await self._get_auditor().audit_invoice(
+                target, use_llm=request.use_llm, save_result=False
+            )
+            if not request.dry_run:
+                await store.create_audit_result(audit)
+            result.audit_passed = audit.passed
+
+        return result
+
+    def to_response(self, job: ReprocessJob) -> ReprocessJobResponse:
+        """Convert to API response format."""
+        return ReprocessJobResponse(
+            job_id=job.job_id,
+            status=job.status,
+            dry_run=job.dry_run,
+            total=len(job.invoice_ids),
+            processed=len(job.results),
+            changed=job.count("changed"),
+            unchanged=job.count("unchanged"),
+            skipped=job.count("skipped"),
+            failed=job.count("failed"),
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            results=list(job.results),
+        )
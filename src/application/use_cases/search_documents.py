@@ -91,7 +91,7 @@ class SearchDocumentsUseCase:
         self,
         query: str,
         top_k: int = 5,
-        max_context_length: int = 4000,
+        max_context_tokens: int | None = None,
     ) -> SearchContext:
         """
         Search and prepare context for RAG.
@@ -102,7 +102,7 @@ class SearchDocumentsUseCase:
         return await search.search_for_rag(
             query=query,
             top_k=top_k,
-            max_context_length=max_context_length,
+            max_context_tokens=max_context_tokens,
         )
 
     def to_response(self, result: SearchResultDTO) -> SearchResponse:
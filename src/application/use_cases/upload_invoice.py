@@ -55,8 +55,9 @@ class UploadInvoiceUseCase:
     2. Extract text from PDF
     3. Parse invoice using parser service
     4. Store invoice in database
-    5. Optionally audit invoice
-    6. Index document for search
+    5. Queue the new line items for the items vector index
+    6. Optionally audit invoice
+    7. Index document for search
     """
 
     def __init__(
@@ -165,6 +166,9 @@ class UploadInvoiceUseCase:
             inv_store = await self._get_invoice_store()
             await inv_store.save_invoice(invoice)  # type: ignore[attr-defined]
 
+            # Embed the new line items in the background
+            indexer.schedule_item_indexing()
+
             # Optional audit
             audit_result = None
             if request.auto_audit:
@@ -24,6 +24,34 @@ class LLMSettings(BaseSettings):
     max_tokens: int = 4096
     temperature: float = 0.1
 
+    # HTTP connection pool (Ollama)
+    pool_max_connections: int = 10
+    pool_max_keepalive: int = 5
+    pool_keepalive_expiry: float = 60.0
+    connect_timeout: float = 5.0
+    health_timeout: float = 10.0
+    vision_timeout: int = 180
+
+    # Prompt-prefix reuse: how long Ollama keeps the model and its KV cache
+    # loaded between requests, and llama.cpp's in-memory prompt cache size
+    keep_alive: str = "30m"
+    prompt_cache_mb: int = 512
+
+    # llama.cpp worker pool: model instances and CPU threads each (0 = share cores)
+    llama_workers: int = 1
+    llama_threads_per_worker: int = 0
+
+    # Request scheduler (shared GPU): total slots, per-class caps, max queue wait.
+    # With llama_cpp and llama_workers > 1, slots and caps are at least llama_workers.
+    scheduler_max_concurrency: int = 1
+    scheduler_interactive_concurrency: int = 1
+    scheduler_ingest_concurrency: int = 1
+    scheduler_background_concurrency: int = 1
+    scheduler_interactive_deadline: float = 30.0
+    scheduler_ingest_deadline: float = 300.0
+    scheduler_background_deadline: float = 600.0
+    scheduler_max_queue: int = 64
+
     # Circuit breaker settings
     failure_threshold: int = 3
     cooldown_seconds: int = 60
@@ -63,6 +91,13 @@ class StorageSettings(BaseSettings):
     pool_size: int = 5
     busy_timeout: int = 30000  # ms
 
+    # Streaming index rebuild
+    rebuild_batch_size: int = 256  # rows embedded per batch
+    rebuild_checkpoint_rows: int = 10000  # rows between on-disk checkpoints
+    rebuild_lock_stale_seconds: float = 600.0  # idle is_building lock a rebuild may take over
+    index_persist_rows: int = 5000  # rows appended between index saves when indexing incrementally
+    index_refresh_seconds: float = 5.0  # how often to look for a newer index generation
+
     @property
     def db_path(self) -> Path:
         return self.data_dir / self.db_name
@@ -91,10 +126,17 @@ class SearchSettings(BaseSettings):
     reranker_model: str = "BAAI/bge-reranker-v2-m3"
     reranker_top_k: int = 10
 
-    # Chunking
+    # Chunking ("tokens" uses the embedding model tokenizer; sizes in chars for "chars")
+    chunk_strategy: Literal["tokens", "chars"] = "tokens"
+    chunk_max_tokens: int = 512
+    chunk_overlap_tokens: int = 64
     chunk_size: int = 512
     chunk_overlap: int = 50
 
+    # RAG context packing (token budget and near-duplicate word containment)
+    rag_context_tokens: int = 1500
+    rag_duplicate_threshold: float = 0.85
+
 
 class ParserSettings(BaseSettings):
     """Invoice parser configuration."""
@@ -104,15 +146,32 @@ class ParserSettings(BaseSettings):
     # Template matching
     template_dir: Path = Path("templates/companies")
     template_min_confidence: float = 0.7
+    template_cache_size: int = 1024  # Detection results kept (LRU)
+    template_reload_interval: float = 2.0  # Seconds between template dir checks, 0 = never
 
     # Table parsing
     min_column_gap: int = 2
     header_search_lines: int = 50
 
+    # CPU-bound parsers (template, table) run in worker processes, 0 = on the event loop
+    cpu_workers: int = 2
+    # Seconds a parser may take per document; parsers not listed have no limit
+    budget_seconds: dict[str, float] = Field(
+        default_factory=lambda: {"template": 10.0, "table_aware": 30.0, "vision": 900.0}
+    )
+    # Invoices re-parsed concurrently by POST /api/invoices/reprocess
+    reprocess_workers: int = 4
+
     # Vision fallback
     vision_enabled: bool = True
     vision_min_confidence: float = 0.6
 
+    # Multi-page vision: render resolution, render processes, pages in flight
+    vision_dpi: int = 150
+    vision_render_workers: int = 2
+    vision_page_concurrency: int = 4
+    vision_max_pages: int = 20
+
 
 class APISettings(BaseSettings):
     """API server configuration."""
@@ -153,9 +212,20 @@ class CacheSettings(BaseSettings):
     search_cache_size: int = 1000
     search_cache_ttl: int = 300  # seconds
 
-    # Disk cache
+    # LLM response cache (SQLite, low-temperature calls only)
+    llm_cache_enabled: bool = True
+    llm_cache_ttl: int = 7 * 24 * 3600  # seconds
+    llm_cache_max_entries: int = 5000
+    llm_cache_max_temperature: float = 0.3
+
+    # Vision extraction cache (disk, keyed by image hash + model + prompt)
     vision_cache_enabled: bool = True
     vision_cache_dir: Path = Path("data/cache/vision")
+    vision_cache_max_mb: int = 256
+
+    # Parser result cache (SQLite, keyed by text, hints and parser versions)
+    parser_cache_enabled: bool = True
+    parser_cache_max_entries: int = 20000
 
 
 class Settings(BaseSettings):
@@ -164,10 +164,14 @@ class Invoice(BaseModel):
 
     # Parsing metadata
     parser_version: str = "v1.0"
+    parser_name: str | None = None
     template_id: str | None = None
     parsing_status: ParsingStatus = ParsingStatus.OK
     error_message: str | None = None
 
+    # Versioning: reprocessing stores a new version and clears this flag on the old one
+    is_latest: bool = True
+
     # Line items
     items: list[LineItem] = Field(default_factory=list)
 
@@ -136,6 +136,7 @@ class ChatSession(BaseModel):
     # Summary for long conversations
     conversation_summary: str | None = None
     summary_message_count: int = 0
+    summary_last_message_id: int | None = None
 
     # Token tracking
     total_tokens: int = 0
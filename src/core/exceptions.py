@@ -59,6 +59,17 @@ class InvoiceNotFoundError(StorageError):
         )
 
 
+class InvoiceNotLatestError(StorageError):
+    """Invoice is missing or was superseded by a newer version."""
+
+    def __init__(self, invoice_id: int):
+        super().__init__(
+            f"Invoice is not the latest version: {invoice_id}",
+            code="INVOICE_NOT_LATEST",
+            details={"invoice_id": invoice_id},
+        )
+
+
 class SessionNotFoundError(StorageError):
     """Chat session not found."""
 
@@ -215,6 +226,22 @@ class CircuitBreakerOpenError(LLMError):
         )
 
 
+class LLMOverloadedError(LLMError):
+    """LLM request shed because it could not be scheduled in time."""
+
+    def __init__(self, priority: str, waited_seconds: float, queue_depth: int):
+        super().__init__(
+            f"LLM busy: {priority} request shed after {waited_seconds:.1f}s "
+            f"({queue_depth} queued)",
+            code="LLM_OVERLOADED",
+            details={
+                "priority": priority,
+                "waited_seconds": round(waited_seconds, 3),
+                "queue_depth": queue_depth,
+            },
+        )
+
+
 # Parser Exceptions
 class ParserError(SRGError):
     """Base exception for parsing operations."""
@@ -3,12 +3,18 @@
 from src.core.interfaces.inventory_store import IInventoryStore
 from src.core.interfaces.llm import (
     HealthStatus,
+    IChunker,
     IEmbeddingProvider,
     ILLMProvider,
     IVisionProvider,
+    LLMPriority,
     LLMProvider,
     LLMResponse,
     VisionResponse,
+    current_llm_priority,
+    llm_cache_bypassed,
+    llm_priority,
+    no_llm_cache,
 )
 from src.core.interfaces.material_store import IMaterialStore
 from src.core.interfaces.parser import (
@@ -40,10 +46,16 @@ __all__ = [
     "ILLMProvider",
     "IVisionProvider",
     "IEmbeddingProvider",
+    "IChunker",
     "LLMProvider",
     "LLMResponse",
     "VisionResponse",
     "HealthStatus",
+    "no_llm_cache",
+    "llm_cache_bypassed",
+    "LLMPriority",
+    "llm_priority",
+    "current_llm_priority",
     # Storage interfaces
     "IInventoryStore",
     "ISalesStore",
@@ -5,7 +5,9 @@ Defines contracts that Ollama and llama-cpp implementations must fulfill.
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
 
@@ -54,6 +56,58 @@ class HealthStatus:
     response_time_ms: float | None = None
 
 
+class LLMPriority(str, Enum):
+    """Scheduling class of an LLM call, highest priority first."""
+
+    INTERACTIVE = "interactive"
+    INGEST = "ingest"
+    BACKGROUND = "background"
+
+
+_llm_priority: ContextVar[LLMPriority | None] = ContextVar("llm_priority", default=None)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """
+    Run LLM calls made inside this block under the given scheduling class.
+
+    Untagged text calls are treated as interactive and vision calls as ingest.
+    """
+    token = _llm_priority.set(priority)
+    try:
+        yield
+    finally:
+        _llm_priority.reset(token)
+
+
+def current_llm_priority() -> LLMPriority | None:
+    """Scheduling class set by the innermost ``llm_priority()`` block, if any."""
+    return _llm_priority.get()
+
+
+_llm_cache_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+
+
+@contextmanager
+def no_llm_cache() -> Iterator[None]:
+    """
+    Skip response caching for LLM calls made inside this block.
+
+    Caching providers always call the model and don't store the result.
+    """
+    token = _llm_cache_bypass.set(True)
+    try:
+        yield
+    finally:
+        _llm_cache_bypass.reset(token)
+
+
+def llm_cache_bypassed() -> bool:
+    """Whether the current call is inside a ``no_llm_cache()`` block."""
+    return _llm_cache_bypass.get()
+
+
 class ILLMProvider(ABC):
     """
     Abstract interface for LLM providers.
@@ -66,8 +120,8 @@ class ILLMProvider(ABC):
         self,
         prompt: str,
         system_prompt: str | None = None,
-        temperature: float = 0.7,
-        max_tokens: int = 2048,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
         stop: list[str] | None = None,
     ) -> LLMResponse:
         """
@@ -76,8 +130,8 @@ class ILLMProvider(ABC):
         Args:
             prompt: User prompt
             system_prompt: Optional system prompt
-            temperature: Sampling temperature (0-2)
-            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0-2), None for the provider default
+            max_tokens: Maximum tokens to generate, None for the provider default
             stop: Stop sequences
 
         Returns:
@@ -90,9 +144,9 @@ class ILLMProvider(ABC):
         self,
         prompt: str,
         system_prompt: str | None = None,
-        temperature: float = 0.7,
-        max_tokens: int = 2048,
-    ) -> AsyncIterator[str]:
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncGenerator[str, None]:
         """
         Generate text with streaming output.
 
@@ -105,22 +159,54 @@ class ILLMProvider(ABC):
     async def chat(
         self,
         messages: list[dict[str, str]],
-        temperature: float = 0.7,
-        max_tokens: int = 2048,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
     ) -> LLMResponse:
         """
         Chat completion with message history.
 
         Args:
             messages: List of {"role": "user"|"assistant"|"system", "content": "..."}
-            temperature: Sampling temperature
-            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature, None for the provider default
+            max_tokens: Maximum tokens to generate, None for the provider default
 
         Returns:
             LLMResponse with assistant reply
         """
         pass
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Chat completion with streaming output.
+
+        Providers that can stream chat should override this; the default
+        yields the whole ``chat`` reply as one chunk.
+
+        Yields:
+            Text chunks as they're generated
+        """
+        response = await self.chat(messages, temperature=temperature, max_tokens=max_tokens)
+        yield response.text
+
+    def count_tokens(self, texts: list[str]) -> list[int] | None:
+        """
+        Count model tokens for each text.
+
+        Providers with a local tokenizer override this; the default has none.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            Token count per text, or None if the provider has no tokenizer
+        """
+        return None
+
     @abstractmethod
     async def check_health(self) -> HealthStatus:
         """
@@ -252,3 +338,35 @@ class IEmbeddingProvider(ABC):
             True if model is ready
         """
         pass
+
+    @abstractmethod
+    def count_tokens(self, texts: list[str]) -> list[int]:
+        """
+        Count model tokens for each text in one tokenizer call.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            Token count per text (special tokens excluded)
+        """
+        pass
+
+
+class IChunker(ABC):
+    """
+    Abstract interface for splitting page text into embedding chunks.
+    """
+
+    @abstractmethod
+    def split_batch(self, texts: list[str]) -> list[list[str]]:
+        """
+        Split several texts into chunks.
+
+        Args:
+            texts: Texts to split (e.g. one per page)
+
+        Returns:
+            Chunk texts for each input, in input order
+        """
+        pass
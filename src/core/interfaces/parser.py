@@ -5,6 +5,7 @@ Defines contracts for template, table-aware, and vision parsers.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -68,6 +69,25 @@ class IInvoiceParser(ABC):
         """
         pass
 
+    @property
+    def version(self) -> str:
+        """
+        Version of the parser's extraction logic.
+
+        Part of the parser result cache key; change it whenever the same
+        input would produce a different result.
+        """
+        return "1"
+
+    def worker_factory(self) -> "Callable[[], IInvoiceParser] | None":
+        """
+        Picklable callable that builds this parser in a worker process.
+
+        CPU-bound parsers return one so the registry can run them off
+        the event loop; None (the default) keeps parsing on the loop.
+        """
+        return None
+
     @abstractmethod
     async def parse(
         self,
@@ -5,6 +5,7 @@ Defines contracts for document, invoice, session, and vector stores.
 """
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import Any
 
 from src.core.entities.company_document import CompanyDocument
@@ -160,6 +161,24 @@ class IInvoiceStore(ABC):
         """Search invoices by invoice_no, seller, or buyer."""
         pass
 
+    @abstractmethod
+    async def find_invoice_ids(
+        self,
+        company_key: str | None = None,
+        seller_name: str | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        parser_name: str | None = None,
+        limit: int = 1000,
+    ) -> list[int]:
+        """IDs of the latest invoices matching all given filters."""
+        pass
+
+    @abstractmethod
+    async def replace_invoice(self, invoice_id: int, invoice: Invoice) -> Invoice:
+        """Store a new version of an invoice; the old one stops being latest."""
+        pass
+
     # Audit operations
     @abstractmethod
     async def create_audit_result(self, result: AuditResult) -> AuditResult:
@@ -225,6 +244,14 @@ class ISessionStore(ABC):
         """Get session by ID with messages."""
         pass
 
+    async def get_session_header(self, session_id: str) -> ChatSession | None:
+        """
+        Get session fields without messages or memory facts.
+
+        Stores that can skip loading them should override this.
+        """
+        return await self.get_session(session_id)
+
     @abstractmethod
     async def update_session(self, session: ChatSession) -> ChatSession:
         """Update session metadata."""
@@ -261,12 +288,25 @@ class ISessionStore(ABC):
         """Get messages for session."""
         pass
 
+    @abstractmethod
+    async def count_messages(self, session_id: str) -> int:
+        """Count messages in a session."""
+        pass
+
     # Memory operations
     @abstractmethod
     async def save_memory_fact(self, fact: MemoryFact) -> MemoryFact:
         """Save or update memory fact."""
         pass
 
+    async def save_memory_facts(self, facts: list[MemoryFact]) -> list[MemoryFact]:
+        """
+        Insert several new memory facts.
+
+        Stores that can write them in one transaction should override this.
+        """
+        return [await self.save_memory_fact(fact) for fact in facts]
+
     @abstractmethod
     async def get_memory_facts(
         self,
@@ -306,8 +346,14 @@ class IVectorStore(ABC):
         index_name: str,
         embeddings: Any,  # np.ndarray
         ids: list[int],
+        persist: bool = True,
     ) -> bool:
-        """Add vectors to existing index (incremental)."""
+        """
+        Add vectors to existing index (incremental).
+
+        With persist=False the index is only written by a later save_index(),
+        for callers that checkpoint a batch themselves.
+        """
         pass
 
     @abstractmethod
@@ -340,6 +386,39 @@ class IVectorStore(ABC):
         """Load index from disk."""
         pass
 
+    # Zero-downtime rebuilds
+    @abstractmethod
+    async def begin_rebuild(self, index_name: str, resume: bool = False) -> Any:
+        """
+        Start building a new generation of an index off to the side.
+
+        The live index keeps serving searches until commit_rebuild().
+
+        Returns:
+            Opaque build handle for stage_vectors() / commit_rebuild()
+        """
+        pass
+
+    @abstractmethod
+    async def stage_vectors(
+        self,
+        build: Any,
+        embeddings: Any,  # np.ndarray
+        ids: list[int],
+    ) -> None:
+        """Append vectors to an in-progress rebuild."""
+        pass
+
+    @abstractmethod
+    async def commit_rebuild(self, build: Any) -> int:
+        """
+        Atomically swap a finished rebuild in as the live index.
+
+        Returns:
+            The new index generation number (0 if nothing was built)
+        """
+        pass
+
     # ID mapping
     @abstractmethod
     async def save_id_mapping(
@@ -10,11 +10,15 @@ NO infrastructure imports. All dependencies injected via constructor.
 """
 
 from src.core.services.catalog_matcher import CatalogMatcher, MatchCandidate
-from src.core.services.chat_service import ChatService
+from src.core.services.chat_service import ChatService, SessionInfo
+from src.core.services.chunking import CharChunker, TokenChunker
+from src.core.services.context_packer import ContextPacker, PackedContext
+from src.core.services.conversation_summarizer import ConversationSummarizer
 from src.core.services.document_indexer import DocumentIndexerService
 from src.core.services.invoice_auditor import InvoiceAuditorService
 from src.core.services.invoice_parser import InvoiceParserService
 from src.core.services.material_ingestion import IngestionResult, MaterialIngestionService
+from src.core.services.memory_extractor import MemoryFactExtractor
 from src.core.services.proforma_pdf_service import (
     IProformaPdfRenderer,
     ProformaPdfResult,
@@ -41,10 +45,17 @@ __all__ = [
     # Search
     "SearchService",
     "SearchContext",
+    "ContextPacker",
+    "PackedContext",
     # Chat
     "ChatService",
+    "SessionInfo",
+    "ConversationSummarizer",
+    "MemoryFactExtractor",
     # Document Indexer
     "DocumentIndexerService",
+    "CharChunker",
+    "TokenChunker",
     # Reminder Intelligence
     "ReminderIntelligenceService",
 ]
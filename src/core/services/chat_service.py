@@ -5,9 +5,14 @@ Layer-pure service managing conversations with context-aware responses.
 NO infrastructure imports - depends only on core entities, interfaces, exceptions.
 """
 
-from collections.abc import AsyncIterator
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Awaitable
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 from src.core.entities.session import (
     ChatSession,
@@ -17,11 +22,90 @@ from src.core.entities.session import (
     MessageRole,
 )
 from src.core.exceptions import ChatError
-from src.core.interfaces import ILLMProvider, ISessionStore
+from src.core.interfaces import ILLMProvider, ISessionStore, LLMPriority, llm_priority
+from src.core.services.conversation_summarizer import ConversationSummarizer
+from src.core.services.memory_extractor import MemoryFactExtractor
 
 # Import SearchService for type hints only - it's also a core service
 from src.core.services.search_service import SearchService
 
+DEFAULT_SYSTEM_PROMPT = (
+    "You are an assistant for invoice, catalog and trade-document questions. "
+    "Answer from the provided context when it is relevant and say so when "
+    "the answer is not in it."
+)
+
+# Sessions whose recent messages and history-window anchor are kept in memory
+_MAX_TRACKED_SESSIONS = 1024
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SessionInfo:
+    """Session id, title and message count, without the messages."""
+
+    session_id: str
+    title: str | None
+    message_count: int
+
+
+@dataclass
+class _SessionWindow:
+    """A session header, its most recent messages and its message count."""
+
+    session: ChatSession
+    messages: list[Message] = field(default_factory=list)
+    message_count: int = 0
+
+    def info(self) -> SessionInfo:
+        return SessionInfo(
+            session_id=self.session.session_id,
+            title=self.session.title,
+            message_count=self.message_count,
+        )
+
+
+class _StageTimer:
+    """Wall-clock milliseconds per chat turn stage."""
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+        self.timings: dict[str, float] = {}
+
+    async def run(self, stage: str, awaitable: Awaitable[T]) -> T:
+        """Await a stage and record how long it took."""
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.timings[stage] = round((time.perf_counter() - started) * 1000, 2)
+
+    def mark(self, stage: str) -> None:
+        """Record the time elapsed since the turn started."""
+        self.timings[stage] = round((time.perf_counter() - self._start) * 1000, 2)
+
+
+@dataclass
+class _Turn:
+    """Everything a chat turn needs before generation starts."""
+
+    window: _SessionWindow
+    context: str
+    messages: list[dict[str, str]]
+    timer: _StageTimer
+
+    @property
+    def session(self) -> ChatSession:
+        return self.window.session
+
+    def metadata(self) -> dict[str, Any]:
+        """Assistant message metadata: RAG context and stage timings."""
+        self.timer.mark("total")
+        metadata: dict[str, Any] = {"context_used": self.context} if self.context else {}
+        metadata["timings_ms"] = dict(self.timer.timings)
+        return metadata
+
 
 class ChatService:
     """
@@ -30,10 +114,21 @@ class ChatService:
     Features:
     - Session management
     - Context retrieval via search
-    - Memory fact extraction
+    - Background memory fact extraction
     - Streaming responses
     - Graceful degradation when LLM unavailable
 
+    Turns are sent as structured chat messages behind a fixed system
+    prompt, and the history window only moves forward in steps, so
+    consecutive requests of a session share a long common prefix that
+    the provider's KV/prompt cache can reuse. Messages that leave the
+    window are folded into a rolling summary on the session, which rides
+    on the system prompt.
+
+    Chat turns load the session header and its recent messages once and
+    then keep them in an in-process LRU, appending each new message, so
+    long sessions cost the same per turn as short ones.
+
     Required interfaces for DI:
     - ISessionStore: Session and message persistence
     - ILLMProvider: LLM for responses and fact extraction
@@ -48,6 +143,8 @@ class ChatService:
         max_history_messages: int = 10,
         max_tokens: int = 2048,
         temperature: float = 0.7,
+        memory_extractor: MemoryFactExtractor | None = None,
+        summarizer: ConversationSummarizer | None = None,
     ):
         """
         Initialize chat service with injected dependencies.
@@ -59,6 +156,8 @@ class ChatService:
             max_history_messages: Max messages to include in context
             max_tokens: Default max tokens for LLM responses
             temperature: Default temperature for LLM responses
+            memory_extractor: Background fact extractor (created if omitted)
+            summarizer: Background rolling-summary updater (created if omitted)
         """
         self._store = session_store
         self._llm = llm_provider
@@ -66,6 +165,10 @@ class ChatService:
         self._max_history = max_history_messages
         self._max_tokens = max_tokens
         self._temperature = temperature
+        self._memory = memory_extractor or MemoryFactExtractor(session_store, llm_provider)
+        self._summarizer = summarizer or ConversationSummarizer(session_store, llm_provider)
+        self._window_start: OrderedDict[str, int] = OrderedDict()
+        self._windows: OrderedDict[str, _SessionWindow] = OrderedDict()
 
     async def create_session(
         self,
@@ -94,6 +197,28 @@ class ChatService:
         """Get session by ID."""
         return await self._store.get_session(session_id)
 
+    async def get_session_info(self, session_id: str) -> SessionInfo | None:
+        """
+        Get session id, title and message count.
+
+        Served from the turn window when the session is tracked; otherwise
+        reads the session header and a message count, never the messages.
+        """
+        window = self._windows.get(session_id)
+        if window is not None:
+            return window.info()
+        session, message_count = await asyncio.gather(
+            self._store.get_session_header(session_id),
+            self._store.count_messages(session_id),
+        )
+        if not session:
+            return None
+        return SessionInfo(
+            session_id=session.session_id,
+            title=session.title,
+            message_count=message_count,
+        )
+
     async def list_sessions(
         self,
         limit: int = 20,
@@ -104,8 +229,107 @@ class ChatService:
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session and its messages."""
+        self._windows.pop(session_id, None)
+        self._window_start.pop(session_id, None)
         return await self._store.delete_session(session_id)
 
+    async def _open_session(self, session_id: str | None) -> _SessionWindow:
+        """Session header and recent messages, from the LRU or the store."""
+        if session_id is None:
+            return self._track(_SessionWindow(await self.create_session()))
+
+        window = self._windows.get(session_id)
+        if window is not None:
+            self._windows.move_to_end(session_id)
+            return window
+
+        session, messages, message_count = await asyncio.gather(
+            self._store.get_session_header(session_id),
+            self._store.get_messages(session_id, limit=self._window_capacity),
+            self._store.count_messages(session_id),
+        )
+        if not session:
+            raise ChatError(f"Session not found: {session_id}")
+        return self._track(_SessionWindow(session, messages, message_count))
+
+    @property
+    def _window_capacity(self) -> int:
+        return max(1, 2 * self._max_history)
+
+    def _track(self, window: _SessionWindow) -> _SessionWindow:
+        self._windows[window.session.session_id] = window
+        self._windows.move_to_end(window.session.session_id)
+        if len(self._windows) > _MAX_TRACKED_SESSIONS:
+            self._windows.popitem(last=False)
+        return window
+
+    def _record(self, window: _SessionWindow, message: Message) -> None:
+        """Append a saved message to the in-memory window."""
+        window.messages.append(message)
+        window.message_count += 1
+        del window.messages[:-self._window_capacity]
+
+    async def _retrieve(self, message: str, top_k: int) -> str:
+        """RAG context for the message, or "" when retrieval fails."""
+        if self._search is None:
+            return ""
+        try:
+            search_context = await self._search.search_for_rag(query=message, top_k=top_k)
+            return search_context.formatted_context
+        except Exception:
+            # Graceful degradation - continue without RAG
+            return ""
+
+    async def _prepare_turn(
+        self,
+        message: str,
+        session_id: str | None,
+        use_rag: bool,
+        top_k: int,
+    ) -> _Turn:
+        """
+        Run the pre-generation stages of a chat turn.
+
+        Retrieval depends only on the message text, so it starts first and
+        overlaps the session/history load and the user-message insert; the
+        prompt is built once all three are done.
+        """
+        timer = _StageTimer()
+        retrieval: asyncio.Future[str] | None = None
+        if use_rag and self._search is not None:
+            retrieval = asyncio.ensure_future(timer.run("retrieval", self._retrieve(message, top_k)))
+        try:
+            window = await timer.run("session", self._open_session(session_id))
+            history = list(window.messages)
+            persist = timer.run(
+                "persist",
+                self._store.add_message(
+                    Message(
+                        session_id=window.session.session_id,
+                        role=MessageRole.USER,
+                        content=message,
+                    )
+                ),
+            )
+            if retrieval is None:
+                user_msg, context = await persist, ""
+            else:
+                user_msg, context = await asyncio.gather(persist, retrieval)
+        except BaseException:
+            if retrieval is not None:
+                retrieval.cancel()
+            raise
+        self._record(window, user_msg)
+
+        messages = self._build_messages(
+            session=window.session,
+            message=message,
+            history=history,
+            context=context,
+        )
+        timer.mark("prompt_ready")
+        return _Turn(window=window, context=context, messages=messages, timer=timer)
+
     async def chat(
         self,
         message: str,
@@ -133,53 +357,19 @@ class ChatService:
 
         message = message.strip()
 
-        # Get or create session
-        if session_id:
-            session = await self._store.get_session(session_id)
-            if not session:
-                raise ChatError(f"Session not found: {session_id}")
-        else:
-            session = await self.create_session()
-
-        # Save user message
-        user_msg = Message(
-            session_id=session.session_id,
-            role=MessageRole.USER,
-            content=message,
-        )
-        user_msg = await self._store.add_message(user_msg)
+        # Session load, retrieval and user-message insert run concurrently
+        turn = await self._prepare_turn(message, session_id, use_rag, top_k)
+        session = turn.session
 
         try:
-            # Build context from RAG
-            context = ""
-            if use_rag and self._search:
-                try:
-                    search_context = await self._search.search_for_rag(
-                        query=message,
-                        top_k=top_k,
-                    )
-                    context = search_context.formatted_context
-                except Exception:
-                    # Graceful degradation - continue without RAG
-                    pass
-
-            # Get conversation history
-            history = await self._store.get_messages(
-                session.session_id, limit=self._max_history
-            )
-
-            # Build prompt
-            prompt = self._build_prompt(
-                message=message,
-                history=history[:-1],  # Exclude just-added user message
-                context=context,
-            )
-
             # Generate response
-            response = await self._llm.generate(
-                prompt,
-                max_tokens=self._max_tokens,
-                temperature=self._temperature,
+            response = await turn.timer.run(
+                "generation",
+                self._llm.chat(
+                    turn.messages,
+                    max_tokens=self._max_tokens,
+                    temperature=self._temperature,
+                ),
             )
             response_text = response.text
 
@@ -188,12 +378,13 @@ class ChatService:
                 session_id=session.session_id,
                 role=MessageRole.ASSISTANT,
                 content=response_text,
-                metadata={"context_used": context} if context else {},
+                metadata=turn.metadata(),
             )
             assistant_msg = await self._store.add_message(assistant_msg)
+            self._record(turn.window, assistant_msg)
 
-            # Extract and save memory facts (non-blocking, graceful)
-            await self._extract_memory_facts(session.session_id, message, response_text)
+            # Extract memory facts in the background
+            self._memory.submit(session.session_id, message, response_text)
 
             # Update session timestamp
             session.updated_at = datetime.now()
@@ -210,7 +401,7 @@ class ChatService:
         session_id: str | None = None,
         use_rag: bool = True,
         top_k: int = 5,
-    ) -> AsyncIterator[str]:
+    ) -> AsyncGenerator[str, None]:
         """
         Stream a chat response.
 
@@ -231,66 +422,55 @@ class ChatService:
 
         message = message.strip()
 
-        # Get or create session
-        if session_id:
-            session = await self._store.get_session(session_id)
-            if not session:
-                raise ChatError(f"Session not found: {session_id}")
-        else:
-            session = await self.create_session()
-
-        # Save user message
-        user_msg = Message(
-            session_id=session.session_id,
-            role=MessageRole.USER,
-            content=message,
-        )
-        await self._store.add_message(user_msg)
+        # Session load, retrieval and user-message insert run concurrently
+        turn = await self._prepare_turn(message, session_id, use_rag, top_k)
+        session = turn.session
 
         try:
-            # Build context from RAG
-            context = ""
-            if use_rag and self._search:
-                try:
-                    search_context = await self._search.search_for_rag(
-                        query=message,
-                        top_k=top_k,
-                    )
-                    context = search_context.formatted_context
-                except Exception:
-                    pass
-
-            # Get history
-            history = await self._store.get_messages(
-                session.session_id, limit=self._max_history
-            )
-
-            # Build prompt
-            prompt = self._build_prompt(
-                message=message,
-                history=history[:-1],
-                context=context,
-            )
-
             # Stream response
             full_response = ""
-
-            async for chunk in self._llm.generate_stream(
-                prompt,
-                max_tokens=self._max_tokens,
-                temperature=self._temperature,
-            ):
-                full_response += chunk
-                yield chunk
+            generation_started = time.perf_counter()
+
+            try:
+                async with aclosing(
+                    self._llm.chat_stream(
+                        turn.messages,
+                        max_tokens=self._max_tokens,
+                        temperature=self._temperature,
+                    )
+                ) as stream:
+                    async for chunk in stream:
+                        if not full_response:
+                            turn.timer.mark("first_token")
+                        full_response += chunk
+                        yield chunk
+            except (asyncio.CancelledError, GeneratorExit):
+                # Consumer went away; generation upstream is already stopped.
+                # Keep what the user saw so the history stays consistent.
+                if full_response:
+                    partial = await self._store.add_message(
+                        Message(
+                            session_id=session.session_id,
+                            role=MessageRole.ASSISTANT,
+                            content=full_response,
+                            metadata={**turn.metadata(), "partial": True},
+                        )
+                    )
+                    self._record(turn.window, partial)
+                raise
+            turn.timer.timings["generation"] = round(
+                (time.perf_counter() - generation_started) * 1000, 2
+            )
 
             # Save complete response
             assistant_msg = Message(
                 session_id=session.session_id,
                 role=MessageRole.ASSISTANT,
                 content=full_response,
-                metadata={"context_used": context} if context else {},
+                metadata=turn.metadata(),
             )
-            await self._store.add_message(assistant_msg)
+            assistant_msg = await self._store.add_message(assistant_msg)
+            self._record(turn.window, assistant_msg)
 
             # Update session timestamp
             session.updated_at = datetime.now()
@@ -299,79 +479,68 @@ class ChatService:
         except Exception as e:
             raise ChatError(f"Chat stream failed: {str(e)}")
 
-    def _build_prompt(
+    def _build_messages(
         self,
+        session: ChatSession,
         message: str,
         history: list[Message],
         context: str = "",
-    ) -> str:
-        """Build prompt with history and context."""
-        parts = []
+    ) -> list[dict[str, str]]:
+        """
+        Build chat messages: system prompt, history window, current turn.
 
-        # System context from RAG
-        if context:
-            parts.append(
-                f"Use the following context to help answer the question:\n\n{context}\n\n---\n"
+        The rolling summary of older turns is appended to the system
+        prompt. RAG context rides on the current user turn only, so
+        earlier turns are resent exactly as before.
+        """
+        system_prompt = session.system_prompt or DEFAULT_SYSTEM_PROMPT
+        if session.conversation_summary:
+            system_prompt += (
+                f"\n\nSummary of the earlier conversation:\n{session.conversation_summary}"
             )
+        messages = [{"role": "system", "content": system_prompt}]
 
-        # Conversation history
-        if history:
-            parts.append("Previous conversation:\n")
-            for msg in history[-6:]:  # Last 6 messages
-                role = "User" if msg.role == MessageRole.USER else "Assistant"
-                parts.append(f"{role}: {msg.content}\n")
-            parts.append("\n")
-
-        # Current message
-        parts.append(f"User: {message}\n\nAssistant:")
-
-        return "".join(parts)
-
-    async def _extract_memory_facts(
-        self,
-        session_id: str,
-        user_message: str,
-        assistant_response: str,
-    ) -> None:
-        """Extract and save memory facts from conversation."""
-        try:
-            prompt = f"""Extract key facts from this conversation that might be useful later.
-
-User: {user_message}
-Assistant: {assistant_response}
+        for msg in self._history_window(session, history):
+            if msg.role in (MessageRole.USER, MessageRole.ASSISTANT):
+                messages.append({"role": msg.role.value, "content": msg.content})
 
-List only important facts (entities, numbers, decisions).
-Format: One fact per line, starting with "- ".
-If no important facts, respond with "NONE".
+        if context:
+            message = (
+                f"Use the following context to help answer the question:\n\n{context}"
+                f"\n\n---\n\n{message}"
+            )
+        messages.append({"role": "user", "content": message})
 
-Facts:"""
+        return messages
 
-            llm_response = await self._llm.generate(
-                prompt,
-                max_tokens=200,
-                temperature=0.1,
-            )
-            response = llm_response.text
-
-            if "NONE" in response.upper():
-                return
-
-            for line in response.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("- "):
-                    fact_text = line[2:].strip()
-                    if fact_text and len(fact_text) > 5:
-                        fact = MemoryFact(
-                            session_id=session_id,
-                            fact_type=MemoryFactType.ENTITY,
-                            key=f"extracted_{hash(fact_text) % 10000}",
-                            value=fact_text,
-                        )
-                        await self._store.save_memory_fact(fact)
+    def _history_window(self, session: ChatSession, history: list[Message]) -> list[Message]:
+        """
+        Recent history starting at a per-session anchor message.
 
-        except Exception:
-            # Graceful degradation - memory extraction is optional
-            pass
+        A plain "last N messages" window shifts every turn and invalidates
+        the cached prompt prefix. Instead the window grows from its anchor
+        and, once longer than ``max_history``, jumps forward to keep the
+        newest half; the messages it leaves behind go to the summarizer.
+        """
+        session_id = session.session_id
+        start = self._window_start.get(session_id)
+        window = [m for m in history if start is None or m.id is None or m.id >= start]
+
+        if len(window) > self._max_history:
+            keep = max(1, self._max_history // 2)
+            self._summarizer.submit(session, window[:-keep])
+            window = window[-keep:]
+        if window and window[0].id is not None:
+            self._window_start[session_id] = window[0].id
+            self._window_start.move_to_end(session_id)
+            if len(self._window_start) > _MAX_TRACKED_SESSIONS:
+                self._window_start.popitem(last=False)
+
+        return window
+
+    async def flush_memory_extraction(self) -> None:
+        """Wait for queued memory fact extraction and summary updates to finish."""
+        await asyncio.gather(self._memory.flush(), self._summarizer.flush())
 
     async def get_session_facts(self, session_id: str) -> list[MemoryFact]:
         """Get all memory facts for a session."""
@@ -411,11 +580,12 @@ Facts:"""
 Summary:"""
 
         try:
-            summary_response = await self._llm.generate(
-                prompt,
-                max_tokens=150,
-                temperature=0.3,
-            )
+            with llm_priority(LLMPriority.BACKGROUND):
+                summary_response = await self._llm.generate(
+                    prompt,
+                    max_tokens=150,
+                    temperature=0.3,
+                )
             return summary_response.text.strip()
         except Exception:
             return "Unable to generate summary"
@@ -0,0 +1,178 @@
+"""
+Text chunking strategies for the document indexer.
+
+Layer-pure: token counts come from an injected callable, normally the
+embedding provider's tokenizer.
+NO infrastructure imports - depends only on core interfaces.
+"""
+
+import math
+import re
+from collections.abc import Callable
+
+from src.core.interfaces import IChunker
+
+# Sentence ends followed by whitespace (Latin/Arabic), CJK full stops
+# (no trailing space needed), and line breaks
+_SENTENCE_END = re.compile(r"[.!?؟](?=\s)\s*|[。！？]\s*|\n\s*")
+
+
+def split_sentences(text: str) -> list[str]:
+    """
+    Split text into sentences, keeping each sentence's trailing whitespace.
+
+    Joining the pieces back together reproduces the original text, so
+    chunks built from them keep the page's own spacing and line breaks.
+    """
+    pieces = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        pieces.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        pieces.append(text[start:])
+    return [p for p in pieces if p.strip()]
+
+
+class CharChunker(IChunker):
+    """
+    Character-budget chunker.
+
+    Packs sentences up to ``chunk_size`` characters and prefixes each chunk
+    with the last ``overlap`` characters of the previous one. Used when no
+    tokenizer is available.
+    """
+
+    def __init__(self, chunk_size: int = 512, overlap: int = 50):
+        self._chunk_size = chunk_size
+        self._overlap = overlap
+
+    def split_batch(self, texts: list[str]) -> list[list[str]]:
+        return [self.split(text) for text in texts]
+
+    def split(self, text: str) -> list[str]:
+        """Split one text into overlapping chunks."""
+        if len(text) <= self._chunk_size:
+            return [text]
+
+        chunks: list[str] = []
+        current: list[str] = []
+        length = 0
+
+        for sentence in (s.strip() for s in re.split(r"(?<=[.!?])\s+", text)):
+            if not sentence:
+                continue
+            if length + len(sentence) <= self._chunk_size:
+                current.append(sentence)
+                length += len(sentence) + 1
+                continue
+
+            if current:
+                chunks.append(" ".join(current).strip())
+
+            # Start new chunk with overlap from previous
+            if self._overlap > 0 and chunks:
+                current = [chunks[-1][-self._overlap:], sentence]
+            else:
+                current = [sentence]
+            length = sum(len(part) + 1 for part in current)
+
+        if current:
+            chunks.append(" ".join(current).strip())
+
+        return chunks
+
+
+class TokenChunker(IChunker):
+    """
+    Token-budget chunker.
+
+    Packs whole sentences into chunks of at most ``max_tokens`` model
+    tokens, carrying trailing sentences worth up to ``overlap_tokens`` into
+    the next chunk. All sentences of a batch are tokenized in a single
+    ``count_tokens`` call. Sentences longer than the budget are cut at
+    whitespace (or anywhere, for unspaced scripts) into near-equal parts.
+    """
+
+    def __init__(
+        self,
+        count_tokens: Callable[[list[str]], list[int]],
+        max_tokens: int = 512,
+        overlap_tokens: int = 64,
+    ):
+        self._count_tokens = count_tokens
+        self._max_tokens = max(1, max_tokens)
+        self._overlap_tokens = max(0, min(overlap_tokens, self._max_tokens // 2))
+
+    def split_batch(self, texts: list[str]) -> list[list[str]]:
+        sentences = [split_sentences(text) for text in texts]
+        flat = [s.strip() for group in sentences for s in group]
+        counts = iter(self._count_tokens(flat) if flat else [])
+
+        return [
+            self._pack([(s, next(counts)) for s in group])
+            for group in sentences
+        ]
+
+    def _pack(self, sentences: list[tuple[str, int]]) -> list[str]:
+        """Greedily pack (sentence, token count) pairs into chunks."""
+        chunks: list[str] = []
+        current: list[tuple[str, int]] = []
+        used = 0
+
+        for sentence, tokens in self._fit(sentences):
+            if current and used + tokens > self._max_tokens:
+                chunks.append("".join(s for s, _ in current).strip())
+                current, used = self._carry_over(current, tokens)
+            current.append((sentence, tokens))
+            used += tokens
+
+        if current:
+            chunks.append("".join(s for s, _ in current).strip())
+
+        return chunks
+
+    def _carry_over(
+        self,
+        previous: list[tuple[str, int]],
+        next_tokens: int,
+    ) -> tuple[list[tuple[str, int]], int]:
+        """Trailing sentences of the previous chunk to repeat as overlap."""
+        carried: list[tuple[str, int]] = []
+        used = 0
+        for sentence, tokens in reversed(previous):
+            if (
+                used + tokens > self._overlap_tokens
+                or used + tokens + next_tokens > self._max_tokens
+            ):
+                break
+            carried.insert(0, (sentence, tokens))
+            used += tokens
+        return carried, used
+
+    def _fit(self, sentences: list[tuple[str, int]]) -> list[tuple[str, int]]:
+        """Cut sentences longer than the token budget into smaller parts."""
+        fitted = []
+        for sentence, tokens in sentences:
+            if tokens <= self._max_tokens:
+                fitted.append((sentence, tokens))
+                continue
+
+            parts = math.ceil(tokens / self._max_tokens)
+            for piece in _cut(sentence, parts):
+                fitted.append((piece, math.ceil(tokens / parts)))
+        return fitted
+
+
+def _cut(text: str, parts: int) -> list[str]:
+    """Cut text into ``parts`` pieces of similar length, preferring whitespace."""
+    pieces = []
+    start = 0
+    for i in range(1, parts):
+        target = len(text) * i // parts
+        space = text.rfind(" ", start + 1, target + 1)
+        end = space + 1 if space > start else target
+        pieces.append(text[start:end])
+        start = end
+    pieces.append(text[start:])
+    return [p for p in pieces if p.strip()]
@@ -0,0 +1,222 @@
+"""
+Token-budgeted packing of search results into RAG context.
+
+Layer-pure: token counts come from an injected callable, normally the
+LLM's (or embedding model's) tokenizer.
+NO infrastructure imports - depends only on core entities.
+"""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from src.config import get_logger
+from src.core.entities.document import SearchResult
+
+logger = get_logger(__name__)
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# Shortest chunk overlap worth stitching; shorter matches are coincidence
+_MIN_OVERLAP = 20
+
+# Tokens reserved per block for its "[n] " label and separator
+_LABEL_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def stitch(first: str, second: str) -> str:
+    """Join two consecutive chunks, dropping the overlap they share."""
+    limit = min(len(first), len(second))
+    for size in range(limit, _MIN_OVERLAP - 1, -1):
+        if first.endswith(second[:size]):
+            return first + second[size:]
+    return f"{first} {second}"
+
+
+@dataclass
+class _Block:
+    """One or more adjacent chunks of the same page."""
+
+    results: list[SearchResult]
+    text: str
+    words: set[str] = field(default_factory=set)
+
+    @property
+    def key(self) -> tuple[int, int] | None:
+        head = self.results[0]
+        if head.doc_id is None or head.page_no is None:
+            return None
+        return head.doc_id, head.page_no
+
+    @property
+    def first_id(self) -> int:
+        return min(r.chunk_id or 0 for r in self.results)
+
+    @property
+    def last_id(self) -> int:
+        return max(r.chunk_id or 0 for r in self.results)
+
+
+@dataclass
+class PackedContext:
+    """Formatted context and what went into it."""
+
+    text: str
+    tokens: int
+    results: list[SearchResult]
+    dropped_duplicates: int = 0
+    dropped_over_budget: int = 0
+
+
+class ContextPacker:
+    """
+    Packs ranked search results into a prompt context under a token budget.
+
+    Chunks from the same page with consecutive ids are merged into one
+    passage with their shared overlap removed. Passages whose words are
+    mostly contained in a better-ranked passage are dropped. The rest are
+    added in relevance order while they fit; passages that would overflow
+    the budget are skipped whole rather than cut mid-sentence, except that
+    the top passage is trimmed if it alone exceeds the budget.
+    """
+
+    def __init__(
+        self,
+        count_tokens: Callable[[list[str]], list[int]] | None = None,
+        max_tokens: int = 1500,
+        duplicate_threshold: float = 0.85,
+    ):
+        """
+        Initialize packer.
+
+        Args:
+            count_tokens: Batch token counter; falls back to an estimate
+            max_tokens: Default token budget for the packed context
+            duplicate_threshold: Word containment at which a passage is a duplicate
+        """
+        self._count_tokens = count_tokens
+        self._max_tokens = max_tokens
+        self._duplicate_threshold = duplicate_threshold
+
+    def pack(self, results: list[SearchResult], max_tokens: int | None = None) -> PackedContext:
+        """Build the context for results ordered best-first."""
+        budget = max_tokens if max_tokens is not None else self._max_tokens
+
+        blocks = self._merge_adjacent(results)
+        unique = self._drop_duplicates(blocks)
+        dropped_duplicates = len(blocks) - len(unique)
+
+        counts = self._count([b.text for b in unique])
+        parts: list[str] = []
+        included: list[SearchResult] = []
+        used = 0
+        dropped_over_budget = 0
+
+        for block, tokens in zip(unique, counts, strict=True):
+            text = block.text
+            cost = tokens + _LABEL_TOKENS
+            if used + cost > budget:
+                if parts or budget <= _LABEL_TOKENS:
+                    dropped_over_budget += 1
+                    continue
+                # The best passage alone is too long - keep its head
+                text = _trim(text, (budget - _LABEL_TOKENS) / max(1, tokens))
+                cost = budget
+
+            parts.append(f"[{len(parts) + 1}] {text}")
+            included.extend(block.results)
+            used += cost
+
+        return PackedContext(
+            text="\n\n".join(parts),
+            tokens=used,
+            results=included,
+            dropped_duplicates=dropped_duplicates,
+            dropped_over_budget=dropped_over_budget,
+        )
+
+    def _count(self, texts: list[str]) -> list[int]:
+        if not texts:
+            return []
+        if self._count_tokens is not None:
+            try:
+                return self._count_tokens(texts)
+            except Exception as e:
+                logger.warning("context_token_count_failed", error=str(e))
+        return [estimate_tokens(t) for t in texts]
+
+    @staticmethod
+    def _merge_adjacent(results: list[SearchResult]) -> list[_Block]:
+        """Group consecutive chunks of a page, keeping the best rank's position."""
+        blocks: list[_Block] = []
+        for result in results:
+            block = _Block([result], result.text)
+            key = block.key
+            if key is not None and result.chunk_id is not None:
+                target = next(
+                    (
+                        b for b in blocks
+                        if b.key == key
+                        and result.chunk_id in (b.first_id - 1, b.last_id + 1)
+                    ),
+                    None,
+                )
+                if target is not None:
+                    _absorb(target, block)
+                    continue
+            blocks.append(block)
+
+        # A later chunk can bridge two blocks of the same page
+        merged: list[_Block] = []
+        for block in blocks:
+            target = next(
+                (
+                    b for b in merged
+                    if block.key is not None
+                    and b.key == block.key
+                    and (block.first_id == b.last_id + 1 or block.last_id == b.first_id - 1)
+                ),
+                None,
+            )
+            if target is not None:
+                _absorb(target, block)
+            else:
+                merged.append(block)
+        return merged
+
+    def _drop_duplicates(self, blocks: list[_Block]) -> list[_Block]:
+        """Drop passages mostly contained in a better-ranked one."""
+        kept: list[_Block] = []
+        for block in blocks:
+            block.words = set(_WORD.findall(block.text.lower()))
+            if not block.words:
+                continue
+            if any(self._overlaps(block.words, other.words) for other in kept):
+                continue
+            kept.append(block)
+        return kept
+
+    def _overlaps(self, a: set[str], b: set[str]) -> bool:
+        smaller = min(len(a), len(b))
+        return smaller > 0 and len(a & b) / smaller >= self._duplicate_threshold
+
+
+def _absorb(target: _Block, block: _Block) -> None:
+    """Merge block into target in chunk order."""
+    if block.first_id > target.last_id:
+        target.text = stitch(target.text, block.text)
+    else:
+        target.text = stitch(block.text, target.text)
+    target.results.extend(block.results)
+
+
+def _trim(text: str, ratio: float) -> str:
+    """Keep roughly ``ratio`` of text, ending at whitespace."""
+    cut = int(len(text) * max(0.0, ratio))
+    space = text.rfind(" ", 0, cut)
+    return text[: space if space > 0 else cut].rstrip() + "..."
@@ -0,0 +1,132 @@
+"""
+Rolling conversation summaries for chat sessions.
+
+Layer-pure service: folds messages that leave the prompt's history window
+into ``ChatSession.conversation_summary`` with a low-priority LLM call,
+off the chat response path.
+NO infrastructure imports - depends only on core entities, interfaces.
+"""
+
+import asyncio
+from collections import OrderedDict
+
+from src.config import get_logger
+from src.core.entities.session import ChatSession, Message, MessageRole
+from src.core.interfaces import ILLMProvider, ISessionStore, LLMPriority, llm_priority
+
+logger = get_logger(__name__)
+
+# Per-message cap when building the summary prompt
+_MAX_MESSAGE_CHARS = 600
+
+
+class ConversationSummarizer:
+    """
+    Background summary updates with a per-session coalescing queue.
+
+    ``submit`` returns immediately. Messages queued for the same session
+    before the worker reaches it are folded in with one LLM call. Each
+    session records the newest summarized message id, so a message is
+    summarized once even if it is submitted again (e.g. after a restart).
+    """
+
+    def __init__(
+        self,
+        session_store: ISessionStore,
+        llm_provider: ILLMProvider,
+        max_summary_tokens: int = 300,
+    ):
+        """
+        Initialize summarizer.
+
+        Args:
+            session_store: Where updated sessions are saved
+            llm_provider: LLM used for summarization
+            max_summary_tokens: Length cap of the summary
+        """
+        self._store = session_store
+        self._llm = llm_provider
+        self._max_summary_tokens = max_summary_tokens
+        self._pending: OrderedDict[str, tuple[ChatSession, list[Message]]] = OrderedDict()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of sessions waiting for a summary update."""
+        return len(self._pending)
+
+    def submit(self, session: ChatSession, messages: list[Message]) -> None:
+        """Queue messages that left the history window."""
+        if not messages:
+            return
+        queued = self._pending.get(session.session_id)
+        if queued is None:
+            self._pending[session.session_id] = (session, list(messages))
+        else:
+            queued[1].extend(messages)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+    async def flush(self) -> None:
+        """Wait for queued summary updates to finish."""
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _drain(self) -> None:
+        while self._pending:
+            _, (session, messages) = self._pending.popitem(last=False)
+            try:
+                await self.summarize(session, messages)
+            except Exception as e:
+                # Graceful degradation - the prompt falls back to the window alone
+                logger.warning("conversation_summary_failed", session_id=session.session_id, error=str(e))
+
+    async def summarize(self, session: ChatSession, messages: list[Message]) -> str | None:
+        """Fold messages into the session summary and save the session."""
+        watermark = session.summary_last_message_id or 0
+        new = [
+            m for m in messages
+            if m.id is not None and m.id > watermark
+            and m.role in (MessageRole.USER, MessageRole.ASSISTANT)
+        ]
+        if not new:
+            return session.conversation_summary
+
+        conversation = "\n".join(
+            f"{m.role.value.capitalize()}: {m.content[:_MAX_MESSAGE_CHARS]}" for m in new
+        )
+        previous = session.conversation_summary or "(none yet)"
+        prompt = f"""Update the running summary of a conversation.
+
+Current summary:
+{previous}
+
+New messages:
+{conversation}
+
+Write the updated summary in at most 6 sentences. Keep names, numbers,
+invoice and document references, and open questions. Summary:"""
+
+        with llm_priority(LLMPriority.BACKGROUND):
+            response = await self._llm.generate(
+                prompt,
+                max_tokens=self._max_summary_tokens,
+                temperature=0.2,
+            )
+        summary = response.text.strip()
+        if not summary:
+            return session.conversation_summary
+
+        session.conversation_summary = summary
+        session.summary_message_count += len(new)
+        session.summary_last_message_id = max(m.id for m in new if m.id is not None)
+        await self._store.update_session(session)
+
+        logger.debug(
+            "conversation_summary_updated",
+            session_id=session.session_id,
+            messages=len(new),
+            total=session.summary_message_count,
+        )
+        return summary
@@ -5,19 +5,36 @@ Layer-pure service managing document chunking, embedding, and incremental indexi
 NO infrastructure imports - depends only on core entities, interfaces, exceptions.
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import Executor
 from datetime import datetime
 from typing import Any
 
 import numpy as np
 
+from src.config import get_logger
 from src.core.entities.document import Chunk, Document, DocumentStatus, IndexingState, Page
 from src.core.exceptions import IndexingError
 from src.core.interfaces import (
+    IChunker,
     IDocumentStore,
     IEmbeddingProvider,
     IIndexingStateStore,
+    IInvoiceStore,
     IVectorStore,
 )
+from src.core.services.chunking import CharChunker
+
+logger = get_logger(__name__)
+
+
+def item_embedding_text(item: dict[str, Any]) -> str:
+    """Text embedded for an invoice line item."""
+    return (
+        f"{item['item_name']} {item.get('hs_code') or ''} "
+        f"{item.get('brand') or ''} {item.get('model') or ''}"
+    )
 
 
 class DocumentIndexerService:
@@ -25,9 +42,10 @@ class DocumentIndexerService:
     Document indexing pipeline.
 
     Handles:
-    - Text chunking with overlap
+    - Text chunking with overlap (pluggable, token- or character-budgeted)
     - Embedding generation
-    - Vector index updates (incremental)
+    - Vector index updates (incremental, pipelined)
+    - Background indexing of newly saved invoice items
     - Indexing state tracking
 
     Required interfaces for DI:
@@ -35,6 +53,7 @@ class DocumentIndexerService:
     - IVectorStore: Vector index management
     - IEmbeddingProvider: Embedding generation
     - IIndexingStateStore: Incremental indexing state
+    - IInvoiceStore: Invoice item source for the items index (optional)
     """
 
     def __init__(
@@ -45,6 +64,11 @@ class DocumentIndexerService:
         indexing_state_store: IIndexingStateStore,
         chunk_size: int = 512,
         chunk_overlap: int = 50,
+        executor: Executor | None = None,
+        pipeline_depth: int = 2,
+        invoice_store: IInvoiceStore | None = None,
+        chunker: IChunker | None = None,
+        persist_rows: int = 5000,
     ):
         """
         Initialize indexer service with injected dependencies.
@@ -54,15 +78,25 @@ class DocumentIndexerService:
             vector_store: Vector index (required)
             embedding_provider: Embedding generation (required)
             indexing_state_store: State tracking (required)
-            chunk_size: Default chunk size in chars
-            chunk_overlap: Default overlap between chunks
+            chunk_size: Chunk size in chars when no chunker is given
+            chunk_overlap: Overlap in chars when no chunker is given
+            executor: Executor for embedding inference (default loop executor if None)
+            pipeline_depth: Max batches buffered between pipeline stages
+            invoice_store: Invoice item source (item indexing disabled if None)
+            chunker: Page text splitter (character-based if None)
+            persist_rows: Rows appended between index saves in incremental runs
         """
         self._doc_store = document_store
         self._vec_store = vector_store
         self._embedder = embedding_provider
         self._state_store = indexing_state_store
-        self._chunk_size = chunk_size
-        self._chunk_overlap = chunk_overlap
+        self._chunker = chunker or CharChunker(chunk_size, chunk_overlap)
+        self._executor = executor
+        self._pipeline_depth = max(1, pipeline_depth)
+        self._persist_rows = max(1, persist_rows)
+        self._invoice_store = invoice_store
+        self._item_task: asyncio.Task[None] | None = None
+        self._items_dirty = False
 
     async def index_document(self, document_id: int) -> dict[str, Any]:
         """
@@ -90,8 +124,8 @@ class DocumentIndexerService:
             raise IndexingError(f"No pages found for document: {document_id}")
 
         try:
-            # Create chunks from pages
-            chunks = self._create_chunks(document, pages)
+            # Create chunks from pages; token counting can be slow, keep it off the loop
+            chunks = await asyncio.to_thread(self._create_chunks, document, pages)
 
             if not chunks:
                 return {"chunks_created": 0, "vectors_added": 0}
@@ -146,7 +180,17 @@ class DocumentIndexerService:
         """
         Index pending chunks incrementally.
 
-        Processes chunks that haven't been indexed yet, tracking progress.
+        Runs as a three-stage pipeline connected by bounded queues:
+
+        - reader: pages through unindexed chunks by id cursor
+        - embedder: generates embeddings on the inference executor
+        - writer: adds vectors in memory, saving the index every
+          ``persist_rows`` rows and once at the end
+
+        The queues hold at most ``pipeline_depth`` batches, so a slow stage
+        applies backpressure upstream instead of buffering the whole backlog.
+        ``IndexingState.last_chunk_id`` only advances when the index is
+        saved, so an interrupted run resumes without gaps.
 
         Args:
             batch_size: Number of chunks to process per batch
@@ -155,77 +199,66 @@ class DocumentIndexerService:
         Returns:
             Dict with indexing stats
         """
-        # Get current state
-        state = await self._state_store.get_state(index_name)
-        if state is None:
-            state = IndexingState(index_name=index_name)
-
-        if state.is_building:
-            raise IndexingError(f"Index {index_name} is already being built")
-
-        # Mark as building
-        state.is_building = True
-        state = await self._state_store.update_state(state)
-
-        try:
-            total_indexed = 0
-            last_chunk_id = state.last_chunk_id
-
-            while True:
-                # Get next batch of unindexed chunks
-                chunks = await self._doc_store.get_chunks_for_indexing(
-                    last_chunk_id=last_chunk_id,
-                    limit=batch_size,
+        state = await self._acquire_state(index_name)
+        stats = {"chunks_indexed": 0, "last_chunk_id": state.last_chunk_id}
+        unsaved_rows = 0
+        unchecked_chunks = 0
+
+        async def checkpoint() -> None:
+            nonlocal state, unsaved_rows, unchecked_chunks
+            if unsaved_rows:
+                await self._vec_store.save_index(index_name)
+                unsaved_rows = 0
+            # Advance the resume point only once the vectors are on disk
+            state.last_chunk_id = stats["last_chunk_id"]
+            state.total_indexed += unchecked_chunks
+            unchecked_chunks = 0
+            state = await self._state_store.update_state(state)
+
+        async def write_batch(chunks: list[Chunk], embeddings: np.ndarray, ids: list[int]) -> None:
+            nonlocal state, unsaved_rows, unchecked_chunks
+            if ids:
+                await self._vec_store.add_vectors(
+                    index_name=index_name,
+                    embeddings=embeddings,
+                    ids=ids,
+                    persist=False,
                 )
+                unsaved_rows += len(ids)
 
-                if not chunks:
-                    break
+            stats["chunks_indexed"] += len(chunks)
+            stats["last_chunk_id"] = max(ids, default=stats["last_chunk_id"])
+            unchecked_chunks += len(chunks)
 
-                # Generate embeddings for chunks without them
-                chunks_to_embed = [c for c in chunks if not c.metadata.get("embedding")]
-                if chunks_to_embed:
-                    await self._generate_embeddings(chunks_to_embed)
-
-                # Add to vector index
-                embeddings = []
-                chunk_ids = []
-                for chunk in chunks:
-                    emb = chunk.metadata.get("embedding")
-                    if emb is not None and chunk.id:
-                        embeddings.append(emb)
-                        chunk_ids.append(chunk.id)
-
-                if embeddings:
-                    await self._vec_store.add_vectors(
-                        index_name=index_name,
-                        embeddings=np.array(embeddings),
-                        ids=chunk_ids,
-                    )
-
-                total_indexed += len(chunks)
-                last_chunk_id = max(c.id for c in chunks if c.id) if chunks else last_chunk_id
-
-                # Update state
-                state.last_chunk_id = last_chunk_id
-                state.total_indexed += len(chunks)
+            if unsaved_rows >= self._persist_rows:
+                await checkpoint()
+            else:
+                # Heartbeat: keeps the is_building lock from looking stale
                 state = await self._state_store.update_state(state)
 
+        try:
+            await self._run_pipeline(state.last_chunk_id, batch_size, write_batch)
+            await checkpoint()
+
             # Mark complete
             state.is_building = False
             state.last_run_at = datetime.now()
             state.last_error = None
             await self._state_store.update_state(state)
 
-            # Save index
-            await self._vec_store.save_index(index_name)
-
             return {
-                "chunks_indexed": total_indexed,
-                "last_chunk_id": last_chunk_id,
+                "chunks_indexed": stats["chunks_indexed"],
+                "last_chunk_id": stats["last_chunk_id"],
                 "total_indexed": state.total_indexed,
             }
 
         except Exception as e:
+            # Batches already appended are live in memory; keep them so the
+            # next run doesn't add them twice
+            try:
+                await checkpoint()
+            except Exception as save_error:
+                logger.warning("indexing_checkpoint_failed", error=str(save_error))
             # Record error and release lock
             state.is_building = False
             state.last_error = str(e)
@@ -238,9 +271,12 @@ class DocumentIndexerService:
         batch_size: int = 500,
     ) -> dict[str, Any]:
         """
-        Rebuild the entire index from scratch.
+        Rebuild the entire index from scratch without interrupting search.
 
-        Resets state and re-indexes all chunks.
+        All chunks are re-embedded into a new index generation built off to
+        the side; the live generation keeps serving searches and is swapped
+        out atomically once the new one is complete. Incremental indexing
+        is paused (``is_building``) for the duration.
 
         Args:
             index_name: Name of index to rebuild
@@ -249,11 +285,250 @@ class DocumentIndexerService:
         Returns:
             Dict with rebuild stats
         """
-        # Reset state
-        await self._state_store.reset_state(index_name)
+        state = await self._acquire_state(index_name)
+        build = await self._vec_store.begin_rebuild(index_name)
+        stats = {"chunks_indexed": 0, "last_chunk_id": 0}
+
+        async def write_batch(chunks: list[Chunk], embeddings: np.ndarray, ids: list[int]) -> None:
+            if ids:
+                await self._vec_store.stage_vectors(build, embeddings, ids)
+            stats["chunks_indexed"] += len(chunks)
+            stats["last_chunk_id"] = max(ids, default=stats["last_chunk_id"])
+            # Heartbeat: keeps the is_building lock from looking stale
+            await self._state_store.update_state(state)
+
+        try:
+            await self._run_pipeline(0, batch_size, write_batch)
+            generation = await self._vec_store.commit_rebuild(build)
+
+            state.last_chunk_id = stats["last_chunk_id"]
+            state.total_indexed = stats["chunks_indexed"]
+            state.is_building = False
+            state.last_run_at = datetime.now()
+            state.last_error = None
+            await self._state_store.update_state(state)
+
+            return {
+                "chunks_indexed": stats["chunks_indexed"],
+                "last_chunk_id": stats["last_chunk_id"],
+                "total_indexed": state.total_indexed,
+                "generation": generation,
+            }
+
+        except Exception as e:
+            # Old generation is still live; just record the error and release lock
+            state.is_building = False
+            state.last_error = str(e)
+            await self._state_store.update_state(state)
+            raise IndexingError(f"Index rebuild failed: {str(e)}")
+
+    async def index_pending_items(self, batch_size: int = 100) -> dict[str, Any]:
+        """
+        Index invoice items saved since the last run into the "items" index.
+
+        ``invoice_items`` rows past ``IndexingState.last_item_id`` act as the
+        outbox: they are paged by ID, embedded and appended to the live
+        index. The index is saved every ``persist_rows`` rows and at the
+        end, and the cursor only advances with a save, so a crash never
+        skips an item.
+
+        Args:
+            batch_size: Number of items to process per batch
+
+        Returns:
+            Dict with indexing stats
+        """
+        if self._invoice_store is None:
+            raise IndexingError("Item indexing requires an invoice store")
+
+        state = await self._acquire_state("items")
+        items_indexed = 0
+        last_item_id = state.last_item_id
+        unsaved_rows = 0
+
+        async def checkpoint() -> None:
+            nonlocal state, unsaved_rows
+            if unsaved_rows:
+                await self._vec_store.save_index("items")
+                state.total_indexed += unsaved_rows
+                unsaved_rows = 0
+            state.last_item_id = last_item_id
+            state = await self._state_store.update_state(state)
+
+        try:
+            while True:
+                items = await self._invoice_store.get_items_for_indexing(
+                    last_item_id=last_item_id,
+                    limit=batch_size,
+                )
+                if not items:
+                    break
+
+                loop = asyncio.get_running_loop()
+                embeddings = await loop.run_in_executor(
+                    self._executor,
+                    self._embedder.embed_batch,
+                    [item_embedding_text(item) for item in items],
+                )
+                ids = [item["id"] for item in items]
+                await self._vec_store.add_vectors(
+                    index_name="items",
+                    embeddings=np.asarray(embeddings, dtype=np.float32),
+                    ids=ids,
+                    persist=False,
+                )
+
+                items_indexed += len(items)
+                last_item_id = max(ids)
+                unsaved_rows += len(ids)
+                if unsaved_rows >= self._persist_rows:
+                    await checkpoint()
+                else:
+                    # Heartbeat: keeps the is_building lock from looking stale
+                    state = await self._state_store.update_state(state)
+
+            await checkpoint()
+            state.is_building = False
+            state.last_run_at = datetime.now()
+            state.last_error = None
+            await self._state_store.update_state(state)
+
+            return {
+                "items_indexed": items_indexed,
+                "last_item_id": state.last_item_id,
+                "total_indexed": state.total_indexed,
+            }
+
+        except Exception as e:
+            # Keep the batches already appended, as in index_pending
+            try:
+                await checkpoint()
+            except Exception as save_error:
+                logger.warning("indexing_checkpoint_failed", error=str(save_error))
+            state.is_building = False
+            state.last_error = str(e)
+            await self._state_store.update_state(state)
+            raise IndexingError(f"Item indexing failed: {str(e)}")
+
+    def schedule_item_indexing(self) -> None:
+        """
+        Queue a background run of ``index_pending_items``.
+
+        Called after invoices are saved. Requests arriving while a run is in
+        flight are coalesced into one follow-up run, so bursts of uploads
+        don't pile up tasks. No-op without an invoice store.
+        """
+        if self._invoice_store is None:
+            return
+        self._items_dirty = True
+        if self._item_task is None or self._item_task.done():
+            self._item_task = asyncio.create_task(self._drain_item_queue())
+
+    async def flush_item_indexing(self) -> None:
+        """Wait for any scheduled item indexing to finish."""
+        if self._item_task is not None:
+            await asyncio.gather(self._item_task, return_exceptions=True)
+
+    async def _drain_item_queue(self) -> None:
+        """Run item indexing until no new requests arrived during the last run."""
+        while self._items_dirty:
+            self._items_dirty = False
+            try:
+                result = await self.index_pending_items()
+            except IndexingError as e:
+                # A rebuild holding the lock re-reads items itself; later saves retry
+                logger.warning("item_indexing_failed", error=str(e))
+                return
+            logger.info("items_indexed", **result)
+
+    async def _acquire_state(self, index_name: str) -> IndexingState:
+        """Load indexing state and take the ``is_building`` lock."""
+        state = await self._state_store.get_state(index_name)
+        if state is None:
+            state = IndexingState(index_name=index_name)
+
+        if state.is_building:
+            raise IndexingError(f"Index {index_name} is already being built")
+
+        state.is_building = True
+        return await self._state_store.update_state(state)
+
+    async def _run_pipeline(
+        self,
+        start_chunk_id: int,
+        batch_size: int,
+        write_batch: Callable[[list[Chunk], np.ndarray, list[int]], Awaitable[None]],
+    ) -> None:
+        """
+        Stream chunks after ``start_chunk_id`` through read, embed and write stages.
 
-        # Full index rebuild
-        return await self.index_pending(batch_size=batch_size, index_name=index_name)
+        ``write_batch`` receives each batch with its embeddings and chunk IDs,
+        in chunk-ID order.
+        """
+        to_embed: asyncio.Queue[list[Chunk] | None] = asyncio.Queue(maxsize=self._pipeline_depth)
+        to_write: asyncio.Queue[tuple[list[Chunk], np.ndarray] | None] = asyncio.Queue(
+            maxsize=self._pipeline_depth
+        )
+
+        async def read_stage() -> None:
+            cursor = start_chunk_id
+            while True:
+                chunks = await self._doc_store.get_chunks_for_indexing(
+                    last_chunk_id=cursor,
+                    limit=batch_size,
+                )
+                if not chunks:
+                    break
+                cursor = max((c.id for c in chunks if c.id), default=cursor)
+                await to_embed.put(chunks)
+            await to_embed.put(None)
+
+        async def embed_stage() -> None:
+            while (chunks := await to_embed.get()) is not None:
+                embeddings = await self._embed_chunks(chunks)
+                await to_write.put((chunks, embeddings))
+            await to_write.put(None)
+
+        async def write_stage() -> None:
+            while (item := await to_write.get()) is not None:
+                chunks, embeddings = item
+                keep = [i for i, c in enumerate(chunks) if c.id]
+                await write_batch(chunks, embeddings[keep], [chunks[i].id or 0 for i in keep])
+
+        await self._run_stages(read_stage(), embed_stage(), write_stage())
+
+    @staticmethod
+    async def _run_stages(*stages: Coroutine[Any, Any, None]) -> None:
+        """Run pipeline stages concurrently, cancelling the rest if one fails."""
+        tasks = [asyncio.create_task(stage) for stage in stages]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _embed_chunks(self, chunks: list[Chunk]) -> np.ndarray:
+        """
+        Embed a batch of chunks on the inference executor.
+
+        Chunks that already carry an embedding in their metadata are reused
+        rather than re-embedded.
+        """
+        pending = [i for i, c in enumerate(chunks) if not c.metadata.get("embedding")]
+        vectors: list[Any] = [c.metadata.get("embedding") for c in chunks]
+
+        if pending:
+            texts = [chunks[i].embedding_text for i in pending]
+            loop = asyncio.get_running_loop()
+            embedded = await loop.run_in_executor(
+                self._executor, self._embedder.embed_batch, texts
+            )
+            for i, embedding in zip(pending, embedded):
+                vectors[i] = embedding
+
+        return np.asarray(vectors, dtype=np.float32)
 
     def _create_chunks(
         self,
@@ -261,23 +536,11 @@ class DocumentIndexerService:
         pages: list[Page],
     ) -> list[Chunk]:
         """Create text chunks from document pages."""
+        pages = [p for p in pages if p.text and p.text.strip()]
+        split = self._chunker.split_batch([(p.text or "").strip() for p in pages])
         chunks = []
 
-        for page in pages:
-            if not page.text:
-                continue
-
-            text = page.text.strip()
-            if not text:
-                continue
-
-            # Split into chunks with overlap
-            page_chunks = self._split_text(
-                text=text,
-                chunk_size=self._chunk_size,
-                overlap=self._chunk_overlap,
-            )
-
+        for page, page_chunks in zip(pages, split):
             for i, chunk_text in enumerate(page_chunks):
                 chunk = Chunk(
                     doc_id=document.id or 0,
@@ -295,49 +558,6 @@ class DocumentIndexerService:
 
         return chunks
 
-    def _split_text(
-        self,
-        text: str,
-        chunk_size: int,
-        overlap: int,
-    ) -> list[str]:
-        """Split text into overlapping chunks."""
-        if len(text) <= chunk_size:
-            return [text]
-
-        chunks = []
-
-        # Try to split on sentence boundaries
-        sentences = self._split_sentences(text)
-
-        current_chunk = ""
-        for sentence in sentences:
-            if len(current_chunk) + len(sentence) <= chunk_size:
-                current_chunk += sentence + " "
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-
-                # Start new chunk with overlap from previous
-                if overlap > 0 and chunks:
-                    overlap_text = chunks[-1][-overlap:]
-                    current_chunk = overlap_text + " " + sentence + " "
-                else:
-                    current_chunk = sentence + " "
-
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
-
-        return chunks
-
-    def _split_sentences(self, text: str) -> list[str]:
-        """Split text into sentences."""
-        import re
-
-        # Simple sentence splitting on .!?
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        return [s.strip() for s in sentences if s.strip()]
-
     async def _generate_embeddings(self, chunks: list[Chunk]) -> None:
         """Generate embeddings for chunks."""
         if not chunks:
@@ -17,7 +17,7 @@ from src.core.entities.invoice import (
     IssueSeverity,
     RowType,
 )
-from src.core.interfaces import IInvoiceStore, ILLMProvider
+from src.core.interfaces import IInvoiceStore, ILLMProvider, LLMPriority, llm_priority
 from src.core.interfaces.price_history import IPriceHistoryStore
 
 
@@ -633,11 +633,12 @@ If no issues found, respond with empty array: []
 JSON response:"""
 
         try:
-            llm_response = await self._llm.generate(
-                prompt,
-                max_tokens=500,
-                temperature=0.1,
-            )
+            with llm_priority(LLMPriority.INGEST):
+                llm_response = await self._llm.generate(
+                    prompt,
+                    max_tokens=500,
+                    temperature=0.1,
+                )
             response = llm_response.text
 
             # Parse LLM response
@@ -5,8 +5,10 @@ Layer-pure service that coordinates parsing via injected interfaces.
 NO infrastructure imports - depends only on core entities, interfaces, exceptions.
 """
 
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+from src.config import get_logger
 from src.core.entities.document import Document, Page
 from src.core.entities.invoice import Invoice, LineItem
 from src.core.exceptions import ParserError
@@ -16,6 +18,9 @@ from src.core.interfaces import (
     IParserRegistry,
     ParserResult,
 )
+from src.core.services.document_indexer import DocumentIndexerService
+
+logger = get_logger(__name__)
 
 
 class InvoiceParserService:
@@ -29,6 +34,7 @@ class InvoiceParserService:
     - IParserRegistry: Parser strategy orchestration
     - IDocumentStore: Document persistence (optional)
     - IInvoiceStore: Invoice persistence (optional)
+    - DocumentIndexerService: Line-item indexing after saves (optional)
     """
 
     def __init__(
@@ -36,6 +42,7 @@ class InvoiceParserService:
         parser_registry: IParserRegistry,
         document_store: IDocumentStore | None = None,
         invoice_store: IInvoiceStore | None = None,
+        item_indexer: Callable[[], Awaitable[DocumentIndexerService]] | None = None,
     ):
         """
         Initialize parser service with injected dependencies.
@@ -44,10 +51,13 @@ class InvoiceParserService:
             parser_registry: Registry of parser strategies
             document_store: Optional document persistence
             invoice_store: Optional invoice persistence
+            item_indexer: Optional async provider of the indexer that embeds
+                saved line items, resolved on the first save
         """
         self._registry = parser_registry
         self._doc_store = document_store
         self._invoice_store = invoice_store
+        self._item_indexer = item_indexer
 
     async def parse_invoice(
         self,
@@ -80,9 +90,20 @@ class InvoiceParserService:
         if not result.success:
             raise ParserError(result.error or "All parsers failed")
 
+        if result.invoice:
+            result.invoice.parser_name = result.parser_name
+
         # Optionally persist the invoice
         if save_result and result.invoice and self._invoice_store:
             result.invoice = await self._invoice_store.create_invoice(result.invoice)
+            # Embed the new line items in the background
+            if self._item_indexer is not None:
+                try:
+                    indexer = await self._item_indexer()
+                    indexer.schedule_item_indexing()
+                except Exception as e:
+                    # The invoice is saved; the next indexing run picks it up
+                    logger.warning("item_indexing_not_scheduled", error=str(e))
 
         return result
 
@@ -91,6 +112,7 @@ class InvoiceParserService:
         document: Document,
         pages: list[Page],
         hints: dict[str, Any] | None = None,
+        save_result: bool = True,
     ) -> ParserResult:
         """
         Parse invoice from a document and its pages.
@@ -99,6 +121,7 @@ class InvoiceParserService:
             document: Document entity
             pages: List of pages with extracted text
             hints: Optional parsing hints
+            save_result: Whether to save to invoice store
 
         Returns:
             ParserResult with invoice data
@@ -123,8 +146,11 @@ class InvoiceParserService:
         hints = hints or {}
         hints["doc_id"] = document.id
         hints["filename"] = document.filename
+        if document.file_path and document.file_path.lower().endswith(".pdf"):
+            # Lets the vision parser render pages of scanned PDFs
+            hints.setdefault("pdf_path", document.file_path)
 
-        result = await self.parse_invoice(full_text, document.filename, hints)
+        result = await self.parse_invoice(full_text, document.filename, hints, save_result)
 
         # Link invoice to document
         if result.success and result.invoice:
@@ -0,0 +1,152 @@
+"""
+Background memory-fact extraction for chat sessions.
+
+Layer-pure service: pulls key facts out of finished chat exchanges with a
+low-priority LLM call, off the chat response path.
+NO infrastructure imports - depends only on core entities, interfaces, exceptions.
+"""
+
+import asyncio
+from collections import OrderedDict
+
+from src.config import get_logger
+from src.core.entities.session import MemoryFact, MemoryFactType
+from src.core.interfaces import ILLMProvider, ISessionStore, LLMPriority, llm_priority
+
+logger = get_logger(__name__)
+
+
+class MemoryFactExtractor:
+    """
+    Fire-and-forget fact extraction with a bounded, coalescing queue.
+
+    ``submit`` returns immediately. Exchanges queued for the same session
+    before the worker reaches it are merged into one extraction prompt,
+    and the resulting facts are stored with a single batched insert.
+    When ``max_pending`` sessions are already waiting, new sessions are
+    dropped - memory facts are a nice-to-have, not worth back-pressure
+    on chat.
+    """
+
+    def __init__(
+        self,
+        session_store: ISessionStore,
+        llm_provider: ILLMProvider,
+        max_pending: int = 100,
+        max_exchanges: int = 5,
+        coalesce_delay: float = 0.5,
+    ):
+        """
+        Initialize extractor.
+
+        Args:
+            session_store: Where extracted facts are saved
+            llm_provider: LLM used for extraction
+            max_pending: Max sessions waiting for extraction
+            max_exchanges: Max exchanges per session kept for one prompt
+            coalesce_delay: Seconds to wait for more messages before extracting
+        """
+        self._store = session_store
+        self._llm = llm_provider
+        self._max_pending = max_pending
+        self._max_exchanges = max(1, max_exchanges)
+        self._coalesce_delay = coalesce_delay
+        self._pending: OrderedDict[str, list[tuple[str, str]]] = OrderedDict()
+        self._task: asyncio.Task[None] | None = None
+        self._dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of sessions waiting for extraction."""
+        return len(self._pending)
+
+    @property
+    def dropped(self) -> int:
+        """Exchanges dropped because the queue was full."""
+        return self._dropped
+
+    def submit(self, session_id: str, user_message: str, assistant_response: str) -> bool:
+        """
+        Queue an exchange for extraction.
+
+        Returns:
+            False if the exchange was dropped because the queue is full
+        """
+        exchanges = self._pending.get(session_id)
+        if exchanges is None:
+            if len(self._pending) >= self._max_pending:
+                self._dropped += 1
+                logger.warning("memory_extraction_dropped", session_id=session_id)
+                return False
+            exchanges = self._pending[session_id] = []
+
+        exchanges.append((user_message, assistant_response))
+        del exchanges[:-self._max_exchanges]
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+        return True
+
+    async def flush(self) -> None:
+        """Wait for queued extractions to finish."""
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _drain(self) -> None:
+        """Extract facts in coalesced batches until the queue is empty."""
+        while self._pending:
+            # Let rapid-fire messages pile up, then take every waiting session
+            await asyncio.sleep(self._coalesce_delay)
+            for _ in range(len(self._pending)):
+                session_id, exchanges = self._pending.popitem(last=False)
+                try:
+                    await self.extract(session_id, exchanges)
+                except Exception as e:
+                    # Graceful degradation - memory extraction is optional
+                    logger.warning("memory_extraction_failed", session_id=session_id, error=str(e))
+
+    async def extract(self, session_id: str, exchanges: list[tuple[str, str]]) -> list[MemoryFact]:
+        """Extract facts from exchanges and save them in one batch."""
+        conversation = "\n".join(
+            f"User: {user}\nAssistant: {assistant}" for user, assistant in exchanges
+        )
+        prompt = f"""Extract key facts from this conversation that might be useful later.
+
+{conversation}
+
+List only important facts (entities, numbers, decisions).
+Format: One fact per line, starting with "- ".
+If no important facts, respond with "NONE".
+
+Facts:"""
+
+        with llm_priority(LLMPriority.BACKGROUND):
+            llm_response = await self._llm.generate(
+                prompt,
+                max_tokens=200,
+                temperature=0.1,
+            )
+        response = llm_response.text
+
+        if "NONE" in response.upper():
+            return []
+
+        facts: dict[str, MemoryFact] = {}
+        for line in response.strip().split("\n"):
+            line = line.strip()
+            if line.startswith("- "):
+                fact_text = line[2:].strip()
+                if fact_text and len(fact_text) > 5 and fact_text not in facts:
+                    facts[fact_text] = MemoryFact(
+                        session_id=session_id,
+                        fact_type=MemoryFactType.ENTITY,
+                        key=f"extracted_{hash(fact_text) % 10000}",
+                        value=fact_text,
+                    )
+
+        if not facts:
+            return []
+
+        saved = await self._store.save_memory_facts(list(facts.values()))
+        logger.debug("memory_facts_extracted", session_id=session_id, facts=len(saved))
+        return saved
@@ -5,12 +5,14 @@ Layer-pure service coordinating hybrid search, reranking, and context preparatio
 NO infrastructure imports - depends only on core entities, interfaces, exceptions.
 """
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
 from src.core.entities.document import SearchResult
 from src.core.exceptions import SearchError
 from src.core.interfaces import IHybridSearcher, IReranker, ISearchCache
+from src.core.services.context_packer import ContextPacker
 
 
 @dataclass
@@ -22,6 +24,7 @@ class SearchContext:
     formatted_context: str
     total_chunks: int
     search_type: str
+    context_tokens: int = 0
 
 
 class SearchService:
@@ -35,6 +38,7 @@ class SearchService:
     - IHybridSearcher: Hybrid search implementation
     - IReranker: Optional result reranking
     - ISearchCache: Optional result caching
+    - ContextPacker: Token-budgeted context assembly (optional)
     """
 
     def __init__(
@@ -42,6 +46,7 @@ class SearchService:
         searcher: IHybridSearcher,
         reranker: IReranker | None = None,
         cache: ISearchCache | None = None,
+        context_packer: ContextPacker | None = None,
     ):
         """
         Initialize search service with injected dependencies.
@@ -50,10 +55,12 @@ class SearchService:
             searcher: Hybrid search implementation (required)
             reranker: Optional reranker for improved relevance
             cache: Optional search cache
+            context_packer: Optional packer for RAG context (estimates tokens if omitted)
         """
         self._searcher = searcher
         self._reranker = reranker
         self._cache = cache
+        self._packer = context_packer or ContextPacker()
 
     async def search(
         self,
@@ -231,15 +238,18 @@ class SearchService:
         self,
         query: str,
         top_k: int = 5,
-        max_context_length: int = 4000,
+        max_context_tokens: int | None = None,
     ) -> SearchContext:
         """
         Search and prepare context for RAG.
 
+        Adjacent chunks of a page are merged, near-duplicates dropped and
+        the rest packed in relevance order into the token budget.
+
         Args:
             query: User query
             top_k: Number of chunks to retrieve
-            max_context_length: Maximum context length in chars
+            max_context_tokens: Context token budget (packer default if None)
 
         Returns:
             SearchContext with formatted context for LLM
@@ -251,32 +261,16 @@ class SearchService:
             use_reranker=True,
         )
 
-        # Format context
-        context_parts = []
-        total_length = 0
-
-        for i, result in enumerate(results):
-            chunk_text = f"[{i + 1}] {result.text}"
-
-            if total_length + len(chunk_text) > max_context_length:
-                # Truncate if needed
-                remaining = max_context_length - total_length
-                if remaining > 100:
-                    chunk_text = chunk_text[:remaining] + "..."
-                    context_parts.append(chunk_text)
-                break
-
-            context_parts.append(chunk_text)
-            total_length += len(chunk_text) + 2  # +2 for newlines
-
-        formatted = "\n\n".join(context_parts)
+        # Token counting may load or run a tokenizer; keep it off the loop
+        packed = await asyncio.to_thread(self._packer.pack, results, max_tokens=max_context_tokens)
 
         return SearchContext(
             query=query,
             results=results,
-            formatted_context=formatted,
+            formatted_context=packed.text,
             total_chunks=len(results),
             search_type="hybrid",
+            context_tokens=packed.tokens,
         )
 
     async def find_similar_chunks(
@@ -5,7 +5,9 @@ from src.infrastructure.embeddings.bge_m3 import (
     SENTENCE_TRANSFORMERS_AVAILABLE,
     BGEM3EmbeddingProvider,
     get_embedding_provider,
+    get_inference_executor,
     reset_embedding_provider,
+    shutdown_inference_executor,
 )
 
 __all__ = [
@@ -13,5 +15,7 @@ __all__ = [
     "BGEM3EmbeddingProvider",
     "get_embedding_provider",
     "reset_embedding_provider",
+    "get_inference_executor",
+    "shutdown_inference_executor",
     "SENTENCE_TRANSFORMERS_AVAILABLE",
 ]
@@ -4,6 +4,8 @@ BGE-M3 embedding provider implementation.
 Provides dense embeddings using sentence-transformers.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
@@ -17,11 +19,13 @@ logger = get_logger(__name__)
 # Try to import sentence-transformers
 try:
     from sentence_transformers import SentenceTransformer
+    from transformers import AutoTokenizer
 
     SENTENCE_TRANSFORMERS_AVAILABLE = True
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     SentenceTransformer = None  # type: ignore[misc, assignment]
+    AutoTokenizer = None
 
 
 class BGEM3EmbeddingProvider(IEmbeddingProvider):
@@ -29,6 +33,9 @@ class BGEM3EmbeddingProvider(IEmbeddingProvider):
     BGE-M3 embedding provider using sentence-transformers.
 
     Provides multilingual dense embeddings optimized for retrieval.
+    Token counting uses its own tokenizer instance behind a lock, so it
+    can run on any thread without touching the model that the inference
+    executor is encoding with.
     """
 
     def __init__(self) -> None:
@@ -46,6 +53,8 @@ class BGEM3EmbeddingProvider(IEmbeddingProvider):
         self.normalize = settings.embedding.normalize
 
         self._model: Any = None
+        self._tokenizer: Any = None
+        self._tokenizer_lock = threading.Lock()
 
     def _load_model(self) -> None:
         """Load the model if not already loaded."""
@@ -140,6 +149,24 @@ class BGEM3EmbeddingProvider(IEmbeddingProvider):
             logger.error("batch_embedding_error", count=len(texts), error=str(e))
             raise EmbeddingError(str(e))
 
+    def count_tokens(self, texts: list[str]) -> list[int]:
+        """Count model tokens per text with one fast-tokenizer call."""
+        if not texts:
+            return []
+
+        # Fast tokenizers are not safe to share between threads
+        with self._tokenizer_lock:
+            if self._tokenizer is None:
+                # Loads the tokenizer files only, not the model weights
+                self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            encoded = self._tokenizer(
+                texts,
+                add_special_tokens=False,
+                return_attention_mask=False,
+                return_token_type_ids=False,
+            )
+        return [len(ids) for ids in encoded["input_ids"]]
+
     def get_dimension(self) -> int:
         """Get the embedding dimension."""
         return self.dimension
@@ -149,8 +176,9 @@ class BGEM3EmbeddingProvider(IEmbeddingProvider):
         return self._model is not None
 
 
-# Singleton
+# Singletons
 _embedding_provider: BGEM3EmbeddingProvider | None = None
+_inference_executor: ThreadPoolExecutor | None = None
 
 
 def get_embedding_provider() -> BGEM3EmbeddingProvider:
@@ -165,3 +193,27 @@ def reset_embedding_provider() -> None:
     """Reset the embedding provider (for testing)."""
     global _embedding_provider
     _embedding_provider = None
+
+
+def get_inference_executor() -> ThreadPoolExecutor:
+    """
+    Get or create the executor used for embedding inference.
+
+    A single worker keeps model calls serialized (the model is not
+    thread-safe) while moving them off the event loop.
+    """
+    global _inference_executor
+    if _inference_executor is None:
+        _inference_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="inference",
+        )
+    return _inference_executor
+
+
+def shutdown_inference_executor() -> None:
+    """Shut down the inference executor (on application stop)."""
+    global _inference_executor
+    if _inference_executor is not None:
+        _inference_executor.shutdown(wait=False, cancel_futures=True)
+        _inference_executor = None
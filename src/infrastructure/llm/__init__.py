@@ -2,13 +2,29 @@
 
 from src.core.interfaces.llm import ILLMProvider
 from src.infrastructure.llm.base import BaseLLMProvider, CircuitBreakerState
+from src.infrastructure.llm.cache import CachedLLMProvider
 from src.infrastructure.llm.factory import check_llm_health, get_llm_provider, get_vision_provider
 from src.infrastructure.llm.llama_cpp import (
     LLAMA_CPP_AVAILABLE,
     LlamaCppProvider,
     get_llama_cpp_provider,
 )
-from src.infrastructure.llm.ollama import OllamaProvider, get_ollama_provider
+from src.infrastructure.llm.llama_pool import (
+    LlamaCppWorkerPool,
+    get_llama_cpp_pool,
+    reset_llama_cpp_pool,
+)
+from src.infrastructure.llm.ollama import (
+    OllamaProvider,
+    close_ollama_provider,
+    get_ollama_provider,
+)
+from src.infrastructure.llm.scheduler import (
+    LLMScheduler,
+    ScheduledLLMProvider,
+    get_llm_scheduler,
+    reset_llm_scheduler,
+)
 
 __all__ = [
     # Interface
@@ -16,13 +32,24 @@ __all__ = [
     # Base
     "BaseLLMProvider",
     "CircuitBreakerState",
+    # Response cache
+    "CachedLLMProvider",
+    # Scheduler
+    "LLMScheduler",
+    "ScheduledLLMProvider",
+    "get_llm_scheduler",
+    "reset_llm_scheduler",
     # Ollama
     "OllamaProvider",
     "get_ollama_provider",
+    "close_ollama_provider",
     # Llama.cpp
     "LlamaCppProvider",
     "get_llama_cpp_provider",
     "LLAMA_CPP_AVAILABLE",
+    "LlamaCppWorkerPool",
+    "get_llama_cpp_pool",
+    "reset_llama_cpp_pool",
     # Factory
     "get_llm_provider",
     "get_vision_provider",
@@ -0,0 +1,241 @@
+"""
+Response cache layered over any LLM provider.
+
+Low-temperature completions (audit analysis, memory-fact extraction,
+session summaries) are effectively deterministic, so repeating the same
+request returns the stored response instead of re-running generation.
+"""
+
+import hashlib
+import json
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from typing import Any
+
+from src.config import get_logger, get_settings
+from src.core.interfaces import (
+    HealthStatus,
+    ILLMProvider,
+    LLMResponse,
+    llm_cache_bypassed,
+)
+from src.infrastructure.storage.sqlite.llm_cache_store import SQLiteLLMCacheStore
+
+logger = get_logger(__name__)
+
+
+def _innermost(provider: Any) -> Any:
+    """Unwrap layers that expose the provider they wrap as ``provider``."""
+    while isinstance(getattr(type(provider), "provider", None), property):
+        provider = provider.provider
+    return provider
+
+
+class CachedLLMProvider(ILLMProvider):
+    """
+    Caching decorator for an ILLMProvider.
+
+    ``generate`` and ``chat`` responses are cached in SQLite, keyed by a
+    SHA-256 of provider, model, prompt (or messages), system prompt,
+    temperature, max_tokens and stop sequences, where provider and model
+    are those of the innermost provider under any wrapper layers (such as
+    the scheduler). Only calls with an explicit temperature at or below
+    ``max_temperature`` are cached; streaming is never cached. Entries
+    expire after ``ttl_seconds`` and the least recently used are evicted
+    beyond ``max_entries``. Wrap a call in ``no_llm_cache()`` to bypass.
+
+    Cache failures are logged and never fail the underlying call.
+    """
+
+    def __init__(
+        self,
+        provider: ILLMProvider,
+        store: SQLiteLLMCacheStore | None = None,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        max_temperature: float | None = None,
+    ):
+        settings = get_settings().cache
+        self._provider = provider
+        self._backend = _innermost(provider)
+        self._store = store or SQLiteLLMCacheStore()
+        self._ttl = ttl_seconds if ttl_seconds is not None else settings.llm_cache_ttl
+        self._max_entries = (
+            max_entries if max_entries is not None else settings.llm_cache_max_entries
+        )
+        self._max_temperature = (
+            max_temperature if max_temperature is not None else settings.llm_cache_max_temperature
+        )
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def provider(self) -> ILLMProvider:
+        """The wrapped provider."""
+        return self._provider
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose provider-specific extras (model, pool_stats, ...) unchanged
+        if name == "_provider":
+            raise AttributeError(name)
+        return getattr(self._provider, name)
+
+    def _cache_key(self, kind: str, **request: Any) -> str:
+        """Content address of a request."""
+        provider = self._backend
+        material = {
+            "provider": type(provider).__name__,
+            "model": getattr(provider, "model", None) or getattr(provider, "model_path", None),
+            "kind": kind,
+            **request,
+        }
+        encoded = json.dumps(material, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _cacheable(self, temperature: float | None) -> bool:
+        return (
+            temperature is not None
+            and temperature <= self._max_temperature
+            and not llm_cache_bypassed()
+        )
+
+    async def _lookup(self, key: str) -> LLMResponse | None:
+        try:
+            cached = await self._store.get(key, self._ttl)
+        except Exception as e:
+            logger.warning("llm_cache_read_failed", error=str(e))
+            return None
+
+        if cached is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            logger.debug("llm_cache_hit", key=key[:12])
+        return cached
+
+    async def _remember(self, key: str, response: LLMResponse) -> None:
+        if response.error or not response.text.strip():
+            return
+        try:
+            await self._store.put(key, type(self._backend).__name__, response, self._max_entries)
+        except Exception as e:
+            logger.warning("llm_cache_write_failed", error=str(e))
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+    ) -> LLMResponse:
+        """Generate text completion, served from cache when possible."""
+        if not self._cacheable(temperature):
+            return await self._provider.generate(
+                prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stop=stop,
+            )
+
+        key = self._cache_key(
+            "generate",
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop=stop,
+        )
+        cached = await self._lookup(key)
+        if cached is not None:
+            return cached
+
+        response = await self._provider.generate(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop=stop,
+        )
+        await self._remember(key, response)
+        return response
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Stream text; never cached."""
+        async with aclosing(
+            self._provider.generate_stream(
+                prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        ) as stream:
+            async for chunk in stream:
+                yield chunk
+
+    async def chat(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        """Chat completion, served from cache when possible."""
+        if not self._cacheable(temperature):
+            return await self._provider.chat(
+                messages, temperature=temperature, max_tokens=max_tokens
+            )
+
+        key = self._cache_key(
+            "chat", messages=messages, temperature=temperature, max_tokens=max_tokens
+        )
+        cached = await self._lookup(key)
+        if cached is not None:
+            return cached
+
+        response = await self._provider.chat(
+            messages, temperature=temperature, max_tokens=max_tokens
+        )
+        await self._remember(key, response)
+        return response
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Stream a chat reply; never cached."""
+        async with aclosing(
+            self._provider.chat_stream(messages, temperature=temperature, max_tokens=max_tokens)
+        ) as stream:
+            async for chunk in stream:
+                yield chunk
+
+    def count_tokens(self, texts: list[str]) -> list[int] | None:
+        return self._provider.count_tokens(texts)
+
+    async def check_health(self) -> HealthStatus:
+        return await self._provider.check_health()
+
+    def is_available(self) -> bool:
+        return self._provider.is_available()
+
+    async def clear(self) -> int:
+        """Drop all cached responses."""
+        return await self._store.clear()
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this process plus persisted entry count."""
+        stats: dict[str, Any] = {"hits": self._hits, "misses": self._misses}
+        try:
+            stats["entries"] = (await self._store.get_stats())["entries"]
+        except Exception as e:
+            stats["error"] = str(e)
+        return stats
@@ -4,13 +4,26 @@ LLM provider factory.
 Creates appropriate provider based on configuration.
 """
 
-from typing import Any
+from typing import Any, cast
 
 from src.config import get_logger, get_settings
 from src.core.interfaces import ILLMProvider, IVisionProvider
 
 logger = get_logger(__name__)
 
+# Wrapper layers per (layer, provider type), so all callers share one
+# scheduler view and one set of cache hit counters
+_layers: dict[tuple[str, str], Any] = {}
+
+
+def _layer(name: str, provider_type: str, inner: Any, wrap: Any) -> Any:
+    """Return the shared ``wrap(inner)`` layer, rebuilding it if ``inner`` changed."""
+    layer = _layers.get((name, provider_type))
+    if layer is None or layer.provider is not inner:
+        layer = wrap(inner)
+        _layers[(name, provider_type)] = layer
+    return layer
+
 
 def get_llm_provider(
     provider_type: str | None = None,
@@ -19,6 +32,9 @@ def get_llm_provider(
     """
     Get an LLM provider instance.
 
+    Calls go through the shared LLM scheduler, and the response cache sits
+    in front of it (when CACHE_LLM_CACHE_ENABLED) so cache hits never queue.
+
     Args:
         provider_type: "ollama" or "llama_cpp" (default from settings)
         model_path: Optional model path for llama_cpp
@@ -26,40 +42,58 @@ def get_llm_provider(
     Returns:
         ILLMProvider instance
     """
+    from src.infrastructure.llm.cache import CachedLLMProvider
+    from src.infrastructure.llm.scheduler import ScheduledLLMProvider, get_llm_scheduler
+
     settings = get_settings()
     provider_type = provider_type or settings.llm.provider
 
+    provider: ILLMProvider
     if provider_type == "ollama":
         from src.infrastructure.llm.ollama import get_ollama_provider
 
-        return get_ollama_provider()
+        provider = get_ollama_provider()
 
     elif provider_type == "llama_cpp":
-        from src.infrastructure.llm.llama_cpp import get_llama_cpp_provider
+        if settings.llm.llama_workers > 1:
+            from src.infrastructure.llm.llama_pool import get_llama_cpp_pool
+
+            provider = get_llama_cpp_pool(model_path)
+        else:
+            from src.infrastructure.llm.llama_cpp import get_llama_cpp_provider
 
-        return get_llama_cpp_provider(model_path)
+            provider = get_llama_cpp_provider(model_path)
 
     else:
         raise ValueError(f"Unknown LLM provider: {provider_type}")
 
+    scheduled = _layer(
+        "scheduled", provider_type, provider,
+        lambda p: ScheduledLLMProvider(p, get_llm_scheduler()),
+    )
+    if not settings.cache.llm_cache_enabled:
+        return cast(ILLMProvider, scheduled)
+
+    return cast(ILLMProvider, _layer("cached", provider_type, scheduled, CachedLLMProvider))
+
 
 def get_vision_provider() -> IVisionProvider:
     """
     Get a vision provider instance.
 
-    Currently only Ollama supports vision.
+    Currently only Ollama supports vision, also when llama_cpp serves
+    text. Calls share the LLM scheduler with text generation.
     """
-    settings = get_settings()
-
-    if settings.llm.provider == "ollama":
-        from src.infrastructure.llm.ollama import get_ollama_provider
-
-        return get_ollama_provider()
-
-    # Fallback to Ollama for vision even if using llama_cpp for text
     from src.infrastructure.llm.ollama import get_ollama_provider
-
-    return get_ollama_provider()
+    from src.infrastructure.llm.scheduler import ScheduledLLMProvider, get_llm_scheduler
+
+    return cast(
+        IVisionProvider,
+        _layer(
+            "scheduled", "ollama", get_ollama_provider(),
+            lambda p: ScheduledLLMProvider(p, get_llm_scheduler()),
+        ),
+    )
 
 
 async def check_llm_health() -> dict[str, Any]:
@@ -2,11 +2,16 @@
 llama-cpp-python LLM provider implementation.
 
 Provides direct local inference using llama-cpp-python bindings.
+A RAM prompt cache keeps the evaluated state of recent prompts, so a chat
+turn that extends an earlier conversation only evaluates the new tokens.
 """
 
 import asyncio
+import threading
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from pathlib import Path
 from typing import Any
 
@@ -19,22 +24,28 @@ logger = get_logger(__name__)
 
 # Try to import llama-cpp-python
 try:
-    from llama_cpp import Llama
+    from llama_cpp import Llama, LlamaRAMCache
 
     LLAMA_CPP_AVAILABLE = True
 except ImportError:
     LLAMA_CPP_AVAILABLE = False
     Llama = None  # type: ignore[misc, assignment]
+    LlamaRAMCache = None
 
 
 class LlamaCppProvider(BaseLLMProvider, ILLMProvider):
     """
     llama-cpp-python local inference provider.
 
-    Runs models directly using llama.cpp bindings.
+    Runs models directly using llama.cpp bindings. A ``Llama`` object is
+    not thread-safe, so every call on the decoding model runs on the
+    provider's own single-thread executor; concurrent requests queue there
+    instead of racing. Token counting uses a separate vocabulary-only
+    instance, so it neither waits behind nor races a generation. See
+    LlamaCppWorkerPool for parallel instances.
     """
 
-    def __init__(self, model_path: str | None = None):
+    def __init__(self, model_path: str | None = None, n_threads: int | None = None):
         super().__init__()
 
         if not LLAMA_CPP_AVAILABLE:
@@ -46,22 +57,30 @@ class LlamaCppProvider(BaseLLMProvider, ILLMProvider):
         self.model_path = model_path or settings.llm.model_name
         self.max_tokens = settings.llm.max_tokens
         self.temperature = settings.llm.temperature
+        self.prompt_cache_mb = settings.llm.prompt_cache_mb
+        self.n_threads = n_threads
 
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llama_cpp")
         self._model: Any = None
         self._model_loaded = False
+        self._tokenizer: Any = None
+        self._tokenizer_lock = threading.Lock()
 
-    def _load_model(self) -> None:
-        """Load the model if not already loaded."""
-        if self._model is not None:
-            return
-
+    def _model_file(self) -> Path:
         path = Path(self.model_path)
         if not path.exists():
             raise LLMUnavailableError(
                 "llama_cpp",
                 f"Model file not found: {self.model_path}",
             )
+        return path
+
+    def _load_model(self) -> None:
+        """Load the model if not already loaded."""
+        if self._model is not None:
+            return
 
+        path = self._model_file()
         logger.info("loading_llama_model", path=str(path))
 
         self._model = Llama(
@@ -69,8 +88,11 @@ class LlamaCppProvider(BaseLLMProvider, ILLMProvider):
             n_ctx=4096,
             n_batch=512,
             n_gpu_layers=-1,  # Use GPU if available
+            n_threads=self.n_threads,
             verbose=False,
         )
+        if self.prompt_cache_mb > 0:
+            self._model.set_cache(LlamaRAMCache(capacity_bytes=self.prompt_cache_mb << 20))
         self._model_loaded = True
 
         logger.info("llama_model_loaded", path=str(path))
@@ -95,7 +117,7 @@ class LlamaCppProvider(BaseLLMProvider, ILLMProvider):
             # Run in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
             return await loop.run_in_executor(
-                None,
+                self._executor,
                 self._generate_sync,
                 full_prompt,
                 temperature,
@@ -154,7 +176,7 @@ class LlamaCppProvider(BaseLLMProvider, ILLMProvider):
         system_prompt: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
-    ) -> AsyncIterator[str]:
+    ) -> AsyncGenerator[str, None]:
         """Generate text with streaming output."""
         temperature = temperature if temperature is not None else self.temperature
         max_tokens = max_tokens or self.max_tokens
@@ -163,34 +185,43 @@ class LlamaCppProvider(BaseLLMProvider, ILLMProvider):
         if system_prompt:
             full_prompt = f"{system_prompt}\n\n{prompt}"
 
-        self._load_model()
-        assert self._model is not None
-
-        # Run streaming in thread pool
+        # Run streaming on the model's thread
         loop = asyncio.get_event_loop()
         queue: asyncio.Queue[str | None] = asyncio.Queue()
+        stop = threading.Event()
 
         def _stream_sync() -> None:
-            for output in self._model(
-                full_prompt,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                stream=True,
-            ):
-                text = output["choices"][0]["text"]
-                asyncio.run_coroutine_threadsafe(queue.put(text), loop)
-
-            asyncio.run_coroutine_threadsafe(queue.put(None), loop)
+            try:
+                self._load_model()
+                for output in self._model(
+                    full_prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stream=True,
+                ):
+                    if stop.is_set():
+                        # Consumer went away - stop decoding and free the model
+                        logger.info("llama_cpp_stream_cancelled")
+                        break
+                    text = output["choices"][0]["text"]
+                    asyncio.run_coroutine_threadsafe(queue.put(text), loop)
+            finally:
+                asyncio.run_coroutine_threadsafe(queue.put(None), loop)
 
         # Start streaming in background
-        loop.run_in_executor(None, _stream_sync)
+        worker = loop.run_in_executor(self._executor, _stream_sync)
 
         # Yield tokens as they arrive
-        while True:
-            token = await queue.get()
-            if token is None:
-                break
-            yield token
+        try:
+            while True:
+                token = await queue.get()
+                if token is None:
+                    break
+                yield token
+        finally:
+            stop.set()
+            # Hold the caller (and its scheduler slot) until the model is idle
+            await asyncio.shield(worker)
 
     async def chat(
         self,
@@ -209,6 +240,42 @@ class LlamaCppProvider(BaseLLMProvider, ILLMProvider):
             max_tokens=max_tokens,
         )
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Chat completion with streaming output."""
+        prompt = format_chat_messages(messages)
+        prompt += "\nAssistant:"
+
+        async with aclosing(self.generate_stream(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )) as stream:
+            async for chunk in stream:
+                yield chunk
+
+    def count_tokens(self, texts: list[str]) -> list[int]:
+        """Count model tokens per text with a vocabulary-only instance."""
+        if not texts:
+            return []
+
+        with self._tokenizer_lock:
+            if self._tokenizer is None:
+                # Loads the vocabulary only - no weights, no context
+                self._tokenizer = Llama(
+                    model_path=str(self._model_file()),
+                    vocab_only=True,
+                    verbose=False,
+                )
+            return [
+                len(self._tokenizer.tokenize(text.encode("utf-8"), add_bos=False, special=False))
+                for text in texts
+            ]
+
     async def check_health(self) -> HealthStatus:
         """Check if llama-cpp is available."""
         if not LLAMA_CPP_AVAILABLE:
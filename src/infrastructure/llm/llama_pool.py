@@ -0,0 +1,254 @@
+"""
+Pool of llama.cpp model instances for parallel local inference.
+
+One ``Llama`` object decodes one request at a time. On multi-core CPU
+boxes the pool loads several instances, each with its own thread and a
+share of the cores, and leases them to requests in arrival order.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from src.config import get_logger, get_settings
+from src.core.interfaces import HealthStatus, ILLMProvider, LLMResponse
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _WorkerStats:
+    """Throughput counters for one model instance."""
+
+    requests: int = 0
+    failures: int = 0
+    completion_tokens: int = 0
+    busy_seconds: float = 0.0
+    busy: bool = False
+
+
+@dataclass
+class _Meter:
+    """Tokens produced during one lease."""
+
+    tokens: int = 0
+
+
+class LlamaCppWorkerPool(ILLMProvider):
+    """
+    Leases requests to a fixed set of model instances.
+
+    Idle workers sit in a FIFO queue: a request takes the worker that has
+    been idle longest and waits its turn when all are busy, so requests
+    are served first come, first served and load spreads evenly. A
+    streaming call keeps its worker until the stream ends or is closed.
+    Priority ordering stays with the LLM scheduler in front of the pool.
+    """
+
+    def __init__(self, workers: list[ILLMProvider]):
+        """
+        Initialize pool.
+
+        Args:
+            workers: Independent providers, one per model instance
+        """
+        if not workers:
+            raise ValueError("LlamaCppWorkerPool needs at least one worker")
+
+        self._workers = workers
+        self._stats = [_WorkerStats() for _ in workers]
+        self._idle: asyncio.Queue[int] | None = None
+        self._waiting = 0
+
+    @property
+    def size(self) -> int:
+        """Number of model instances."""
+        return len(self._workers)
+
+    @property
+    def model_path(self) -> Any:
+        # Used by the response cache key, same as a single provider
+        return getattr(self._workers[0], "model_path", None)
+
+    def _idle_queue(self) -> asyncio.Queue[int]:
+        # Created lazily so the queue binds to the running loop
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for index in range(len(self._workers)):
+                self._idle.put_nowait(index)
+        return self._idle
+
+    @asynccontextmanager
+    async def _lease(self) -> AsyncIterator[tuple[ILLMProvider, _Meter]]:
+        """Hold the longest-idle worker for the duration of the block."""
+        idle = self._idle_queue()
+        self._waiting += 1
+        try:
+            index = await idle.get()
+        finally:
+            self._waiting -= 1
+        stats = self._stats[index]
+        meter = _Meter()
+        stats.busy = True
+        start = time.monotonic()
+        try:
+            yield self._workers[index], meter
+        except Exception:
+            stats.failures += 1
+            raise
+        finally:
+            stats.busy = False
+            stats.requests += 1
+            stats.busy_seconds += time.monotonic() - start
+            stats.completion_tokens += meter.tokens
+            idle.put_nowait(index)
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+    ) -> LLMResponse:
+        async with self._lease() as (worker, meter):
+            response = await worker.generate(
+                prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stop=stop,
+            )
+            meter.tokens = response.completion_tokens
+            return response
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncGenerator[str, None]:
+        async with (
+            self._lease() as (worker, meter),
+            aclosing(
+                worker.generate_stream(
+                    prompt,
+                    system_prompt=system_prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            ) as stream,
+        ):
+            async for chunk in stream:
+                # llama.cpp streams one token per chunk
+                meter.tokens += 1
+                yield chunk
+
+    async def chat(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        async with self._lease() as (worker, meter):
+            response = await worker.chat(messages, temperature=temperature, max_tokens=max_tokens)
+            meter.tokens = response.completion_tokens
+            return response
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncGenerator[str, None]:
+        async with (
+            self._lease() as (worker, meter),
+            aclosing(
+                worker.chat_stream(messages, temperature=temperature, max_tokens=max_tokens)
+            ) as stream,
+        ):
+            async for chunk in stream:
+                meter.tokens += 1
+                yield chunk
+
+    def count_tokens(self, texts: list[str]) -> list[int] | None:
+        # Workers tokenize on a vocabulary-only instance, never a leased model
+        return self._workers[0].count_tokens(texts)
+
+    async def check_health(self) -> HealthStatus:
+        status = await self._workers[0].check_health()
+        status.provider = "llama_cpp_pool"
+        return status
+
+    def is_available(self) -> bool:
+        return any(worker.is_available() for worker in self._workers)
+
+    def worker_stats(self) -> dict[str, Any]:
+        """Queue depth plus per-worker request counts and decode throughput."""
+        idle = self._idle_queue()
+        workers = []
+        for index, stats in enumerate(self._stats):
+            busy = stats.busy_seconds
+            workers.append(
+                {
+                    "worker": index,
+                    "busy": stats.busy,
+                    "requests": stats.requests,
+                    "failures": stats.failures,
+                    "completion_tokens": stats.completion_tokens,
+                    "busy_seconds": round(busy, 3),
+                    "tokens_per_sec": round(stats.completion_tokens / busy, 2) if busy > 0 else 0.0,
+                }
+            )
+        return {
+            "workers": len(self._workers),
+            "idle": idle.qsize(),
+            "waiting": self._waiting,
+            "tokens_per_sec": round(sum(w["tokens_per_sec"] for w in workers), 2),
+            "per_worker": workers,
+        }
+
+
+def threads_per_worker(workers: int, configured: int = 0) -> int:
+    """CPU threads for each instance: configured, or an even share of the cores."""
+    if configured > 0:
+        return configured
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+# Singleton
+_llama_cpp_pool: LlamaCppWorkerPool | None = None
+
+
+def get_llama_cpp_pool(
+    model_path: str | None = None,
+    worker_factory: Callable[[str | None, int], ILLMProvider] | None = None,
+) -> LlamaCppWorkerPool:
+    """Get or create the llama.cpp worker pool singleton (LLM_LLAMA_WORKERS instances)."""
+    global _llama_cpp_pool
+    if _llama_cpp_pool is None:
+        llm = get_settings().llm
+        count = max(1, llm.llama_workers)
+        n_threads = threads_per_worker(count, llm.llama_threads_per_worker)
+
+        if worker_factory is None:
+            from src.infrastructure.llm.llama_cpp import LlamaCppProvider
+
+            worker_factory = LlamaCppProvider
+
+        _llama_cpp_pool = LlamaCppWorkerPool(
+            [worker_factory(model_path, n_threads) for _ in range(count)]
+        )
+        logger.info("llama_cpp_pool_created", workers=count, threads_per_worker=n_threads)
+    return _llama_cpp_pool
+
+
+def reset_llama_cpp_pool() -> None:
+    """Reset the pool (for testing)."""
+    global _llama_cpp_pool
+    _llama_cpp_pool = None
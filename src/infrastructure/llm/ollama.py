@@ -2,11 +2,17 @@
 Ollama LLM provider implementation.
 
 Provides HTTP client for Ollama API with chat and vision capabilities.
+All calls share one pooled, keep-alive ``httpx.AsyncClient`` owned by the
+provider and closed on application shutdown. Every request carries
+``keep_alive`` so the model, and the KV cache of the last prompt, stay
+loaded between chat turns; Ollama then only prefills the part of a chat
+that differs from the previous request.
 """
 
 import base64
+import json
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator
 from pathlib import Path
 from typing import Any, cast
 
@@ -44,8 +50,82 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
         self.model = settings.llm.model_name
         self.vision_model = settings.llm.vision_model
         self.timeout = settings.llm.timeout
+        self.vision_timeout = settings.llm.vision_timeout
+        self.health_timeout = settings.llm.health_timeout
+        self.connect_timeout = settings.llm.connect_timeout
         self.max_tokens = settings.llm.max_tokens
         self.temperature = settings.llm.temperature
+        self.keep_alive = settings.llm.keep_alive
+        self.limits = httpx.Limits(
+            max_connections=settings.llm.pool_max_connections,
+            max_keepalive_connections=settings.llm.pool_max_keepalive,
+            keepalive_expiry=settings.llm.pool_keepalive_expiry,
+        )
+
+        self._client: httpx.AsyncClient | None = None
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._requests = 0
+
+    # Connection pool
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled client, created on first use if not started."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.host,
+                limits=self.limits,
+                timeout=self._timeout(self.timeout),
+            )
+            logger.info(
+                "ollama_client_opened",
+                host=self.host,
+                max_connections=self.limits.max_connections,
+                max_keepalive=self.limits.max_keepalive_connections,
+            )
+        return self._client
+
+    async def start(self) -> None:
+        """Open the connection pool (called at application startup)."""
+        _ = self.client
+
+    async def close(self) -> None:
+        """Close the connection pool (called at application shutdown)."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("ollama_client_closed", requests=self._requests)
+        self._client = None
+
+    def _timeout(self, read: float) -> httpx.Timeout:
+        """Per-endpoint timeout: fast connect, endpoint-specific read."""
+        return httpx.Timeout(read, connect=self.connect_timeout)
+
+    def _track_start(self) -> None:
+        self._requests += 1
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _track_end(self) -> None:
+        self._in_flight -= 1
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Connection pool utilisation metrics."""
+        stats: dict[str, Any] = {
+            "max_connections": self.limits.max_connections,
+            "max_keepalive": self.limits.max_keepalive_connections,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "requests": self._requests,
+            "open": self._client is not None and not self._client.is_closed,
+        }
+        # httpcore's pool isn't public API; report it when present
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is not None:
+            stats["connections"] = len(connections)
+            stats["idle_connections"] = sum(1 for c in connections if c.is_idle())
+        return stats
 
     async def _make_request(
         self,
@@ -54,21 +134,25 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
         timeout: int | None = None,
     ) -> dict[str, Any]:
         """Make HTTP request to Ollama API."""
-        url = f"{self.host}/{endpoint}"
         timeout = timeout or self.timeout
 
-        async with httpx.AsyncClient(timeout=timeout + 5) as client:
-            response = await client.post(url, json=payload, timeout=timeout)
+        self._track_start()
+        try:
+            response = await self.client.post(
+                f"/{endpoint}", json=payload, timeout=self._timeout(timeout)
+            )
+        finally:
+            self._track_end()
 
-            if response.status_code == 404:
-                model = payload.get("model", "unknown")
-                raise ModelNotFoundError(model, "ollama")
+        if response.status_code == 404:
+            model = payload.get("model", "unknown")
+            raise ModelNotFoundError(model, "ollama")
 
-            if response.status_code != 200:
-                error_text = response.text[:200]
-                raise LLMUnavailableError("ollama", f"HTTP {response.status_code}: {error_text}")
+        if response.status_code != 200:
+            error_text = response.text[:200]
+            raise LLMUnavailableError("ollama", f"HTTP {response.status_code}: {error_text}")
 
-            return cast(dict[str, Any], response.json())
+        return cast(dict[str, Any], response.json())
 
     async def generate(
         self,
@@ -94,6 +178,7 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
             "model": self.model,
             "prompt": prompt,
             "stream": False,
+            "keep_alive": self.keep_alive,
             "options": options,
         }
 
@@ -120,12 +205,7 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
                 elapsed_ms=int(elapsed * 1000),
             )
 
-            return LLMResponse(
-                text=response_text,
-                model=self.model,
-                done=result.get("done", True),
-                done_reason=result.get("done_reason"),
-            )
+            return _to_response(result, response_text, self.model)
 
         return await self._with_resilience(_do_generate)
 
@@ -135,7 +215,7 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
         system_prompt: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
-    ) -> AsyncIterator[str]:
+    ) -> AsyncGenerator[str, None]:
         """Generate text with streaming output."""
         temperature = temperature if temperature is not None else self.temperature
         max_tokens = max_tokens or self.max_tokens
@@ -144,6 +224,7 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
             "model": self.model,
             "prompt": prompt,
             "stream": True,
+            "keep_alive": self.keep_alive,
             "options": {
                 "temperature": temperature,
                 "num_predict": max_tokens,
@@ -153,23 +234,46 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
         if system_prompt:
             payload["system"] = system_prompt
 
-        url = f"{self.host}/api/generate"
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            async with client.stream("POST", url, json=payload) as response:
+        self._track_start()
+        try:
+            async with self.client.stream(
+                "POST", "/api/generate", json=payload, timeout=self._timeout(self.timeout)
+            ) as response:
                 if response.status_code != 200:
                     raise LLMUnavailableError("ollama", f"HTTP {response.status_code}")
 
                 async for line in response.aiter_lines():
                     if line:
                         try:
-                            import json
-
                             data = json.loads(line)
                             if "response" in data:
                                 yield data["response"]
                         except json.JSONDecodeError:
                             continue
+        finally:
+            self._track_end()
+
+    def _chat_payload(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None,
+        max_tokens: int | None,
+        stream: bool,
+    ) -> dict[str, Any]:
+        """Build an /api/chat request; messages are passed through unchanged."""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": msg.get("role", "user"), "content": msg.get("content", "")}
+                for msg in messages
+            ],
+            "stream": stream,
+            "keep_alive": self.keep_alive,
+            "options": {
+                "temperature": temperature if temperature is not None else self.temperature,
+                "num_predict": max_tokens or self.max_tokens,
+            },
+        }
 
     async def chat(
         self,
@@ -178,28 +282,7 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
         max_tokens: int | None = None,
     ) -> LLMResponse:
         """Chat completion with message history."""
-        temperature = temperature if temperature is not None else self.temperature
-        max_tokens = max_tokens or self.max_tokens
-
-        # Convert to Ollama chat format
-        ollama_messages: list[dict[str, str]] = []
-        for msg in messages:
-            ollama_messages.append(
-                {
-                    "role": msg.get("role", "user"),
-                    "content": msg.get("content", ""),
-                }
-            )
-
-        payload = {
-            "model": self.model,
-            "messages": ollama_messages,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens,
-            },
-        }
+        payload = self._chat_payload(messages, temperature, max_tokens, stream=False)
 
         async def _do_chat() -> LLMResponse:
             start_time = time.time()
@@ -217,59 +300,99 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
                 model=self.model,
                 messages=len(messages),
                 response_len=len(response_text),
+                prompt_eval_count=result.get("prompt_eval_count"),
                 elapsed_ms=int(elapsed * 1000),
             )
 
-            return LLMResponse(
-                text=response_text,
-                model=self.model,
-                done=result.get("done", True),
-            )
+            return _to_response(result, response_text, self.model)
 
         return await self._with_resilience(_do_chat)
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Chat completion with streaming output."""
+        payload = self._chat_payload(messages, temperature, max_tokens, stream=True)
+
+        self._track_start()
+        try:
+            async with self.client.stream(
+                "POST", "/api/chat", json=payload, timeout=self._timeout(self.timeout)
+            ) as response:
+                if response.status_code != 200:
+                    raise LLMUnavailableError("ollama", f"HTTP {response.status_code}")
+
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    content = data.get("message", {}).get("content")
+                    if content:
+                        yield content
+                    if data.get("done"):
+                        logger.info(
+                            "ollama_chat_stream",
+                            model=self.model,
+                            messages=len(messages),
+                            prompt_eval_count=data.get("prompt_eval_count"),
+                            eval_count=data.get("eval_count"),
+                        )
+        finally:
+            self._track_end()
+
     async def check_health(self) -> HealthStatus:
         """Check if Ollama is available."""
         start_time = time.time()
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                # Check if Ollama is running
-                response = await client.get(f"{self.host}/api/tags")
+            # Check if Ollama is running
+            self._track_start()
+            try:
+                response = await self.client.get(
+                    "/api/tags", timeout=self._timeout(self.health_timeout)
+                )
+            finally:
+                self._track_end()
 
-                if response.status_code != 200:
-                    status = HealthStatus(
-                        available=False,
-                        provider="ollama",
-                        error=f"HTTP {response.status_code}",
-                    )
-                    self._update_health_cache(status)
-                    return status
-
-                # Check if model is available
-                data = response.json()
-                models = [m.get("name", "") for m in data.get("models", [])]
-
-                if self.model not in models and not any(self.model in m for m in models):
-                    status = HealthStatus(
-                        available=False,
-                        provider="ollama",
-                        model=self.model,
-                        error=f"Model '{self.model}' not installed. Run: ollama pull {self.model}",
-                    )
-                    self._update_health_cache(status)
-                    return status
-
-                elapsed = (time.time() - start_time) * 1000
+            if response.status_code != 200:
+                status = HealthStatus(
+                    available=False,
+                    provider="ollama",
+                    error=f"HTTP {response.status_code}",
+                )
+                self._update_health_cache(status)
+                return status
+
+            # Check if model is available
+            data = response.json()
+            models = [m.get("name", "") for m in data.get("models", [])]
+
+            if self.model not in models and not any(self.model in m for m in models):
                 status = HealthStatus(
-                    available=True,
+                    available=False,
                     provider="ollama",
                     model=self.model,
-                    response_time_ms=elapsed,
+                    error=f"Model '{self.model}' not installed. Run: ollama pull {self.model}",
                 )
                 self._update_health_cache(status)
                 return status
 
+            elapsed = (time.time() - start_time) * 1000
+            status = HealthStatus(
+                available=True,
+                provider="ollama",
+                model=self.model,
+                response_time_ms=elapsed,
+            )
+            self._update_health_cache(status)
+            return status
+
         except httpx.ConnectError:
             status = HealthStatus(
                 available=False,
@@ -323,6 +446,7 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
             "prompt": prompt,
             "images": [image_data],
             "stream": False,
+            "keep_alive": self.keep_alive,
             "options": {
                 "num_predict": max_tokens,
             },
@@ -330,7 +454,7 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
 
         async def _do_vision() -> VisionResponse:
             start_time = time.time()
-            result = await self._make_request("api/generate", payload, timeout=180)
+            result = await self._make_request("api/generate", payload, timeout=self.vision_timeout)
             elapsed = time.time() - start_time
 
             response_text = result.get("response", "")
@@ -358,6 +482,23 @@ class OllamaProvider(BaseLLMProvider, ILLMProvider, IVisionProvider):
             )
 
 
+def _to_response(result: dict[str, Any], text: str, model: str) -> LLMResponse:
+    """LLMResponse from a final Ollama result, with token counts."""
+    # prompt_eval_count covers only the prompt tokens Ollama had to evaluate,
+    # so a reused KV-cache prefix shows up as a small count
+    prompt_tokens = result.get("prompt_eval_count") or 0
+    completion_tokens = result.get("eval_count") or 0
+    return LLMResponse(
+        text=text,
+        model=model,
+        done=result.get("done", True),
+        done_reason=result.get("done_reason"),
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+    )
+
+
 # Singleton
 _ollama_provider: OllamaProvider | None = None
 
@@ -368,3 +509,9 @@ def get_ollama_provider() -> OllamaProvider:
     if _ollama_provider is None:
         _ollama_provider = OllamaProvider()
     return _ollama_provider
+
+
+async def close_ollama_provider() -> None:
+    """Close the Ollama provider's connection pool, if one was created."""
+    if _ollama_provider is not None:
+        await _ollama_provider.close()
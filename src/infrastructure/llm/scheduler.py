@@ -0,0 +1,345 @@
+"""
+Priority-aware scheduler for LLM and vision calls.
+
+All model calls share one GPU. The scheduler hands out a fixed number of
+slots, preferring interactive chat over ingest (audits, vision parsing)
+over background work (memory facts, summaries), with a concurrency cap
+per class. Requests that cannot start within their class deadline, or
+that arrive when their queue is full, are shed with LLMOverloadedError
+instead of piling up.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.config import get_logger, get_settings
+from src.core.exceptions import LLMOverloadedError
+from src.core.interfaces import (
+    HealthStatus,
+    ILLMProvider,
+    IVisionProvider,
+    LLMPriority,
+    LLMResponse,
+    VisionResponse,
+    current_llm_priority,
+)
+
+logger = get_logger(__name__)
+
+# Dispatch order
+PRIORITY_ORDER = (LLMPriority.INTERACTIVE, LLMPriority.INGEST, LLMPriority.BACKGROUND)
+
+
+@dataclass
+class _ClassStats:
+    """Counters and recent queue waits for one priority class."""
+
+    running: int = 0
+    completed: int = 0
+    shed: int = 0
+    waits: deque[float] = field(default_factory=lambda: deque(maxlen=256))
+
+
+class LLMScheduler:
+    """
+    Slot scheduler with priority queues and per-class concurrency caps.
+
+    When a slot frees up it goes to the oldest waiter of the highest
+    priority class that is under its cap.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        limits: dict[LLMPriority, int],
+        deadlines: dict[LLMPriority, float],
+        max_queue: int,
+    ):
+        self._max_concurrency = max(1, max_concurrency)
+        self._limits = {p: max(1, limits.get(p, 1)) for p in PRIORITY_ORDER}
+        self._deadlines = deadlines
+        self._max_queue = max_queue
+        self._running = 0
+        self._queues: dict[LLMPriority, deque[asyncio.Future[None]]] = {
+            p: deque() for p in PRIORITY_ORDER
+        }
+        self._stats = {p: _ClassStats() for p in PRIORITY_ORDER}
+
+    @asynccontextmanager
+    async def slot(self, priority: LLMPriority) -> AsyncIterator[None]:
+        """Hold a model slot for the duration of the block."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release(priority)
+
+    async def _acquire(self, priority: LLMPriority) -> None:
+        queue = self._queues[priority]
+        if len(queue) >= self._max_queue:
+            self._shed(priority, 0.0)
+
+        start = time.monotonic()
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        self._dispatch()
+
+        try:
+            await asyncio.wait_for(waiter, timeout=self._deadlines.get(priority))
+        except TimeoutError:
+            self._abandon(priority, waiter)
+            self._shed(priority, time.monotonic() - start)
+        except asyncio.CancelledError:
+            self._abandon(priority, waiter)
+            raise
+
+        self._stats[priority].waits.append(time.monotonic() - start)
+
+    def _abandon(self, priority: LLMPriority, waiter: asyncio.Future[None]) -> None:
+        """Give up a wait: return the slot if it was granted, else leave the queue."""
+        if waiter.done() and not waiter.cancelled():
+            # Granted in the same loop tick as the deadline or cancellation
+            self._release(priority, completed=False)
+        else:
+            self._discard(priority, waiter)
+
+    def _release(self, priority: LLMPriority, completed: bool = True) -> None:
+        self._running -= 1
+        stats = self._stats[priority]
+        stats.running -= 1
+        if completed:
+            stats.completed += 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiters in priority order."""
+        while self._running < self._max_concurrency:
+            for priority in PRIORITY_ORDER:
+                queue = self._queues[priority]
+                while queue and queue[0].done():
+                    queue.popleft()
+                if queue and self._stats[priority].running < self._limits[priority]:
+                    queue.popleft().set_result(None)
+                    self._running += 1
+                    self._stats[priority].running += 1
+                    break
+            else:
+                return
+
+    def _discard(self, priority: LLMPriority, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._queues[priority].remove(waiter)
+        except ValueError:
+            pass
+
+    def _shed(self, priority: LLMPriority, waited: float) -> None:
+        self._stats[priority].shed += 1
+        depth = len(self._queues[priority])
+        logger.warning(
+            "llm_request_shed",
+            priority=priority.value,
+            waited_ms=int(waited * 1000),
+            queue_depth=depth,
+        )
+        raise LLMOverloadedError(priority.value, waited, depth)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Per-class queue depth, running count and queue-wait metrics."""
+        classes: dict[str, Any] = {}
+        for priority in PRIORITY_ORDER:
+            stats = self._stats[priority]
+            waits = sorted(stats.waits)
+            classes[priority.value] = {
+                "queued": sum(1 for w in self._queues[priority] if not w.done()),
+                "running": stats.running,
+                "limit": self._limits[priority],
+                "completed": stats.completed,
+                "shed": stats.shed,
+                "wait_ms_avg": int(1000 * sum(waits) / len(waits)) if waits else 0,
+                "wait_ms_p95": int(1000 * waits[int(0.95 * (len(waits) - 1))]) if waits else 0,
+                "wait_ms_max": int(1000 * waits[-1]) if waits else 0,
+            }
+        return {
+            "max_concurrency": self._max_concurrency,
+            "running": self._running,
+            "classes": classes,
+        }
+
+
+class ScheduledLLMProvider(ILLMProvider, IVisionProvider):
+    """
+    Routes every model call of a provider through an LLMScheduler.
+
+    The class comes from ``llm_priority()``; untagged text calls run as
+    interactive and vision calls as ingest. A streaming call holds its
+    slot until the stream ends or is closed; closing it closes the
+    provider's stream too. Health checks bypass the scheduler.
+    """
+
+    def __init__(self, provider: Any, scheduler: "LLMScheduler"):
+        self._provider = provider
+        self._scheduler = scheduler
+
+    @property
+    def provider(self) -> Any:
+        """The wrapped provider."""
+        return self._provider
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose provider-specific extras (model, pool_stats, ...) unchanged
+        if name == "_provider":
+            raise AttributeError(name)
+        return getattr(self._provider, name)
+
+    def scheduler_stats(self) -> dict[str, Any]:
+        """Queue and wait metrics of the shared scheduler."""
+        return self._scheduler.get_stats()
+
+    @staticmethod
+    def _priority(default: LLMPriority) -> LLMPriority:
+        return current_llm_priority() or default
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+    ) -> LLMResponse:
+        async with self._scheduler.slot(self._priority(LLMPriority.INTERACTIVE)):
+            response: LLMResponse = await self._provider.generate(
+                prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stop=stop,
+            )
+            return response
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncGenerator[str, None]:
+        async with (
+            self._scheduler.slot(self._priority(LLMPriority.INTERACTIVE)),
+            aclosing(
+                self._provider.generate_stream(
+                    prompt,
+                    system_prompt=system_prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            ) as stream,
+        ):
+            async for chunk in stream:
+                yield chunk
+
+    async def chat(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        async with self._scheduler.slot(self._priority(LLMPriority.INTERACTIVE)):
+            response: LLMResponse = await self._provider.chat(
+                messages, temperature=temperature, max_tokens=max_tokens
+            )
+            return response
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncGenerator[str, None]:
+        async with (
+            self._scheduler.slot(self._priority(LLMPriority.INTERACTIVE)),
+            aclosing(
+                self._provider.chat_stream(messages, temperature=temperature, max_tokens=max_tokens)
+            ) as stream,
+        ):
+            async for chunk in stream:
+                yield chunk
+
+    async def analyze_image(
+        self,
+        image_path: str,
+        prompt: str,
+        max_tokens: int = 2048,
+    ) -> VisionResponse:
+        async with self._scheduler.slot(self._priority(LLMPriority.INGEST)):
+            response: VisionResponse = await self._provider.analyze_image(
+                image_path, prompt, max_tokens
+            )
+            return response
+
+    async def analyze_image_base64(
+        self,
+        image_data: str,
+        prompt: str,
+        max_tokens: int = 2048,
+    ) -> VisionResponse:
+        async with self._scheduler.slot(self._priority(LLMPriority.INGEST)):
+            response: VisionResponse = await self._provider.analyze_image_base64(
+                image_data, prompt, max_tokens
+            )
+            return response
+
+    def count_tokens(self, texts: list[str]) -> list[int] | None:
+        counts: list[int] | None = self._provider.count_tokens(texts)
+        return counts
+
+    async def check_health(self) -> HealthStatus:
+        status: HealthStatus = await self._provider.check_health()
+        return status
+
+    def is_available(self) -> bool:
+        return bool(self._provider.is_available())
+
+
+# Singleton
+_scheduler: LLMScheduler | None = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """
+    Get or create the process-wide LLM scheduler.
+
+    With a llama.cpp worker pool, the total and per-class slot counts are
+    raised to at least the pool size.
+    """
+    global _scheduler
+    if _scheduler is None:
+        llm = get_settings().llm
+        # Every llama.cpp pool worker decodes on its own, so let the pool fill up
+        workers = max(1, llm.llama_workers) if llm.provider == "llama_cpp" else 1
+        _scheduler = LLMScheduler(
+            max_concurrency=max(llm.scheduler_max_concurrency, workers),
+            limits={
+                LLMPriority.INTERACTIVE: max(llm.scheduler_interactive_concurrency, workers),
+                LLMPriority.INGEST: max(llm.scheduler_ingest_concurrency, workers),
+                LLMPriority.BACKGROUND: max(llm.scheduler_background_concurrency, workers),
+            },
+            deadlines={
+                LLMPriority.INTERACTIVE: llm.scheduler_interactive_deadline,
+                LLMPriority.INGEST: llm.scheduler_ingest_deadline,
+                LLMPriority.BACKGROUND: llm.scheduler_background_deadline,
+            },
+            max_queue=llm.scheduler_max_queue,
+        )
+    return _scheduler
+
+
+def reset_llm_scheduler() -> None:
+    """Reset the scheduler (for testing)."""
+    global _scheduler
+    _scheduler = None
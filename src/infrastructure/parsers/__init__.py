@@ -4,10 +4,15 @@ from src.infrastructure.parsers.base import (
     ConfidenceFactors,
     # Enhanced result types
     EnhancedParserResult,
+    # Line classification
+    LineInfo,
+    LineToken,
     ParserTiming,
+    TokenKind,
     # Confidence scoring
     calculate_confidence,
     calculate_item_confidence,
+    classify_line,
     # Text utilities
     clean_item_name,
     # Currency
@@ -25,12 +30,24 @@ from src.infrastructure.parsers.base import (
     split_cells_by_whitespace,
     strip_currency,
 )
+from src.infrastructure.parsers.page_renderer import (
+    PageRenderer,
+    get_page_renderer,
+    shutdown_page_renderer,
+)
+from src.infrastructure.parsers.parser_pool import (
+    ParserPool,
+    get_parser_pool,
+    shutdown_parser_pool,
+)
+from src.infrastructure.parsers.pymupdf_compat import PYMUPDF_AVAILABLE
 from src.infrastructure.parsers.registry import (
     DEFAULT_CONFIDENCE_THRESHOLD,
     ParserRegistry,
     get_parser_registry,
     reset_parser_registry,
 )
+from src.infrastructure.parsers.result_cache import CachedParserRegistry
 from src.infrastructure.parsers.table_aware_parser import (
     TableAwareParser,
     get_table_aware_parser,
@@ -41,11 +58,19 @@ from src.infrastructure.parsers.template_parser import (
     get_template_detector,
     get_template_parser,
 )
+from src.infrastructure.parsers.vision_cache import (
+    VISION_PROMPT_VERSION,
+    VisionResponseCache,
+    get_vision_cache,
+    reset_vision_cache,
+)
 from src.infrastructure.parsers.vision_parser import (
     VisionInvoiceResponse,
     VisionLineItem,
     VisionParser,
     get_vision_parser,
+    merge_page_extractions,
+    split_page_texts,
 )
 
 __all__ = [
@@ -61,6 +86,11 @@ __all__ = [
     "split_cells_by_whitespace",
     "safe_string",
     "strip_currency",
+    # Line classification
+    "classify_line",
+    "LineInfo",
+    "LineToken",
+    "TokenKind",
     # Date parsing
     "parse_date",
     # Currency
@@ -85,9 +115,27 @@ __all__ = [
     "VisionInvoiceResponse",
     "VisionLineItem",
     "get_vision_parser",
+    "merge_page_extractions",
+    "split_page_texts",
+    # PDF page rendering
+    "PageRenderer",
+    "PYMUPDF_AVAILABLE",
+    "get_page_renderer",
+    "shutdown_page_renderer",
+    # Vision response cache
+    "VisionResponseCache",
+    "VISION_PROMPT_VERSION",
+    "get_vision_cache",
+    "reset_vision_cache",
+    # CPU-bound parser processes
+    "ParserPool",
+    "get_parser_pool",
+    "shutdown_parser_pool",
     # Registry
     "DEFAULT_CONFIDENCE_THRESHOLD",
     "ParserRegistry",
     "get_parser_registry",
     "reset_parser_registry",
+    # Parser result cache
+    "CachedParserRegistry",
 ]
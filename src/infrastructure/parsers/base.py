@@ -9,6 +9,8 @@ import re
 import unicodedata
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import StrEnum
+from functools import cached_property, lru_cache
 from typing import Any
 
 # Bank info detection patterns
@@ -134,25 +136,11 @@ def is_bank_line(text: str) -> bool:
     Check if a line contains bank information.
 
     Used to filter bank details from item extraction.
+    Keywords, IBAN and SWIFT codes are found by ``classify_line``.
     """
     if not text:
         return False
-
-    t = text.strip().lower()
-
-    # Check keywords
-    if BANK_PATTERN.search(t):
-        return True
-
-    # Check IBAN pattern
-    if IBAN_PATTERN.search(text):
-        return True
-
-    # Check SWIFT pattern
-    if SWIFT_PATTERN.search(text):
-        return True
-
-    return False
+    return classify_line(text).is_bank
 
 
 def is_summary_or_meta_line(text: str) -> bool:
@@ -163,12 +151,7 @@ def is_summary_or_meta_line(text: str) -> bool:
     """
     if not text:
         return True
-
-    t = text.strip()
-    if len(t) < 3:
-        return True
-
-    return bool(SUMMARY_REGEX.match(t))
+    return classify_line(text).is_summary
 
 
 def is_hs_code(text: str) -> bool:
@@ -324,6 +307,16 @@ MONTH_MAP = {
 }
 
 
+_MONTH_NAMES = (
+    r"Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?"
+    r"|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?"
+)
+_ISO_DATE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_NUMERIC_DATE = re.compile(r"(\d{1,2})[/.](\d{1,2})[/.](\d{4})")
+_DAY_MONTH_YEAR = re.compile(rf"(\d{{1,2}})\s+({_MONTH_NAMES})\s*,?\s*(\d{{4}})", re.IGNORECASE)
+_MONTH_DAY_YEAR = re.compile(rf"({_MONTH_NAMES})\s+(\d{{1,2}})\s*,?\s*(\d{{4}})", re.IGNORECASE)
+
+
 def parse_date(text: str | None) -> str | None:
     """
     Parse various date formats into ISO format (YYYY-MM-DD).
@@ -343,7 +336,7 @@ def parse_date(text: str | None) -> str | None:
     text = text.strip()
 
     # Try ISO format first
-    iso_match = re.match(r"(\d{4})-(\d{1,2})-(\d{1,2})", text)
+    iso_match = _ISO_DATE.match(text)
     if iso_match:
         try:
             year, month, day = map(int, iso_match.groups())
@@ -352,7 +345,7 @@ def parse_date(text: str | None) -> str | None:
             pass
 
     # Try numeric formats: DD/MM/YYYY or MM/DD/YYYY
-    numeric_match = re.match(r"(\d{1,2})[/.](\d{1,2})[/.](\d{4})", text)
+    numeric_match = _NUMERIC_DATE.match(text)
     if numeric_match:
         a, b, year = map(int, numeric_match.groups())
         # Heuristic: if first number > 12, it's day (European format)
@@ -377,11 +370,7 @@ def parse_date(text: str | None) -> str | None:
 
     # Try long formats with month names
     # Pattern: Day Month Year (15 January 2024)
-    long_match1 = re.search(
-        r"(\d{1,2})\s+(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s*,?\s*(\d{4})",
-        text,
-        re.IGNORECASE,
-    )
+    long_match1 = _DAY_MONTH_YEAR.search(text)
     if long_match1:
         day = int(long_match1.group(1))
         month = MONTH_MAP.get(long_match1.group(2).lower()[:3], 0)
@@ -394,11 +383,7 @@ def parse_date(text: str | None) -> str | None:
                 pass
 
     # Pattern: Month Day, Year (January 15, 2024)
-    long_match2 = re.search(
-        r"(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+(\d{1,2})\s*,?\s*(\d{4})",
-        text,
-        re.IGNORECASE,
-    )
+    long_match2 = _MONTH_DAY_YEAR.search(text)
     if long_match2:
         month = MONTH_MAP.get(long_match2.group(1).lower()[:3], 0)
         day = int(long_match2.group(2))
@@ -670,6 +655,182 @@ def strip_currency(value: str) -> str:
     return result.strip()
 
 
+# ============================================================================
+# Line Classification
+# ============================================================================
+
+
+class TokenKind(StrEnum):
+    """Kinds of tokens ``classify_line`` recognizes."""
+
+    IBAN = "iban"
+    SWIFT = "swift"
+    DATE = "date"
+    HS_CODE = "hs_code"
+    NUMBER = "number"
+    CURRENCY = "currency"
+
+
+@dataclass(frozen=True)
+class LineToken:
+    """A typed token of a line and its character span."""
+
+    kind: TokenKind
+    text: str
+    start: int
+    end: int
+
+
+_WORD = re.compile(r"\S+")
+_NUMBER_PREFIX = re.compile(r"-?\d[\d,.]*\d|-?\d")
+_DOTTED_HS_CODE = re.compile(r"\d{4}\.\d{2}(?:\.\d{2}){0,2}")
+_IBAN_WORD = re.compile(r"[A-Z]{2}\d{2}[A-Z0-9]{11,30}")
+_SWIFT_WORD = re.compile(r"[A-Z]{6}[A-Z0-9]{2}(?:[A-Z0-9]{3})?")
+_CURRENCY_CODE_SET = frozenset(CURRENCY_CODES)
+_CURRENCY_SIGNS = frozenset(s for s in CURRENCY_SYMBOLS if len(s) == 1)
+_EDGE_PUNCTUATION = "()[],;:"
+
+
+def _long_date_words(words: list[tuple[int, str]], i: int) -> int:
+    """3 if words i..i+2 spell "15 January 2024" or "January 15, 2024", else 0."""
+    if i + 2 >= len(words):
+        return 0
+    first, second, year = (w.strip(_EDGE_PUNCTUATION).rstrip(".") for _, w in words[i : i + 3])
+    if not (year.isdigit() and len(year) == 4):
+        return 0
+    day, month = (first, second) if first[:1].isdigit() else (second, first)
+    if day.isdigit() and len(day) <= 2 and month.lower() in MONTH_MAP:
+        return 3
+    return 0
+
+
+def _word_tokens(word: str, offset: int) -> list[LineToken]:
+    """Tokens of one whitespace-delimited word (edge punctuation removed)."""
+    first = word[0]
+    if first.isdigit() or (first == "-" and word[1:2].isdigit()):
+        if _ISO_DATE.fullmatch(word) or _NUMERIC_DATE.fullmatch(word):
+            return [LineToken(TokenKind.DATE, word, offset, offset + len(word))]
+        if _DOTTED_HS_CODE.fullmatch(word):
+            return [LineToken(TokenKind.HS_CODE, word, offset, offset + len(word))]
+        match = _NUMBER_PREFIX.match(word)
+        if match:
+            return [LineToken(TokenKind.NUMBER, match.group(), offset, offset + match.end())]
+        return []
+
+    if word in CURRENCY_SYMBOLS or word.upper() in _CURRENCY_CODE_SET:
+        return [LineToken(TokenKind.CURRENCY, word, offset, offset + len(word))]
+    if first in _CURRENCY_SIGNS:
+        # "$1,200.00"
+        sign = LineToken(TokenKind.CURRENCY, first, offset, offset + 1)
+        return [sign, *_word_tokens(word[1:], offset + 1)] if len(word) > 1 else [sign]
+    if first.isupper():
+        if _IBAN_WORD.fullmatch(word):
+            return [LineToken(TokenKind.IBAN, word, offset, offset + len(word))]
+        if _SWIFT_WORD.fullmatch(word):
+            return [LineToken(TokenKind.SWIFT, word, offset, offset + len(word))]
+    return []
+
+
+def _scan(line: str) -> tuple[LineToken, ...]:
+    words = [(m.start(), m.group()) for m in _WORD.finditer(line)]
+    tokens: list[LineToken] = []
+    i = 0
+    while i < len(words):
+        start, raw = words[i]
+        word = raw.strip(_EDGE_PUNCTUATION).rstrip(".")
+        if not word:
+            i += 1
+            continue
+        offset = start + raw.index(word)
+
+        span = _long_date_words(words, i)
+        if span:
+            last_start, last_raw = words[i + span - 1]
+            end = last_start + len(last_raw.rstrip(_EDGE_PUNCTUATION + "."))
+            tokens.append(LineToken(TokenKind.DATE, line[offset:end], offset, end))
+            i += span
+            continue
+
+        tokens.extend(_word_tokens(word, offset))
+        i += 1
+    return tuple(tokens)
+
+
+@dataclass(frozen=True)
+class LineInfo:
+    """Tokens and classification of one line."""
+
+    text: str
+    tokens: tuple[LineToken, ...]
+    is_bank: bool
+    is_summary: bool
+
+    def of_kind(self, *kinds: TokenKind) -> list[LineToken]:
+        """Tokens of the given kinds, in line order."""
+        return [t for t in self.tokens if t.kind in kinds]
+
+    @cached_property
+    def numbers(self) -> list[float]:
+        """Values of the number tokens."""
+        values = []
+        for t in self.tokens:
+            if t.kind == TokenKind.NUMBER:
+                value = float(t.text) if t.text.isdigit() else parse_number(t.text)
+                if value is not None:
+                    values.append(value)
+        return values
+
+    @cached_property
+    def hs_code(self) -> str | None:
+        """First HS code: a dotted code or a 6-10 digit number."""
+        for t in self.tokens:
+            if t.kind == TokenKind.HS_CODE:
+                return t.text.replace(".", "")
+            if t.kind == TokenKind.NUMBER and t.text.isdigit() and 6 <= len(t.text) <= 10:
+                return t.text
+        return None
+
+    @cached_property
+    def date(self) -> str | None:
+        """First parseable date as YYYY-MM-DD."""
+        for t in self.of_kind(TokenKind.DATE):
+            parsed = parse_date(t.text)
+            if parsed:
+                return parsed
+        return None
+
+    @property
+    def currency(self) -> str | None:
+        """ISO code of the first currency symbol or code."""
+        for t in self.of_kind(TokenKind.CURRENCY):
+            return CURRENCY_SYMBOLS.get(t.text, t.text.upper())
+        return None
+
+
+@lru_cache(maxsize=8192)
+def classify_line(line: str) -> LineInfo:
+    """
+    Tokenize and classify a line, once per distinct line text.
+
+    Bank lines contain a bank keyword, an IBAN or a SWIFT code; summary
+    lines are short or match SUMMARY_PATTERNS. Token values (numbers,
+    dates, HS codes) are parsed on first access. The parsers check the
+    same lines several times, so results are cached.
+    """
+    stripped = line.strip()
+    lower = stripped.lower()
+    return LineInfo(
+        text=line,
+        tokens=_scan(line),
+        is_bank=(
+            any(keyword in lower for keyword in BANK_KEYWORDS)
+            or IBAN_PATTERN.search(line) is not None
+            or SWIFT_PATTERN.search(line) is not None
+        ),
+        is_summary=len(stripped) < 3 or SUMMARY_REGEX.match(stripped) is not None,
+    )
+
+
 # ============================================================================
 # Safe String Cleanup
 # ============================================================================
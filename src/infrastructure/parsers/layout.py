@@ -0,0 +1,167 @@
+"""
+Layout-aware table reconstruction from PDF word boxes.
+
+Plain ``get_text()`` output loses horizontal positions, and with
+proportional fonts character counts no longer line up with columns.
+This module keeps each word's bounding box, groups words into rows by
+their vertical centre, merges nearby words into cells and clusters the
+cells' x-ranges into columns. Rows come out as cells in the same shape
+as ``split_cells_by_whitespace`` (positions in PDF points), so the
+table parser can map them onto header columns.
+"""
+
+from dataclasses import dataclass
+from statistics import median
+from typing import Any
+
+from src.infrastructure.parsers.pymupdf_compat import PYMUPDF_AVAILABLE, pymupdf
+
+# Words closer than this many word-heights belong to the same cell
+_CELL_GAP_RATIO = 0.8
+
+# Words whose vertical centres differ by less than this share a row
+_ROW_TOLERANCE_RATIO = 0.5
+
+
+@dataclass(frozen=True)
+class Word:
+    """A word and its bounding box in PDF points."""
+
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    text: str
+
+    @property
+    def height(self) -> float:
+        return self.y1 - self.y0
+
+    @property
+    def y_center(self) -> float:
+        return (self.y0 + self.y1) / 2
+
+
+@dataclass
+class LayoutRow:
+    """One visual row of a page: its cells as (x0, x1, text) in reading order."""
+
+    page_no: int
+    spans: list[tuple[float, float, str]]
+
+    @property
+    def text(self) -> str:
+        return "  ".join(text for _, _, text in self.spans)
+
+
+def extract_words(pdf_path: str) -> dict[int, list[Word]]:
+    """Word boxes per page (1-based) of a PDF with a text layer."""
+    if not PYMUPDF_AVAILABLE:
+        raise ImportError("PyMuPDF not installed. Install with: pip install PyMuPDF")
+
+    pages: dict[int, list[Word]] = {}
+    with pymupdf.open(pdf_path) as doc:
+        for page_no, page in enumerate(doc, start=1):
+            pages[page_no] = [
+                Word(x0, y0, x1, y1, text)
+                for x0, y0, x1, y1, text, *_ in page.get_text("words")
+                if text.strip()
+            ]
+    return pages
+
+
+def group_rows(words: list[Word]) -> list[list[Word]]:
+    """Group words into rows by vertical centre, top to bottom, left to right."""
+    if not words:
+        return []
+
+    tolerance = median(w.height for w in words) * _ROW_TOLERANCE_RATIO
+    rows: list[list[Word]] = []
+    row_center = 0.0
+    for word in sorted(words, key=lambda w: (w.y_center, w.x0)):
+        if rows and abs(word.y_center - row_center) <= tolerance:
+            rows[-1].append(word)
+            # Running mean keeps slightly skewed rows together
+            row_center += (word.y_center - row_center) / len(rows[-1])
+        else:
+            rows.append([word])
+            row_center = word.y_center
+
+    return [sorted(row, key=lambda w: w.x0) for row in rows]
+
+
+def split_cells(row: list[Word], gap: float) -> list[tuple[float, float, str]]:
+    """Merge a row's words into cells wherever the gap between them is small."""
+    cells: list[tuple[float, float, str]] = []
+    for word in row:
+        if cells and word.x0 - cells[-1][1] <= gap:
+            x0, _, text = cells[-1]
+            cells[-1] = (x0, max(word.x1, cells[-1][1]), f"{text} {word.text}")
+        else:
+            cells.append((word.x0, word.x1, word.text))
+    return cells
+
+
+def cluster_columns(spans: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """Merge overlapping x-ranges into column spans, left to right."""
+    columns: list[tuple[float, float]] = []
+    for x0, x1 in sorted(spans):
+        if columns and x0 <= columns[-1][1]:
+            columns[-1] = (columns[-1][0], max(columns[-1][1], x1))
+        else:
+            columns.append((x0, x1))
+    return columns
+
+
+def _column_of(x0: float, x1: float, columns: list[tuple[float, float]]) -> int:
+    """Index of the column a cell overlaps most."""
+    best, best_overlap = 0, float("-inf")
+    for idx, (c0, c1) in enumerate(columns):
+        overlap = min(x1, c1) - max(x0, c0)
+        if overlap > best_overlap:
+            best, best_overlap = idx, overlap
+    return best
+
+
+def layout_rows(pages: dict[int, list[Word]]) -> list[LayoutRow]:
+    """Rows of cells for all pages, in reading order."""
+    rows: list[LayoutRow] = []
+    for page_no in sorted(pages):
+        words = pages[page_no]
+        if not words:
+            continue
+        gap = median(w.height for w in words) * _CELL_GAP_RATIO
+        rows.extend(LayoutRow(page_no, split_cells(row, gap)) for row in group_rows(words))
+    return rows
+
+
+def table_columns(rows: list[LayoutRow]) -> list[tuple[float, float]]:
+    """Column spans clustered from the cells of multi-cell table rows."""
+    return cluster_columns(
+        [(x0, x1) for row in rows if len(row.spans) >= 2 for x0, x1, _ in row.spans]
+    )
+
+
+def aligned_cells(row: LayoutRow, columns: list[tuple[float, float]]) -> list[dict[str, Any]]:
+    """
+    A row's cells snapped to columns.
+
+    Cells use the ``split_cells_by_whitespace`` shape with the column
+    span as position; cells of the row in the same column are joined.
+    """
+    if not columns:
+        return []
+
+    merged: dict[int, list[str]] = {}
+    for x0, x1, text in row.spans:
+        merged.setdefault(_column_of(x0, x1, columns), []).append(text)
+
+    return [
+        {
+            "text": " ".join(texts),
+            "start_pos": columns[idx][0],
+            "end_pos": columns[idx][1],
+            "column": idx,
+        }
+        for idx, texts in sorted(merged.items())
+    ]
@@ -0,0 +1,93 @@
+"""
+PDF page rasterization for vision parsing.
+
+MuPDF is not safe to drive from several threads, so pages are rendered
+in a small process pool; each task opens the PDF and renders one page
+to a PNG file.
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.config import get_logger, get_settings
+from src.infrastructure.parsers.pymupdf_compat import PYMUPDF_AVAILABLE, pymupdf
+
+logger = get_logger(__name__)
+
+
+def count_pages(pdf_path: str) -> int:
+    """Number of pages in a PDF."""
+    with pymupdf.open(pdf_path) as doc:
+        return int(doc.page_count)
+
+
+def render_page(pdf_path: str, page_no: int, dpi: int, output_path: str) -> str:
+    """Render one page (1-based) to a PNG file and return its path."""
+    with pymupdf.open(pdf_path) as doc:
+        pixmap = doc[page_no - 1].get_pixmap(dpi=dpi)
+        pixmap.save(output_path)
+    return output_path
+
+
+class PageRenderer:
+    """Renders PDF pages to images on a shared process pool."""
+
+    def __init__(self, workers: int | None = None, dpi: int | None = None):
+        settings = get_settings().parser
+        self._workers = max(1, workers if workers is not None else settings.vision_render_workers)
+        self.dpi = dpi if dpi is not None else settings.vision_dpi
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._workers)
+        return self._pool
+
+    async def page_count(self, pdf_path: str) -> int:
+        """Number of pages, read on the render pool."""
+        if not PYMUPDF_AVAILABLE:
+            raise ImportError("PyMuPDF not installed. Install with: pip install PyMuPDF")
+
+        loop = asyncio.get_running_loop()
+        count: int = await loop.run_in_executor(self._executor(), count_pages, pdf_path)
+        return count
+
+    async def render(self, pdf_path: str, page_no: int, output_dir: str | Path) -> str:
+        """Render a page into output_dir and return the image path."""
+        if not PYMUPDF_AVAILABLE:
+            raise ImportError("PyMuPDF not installed. Install with: pip install PyMuPDF")
+
+        output_path = str(Path(output_dir) / f"page_{page_no:04d}.png")
+        loop = asyncio.get_running_loop()
+        path: str = await loop.run_in_executor(
+            self._executor(), render_page, pdf_path, page_no, self.dpi, output_path
+        )
+        logger.debug("pdf_page_rendered", page_no=page_no, dpi=self.dpi)
+        return path
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Singleton
+_page_renderer: PageRenderer | None = None
+
+
+def get_page_renderer() -> PageRenderer:
+    """Get or create the page renderer singleton."""
+    global _page_renderer
+    if _page_renderer is None:
+        _page_renderer = PageRenderer()
+    return _page_renderer
+
+
+def shutdown_page_renderer() -> None:
+    """Stop the render processes and drop the singleton."""
+    global _page_renderer
+    if _page_renderer is not None:
+        _page_renderer.shutdown()
+    _page_renderer = None
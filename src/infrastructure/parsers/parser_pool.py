@@ -0,0 +1,163 @@
+"""
+Process pool for CPU-bound invoice parsers.
+
+Template and table parsing are pure-Python regex and string loops; on
+the event loop a long packing list stalls every other request. Tasks
+carry a parser's ``worker_factory`` rather than the parser, so each
+worker builds its own parser once and keeps it (with compiled templates)
+across documents.
+"""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from src.config import get_logger, get_settings
+from src.core.interfaces import IInvoiceParser, ParserResult
+
+logger = get_logger(__name__)
+
+
+def run_parser(
+    factory: Callable[[], IInvoiceParser],
+    text: str,
+    filename: str,
+    hints: dict[str, Any],
+) -> ParserResult:
+    """Worker entry point: build (or reuse) the parser and parse one document."""
+    return asyncio.run(factory().parse(text, filename, hints))
+
+
+class ParserPool:
+    """
+    Runs parsers in worker processes with a time budget.
+
+    Each worker is its own single-process executor, and a task only takes
+    a worker once one is idle, so the budget never includes time spent
+    queued behind other documents. A regex stuck in backtracking cannot be
+    interrupted from Python, so a task that overruns its budget gets its
+    worker killed; only that worker is replaced, on its next task. A task
+    whose worker crashed is retried once on a fresh one.
+    """
+
+    def __init__(self, workers: int | None = None):
+        settings = get_settings().parser
+        self._workers = max(1, workers if workers is not None else settings.cpu_workers)
+        self._pools: list[ProcessPoolExecutor | None] = [None] * self._workers
+        self._idle = list(range(self._workers))
+        self._slots = asyncio.Semaphore(self._workers)
+        self._restarts = 0
+
+    def _executor(self, slot: int) -> ProcessPoolExecutor:
+        pool = self._pools[slot]
+        if pool is None:
+            pool = self._pools[slot] = ProcessPoolExecutor(max_workers=1)
+        return pool
+
+    def _kill(self, slot: int, pool: ProcessPoolExecutor) -> None:
+        """Terminate a worker, unless it was already replaced."""
+        if pool is not self._pools[slot]:
+            return
+        self._pools[slot] = None
+        self._restarts += 1
+        # ProcessPoolExecutor has no public way to stop a running task
+        workers = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False)
+        for process in workers:
+            process.kill()
+
+    async def run(
+        self,
+        factory: Callable[[], IInvoiceParser],
+        text: str,
+        filename: str,
+        hints: dict[str, Any],
+        budget: float | None = None,
+    ) -> ParserResult:
+        """
+        Parse in a worker process.
+
+        Waits for an idle worker first; the budget starts once the task
+        has one.
+
+        Raises:
+            TimeoutError: If parsing takes longer than ``budget`` seconds
+        """
+        async with self._slots:
+            slot = self._idle.pop()
+            try:
+                return await self._run_in(slot, factory, text, filename, hints, budget)
+            finally:
+                self._idle.append(slot)
+
+    async def _run_in(
+        self,
+        slot: int,
+        factory: Callable[[], IInvoiceParser],
+        text: str,
+        filename: str,
+        hints: dict[str, Any],
+        budget: float | None,
+    ) -> ParserResult:
+        retried = False
+        while True:
+            pool = self._executor(slot)
+            future = pool.submit(run_parser, factory, text, filename, hints)
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(future), budget)
+            except TimeoutError:
+                self._kill(slot, pool)
+                raise
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    # Don't hand the next task a worker that is still busy
+                    if not future.done():
+                        self._kill(slot, pool)
+                    raise
+                # The pool cancelled the task on shutdown: retry as broken
+                self._kill(slot, pool)
+                if retried:
+                    raise BrokenProcessPool("Parser task cancelled by pool shutdown") from None
+                retried = True
+                logger.warning("parser_pool_retry", filename=filename)
+            except BrokenProcessPool:
+                # The worker crashed (or was shut down under the task)
+                self._kill(slot, pool)
+                if retried:
+                    raise
+                retried = True
+                logger.warning("parser_pool_retry", filename=filename)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Worker count and how often a worker was replaced."""
+        return {"workers": self._workers, "restarts": self._restarts}
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        for slot, pool in enumerate(self._pools):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+                self._pools[slot] = None
+
+
+# Singleton
+_parser_pool: ParserPool | None = None
+
+
+def get_parser_pool() -> ParserPool:
+    """Get or create the parser pool singleton."""
+    global _parser_pool
+    if _parser_pool is None:
+        _parser_pool = ParserPool()
+    return _parser_pool
+
+
+def shutdown_parser_pool() -> None:
+    """Stop the parser processes and drop the singleton."""
+    global _parser_pool
+    if _parser_pool is not None:
+        _parser_pool.shutdown()
+    _parser_pool = None
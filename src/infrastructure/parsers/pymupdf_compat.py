@@ -0,0 +1,25 @@
+"""
+Optional PyMuPDF import shared by the PDF-reading parsers.
+
+PyMuPDF >= 1.24.3 is importable as ``pymupdf``; older releases only ship
+the legacy ``fitz`` module name. ``pymupdf`` is None when neither is
+installed, so check ``PYMUPDF_AVAILABLE`` before using it.
+"""
+
+import importlib
+from typing import Any
+
+
+def _import_pymupdf() -> Any:
+    for name in ("pymupdf", "fitz"):
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+# Untyped library, exposed as Any
+pymupdf: Any = _import_pymupdf()
+
+PYMUPDF_AVAILABLE = pymupdf is not None
@@ -5,14 +5,17 @@ Manages multiple parsers and routes parsing to the best available strategy.
 Uses a deterministic parsing chain: Template (100) → Table-aware (80) → Vision (60).
 """
 
+import asyncio
+from collections import Counter
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 
-from src.config import get_logger
+from src.config import get_logger, get_settings
 from src.core.interfaces import IInvoiceParser, IParserRegistry, ParserResult
 from src.infrastructure.parsers.base import ParserTiming
+from src.infrastructure.parsers.parser_pool import ParserPool, get_parser_pool
 from src.infrastructure.parsers.table_aware_parser import get_table_aware_parser
-from src.infrastructure.parsers.template_parser import get_template_parser
+from src.infrastructure.parsers.template_parser import get_template_detector, get_template_parser
 from src.infrastructure.parsers.vision_parser import get_vision_parser
 
 logger = get_logger(__name__)
@@ -29,11 +32,18 @@ class ParserRegistry(IParserRegistry):
     Uses deterministic ordering by priority (highest first).
 
     Parsing chain: Template (100) → Table-aware (80) → Vision (60)
+
+    With a pool, parsers that provide a ``worker_factory`` (the CPU-bound
+    template and table parsers) run in worker processes; the rest run on
+    the event loop. Either way a parser that exceeds its time budget
+    counts as failed and the chain moves on.
     """
 
     def __init__(
         self,
         confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        pool: ParserPool | None = None,
+        budgets: dict[str, float] | None = None,
     ):
         """
         Initialize parser registry.
@@ -41,9 +51,18 @@ class ParserRegistry(IParserRegistry):
         Args:
             confidence_threshold: Minimum confidence to accept result
                                   and stop trying other parsers.
+            pool: Worker processes for CPU-bound parsers (default: none,
+                  everything runs on the event loop)
+            budgets: Seconds per document by parser name
+                     (default: PARSER_BUDGET_SECONDS)
         """
         self._parsers: list[IInvoiceParser] = []
         self._confidence_threshold = confidence_threshold
+        self._pool = pool
+        self._budgets = budgets if budgets is not None else get_settings().parser.budget_seconds
+        self._outcomes: Counter[str] = Counter()
+        self._layout_tables = 0
+        self._budget_exceeded: Counter[str] = Counter()
 
     @property
     def confidence_threshold(self) -> float:
@@ -121,6 +140,77 @@ class ParserRegistry(IParserRegistry):
         """
         Parse using the best available parser.
 
+        See ``_parse_chain``; the outcome is counted for ``get_stats``.
+        """
+        result = await self._parse_chain(text, filename, hints)
+        self._outcomes[result.parser_name if result.success else "failed"] += 1
+        if result.success and (result.metadata or {}).get("layout") == "words":
+            self._layout_tables += 1
+        return result
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Documents parsed per winning parser and the vision fallback rate.
+
+        ``vision_fallback_rate_without_layout`` counts the documents the
+        word-box layout pass recovered as vision fallbacks, i.e. the rate
+        before that pass existed.
+        """
+        documents = sum(self._outcomes.values())
+        vision = self._outcomes.get("vision", 0)
+        stats: dict[str, Any] = {
+            "documents": documents,
+            "by_parser": dict(self._outcomes),
+            "layout_tables": self._layout_tables,
+            "vision_fallback_rate": round(vision / documents, 4) if documents else 0.0,
+            "vision_fallback_rate_without_layout": (
+                round((vision + self._layout_tables) / documents, 4) if documents else 0.0
+            ),
+            "budget_exceeded": dict(self._budget_exceeded),
+        }
+        if self._pool is not None:
+            stats["pool"] = self._pool.get_stats()
+        return stats
+
+    async def _run_parser(
+        self,
+        parser: IInvoiceParser,
+        text: str,
+        filename: str,
+        hints: dict[str, Any],
+    ) -> ParserResult:
+        """Run one parser in the pool or on the loop, within its budget."""
+        budget = self._budgets.get(parser.name)
+        factory = parser.worker_factory() if self._pool is not None else None
+        try:
+            if self._pool is not None and factory is not None:
+                return await self._pool.run(factory, text, filename, hints, budget)
+            return await asyncio.wait_for(parser.parse(text, filename, hints), budget)
+        except TimeoutError:
+            if budget is None:
+                raise  # raised by the parser itself
+            self._budget_exceeded[parser.name] += 1
+            logger.warning(
+                "parser_budget_exceeded",
+                parser_name=parser.name,
+                budget_seconds=budget,
+                filename=filename,
+            )
+            return ParserResult(
+                success=False,
+                parser_name=parser.name,
+                error=f"Exceeded {budget:g}s time budget",
+            )
+
+    async def _parse_chain(
+        self,
+        text: str,
+        filename: str,
+        hints: dict[str, Any] | None = None,
+    ) -> ParserResult:
+        """
+        Run the parser chain.
+
         Tries parsers in priority order:
         1. Template parser (priority 100) - if template matches
         2. Table-aware parser (priority 80) - for structured tables
@@ -175,7 +265,7 @@ class ParserRegistry(IParserRegistry):
             )
 
             try:
-                result = await parser.parse(text, filename, hints)
+                result = await self._run_parser(parser, text, filename, hints)
                 end_time = datetime.now(UTC)
                 duration_ms = (end_time - start_time).total_seconds() * 1000
 
@@ -339,7 +429,7 @@ class ParserRegistry(IParserRegistry):
                 error=f"Parser '{parser_name}' not found",
             )
 
-        return await parser.parse(text, filename, hints or {})
+        return await self._run_parser(parser, text, filename, hints or {})
 
 
 # Singleton registry with default parsers
@@ -347,17 +437,34 @@ _registry: ParserRegistry | None = None
 
 
 def get_parser_registry() -> ParserRegistry:
-    """Get or create the global parser registry with default parsers."""
+    """
+    Get or create the global parser registry with default parsers.
+
+    The registry is wrapped in the result cache when
+    CACHE_PARSER_CACHE_ENABLED; registry methods are forwarded unchanged.
+    """
     global _registry
 
     if _registry is None:
-        _registry = ParserRegistry()
+        settings = get_settings()
+        registry = ParserRegistry(
+            pool=get_parser_pool() if settings.parser.cpu_workers > 0 else None,
+        )
 
         # Register default parsers in priority order
-        _registry.register(get_template_parser())
-        _registry.register(get_table_aware_parser())
-        _registry.register(get_vision_parser())
+        registry.register(get_template_parser())
+        registry.register(get_table_aware_parser())
+        registry.register(get_vision_parser())
+
+        if settings.cache.parser_cache_enabled:
+            from src.infrastructure.parsers.result_cache import CachedParserRegistry
+
+            registry = cast(
+                ParserRegistry,
+                CachedParserRegistry(registry, detector=get_template_detector()),
+            )
 
+        _registry = registry
         logger.info(
             "parser_registry_initialized",
             parsers=[p.name for p in _registry.get_parsers()],
@@ -0,0 +1,275 @@
+"""
+Result cache layered over the parser registry.
+
+Re-parsing an unchanged document (reprocess, audit re-runs, template
+experiments) returns the stored ParserResult instead of running the
+template → table-aware → vision chain again.
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Any
+
+from src.config import get_logger, get_settings
+from src.core.entities import Invoice, LineItem
+from src.core.interfaces import IInvoiceParser, IParserRegistry, ParserResult
+from src.infrastructure.parsers.template_parser import TemplateDetector
+from src.infrastructure.parsers.vision_cache import hash_image
+from src.infrastructure.storage.sqlite.parser_result_store import SQLiteParserResultStore
+
+logger = get_logger(__name__)
+
+# Hints that name the document rather than describe its content
+_IDENTITY_HINTS = frozenset({"doc_id", "filename", "no_cache"})
+
+# Hints pointing at files; their content is hashed instead of the path
+_FILE_HINTS = frozenset({"pdf_path", "image_path"})
+
+
+def hints_digest(hints: dict[str, Any]) -> str:
+    """
+    Digest of the hints that can change a parse result.
+
+    Raises:
+        OSError: If a file hint cannot be read
+    """
+    material: dict[str, Any] = {}
+    for key, value in hints.items():
+        if key in _IDENTITY_HINTS:
+            continue
+        material[key] = hash_image(value) if key in _FILE_HINTS and value else value
+    encoded = json.dumps(material, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def dump_result(result: ParserResult) -> str:
+    """Serialize a ParserResult to JSON."""
+    return json.dumps(
+        {
+            "success": result.success,
+            "invoice": result.invoice.model_dump(mode="json") if result.invoice else None,
+            "items": [item.model_dump(mode="json") for item in result.items or []],
+            "confidence": result.confidence,
+            "parser_name": result.parser_name,
+            "error": result.error,
+            "metadata": result.metadata,
+        },
+        ensure_ascii=False,
+        default=str,
+    )
+
+
+def load_result(data: str) -> ParserResult:
+    """Rebuild a ParserResult from ``dump_result`` output."""
+    raw = json.loads(data)
+    return ParserResult(
+        success=raw["success"],
+        invoice=Invoice.model_validate(raw["invoice"]) if raw["invoice"] else None,
+        items=[LineItem.model_validate(item) for item in raw["items"]],
+        confidence=raw["confidence"],
+        parser_name=raw["parser_name"],
+        error=raw["error"],
+        metadata=raw["metadata"],
+    )
+
+
+class CachedParserRegistry(IParserRegistry):
+    """
+    Caching decorator for an IParserRegistry.
+
+    Successful ``parse`` results that meet the registry's confidence
+    threshold and have no failed pages are cached in SQLite, keyed by a
+    SHA-256 of the text, the hints digest, the name and version of every
+    registered parser, and the template the text matches together with
+    that template's revision. Editing a template therefore changes the
+    key of every document it matches; entries stored under a template
+    that a reload edited or removed are also deleted, so they do not
+    linger until LRU eviction. Pass ``no_cache=True`` in the hints to
+    re-run the parsers and refresh the entry.
+
+    Cache failures are logged and never fail the underlying parse.
+    """
+
+    def __init__(
+        self,
+        registry: IParserRegistry,
+        store: SQLiteParserResultStore | None = None,
+        detector: TemplateDetector | None = None,
+        max_entries: int | None = None,
+    ):
+        settings = get_settings().cache
+        self._registry = registry
+        self._store = store or SQLiteParserResultStore()
+        self._detector = detector
+        self._max_entries = (
+            max_entries if max_entries is not None else settings.parser_cache_max_entries
+        )
+        self._stale_templates: set[str] = set()
+        self._hits = 0
+        self._misses = 0
+        self._invalidated = 0
+        if detector is not None:
+            detector.add_change_listener(self._stale_templates.update)
+
+    @property
+    def registry(self) -> IParserRegistry:
+        """The wrapped registry."""
+        return self._registry
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose registry extras (get_parser, confidence_threshold, ...) unchanged
+        if name == "_registry":
+            raise AttributeError(name)
+        return getattr(self._registry, name)
+
+    def register(self, parser: IInvoiceParser) -> None:
+        self._registry.register(parser)
+
+    def unregister(self, parser_name: str) -> bool:
+        return self._registry.unregister(parser_name)
+
+    def get_parsers(self) -> list[IInvoiceParser]:
+        return self._registry.get_parsers()
+
+    async def parse_with_parser(
+        self,
+        parser_name: str,
+        text: str,
+        filename: str,
+        hints: dict[str, Any] | None = None,
+    ) -> ParserResult:
+        """Parse with one parser; never cached."""
+        return await self._registry.parse_with_parser(parser_name, text, filename, hints)
+
+    @staticmethod
+    def _content_digests(text: str, hints: dict[str, Any]) -> tuple[str, str]:
+        """
+        Digests of the text and hints.
+
+        Raises:
+            OSError: If a file hint cannot be read
+        """
+        text_digest = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+        return text_digest, hints_digest(hints)
+
+    def _cache_key(self, text: str, digests: tuple[str, str]) -> tuple[str, str | None]:
+        """Content address of a parse, and the template the text matches."""
+        template_id = None
+        template_revision = None
+        if self._detector is not None:
+            match = self._detector.detect(text)
+            if match is not None:
+                template_id = match.template_id
+                template_revision = self._detector.template_revision(template_id)
+
+        text_digest, hints_key = digests
+        material = {
+            "text": text_digest,
+            "hints": hints_key,
+            "parsers": [[p.name, p.version] for p in self._registry.get_parsers()],
+            "template": [template_id, template_revision],
+        }
+        encoded = json.dumps(material, sort_keys=True)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest(), template_id
+
+    async def _drop_stale_templates(self) -> None:
+        if not self._stale_templates:
+            return
+        template_ids = set(self._stale_templates)
+        self._stale_templates.difference_update(template_ids)
+        try:
+            removed = await self._store.invalidate_templates(template_ids)
+        except Exception as e:
+            logger.warning("parser_cache_invalidate_failed", error=str(e))
+            return
+        self._invalidated += removed
+        logger.info("parser_cache_invalidated", templates=sorted(template_ids), entries=removed)
+
+    async def _lookup(self, key: str) -> ParserResult | None:
+        try:
+            cached = await self._store.get(key)
+            result = load_result(cached) if cached is not None else None
+        except Exception as e:
+            logger.warning("parser_cache_read_failed", error=str(e))
+            return None
+
+        if result is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            logger.debug("parser_cache_hit", key=key[:12], parser_name=result.parser_name)
+        return result
+
+    def _cacheable(self, result: ParserResult) -> bool:
+        """Only complete results the registry would accept are kept."""
+        if not result.success:
+            return False
+        threshold = getattr(self._registry, "confidence_threshold", None)
+        if threshold is not None and result.confidence < threshold:
+            return False
+        # A page that failed may succeed next time (shed or timed-out vision call)
+        pages = (result.metadata or {}).get("pages") or []
+        return not any(isinstance(page, dict) and page.get("error") for page in pages)
+
+    async def _remember(self, key: str, template_id: str | None, result: ParserResult) -> None:
+        if not self._cacheable(result):
+            return
+        try:
+            await self._store.put(
+                key, result.parser_name, template_id, dump_result(result), self._max_entries
+            )
+        except Exception as e:
+            logger.warning("parser_cache_write_failed", error=str(e))
+
+    async def parse(
+        self,
+        text: str,
+        filename: str,
+        hints: dict[str, Any] | None = None,
+    ) -> ParserResult:
+        """Parse using the registry, served from cache when possible."""
+        hints = hints or {}
+        try:
+            # Hashing the text and any PDF is slow, so keep it off the loop;
+            # detection stays on it, as the detector is shared with the parsers
+            digests = await asyncio.to_thread(self._content_digests, text, hints)
+            key, template_id = self._cache_key(text, digests)
+        except Exception as e:
+            logger.warning("parser_cache_key_failed", filename=filename, error=str(e))
+            return await self._registry.parse(text, filename, hints)
+
+        await self._drop_stale_templates()
+
+        if not hints.get("no_cache"):
+            cached = await self._lookup(key)
+            if cached is not None:
+                cached.metadata = cached.metadata or {}
+                cached.metadata["parser_cache_hit"] = True
+                return cached
+
+        result = await self._registry.parse(text, filename, hints)
+        await self._remember(key, template_id, result)
+        return result
+
+    async def invalidate_templates(self, template_ids: set[str]) -> int:
+        """Drop cached results parsed with any of the templates."""
+        self._stale_templates.update(template_ids)
+        before = self._invalidated
+        await self._drop_stale_templates()
+        return self._invalidated - before
+
+    async def clear(self) -> int:
+        """Drop all cached results."""
+        return await self._store.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Registry statistics plus this process's cache counters."""
+        get_stats = getattr(self._registry, "get_stats", None)
+        stats: dict[str, Any] = dict(get_stats()) if get_stats else {}
+        stats["cache"] = {
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidated": self._invalidated,
+        }
+        return stats
@@ -4,21 +4,31 @@ Table-aware invoice parser.
 Handles complex invoice layouts with column detection and multi-line descriptions.
 """
 
+import asyncio
 import re
+from collections.abc import Callable
 from typing import Any
 
 from src.config import get_logger
 from src.core.entities import Invoice, LineItem, RowType
 from src.core.interfaces import IInvoiceParser, ParserResult
 from src.infrastructure.parsers.base import (
+    classify_line,
     clean_item_name,
-    extract_hs_code,
     extract_table_block,
     is_bank_line,
     is_summary_or_meta_line,
     parse_number,
     split_cells_by_whitespace,
 )
+from src.infrastructure.parsers.layout import (
+    LayoutRow,
+    aligned_cells,
+    extract_words,
+    layout_rows,
+    table_columns,
+)
+from src.infrastructure.parsers.pymupdf_compat import PYMUPDF_AVAILABLE
 
 logger = get_logger(__name__)
 
@@ -86,6 +96,7 @@ class TableAwareParser(IInvoiceParser):
     - Multi-line description handling
     - Vertical block layout support
     - Position-based cell extraction
+    - Word-box layout pass for PDFs whose plain text doesn't line up
     """
 
     @property
@@ -96,6 +107,13 @@ class TableAwareParser(IInvoiceParser):
     def priority(self) -> int:
         return 80
 
+    @property
+    def version(self) -> str:
+        return "3"  # 2: word-box layout pass, 3: line classifier
+
+    def worker_factory(self) -> Callable[[], IInvoiceParser]:
+        return get_table_aware_parser
+
     def can_parse(self, text: str, hints: dict[str, Any] | None = None) -> float:
         """
         Check if text has table-like structure.
@@ -127,8 +145,17 @@ class TableAwareParser(IInvoiceParser):
                 aligned_rows += 1
 
         alignment_score = min(0.3, aligned_rows * 0.05)
+        score = header_score + alignment_score
+
+        # Columns can still be rebuilt from word positions
+        if self._layout_available(hints):
+            score = max(score, 0.5)
 
-        return header_score + alignment_score
+        return score
+
+    @staticmethod
+    def _layout_available(hints: dict[str, Any] | None) -> bool:
+        return bool(PYMUPDF_AVAILABLE and hints and hints.get("pdf_path"))
 
     async def parse(
         self,
@@ -136,9 +163,25 @@ class TableAwareParser(IInvoiceParser):
         filename: str,
         hints: dict[str, Any] | None = None,
     ) -> ParserResult:
-        """Parse invoice using table-aware logic."""
+        """
+        Parse invoice using table-aware logic.
+
+        The plain-text pass runs first. When it finds no table and the
+        PDF is available, columns are rebuilt from word boxes instead.
+        """
         hints = hints or {}
 
+        result = self._parse_text(text, hints)
+        if result.success or not self._layout_available(hints):
+            return result
+
+        layout_result = await self._parse_layout(hints["pdf_path"], hints)
+        if layout_result.success:
+            return layout_result
+        return result
+
+    def _parse_text(self, text: str, hints: dict[str, Any]) -> ParserResult:
+        """Parse columns from whitespace-aligned plain text."""
         # Extract table block
         text = extract_table_block(text)
         lines = text.split("\n")
@@ -188,6 +231,125 @@ class TableAwareParser(IInvoiceParser):
             metadata={"header_row": header_idx, "columns": list(column_map.keys())},
         )
 
+    async def _parse_layout(self, pdf_path: str, hints: dict[str, Any]) -> ParserResult:
+        """Parse columns clustered from the PDF's word bounding boxes."""
+        try:
+            rows = layout_rows(await asyncio.to_thread(extract_words, pdf_path))
+        except Exception as e:
+            logger.warning("layout_extraction_failed", error=str(e))
+            return ParserResult(
+                success=False, parser_name=self.name, error=f"Layout extraction failed: {e}"
+            )
+
+        header_idx = self._find_layout_header(rows, hints)
+        if header_idx < 0:
+            return ParserResult(
+                success=False,
+                parser_name=self.name,
+                error="No header row detected in layout",
+            )
+
+        # Columns come from the header and the table body up to the totals
+        table = [rows[header_idx]]
+        for row in rows[header_idx + 1 :]:
+            info = classify_line(row.text)
+            if info.is_summary:
+                if re.search(r"\btotal\b", row.text, re.IGNORECASE):
+                    break
+                continue
+            if not info.is_bank:
+                table.append(row)
+        columns = table_columns(table)
+
+        column_map = self._classify_cells(aligned_cells(rows[header_idx], columns))
+        if len(column_map) < 2:
+            return ParserResult(
+                success=False,
+                parser_name=self.name,
+                error="No header columns detected in layout",
+            )
+
+        items = self._parse_layout_items(table[1:], columns, column_map)
+        if not items:
+            return ParserResult(
+                success=False,
+                parser_name=self.name,
+                error="No items extracted from layout",
+            )
+
+        invoice = Invoice(items=items)
+        invoice.total_quantity = sum(i.quantity for i in items if i.row_type == RowType.LINE_ITEM)
+
+        logger.info("layout_table_parsed", items=len(items), columns=len(columns))
+        return ParserResult(
+            success=True,
+            invoice=invoice,
+            items=items,
+            confidence=0.8,
+            parser_name=self.name,
+            metadata={
+                "layout": "words",
+                "header_row": header_idx,
+                "columns": list(column_map.keys()),
+                "pages": sorted({row.page_no for row in table}),
+            },
+        )
+
+    def _find_layout_header(self, rows: list[LayoutRow], hints: dict[str, Any]) -> int:
+        """Index of the first layout row that looks like a table header."""
+        header_pattern = hints.get("header_row_pattern")
+        for i, row in enumerate(rows):
+            if header_pattern:
+                try:
+                    if re.search(header_pattern, row.text, re.IGNORECASE):
+                        return i
+                except re.error:
+                    header_pattern = None
+            if len(row.spans) >= 2 and self._header_keyword_count(row.text) >= 3:
+                return i
+        return -1
+
+    @staticmethod
+    def _header_keyword_count(line: str) -> int:
+        lower = line.lower()
+        return sum(1 for patterns in HEADER_PATTERNS.values() if any(p in lower for p in patterns))
+
+    def _parse_layout_items(
+        self,
+        rows: list[LayoutRow],
+        columns: list[tuple[float, float]],
+        column_map: dict[str, Any],
+    ) -> list[LineItem]:
+        """Build items from column-aligned rows; description-only rows continue the previous item."""
+        items: list[LineItem] = []
+        description_column = column_map.get("description", {}).get("index")
+
+        for row in rows:
+            text = row.text.strip()
+            if not text:
+                continue
+            info = classify_line(text)
+            if info.is_bank or info.is_summary:
+                continue
+
+            cells = aligned_cells(row, columns)
+            item = self._row_to_item(cells, column_map, len(items) + 1, max_distance=1.0)
+            if item is not None:
+                items.append(item)
+                continue
+
+            # Wrapped description text sits alone in the description column
+            if (
+                items
+                and description_column is not None
+                and all(cell["column"] == description_column for cell in cells)
+            ):
+                last = items[-1]
+                last.description = f"{last.description} {text}".strip()
+                last.item_name = clean_item_name(last.description)
+
+        return items
+
     def _detect_vertical_layout(self, lines: list[str]) -> bool:
         """Detect if invoice uses vertical block layout."""
         numbered_lines = 0
@@ -375,10 +537,8 @@ class TableAwareParser(IInvoiceParser):
             if len(line) < 5:
                 continue
 
-            if is_bank_line(line):
-                continue
-
-            if is_summary_or_meta_line(line):
+            info = classify_line(line)
+            if info.is_bank or info.is_summary:
                 continue
 
             # Extract cells
@@ -386,47 +546,62 @@ class TableAwareParser(IInvoiceParser):
             if len(cells) < 2:
                 continue
 
-            # Map cells to columns
-            row_data = self._extract_row_data(cells, column_map)
-
-            # Validate minimum data
-            has_numeric = any(
-                [
-                    row_data.get("quantity"),
-                    row_data.get("unit_price"),
-                    row_data.get("total_price"),
-                ]
-            )
-
-            if not has_numeric:
-                continue
-
-            description = row_data.get("description", "")
-            if not description:
-                # Use first cell as description
-                description = cells[0]["text"] if cells else ""
+            item = self._row_to_item(cells, column_map, line_number)
+            if item is not None:
+                items.append(item)
+                line_number += 1
 
-            if is_summary_or_meta_line(description):
-                continue
+        return items
 
-            items.append(
-                LineItem(
-                    line_number=line_number,
-                    item_name=clean_item_name(description),
-                    description=description,
-                    hs_code=row_data.get("hs_code"),
-                    unit=row_data.get("unit"),
-                    quantity=row_data.get("quantity") or 0.0,
-                    unit_price=row_data.get("unit_price") or 0.0,
-                    total_price=row_data.get("total_price") or 0.0,
-                    row_type=RowType.LINE_ITEM,
-                )
-            )
-            line_number += 1
+    def _row_to_item(
+        self,
+        cells: list[dict[str, Any]],
+        column_map: dict[str, Any],
+        line_number: int,
+        max_distance: float = 100,
+    ) -> LineItem | None:
+        """Line item from a row's cells, or None for non-item rows."""
+        # Map cells to columns
+        row_data = self._extract_row_data(cells, column_map, max_distance)
+
+        # Validate minimum data
+        has_numeric = any(
+            [
+                row_data.get("quantity"),
+                row_data.get("unit_price"),
+                row_data.get("total_price"),
+            ]
+        )
 
-        return items
+        if not has_numeric:
+            return None
+
+        description = row_data.get("description", "")
+        if not description:
+            # Use first cell as description
+            description = cells[0]["text"] if cells else ""
+
+        if is_summary_or_meta_line(description):
+            return None
+
+        return LineItem(
+            line_number=line_number,
+            item_name=clean_item_name(description),
+            description=description,
+            hs_code=row_data.get("hs_code"),
+            unit=row_data.get("unit"),
+            quantity=row_data.get("quantity") or 0.0,
+            unit_price=row_data.get("unit_price") or 0.0,
+            total_price=row_data.get("total_price") or 0.0,
+            row_type=RowType.LINE_ITEM,
+        )
 
-    def _extract_row_data(self, cells: list[dict[str, Any]], column_map: dict[str, Any]) -> dict[str, Any]:
+    def _extract_row_data(
+        self,
+        cells: list[dict[str, Any]],
+        column_map: dict[str, Any],
+        max_distance: float = 100,
+    ) -> dict[str, Any]:
         """Extract data from row cells using column map."""
         data: dict[str, Any] = {}
         used_cells = set()
@@ -453,7 +628,7 @@ class TableAwareParser(IInvoiceParser):
                     best_distance = distance
                     best_cell = (idx, cell)
 
-            if best_cell and best_distance < 100:
+            if best_cell and best_distance < max_distance:
                 idx, cell = best_cell
                 used_cells.add(idx)
                 value = cell["text"]
@@ -461,7 +636,7 @@ class TableAwareParser(IInvoiceParser):
                 if col_type in ["quantity", "unit_price", "total_price"]:
                     data[col_type] = parse_number(value)
                 elif col_type == "hs_code":
-                    data[col_type] = extract_hs_code(value)
+                    data[col_type] = classify_line(value).hs_code
                 else:
                     data[col_type] = value
 
@@ -4,7 +4,13 @@ Template-based invoice parser.
 Matches invoices against company templates for structured extraction.
 """
 
+import functools
+import hashlib
 import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -15,32 +21,158 @@ from src.core.entities import Invoice, LineItem, RowType
 from src.core.interfaces import IInvoiceParser, ITemplateDetector, ParserResult, TemplateMatch
 from src.infrastructure.parsers.base import clean_item_name, is_hs_code, parse_number
 
+try:
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse as _sre_parse
+
 logger = get_logger(__name__)
 
+_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Shorter literals filter out too little to be worth a substring scan
+_MIN_LITERAL_LENGTH = 3
+
+
+def required_literal(pattern: str) -> str | None:
+    """
+    Longest literal run every match of a pattern contains, casefolded.
+
+    Only top-level runs of plain ASCII characters count, so the result is
+    a necessary condition for a case-insensitive match: if it is not in
+    the casefolded text, the pattern cannot match. Patterns with top-level
+    alternation or no usable run return None (always searched).
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, _PATTERN_FLAGS)
+    except (re.error, RecursionError):
+        return None
+
+    best = ""
+    run: list[str] = []
+    for op, arg in parsed:
+        if op is _sre_parse.LITERAL and arg < 128:
+            run.append(chr(arg))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    if len(run) > len(best):
+        best = "".join(run)
+
+    return best.casefold() if len(best) >= _MIN_LITERAL_LENGTH else None
+
+
+def _compile(pattern: str, template_id: str, flags: int = _PATTERN_FLAGS) -> re.Pattern[str] | None:
+    try:
+        return re.compile(pattern, flags)
+    except (re.error, TypeError) as e:
+        logger.warning("template_pattern_invalid", template=template_id, pattern=str(pattern), error=str(e))
+        return None
+
+
+@dataclass
+class CompiledTemplate:
+    """A template with its patterns compiled once at load."""
+
+    template_id: str
+    data: dict[str, Any]
+    # (pattern, required literal) for every valid detection pattern
+    detection: list[tuple[re.Pattern[str], str | None]] = field(default_factory=list)
+    # Listed detection patterns, invalid ones included, as the score denominator
+    pattern_count: int = 0
+    field_patterns: dict[str, re.Pattern[str]] = field(default_factory=dict)
+    item_pattern: re.Pattern[str] | None = None
+
+    @classmethod
+    def build(cls, template_id: str, data: dict[str, Any]) -> "CompiledTemplate":
+        """Compile detection, field and item patterns of a template."""
+        patterns = data.get("detection_patterns") or []
+        compiled = cls(template_id=template_id, data=data, pattern_count=len(patterns))
+
+        for pattern in patterns:
+            regex = _compile(pattern, template_id)
+            if regex is not None:
+                compiled.detection.append((regex, required_literal(pattern)))
+
+        for name, pattern in (data.get("field_patterns") or {}).items():
+            regex = _compile(pattern, template_id)
+            if regex is not None:
+                compiled.field_patterns[name] = regex
+
+        if data.get("item_pattern"):
+            compiled.item_pattern = _compile(data["item_pattern"], template_id, re.MULTILINE)
+
+        return compiled
+
+    def upper_bound(self, present: set[str]) -> float:
+        """Best score possible given the literals found in the text."""
+        if not self.pattern_count:
+            return 0.0
+        possible = sum(1 for _, literal in self.detection if literal is None or literal in present)
+        return possible / self.pattern_count
+
+    def score(self, text: str, present: set[str]) -> float:
+        """Fraction of detection patterns matching the text."""
+        if not self.pattern_count:
+            return 0.0
+        matches = sum(
+            1
+            for regex, literal in self.detection
+            if (literal is None or literal in present) and regex.search(text)
+        )
+        return matches / self.pattern_count
+
 
 class TemplateDetector(ITemplateDetector):
     """
     Detects which company template matches an invoice.
 
-    Uses regex patterns defined in template YAML files.
+    Uses regex patterns defined in template YAML files, compiled once at
+    load. Each pattern's required literal is checked against the text
+    first, so templates that cannot reach the confidence threshold are
+    never regex-searched. Results are kept in a bounded LRU keyed by a
+    digest of the text, and the template directories are re-read when
+    their files change. Each template has a revision (a digest of its
+    file); listeners added with ``add_change_listener`` are told which
+    templates were edited or removed by a reload.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_size: int | None = None, reload_interval: float | None = None) -> None:
+        settings = get_settings().parser
+        self._cache_size = max(0, cache_size if cache_size is not None else settings.template_cache_size)
+        self._reload_interval = (
+            reload_interval if reload_interval is not None else settings.template_reload_interval
+        )
         self._templates: dict[str, dict[str, Any]] = {}
-        self._detection_cache: dict[str, TemplateMatch | None] = {}
+        self._compiled: dict[str, CompiledTemplate] = {}
+        self._revisions: dict[str, str] = {}
+        self._listeners: list[Callable[[set[str]], None]] = []
+        self._literals: frozenset[str] = frozenset()
+        self._template_dirs: list[str] = []
+        self._fingerprint: tuple[tuple[str, int, int], ...] = ()
+        self._checked_at = 0.0
+        self._detection_cache: OrderedDict[str, TemplateMatch | None] = OrderedDict()
 
     def load_templates(self, template_dir: str) -> int:
         """Load templates from directory."""
+        if template_dir not in self._template_dirs:
+            self._template_dirs.append(template_dir)
+        count = self._load_dir(template_dir)
+        self._templates_changed()
+        return count
+
+    def _load_dir(self, template_dir: str) -> int:
         path = Path(template_dir)
         if not path.exists():
             logger.warning("template_dir_not_found", path=str(path))
             return 0
 
         count = 0
-        for yaml_file in path.glob("*.yaml"):
+        for yaml_file in sorted(path.glob("*.yaml")):
             try:
-                with open(yaml_file, encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
+                raw = yaml_file.read_bytes()
+                data = yaml.safe_load(raw.decode("utf-8"))
 
                 if not data:
                     continue
@@ -49,6 +181,8 @@ class TemplateDetector(ITemplateDetector):
                 data["_id"] = template_id
                 data["_path"] = str(yaml_file)
                 self._templates[template_id] = data
+                self._compiled[template_id] = CompiledTemplate.build(template_id, data)
+                self._revisions[template_id] = hashlib.sha256(raw).hexdigest()[:16]
                 count += 1
 
             except Exception as e:
@@ -57,68 +191,153 @@ class TemplateDetector(ITemplateDetector):
         logger.info("templates_loaded", count=count, dir=str(path))
         return count
 
-    def detect(self, text: str) -> TemplateMatch | None:
-        """Detect which template matches the invoice."""
-        if not self._templates:
+    def _templates_changed(self) -> None:
+        self._literals = frozenset(
+            literal
+            for compiled in self._compiled.values()
+            for _, literal in compiled.detection
+            if literal is not None
+        )
+        self._detection_cache.clear()
+        self._fingerprint = self._dir_fingerprint()
+        self._checked_at = time.monotonic()
+
+    def _dir_fingerprint(self) -> tuple[tuple[str, int, int], ...]:
+        entries = []
+        for template_dir in self._template_dirs:
+            path = Path(template_dir)
+            if not path.exists():
+                continue
+            for yaml_file in path.glob("*.yaml"):
+                try:
+                    stat = yaml_file.stat()
+                except OSError:
+                    continue
+                entries.append((str(yaml_file), stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(entries))
+
+    def reload(self) -> int:
+        """Drop all templates and load the known directories again."""
+        previous = dict(self._revisions)
+        self._templates.clear()
+        self._compiled.clear()
+        self._revisions.clear()
+        count = sum(self._load_dir(d) for d in self._template_dirs)
+        self._templates_changed()
+
+        changed = {
+            template_id
+            for template_id, revision in previous.items()
+            if self._revisions.get(template_id) != revision
+        }
+        logger.info("templates_reloaded", count=count, changed=sorted(changed))
+        if changed:
+            for listener in self._listeners:
+                try:
+                    listener(changed)
+                except Exception as e:
+                    logger.warning("template_listener_failed", error=str(e))
+        return count
+
+    @property
+    def template_dirs(self) -> list[str]:
+        """Directories templates were loaded from."""
+        return list(self._template_dirs)
+
+    def add_change_listener(self, listener: Callable[[set[str]], None]) -> None:
+        """Call ``listener`` with the ids of templates a reload edited or removed."""
+        self._listeners.append(listener)
+
+    def template_revision(self, template_id: str) -> str | None:
+        """Digest of a template's file, or None if it is not loaded."""
+        return self._revisions.get(template_id)
+
+    def _ensure_current(self) -> None:
+        """Load templates on first use and reload them when files change."""
+        if not self._template_dirs:
             settings = get_settings()
             self.load_templates(str(settings.parser.template_dir))
+            return
 
-        # Check cache (use hash of first 1000 chars)
-        cache_key = str(hash(text[:1000]))
+        if self._reload_interval <= 0:
+            return
+        now = time.monotonic()
+        if now - self._checked_at < self._reload_interval:
+            return
+        self._checked_at = now
+        if self._dir_fingerprint() != self._fingerprint:
+            self.reload()
+
+    def detect(self, text: str) -> TemplateMatch | None:
+        """Detect which template matches the invoice."""
+        self._ensure_current()
+
+        cache_key = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).hexdigest()
         if cache_key in self._detection_cache:
+            self._detection_cache.move_to_end(cache_key)
             return self._detection_cache[cache_key]
 
-        best_match: TemplateMatch | None = None
-        best_score = 0.0
+        match = self._match(text)
+        if self._cache_size:
+            self._detection_cache[cache_key] = match
+            if len(self._detection_cache) > self._cache_size:
+                self._detection_cache.popitem(last=False)
 
-        for template_id, template in self._templates.items():
-            score = self._calculate_match_score(text, template)
-
-            if score > best_score:
-                best_score = score
-                best_match = TemplateMatch(
-                    template_id=template_id,
-                    template_name=template.get("company_name", template_id),
-                    confidence=score,
-                    company_key=template.get("company_key", template_id),
-                    parser_hints=template.get("parser_hints", {}),
-                )
-
-        settings = get_settings()
-        if best_match and best_match.confidence >= settings.parser.template_min_confidence:
-            self._detection_cache[cache_key] = best_match
+        if match:
             logger.info(
                 "template_matched",
-                template=best_match.template_id,
-                confidence=best_match.confidence,
+                template=match.template_id,
+                confidence=match.confidence,
             )
-            return best_match
-
-        self._detection_cache[cache_key] = None
-        return None
-
-    def _calculate_match_score(self, text: str, template: dict[str, Any]) -> float:
-        """Calculate match score for a template."""
-        patterns = template.get("detection_patterns", [])
-        if not patterns:
-            return 0.0
-
-        matches = 0
-        total = len(patterns)
-
-        for pattern in patterns:
-            try:
-                if re.search(pattern, text, re.IGNORECASE | re.MULTILINE):
-                    matches += 1
-            except re.error:
-                continue
-
-        return matches / total if total > 0 else 0.0
+        return match
+
+    def _match(self, text: str) -> TemplateMatch | None:
+        """Best template at or above the confidence threshold."""
+        min_confidence = get_settings().parser.template_min_confidence
+        folded = text.casefold()
+        present = {literal for literal in self._literals if literal in folded}
+
+        # Templates that can still reach the threshold, most promising first;
+        # ties keep load order so the first best template wins, as before
+        candidates = []
+        for order, compiled in enumerate(self._compiled.values()):
+            bound = compiled.upper_bound(present)
+            if bound > 0 and bound >= min_confidence:
+                candidates.append((-bound, order, compiled))
+        candidates.sort(key=lambda c: (c[0], c[1]))
+
+        best: CompiledTemplate | None = None
+        best_score = 0.0
+        best_order = len(candidates)
+        for neg_bound, order, compiled in candidates:
+            if -neg_bound < best_score:
+                break
+            score = compiled.score(text, present)
+            if score > best_score or (score == best_score and best is not None and order < best_order):
+                best, best_score, best_order = compiled, score, order
+
+        if best is None or best_score < min_confidence:
+            return None
+
+        template = best.data
+        return TemplateMatch(
+            template_id=best.template_id,
+            template_name=template.get("company_name", best.template_id),
+            confidence=best_score,
+            company_key=template.get("company_key", best.template_id),
+            parser_hints=template.get("parser_hints", {}),
+        )
 
     def get_template(self, template_id: str) -> dict[str, Any] | None:
         """Get template by ID."""
         return self._templates.get(template_id)
 
+    def get_compiled_template(self, template_id: str) -> CompiledTemplate | None:
+        """Get a template's compiled patterns by ID."""
+        return self._compiled.get(template_id)
+
     def list_templates(self) -> list[dict[str, Any]]:
         """List all loaded templates."""
         return [
@@ -130,6 +349,15 @@ class TemplateDetector(ITemplateDetector):
             for t in self._templates.values()
         ]
 
+    def get_stats(self) -> dict[str, Any]:
+        """Loaded templates, prefilter literals and cache size."""
+        return {
+            "templates": len(self._compiled),
+            "literals": len(self._literals),
+            "cached_detections": len(self._detection_cache),
+            "cache_size": self._cache_size,
+        }
+
 
 class TemplateParser(IInvoiceParser):
     """
@@ -149,6 +377,10 @@ class TemplateParser(IInvoiceParser):
     def priority(self) -> int:
         return 100  # Highest priority
 
+    def worker_factory(self) -> Callable[[], IInvoiceParser]:
+        """Worker-process parser loading the same template directories."""
+        return functools.partial(worker_template_parser, tuple(self._detector.template_dirs))
+
     def can_parse(self, text: str, hints: dict[str, Any] | None = None) -> float:
         """Check if a template matches this invoice."""
         match = self._detector.detect(text)
@@ -170,7 +402,7 @@ class TemplateParser(IInvoiceParser):
                 error="No matching template found",
             )
 
-        template = self._detector.get_template(match.template_id)
+        template = self._detector.get_compiled_template(match.template_id)
         if not template:
             return ParserResult(
                 success=False,
@@ -217,31 +449,29 @@ class TemplateParser(IInvoiceParser):
                 error=str(e),
             )
 
-    async def _extract_metadata(self, text: str, template: dict[str, Any]) -> Invoice:
+    async def _extract_metadata(self, text: str, template: CompiledTemplate) -> Invoice:
         """Extract invoice metadata using template patterns."""
         invoice = Invoice()
 
-        patterns = template.get("field_patterns", {})
-
         # Extract each field
-        for field, pattern in patterns.items():
+        for field_name, pattern in template.field_patterns.items():
             try:
-                match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+                match = pattern.search(text)
                 if match:
                     value = match.group(1) if match.lastindex else match.group(0)
                     value = value.strip()
 
-                    if field == "invoice_no":
+                    if field_name == "invoice_no":
                         invoice.invoice_no = value
-                    elif field == "invoice_date":
+                    elif field_name == "invoice_date":
                         invoice.invoice_date = value  # type: ignore[assignment]
-                    elif field == "seller_name":
+                    elif field_name == "seller_name":
                         invoice.seller_name = value
-                    elif field == "buyer_name":
+                    elif field_name == "buyer_name":
                         invoice.buyer_name = value
-                    elif field == "total_amount":
+                    elif field_name == "total_amount":
                         invoice.total_amount = parse_number(value) or 0.0
-                    elif field == "currency":
+                    elif field_name == "currency":
                         invoice.currency = value
 
             except re.error:
@@ -249,16 +479,16 @@ class TemplateParser(IInvoiceParser):
 
         return invoice
 
-    async def _extract_items(self, text: str, template: dict[str, Any]) -> list[LineItem]:
+    async def _extract_items(self, text: str, template: CompiledTemplate) -> list[LineItem]:
         """Extract line items using template patterns."""
         items: list[LineItem] = []
 
-        item_pattern = template.get("item_pattern")
-        if not item_pattern:
+        item_pattern = template.item_pattern
+        if item_pattern is None:
             return items
 
         try:
-            for i, match in enumerate(re.finditer(item_pattern, text, re.MULTILINE)):
+            for i, match in enumerate(item_pattern.finditer(text)):
                 groups = match.groupdict() if match.lastindex else {}
 
                 item = LineItem(
@@ -285,6 +515,20 @@ class TemplateParser(IInvoiceParser):
 
 
 # Singletons
+@functools.cache
+def worker_template_parser(template_dirs: tuple[str, ...]) -> TemplateParser:
+    """
+    Template parser of a parser pool worker, built once per process.
+
+    With no directories the detector loads the configured template_dir
+    on first use, like the main process.
+    """
+    detector = TemplateDetector()
+    for template_dir in template_dirs:
+        detector.load_templates(template_dir)
+    return TemplateParser(detector)
+
+
 _template_detector: TemplateDetector | None = None
 _template_parser: TemplateParser | None = None
 
@@ -0,0 +1,203 @@
+"""
+Disk cache for validated vision extraction results.
+
+A vision call on a scanned page takes 30-180 seconds. Re-parsing the same
+file (after a template change or a failed audit) returns the stored
+extraction instead, keyed by the image content, the vision model and the
+extraction prompt.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from src.config import get_logger, get_settings
+from src.infrastructure.parsers.vision_parser import (
+    VISION_EXTRACTION_PROMPT,
+    VisionInvoiceResponse,
+)
+
+logger = get_logger(__name__)
+
+# Changes whenever the extraction prompt or response schema changes, so
+# results produced by an older prompt are never served
+VISION_PROMPT_VERSION = hashlib.sha256(
+    (VISION_EXTRACTION_PROMPT + json.dumps(VisionInvoiceResponse.model_json_schema(), sort_keys=True))
+    .encode("utf-8")
+).hexdigest()[:16]
+
+_CHUNK = 1 << 20
+
+
+def hash_image(image_path: str | Path) -> str:
+    """SHA-256 of an image file's bytes."""
+    digest = hashlib.sha256()
+    with open(image_path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class VisionResponseCache:
+    """
+    Content-addressed store of ``VisionInvoiceResponse`` JSON files.
+
+    Entries live in ``cache_dir`` as ``<key[:2]>/<key>.json``. A hit
+    refreshes the entry's mtime; once the directory exceeds ``max_bytes``
+    the least recently used entries are deleted. Cache failures are
+    logged and treated as misses, never as parse failures.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_bytes: int | None = None,
+        prompt_version: str = VISION_PROMPT_VERSION,
+    ):
+        settings = get_settings().cache
+        self._dir = Path(cache_dir or settings.vision_cache_dir)
+        self._max_bytes = (
+            max_bytes if max_bytes is not None else settings.vision_cache_max_mb << 20
+        )
+        self._prompt_version = prompt_version
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    def cache_key(self, image_hash: str, model: str) -> str:
+        """Key of one (image, model, prompt version) combination."""
+        material = f"{image_hash}\0{model}\0{self._prompt_version}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.json"
+
+    async def get(self, image_hash: str, model: str) -> VisionInvoiceResponse | None:
+        """Cached extraction for an image, or None."""
+        key = self.cache_key(image_hash, model)
+        try:
+            cached = await asyncio.to_thread(self._read, self._path(key))
+        except (OSError, ValueError, ValidationError) as e:
+            logger.warning("vision_cache_read_failed", key=key[:12], error=str(e))
+            cached = None
+
+        if cached is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        logger.info("vision_cache_hit", key=key[:12], model=model)
+        return cached
+
+    async def put(self, image_hash: str, model: str, response: VisionInvoiceResponse) -> None:
+        """Store an extraction and evict old entries over the size cap."""
+        key = self.cache_key(image_hash, model)
+        entry = {
+            "image_sha256": image_hash,
+            "model": model,
+            "prompt_version": self._prompt_version,
+            "created_at": time.time(),
+            "response": response.model_dump(mode="json"),
+        }
+        try:
+            await asyncio.to_thread(self._write, self._path(key), entry)
+            self._writes += 1
+            evicted = await asyncio.to_thread(self._evict)
+        except OSError as e:
+            logger.warning("vision_cache_write_failed", key=key[:12], error=str(e))
+            return
+
+        if evicted:
+            self._evictions += evicted
+            logger.info("vision_cache_evicted", entries=evicted)
+
+    @staticmethod
+    def _read(path: Path) -> VisionInvoiceResponse | None:
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        response = VisionInvoiceResponse.model_validate(json.loads(raw)["response"])
+        # Touch for LRU eviction
+        os.utime(path)
+        return response
+
+    @staticmethod
+    def _write(path: Path, entry: dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self._dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> int:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        return evicted
+
+    async def clear(self) -> int:
+        """Delete all entries. Returns the number removed."""
+
+        def _clear() -> int:
+            entries = self._entries()
+            for _, _, path in entries:
+                path.unlink(missing_ok=True)
+            return len(entries)
+
+        return await asyncio.to_thread(_clear)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this process plus on-disk entry count and size."""
+        lookups = self._hits + self._misses
+        entries = self._entries()
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "writes": self._writes,
+            "evictions": self._evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self._max_bytes,
+        }
+
+
+# Singleton
+_vision_cache: VisionResponseCache | None = None
+
+
+def get_vision_cache() -> VisionResponseCache:
+    """Get or create the vision response cache singleton."""
+    global _vision_cache
+    if _vision_cache is None:
+        _vision_cache = VisionResponseCache()
+    return _vision_cache
+
+
+def reset_vision_cache() -> None:
+    """Reset the cache singleton (for testing)."""
+    global _vision_cache
+    _vision_cache = None
@@ -5,17 +5,21 @@ Uses LLaVA/vision models for complex or scanned invoice extraction.
 Includes Pydantic validation for LLM JSON responses.
 """
 
+import asyncio
 import json
 import re
+import tempfile
+from dataclasses import dataclass, field
 from typing import Any
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
 from src.config import get_logger, get_settings
 from src.core.entities import Invoice, LineItem, RowType
-from src.core.interfaces import IInvoiceParser, ParserResult
+from src.core.interfaces import IInvoiceParser, IVisionProvider, ParserResult
 from src.infrastructure.llm import get_vision_provider
 from src.infrastructure.parsers.base import clean_item_name, parse_date
+from src.infrastructure.parsers.page_renderer import PageRenderer, get_page_renderer
 
 logger = get_logger(__name__)
 
@@ -24,6 +28,7 @@ logger = get_logger(__name__)
 # Pydantic Models for LLM Response Validation
 # ============================================================================
 
+
 class VisionLineItem(BaseModel):
     """Pydantic model for validating LLM-extracted line items."""
 
@@ -82,6 +87,19 @@ class VisionInvoiceResponse(BaseModel):
     tax_amount: float | None = None
     items: list[VisionLineItem] = Field(default_factory=list)
 
+    def is_empty(self) -> bool:
+        """Whether neither a line item nor any header field was extracted."""
+        headers = (
+            self.invoice_no,
+            self.invoice_date,
+            self.seller_name,
+            self.buyer_name,
+            self.total_amount,
+            self.subtotal,
+            self.tax_amount,
+        )
+        return not self.items and all(value is None for value in headers)
+
     @field_validator("invoice_no", "seller_name", "buyer_name", mode="before")
     @classmethod
     def coerce_string(cls, v: Any) -> str | None:
@@ -111,6 +129,7 @@ class VisionInvoiceResponse(BaseModel):
         except (ValueError, TypeError):
             return None
 
+
 VISION_EXTRACTION_PROMPT = """You are an invoice data extraction system. Extract structured data from this invoice image.
 
 OUTPUT FORMAT: Return ONLY a valid JSON object. No explanations, no markdown, no text before or after the JSON.
@@ -148,6 +167,104 @@ EXTRACTION RULES:
 CRITICAL: Return ONLY the JSON object. No other text allowed."""
 
 
+# Page markers written by InvoiceParserService.parse_document
+_PAGE_MARKER = re.compile(r"^--- Page (\d+) ---$", re.MULTILINE)
+
+# Rows that repeat a running total at a page break rather than an item
+_CARRY_ROW = re.compile(
+    r"\b(carried|brought)\s+(forward|over)\b|^\s*[cb]/f\b|^\s*continued\b",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class _Extraction:
+    """Outcome of one vision extraction."""
+
+    data: VisionInvoiceResponse | None = None
+    warnings: list[str] = field(default_factory=list)
+    model: str = ""
+    cache_hit: bool = False
+    error: str | None = None
+    failure_metadata: dict[str, Any] | None = None
+
+
+@dataclass
+class _PageExtraction:
+    """Extraction of one PDF page and where it came from."""
+
+    page_no: int
+    data: VisionInvoiceResponse | None
+    source: str  # "text", "vision" or "cache"
+    model: str = ""
+    warnings: list[str] = field(default_factory=list)
+    error: str | None = None
+
+
+def split_page_texts(text: str) -> dict[int, str]:
+    """Per-page text of a ``--- Page N ---`` joined document."""
+    pages: dict[int, str] = {}
+    markers = list(_PAGE_MARKER.finditer(text or ""))
+    for i, marker in enumerate(markers):
+        end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+        pages[int(marker.group(1))] = text[marker.end() : end].strip()
+    return pages
+
+
+def _is_description_only(item: VisionLineItem) -> bool:
+    return item.quantity is None and item.unit_price is None and item.total_price is None
+
+
+def _same_item(a: VisionLineItem, b: VisionLineItem) -> bool:
+    return (
+        a.description.casefold() == b.description.casefold()
+        and a.quantity == b.quantity
+        and a.total_price == b.total_price
+    )
+
+
+def merge_page_extractions(
+    pages: list[tuple[int, VisionInvoiceResponse]],
+) -> VisionInvoiceResponse:
+    """
+    Merge per-page extractions into one invoice.
+
+    Header fields come from the first page that has them and totals from
+    the last. Carried/brought-forward rows are dropped. At each page
+    break, a leading row that repeats the previous page's last row is
+    dropped, and a leading description-only row continues the previous
+    page's last item.
+    """
+    merged = VisionInvoiceResponse()
+    items: list[VisionLineItem] = []
+
+    for _, page in sorted(pages, key=lambda p: p[0]):
+        for name in ("invoice_no", "invoice_date", "seller_name", "buyer_name"):
+            if getattr(merged, name) is None and getattr(page, name) is not None:
+                setattr(merged, name, getattr(page, name))
+        if merged.currency == "USD" and page.currency != "USD":
+            merged.currency = page.currency
+        for name in ("total_amount", "subtotal", "tax_amount"):
+            if getattr(page, name) is not None:
+                setattr(merged, name, getattr(page, name))
+
+        page_items = [i for i in page.items if not _CARRY_ROW.search(i.description)]
+        if items and page_items:
+            head = page_items[0]
+            if _same_item(head, items[-1]):
+                page_items = page_items[1:]
+            elif head.description and _is_description_only(head):
+                last = items[-1]
+                items[-1] = last.model_copy(
+                    update={"description": f"{last.description} {head.description}".strip()}
+                )
+                page_items = page_items[1:]
+        items.extend(page_items)
+
+    merged.items = items
+    return merged
+
+
 class VisionParser(IInvoiceParser):
     """
     Vision-based invoice parser using LLaVA.
@@ -155,6 +272,24 @@ class VisionParser(IInvoiceParser):
     Used as fallback for complex or scanned invoices.
     """
 
+    def __init__(
+        self,
+        renderer: PageRenderer | None = None,
+        text_parser: IInvoiceParser | None = None,
+        provider: IVisionProvider | None = None,
+    ):
+        """
+        Initialize parser.
+
+        Args:
+            renderer: PDF page rasterizer (default: shared renderer)
+            text_parser: Parser tried on text-layer pages (default: table-aware)
+            provider: Vision model (default: the configured provider)
+        """
+        self._renderer = renderer
+        self._text_parser = text_parser
+        self._provider = provider
+
     @property
     def name(self) -> str:
         return "vision"
@@ -163,6 +298,13 @@ class VisionParser(IInvoiceParser):
     def priority(self) -> int:
         return 60  # Lower priority - used as fallback
 
+    @property
+    def version(self) -> str:
+        """Extraction prompt version and vision model."""
+        from src.infrastructure.parsers.vision_cache import VISION_PROMPT_VERSION
+
+        return f"{VISION_PROMPT_VERSION}:{get_settings().llm.vision_model}"
+
     def can_parse(self, text: str, hints: dict[str, Any] | None = None) -> float:
         """
         Check if vision parsing should be attempted.
@@ -175,7 +317,7 @@ class VisionParser(IInvoiceParser):
         if hints and hints.get("prefer_vision"):
             return 0.9
 
-        if hints and hints.get("image_path"):
+        if hints and (hints.get("image_path") or hints.get("pdf_path")):
             # Has image available
             return 0.6
 
@@ -211,11 +353,17 @@ class VisionParser(IInvoiceParser):
         filename: str,
         hints: dict[str, Any] | None = None,
     ) -> ParserResult:
-        """Parse invoice using vision model."""
+        """
+        Parse invoice using vision model.
+
+        ``hints["image_path"]`` parses a single image. Without it,
+        ``hints["pdf_path"]`` parses every page of the PDF (see parse_pdf).
+        """
         hints = hints or {}
         image_path = hints.get("image_path")
+        pdf_path = hints.get("pdf_path")
 
-        if not image_path:
+        if not image_path and not pdf_path:
             return ParserResult(
                 success=False,
                 parser_name=self.name,
@@ -230,80 +378,299 @@ class VisionParser(IInvoiceParser):
                 error="Vision parsing is disabled",
             )
 
+        if not image_path:
+            return await self.parse_pdf(str(pdf_path), text, filename)
+
         try:
-            # Get vision provider
-            vision = get_vision_provider()
-
-            # Analyze image
-            response = await vision.analyze_image(
-                image_path,
-                VISION_EXTRACTION_PROMPT,
-                max_tokens=4096,
+            extraction = await self._extract(image_path, filename)
+        except Exception as e:
+            logger.error("vision_parse_error", error=str(e))
+            return ParserResult(
+                success=False,
+                parser_name=self.name,
+                error=str(e),
             )
 
-            if response.error:
-                return ParserResult(
-                    success=False,
-                    parser_name=self.name,
-                    error=f"Vision model error: {response.error}",
-                )
+        if extraction.data is None:
+            return ParserResult(
+                success=False,
+                parser_name=self.name,
+                error=extraction.error,
+                metadata=extraction.failure_metadata,
+            )
 
-            # Parse and validate JSON response
-            validated_data, validation_errors = self._parse_json_response(response.text)
+        return self._build_result(
+            extraction.data,
+            extraction.warnings,
+            filename,
+            extraction.model,
+            cache_hit=extraction.cache_hit,
+        )
 
-            if not validated_data:
-                logger.warning(
-                    "vision_json_validation_failed",
-                    errors=validation_errors,
-                    raw_response_preview=response.text[:300],
-                    filename=filename,
-                )
-                return ParserResult(
-                    success=False,
-                    parser_name=self.name,
-                    error=f"JSON validation failed: {'; '.join(validation_errors)}",
-                    metadata={
-                        "raw_response": response.text[:500],
-                        "validation_errors": validation_errors,
-                    },
-                )
+    async def _extract(self, image_path: str, filename: str) -> _Extraction:
+        """Run (or recall) the vision extraction for one image."""
+        vision = self._provider or get_vision_provider()
+        model = getattr(vision, "vision_model", None) or get_settings().llm.vision_model
+
+        cache, image_hash = await self._cache_lookup(image_path)
+        if cache is not None and image_hash is not None:
+            cached = await cache.get(image_hash, model)
+            if cached is not None and not cached.is_empty():
+                return _Extraction(data=cached, model=model, cache_hit=True)
+
+        # Analyze image
+        response = await vision.analyze_image(
+            image_path,
+            VISION_EXTRACTION_PROMPT,
+            max_tokens=4096,
+        )
 
-            # Build invoice and items from validated data
-            invoice = self._build_invoice(validated_data)
-            items = self._build_items(validated_data.items)
-            invoice.items = items
+        if response.error:
+            return _Extraction(model=model, error=f"Vision model error: {response.error}")
 
-            # Calculate confidence based on extraction quality
-            confidence = self._calculate_extraction_confidence(invoice, items)
+        # Parse and validate JSON response
+        validated_data, validation_errors = self._parse_json_response(response.text)
 
-            logger.info(
-                "vision_parse_complete",
-                items_count=len(items),
-                invoice_no=invoice.invoice_no,
-                confidence=confidence,
+        if not validated_data:
+            logger.warning(
+                "vision_json_validation_failed",
+                errors=validation_errors,
+                raw_response_preview=response.text[:300],
                 filename=filename,
             )
-
-            return ParserResult(
-                success=True,
-                invoice=invoice,
-                items=items,
-                confidence=confidence,
-                parser_name=self.name,
-                metadata={
-                    "vision_model": response.model,
-                    "validation_warnings": validation_errors if validation_errors else None,
+            return _Extraction(
+                model=model,
+                error=f"JSON validation failed: {'; '.join(validation_errors)}",
+                failure_metadata={
+                    "raw_response": response.text[:500],
+                    "validation_errors": validation_errors,
                 },
             )
 
+        if validated_data.is_empty():
+            logger.warning("vision_extraction_empty", filename=filename)
+            return _Extraction(
+                model=model,
+                error="Vision model extracted no invoice data",
+                failure_metadata={"raw_response": response.text[:500]},
+            )
+
+        # Only validated, non-empty extractions are cached
+        if cache is not None and image_hash is not None:
+            await cache.put(image_hash, model, validated_data)
+
+        return _Extraction(data=validated_data, warnings=validation_errors, model=response.model)
+
+    async def parse_pdf(self, pdf_path: str, text: str, filename: str) -> ParserResult:
+        """
+        Parse a multi-page PDF page by page.
+
+        Pages with a usable text layer are first given to the text parser
+        and only go to the vision model if it cannot handle them. The rest
+        are rasterized on the render pool and sent to the vision model
+        concurrently (the LLM scheduler still caps how many run at once).
+        Page results are merged in page order, joining line items that a
+        page break split in two. If any page fails the whole parse fails,
+        so an incomplete invoice is never returned as a success.
+        """
+        settings = get_settings().parser
+        renderer = self._renderer or get_page_renderer()
+        page_texts = split_page_texts(text)
+
+        try:
+            page_count = await renderer.page_count(pdf_path)
         except Exception as e:
-            logger.error("vision_parse_error", error=str(e))
+            logger.error("vision_pdf_open_failed", pdf_path=pdf_path, error=str(e))
+            return ParserResult(success=False, parser_name=self.name, error=str(e))
+
+        page_numbers = list(range(1, min(page_count, settings.vision_max_pages) + 1))
+        if page_count > len(page_numbers):
+            logger.warning(
+                "vision_pdf_pages_truncated",
+                pages=page_count,
+                max_pages=settings.vision_max_pages,
+                filename=filename,
+            )
+
+        semaphore = asyncio.Semaphore(max(1, settings.vision_page_concurrency))
+
+        with tempfile.TemporaryDirectory(prefix="srg_vision_") as image_dir:
+
+            async def _page(page_no: int) -> _PageExtraction:
+                from_text = await self._parse_text_page(page_texts.get(page_no), filename)
+                if from_text is not None:
+                    return _PageExtraction(page_no, from_text, source="text")
+
+                async with semaphore:
+                    image_path = await renderer.render(pdf_path, page_no, image_dir)
+                    extraction = await self._extract(image_path, f"{filename}#page{page_no}")
+                return _PageExtraction(
+                    page_no,
+                    extraction.data,
+                    source="cache" if extraction.cache_hit else "vision",
+                    model=extraction.model,
+                    warnings=extraction.warnings,
+                    error=extraction.error,
+                )
+
+            outcomes = await asyncio.gather(
+                *(_page(n) for n in page_numbers), return_exceptions=True
+            )
+
+        pages: list[_PageExtraction] = []
+        for page_no, outcome in zip(page_numbers, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error("vision_page_error", page_no=page_no, error=str(outcome))
+                outcome = _PageExtraction(page_no, None, source="vision", error=str(outcome))
+            pages.append(outcome)
+
+        parsed = [(p.page_no, p.data) for p in pages if p.data is not None]
+        page_report = [
+            {
+                "page": p.page_no,
+                "source": p.source,
+                "items": len(p.data.items) if p.data is not None else 0,
+                **({"error": p.error} if p.error else {}),
+            }
+            for p in pages
+        ]
+
+        failed = [p for p in pages if p.data is None]
+        if failed or not parsed:
+            # A partial invoice must not be saved (or cached) as if complete
+            errors = "; ".join(f"page {p.page_no}: {p.error}" for p in failed)
+            if not pages:
+                error = "PDF has no pages"
+            elif not parsed:
+                error = f"No page could be parsed: {errors}"
+            else:
+                error = f"{len(failed)} of {len(pages)} pages could not be parsed: {errors}"
             return ParserResult(
                 success=False,
                 parser_name=self.name,
-                error=str(e),
+                error=error,
+                metadata={"pages": page_report, "pages_total": page_count},
             )
 
+        merged = merge_page_extractions(parsed)
+        model = next((p.model for p in pages if p.model), get_settings().llm.vision_model)
+        warnings = [w for p in pages for w in p.warnings]
+
+        vision_pages = [p for p in pages if p.source != "text"]
+        result = self._build_result(
+            merged,
+            warnings,
+            filename,
+            model,
+            cache_hit=bool(vision_pages) and all(p.source == "cache" for p in vision_pages),
+        )
+        result.metadata = {
+            **(result.metadata or {}),
+            "pages": page_report,
+            "pages_total": page_count,
+        }
+        return result
+
+    async def _parse_text_page(
+        self,
+        page_text: str | None,
+        filename: str,
+    ) -> VisionInvoiceResponse | None:
+        """Items of a page the text parser can handle on its own, else None."""
+        if not page_text or self._has_ocr_artifacts(page_text):
+            return None
+
+        text_parser = self._text_parser
+        if text_parser is None:
+            from src.infrastructure.parsers.table_aware_parser import get_table_aware_parser
+
+            text_parser = get_table_aware_parser()
+
+        if text_parser.can_parse(page_text) < 0.1:
+            return None
+        result = await text_parser.parse(page_text, filename)
+        if (
+            not result.success
+            or not result.items
+            or result.confidence < get_settings().parser.vision_min_confidence
+        ):
+            return None
+
+        invoice = result.invoice
+        return VisionInvoiceResponse(
+            invoice_no=invoice.invoice_no if invoice else None,
+            invoice_date=str(invoice.invoice_date) if invoice and invoice.invoice_date else None,
+            seller_name=invoice.seller_name if invoice else None,
+            buyer_name=invoice.buyer_name if invoice else None,
+            currency=invoice.currency if invoice else "USD",
+            total_amount=(invoice.total_amount or None) if invoice else None,
+            items=[
+                VisionLineItem(
+                    description=item.description or item.item_name,
+                    hs_code=item.hs_code,
+                    quantity=item.quantity,
+                    unit=item.unit,
+                    unit_price=item.unit_price,
+                    total_price=item.total_price,
+                )
+                for item in result.items
+                if item.row_type == RowType.LINE_ITEM
+            ],
+        )
+
+    async def _cache_lookup(self, image_path: str) -> tuple[Any, str | None]:
+        """The response cache and the image's content hash, when caching is on."""
+        if not get_settings().cache.vision_cache_enabled:
+            return None, None
+
+        from src.infrastructure.parsers.vision_cache import get_vision_cache, hash_image
+
+        try:
+            image_hash = await asyncio.to_thread(hash_image, image_path)
+        except OSError as e:
+            # Unreadable file - let the provider report it
+            logger.warning("vision_cache_hash_failed", image_path=image_path, error=str(e))
+            return None, None
+        return get_vision_cache(), image_hash
+
+    def _build_result(
+        self,
+        data: VisionInvoiceResponse,
+        validation_errors: list[str],
+        filename: str,
+        model: str,
+        cache_hit: bool,
+    ) -> ParserResult:
+        """Successful ParserResult from a validated extraction."""
+        invoice = self._build_invoice(data)
+        items = self._build_items(data.items)
+        invoice.items = items
+
+        # Calculate confidence based on extraction quality
+        confidence = self._calculate_extraction_confidence(invoice, items)
+
+        logger.info(
+            "vision_parse_complete",
+            items_count=len(items),
+            invoice_no=invoice.invoice_no,
+            confidence=confidence,
+            filename=filename,
+            cache_hit=cache_hit,
+        )
+
+        return ParserResult(
+            success=True,
+            invoice=invoice,
+            items=items,
+            confidence=confidence,
+            parser_name=self.name,
+            metadata={
+                "vision_model": model,
+                "validation_warnings": validation_errors if validation_errors else None,
+                "cache_hit": cache_hit,
+            },
+        )
+
     def _extract_json_string(self, text: str) -> str | None:
         """Extract JSON string from LLM response text."""
         text = text.strip()
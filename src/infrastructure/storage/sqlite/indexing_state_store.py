@@ -16,7 +16,8 @@ class SQLiteIndexingStateStore(IIndexingStateStore):
             cursor = await conn.execute(
                 """
                 SELECT id, index_name, last_doc_id, last_chunk_id, last_item_id,
-                       total_indexed, pending_count, is_building, last_error, last_run_at
+                       total_indexed, pending_count, is_building, last_error, last_run_at,
+                       updated_at
                 FROM indexing_state
                 WHERE index_name = ?
                 """,
@@ -37,6 +38,7 @@ class SQLiteIndexingStateStore(IIndexingStateStore):
                 is_building=bool(row[7]),
                 last_error=row[8],
                 last_run_at=datetime.fromisoformat(row[9]) if row[9] else None,
+                updated_at=datetime.fromisoformat(row[10]) if row[10] else datetime.utcnow(),
             )
 
     async def update_state(self, state: IndexingState) -> IndexingState:
@@ -5,7 +5,7 @@ Handles invoices, line items, and audit results.
 """
 
 import json
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 import aiosqlite
@@ -22,6 +22,7 @@ from src.core.entities import (
     ParsingStatus,
     RowType,
 )
+from src.core.exceptions import InvoiceNotLatestError
 from src.core.interfaces import IInvoiceStore
 from src.infrastructure.storage.sqlite.connection import get_connection, get_transaction
 
@@ -34,52 +35,100 @@ class SQLiteInvoiceStore(IInvoiceStore):
     async def create_invoice(self, invoice: Invoice) -> Invoice:
         """Create a new invoice record."""
         async with get_transaction() as conn:
-            # Insert invoice
+            await self._insert_invoice(conn, invoice)
+            logger.info("invoice_created", invoice_id=invoice.id, items=len(invoice.items))
+            return invoice
+
+    async def replace_invoice(self, invoice_id: int, invoice: Invoice) -> Invoice:
+        """
+        Store a re-parsed version of an invoice.
+
+        The new record becomes the latest version and the old one is kept
+        with is_latest = 0, together with its audit history. Catalog
+        matches carry over to new items with the same name.
+
+        Raises:
+            InvoiceNotLatestError: If invoice_id is missing or was already
+                replaced, e.g. by an overlapping reprocess
+        """
+        async with get_transaction() as conn:
+            # Claim the old version first so two replacements cannot both
+            # leave a latest row for the same document
             cursor = await conn.execute(
+                "UPDATE invoices SET is_latest = 0, updated_at = ? WHERE id = ? AND is_latest = 1",
+                (datetime.utcnow().isoformat(), invoice_id),
+            )
+            if cursor.rowcount == 0:
+                raise InvoiceNotLatestError(invoice_id)
+
+            await self._insert_invoice(conn, invoice)
+            await conn.execute(
                 """
-                INSERT INTO invoices (
-                    doc_id, invoice_no, invoice_date, seller_name, buyer_name,
-                    company_key, currency, total_amount, subtotal, tax_amount,
-                    discount_amount, total_quantity, quality_score, confidence,
-                    template_confidence, parser_version, template_id, parsing_status,
-                    error_message, bank_details_json, is_latest, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                UPDATE invoice_items SET matched_material_id = (
+                    SELECT old.matched_material_id FROM invoice_items old
+                    WHERE old.invoice_id = ? AND old.item_name = invoice_items.item_name
+                      AND old.matched_material_id IS NOT NULL
+                    ORDER BY old.line_number
+                    LIMIT 1
+                )
+                WHERE invoice_id = ?
                 """,
-                (
-                    invoice.doc_id,
-                    invoice.invoice_no,
-                    invoice.invoice_date,
-                    invoice.seller_name,
-                    invoice.buyer_name,
-                    invoice.company_key,
-                    invoice.currency,
-                    invoice.total_amount,
-                    invoice.subtotal,
-                    invoice.tax_amount,
-                    invoice.discount_amount,
-                    invoice.total_quantity,
-                    invoice.quality_score,
-                    invoice.confidence,
-                    invoice.template_confidence,
-                    invoice.parser_version,
-                    invoice.template_id,
-                    invoice.parsing_status.value,
-                    invoice.error_message,
-                    json.dumps(invoice.bank_details.model_dump()) if invoice.bank_details else None,
-                    1,
-                    invoice.created_at.isoformat(),
-                    invoice.updated_at.isoformat(),
-                ),
+                (invoice_id, invoice.id),
+            )
+            logger.info(
+                "invoice_replaced",
+                invoice_id=invoice.id,
+                previous_id=invoice_id,
+                items=len(invoice.items),
             )
-            invoice.id = cursor.lastrowid
+            return invoice
 
-            # Insert items
-            for item in invoice.items:
-                item.invoice_id = invoice.id
-                await self._insert_item(conn, item)
+    async def _insert_invoice(self, conn: aiosqlite.Connection, invoice: Invoice) -> None:
+        """Insert an invoice as the latest version, with its items."""
+        cursor = await conn.execute(
+            """
+            INSERT INTO invoices (
+                doc_id, invoice_no, invoice_date, seller_name, buyer_name,
+                company_key, currency, total_amount, subtotal, tax_amount,
+                discount_amount, total_quantity, quality_score, confidence,
+                template_confidence, parser_version, parser_name, template_id,
+                parsing_status, error_message, bank_details_json, is_latest,
+                created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                invoice.doc_id,
+                invoice.invoice_no,
+                invoice.invoice_date,
+                invoice.seller_name,
+                invoice.buyer_name,
+                invoice.company_key,
+                invoice.currency,
+                invoice.total_amount,
+                invoice.subtotal,
+                invoice.tax_amount,
+                invoice.discount_amount,
+                invoice.total_quantity,
+                invoice.quality_score,
+                invoice.confidence,
+                invoice.template_confidence,
+                invoice.parser_version,
+                invoice.parser_name,
+                invoice.template_id,
+                invoice.parsing_status.value,
+                invoice.error_message,
+                json.dumps(invoice.bank_details.model_dump()) if invoice.bank_details else None,
+                1,
+                invoice.created_at.isoformat(),
+                invoice.updated_at.isoformat(),
+            ),
+        )
+        invoice.id = cursor.lastrowid
 
-            logger.info("invoice_created", invoice_id=invoice.id, items=len(invoice.items))
-            return invoice
+        # Insert items
+        for item in invoice.items:
+            item.invoice_id = invoice.id
+            await self._insert_item(conn, item)
 
     async def _insert_item(self, conn: aiosqlite.Connection, item: LineItem) -> None:
         """Insert a single line item."""
@@ -259,6 +308,42 @@ class SQLiteInvoiceStore(IInvoiceStore):
             row = await cursor.fetchone()
             return row[0] if row else 0
 
+    async def find_invoice_ids(
+        self,
+        company_key: str | None = None,
+        seller_name: str | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        parser_name: str | None = None,
+        limit: int = 1000,
+    ) -> list[int]:
+        """IDs of the latest invoices matching every given filter, oldest first."""
+        conditions = ["is_latest = 1"]
+        params: list[Any] = []
+        if company_key:
+            conditions.append("company_key = ?")
+            params.append(company_key)
+        if seller_name:
+            conditions.append("seller_name LIKE ?")
+            params.append(f"%{seller_name}%")
+        if date_from:
+            conditions.append("invoice_date >= ?")
+            params.append(date_from.isoformat())
+        if date_to:
+            conditions.append("invoice_date <= ?")
+            params.append(date_to.isoformat())
+        if parser_name:
+            conditions.append("parser_name = ?")
+            params.append(parser_name)
+
+        async with get_connection() as conn:
+            cursor = await conn.execute(
+                f"SELECT id FROM invoices WHERE {' AND '.join(conditions)} ORDER BY id LIMIT ?",
+                (*params, limit),
+            )
+            rows = await cursor.fetchall()
+            return [row[0] for row in rows]
+
     async def search_invoices(self, query: str, limit: int = 20) -> list[Invoice]:
         """Search invoices by invoice_no, seller, or buyer."""
         async with get_connection() as conn:
@@ -498,9 +583,11 @@ class SQLiteInvoiceStore(IInvoiceStore):
             confidence=row["confidence"],
             template_confidence=row["template_confidence"],
             parser_version=row["parser_version"],
+            parser_name=row["parser_name"] if "parser_name" in row.keys() else None,
             template_id=row["template_id"],
             parsing_status=ParsingStatus(row["parsing_status"]),
             error_message=row["error_message"],
+            is_latest=bool(row["is_latest"]),
             bank_details=bank_details,
             created_at=datetime.fromisoformat(row["created_at"]),
             updated_at=datetime.fromisoformat(row["updated_at"]),
@@ -0,0 +1,117 @@
+"""
+SQLite storage for cached LLM completions.
+
+Backs CachedLLMProvider with the v011 llm_cache table.
+"""
+
+import time
+from typing import Any
+
+from src.config import get_logger
+from src.core.interfaces import LLMResponse
+from src.infrastructure.storage.sqlite.connection import get_connection, get_transaction
+
+logger = get_logger(__name__)
+
+
+class SQLiteLLMCacheStore:
+    """Content-addressed LLM response cache with TTL and size cap."""
+
+    async def get(self, cache_key: str, ttl_seconds: float) -> LLMResponse | None:
+        """Get a cached response, or None if missing or older than the TTL."""
+        now = time.time()
+        async with get_transaction() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT model, response_text, done_reason, prompt_tokens,
+                       completion_tokens, created_at
+                FROM llm_cache
+                WHERE cache_key = ?
+                """,
+                (cache_key,),
+            )
+            row = await cursor.fetchone()
+            if not row:
+                return None
+
+            if now - row["created_at"] > ttl_seconds:
+                await conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (cache_key,))
+                return None
+
+            await conn.execute(
+                "UPDATE llm_cache SET hits = hits + 1, last_used_at = ? WHERE cache_key = ?",
+                (now, cache_key),
+            )
+
+        prompt_tokens = row["prompt_tokens"] or 0
+        completion_tokens = row["completion_tokens"] or 0
+        return LLMResponse(
+            text=row["response_text"],
+            model=row["model"] or "",
+            done=True,
+            done_reason=row["done_reason"],
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
+    async def put(
+        self,
+        cache_key: str,
+        provider: str,
+        response: LLMResponse,
+        max_entries: int,
+    ) -> None:
+        """Store a response, evicting least recently used entries over the cap."""
+        now = time.time()
+        async with get_transaction() as conn:
+            await conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache (
+                    cache_key, provider, model, response_text, done_reason,
+                    prompt_tokens, completion_tokens, created_at, last_used_at, hits
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+                """,
+                (
+                    cache_key,
+                    provider,
+                    response.model,
+                    response.text,
+                    response.done_reason,
+                    response.prompt_tokens,
+                    response.completion_tokens,
+                    now,
+                    now,
+                ),
+            )
+            cursor = await conn.execute(
+                """
+                DELETE FROM llm_cache
+                WHERE cache_key IN (
+                    SELECT cache_key FROM llm_cache
+                    ORDER BY last_used_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (max_entries,),
+            )
+            if cursor.rowcount:
+                logger.info("llm_cache_evicted", entries=cursor.rowcount)
+
+    async def clear(self) -> int:
+        """Delete all cached responses. Returns the number removed."""
+        async with get_transaction() as conn:
+            cursor = await conn.execute("DELETE FROM llm_cache")
+            return cursor.rowcount
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Entry count and total hits."""
+        async with get_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT COUNT(*) AS entries, COALESCE(SUM(hits), 0) AS hits FROM llm_cache"
+            )
+            row = await cursor.fetchone()
+            if row is None:
+                return {"entries": 0, "hits": 0}
+            return {"entries": row["entries"], "hits": row["hits"]}
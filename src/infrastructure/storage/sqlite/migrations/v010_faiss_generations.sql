@@ -0,0 +1,56 @@
+-- Migration: v010_faiss_generations
+-- Description: Version FAISS ID mappings by index generation for hot-swapped rebuilds
+-- Version: 1.5.0
+-- Created: 2026-10-18
+-- Dependencies: v001_initial_schema
+
+-- A rebuild writes mappings for generation N+1 while searches keep
+-- resolving IDs against generation N. Existing rows become generation 0,
+-- which matches the legacy unversioned index files.
+
+-- ============================================================
+-- doc_chunks_faiss_map
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS doc_chunks_faiss_map_v010 (
+    generation INTEGER NOT NULL DEFAULT 0,
+    faiss_id INTEGER NOT NULL,
+    chunk_id INTEGER NOT NULL REFERENCES doc_chunks(id) ON DELETE CASCADE,
+    created_at TEXT DEFAULT (datetime('now')),
+    PRIMARY KEY (generation, faiss_id)
+);
+
+INSERT INTO doc_chunks_faiss_map_v010 (generation, faiss_id, chunk_id, created_at)
+SELECT 0, faiss_id, chunk_id, created_at FROM doc_chunks_faiss_map;
+
+DROP TABLE doc_chunks_faiss_map;
+ALTER TABLE doc_chunks_faiss_map_v010 RENAME TO doc_chunks_faiss_map;
+
+CREATE INDEX IF NOT EXISTS idx_chunks_faiss_chunk ON doc_chunks_faiss_map(chunk_id);
+
+-- ============================================================
+-- line_items_faiss_map
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS line_items_faiss_map_v010 (
+    generation INTEGER NOT NULL DEFAULT 0,
+    faiss_id INTEGER NOT NULL,
+    item_id INTEGER NOT NULL REFERENCES invoice_items(id) ON DELETE CASCADE,
+    created_at TEXT DEFAULT (datetime('now')),
+    PRIMARY KEY (generation, faiss_id)
+);
+
+INSERT INTO line_items_faiss_map_v010 (generation, faiss_id, item_id, created_at)
+SELECT 0, faiss_id, item_id, created_at FROM line_items_faiss_map;
+
+DROP TABLE line_items_faiss_map;
+ALTER TABLE line_items_faiss_map_v010 RENAME TO line_items_faiss_map;
+
+CREATE INDEX IF NOT EXISTS idx_items_faiss_item ON line_items_faiss_map(item_id);
+
+-- ============================================================
+-- Record migration
+-- ============================================================
+
+INSERT OR IGNORE INTO schema_migrations (version, name)
+VALUES ('010', 'faiss_generations');
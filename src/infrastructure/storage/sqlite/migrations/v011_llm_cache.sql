@@ -0,0 +1,30 @@
+-- Migration: v011_llm_cache
+-- Description: Content-addressed cache of deterministic LLM completions
+-- Version: 1.6.0
+-- Created: 2026-10-18
+-- Dependencies: v001_initial_schema
+
+-- cache_key is a SHA-256 over (provider, model, prompt or messages,
+-- system prompt, temperature, max_tokens, stop). Times are Unix seconds.
+
+CREATE TABLE IF NOT EXISTS llm_cache (
+    cache_key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT,
+    response_text TEXT NOT NULL,
+    done_reason TEXT,
+    prompt_tokens INTEGER DEFAULT 0,
+    completion_tokens INTEGER DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache(last_used_at);
+
+-- ============================================================
+-- Record migration
+-- ============================================================
+
+INSERT OR IGNORE INTO schema_migrations (version, name)
+VALUES ('011', 'llm_cache');
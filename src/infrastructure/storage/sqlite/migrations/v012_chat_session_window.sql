@@ -0,0 +1,27 @@
+-- Migration: v012_chat_session_window
+-- Description: Recent-message index and rolling-summary watermark for chat sessions
+-- Version: 1.7.0
+-- Created: 2026-10-18
+-- Dependencies: v001_initial_schema
+
+-- Chat turns read "the newest N messages of a session". With separate
+-- session_id and created_at indexes SQLite filters by session and then
+-- sorts; the composite index serves the query in index order.
+
+CREATE INDEX IF NOT EXISTS idx_messages_session_created
+    ON chat_messages(session_id, created_at, id);
+
+-- Covered by the composite index above
+DROP INDEX IF EXISTS idx_messages_session;
+
+-- Newest message folded into conversation_summary, so messages that
+-- leave the prompt window are summarized exactly once
+
+ALTER TABLE chat_sessions ADD COLUMN summary_last_message_id INTEGER;
+
+-- ============================================================
+-- Record migration
+-- ============================================================
+
+INSERT OR IGNORE INTO schema_migrations (version, name)
+VALUES ('012', 'chat_session_window');
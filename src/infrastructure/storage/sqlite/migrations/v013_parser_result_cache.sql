@@ -0,0 +1,33 @@
+-- Migration: v013_parser_result_cache
+-- Description: Persistent cache of invoice parser results
+-- Version: 1.8.0
+-- Created: 2026-10-18
+-- Dependencies: v001_initial_schema
+
+-- cache_key is a SHA-256 over (text digest, hints digest, parser chain
+-- names and versions, matched template and its revision). template_id
+-- is the template the text matched when the result was stored, so a
+-- template edit can drop its entries. Times are Unix seconds.
+
+CREATE TABLE IF NOT EXISTS parser_result_cache (
+    cache_key TEXT PRIMARY KEY,
+    parser_name TEXT NOT NULL,
+    template_id TEXT,
+    result_json TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_parser_result_cache_last_used
+    ON parser_result_cache(last_used_at);
+
+CREATE INDEX IF NOT EXISTS idx_parser_result_cache_template
+    ON parser_result_cache(template_id);
+
+-- ============================================================
+-- Record migration
+-- ============================================================
+
+INSERT OR IGNORE INTO schema_migrations (version, name)
+VALUES ('013', 'parser_result_cache');
@@ -0,0 +1,21 @@
+-- Migration: v014_invoice_parser_name
+-- Description: Record which parser produced each invoice
+-- Version: 1.9.0
+-- Created: 2026-10-18
+-- Dependencies: v001_initial_schema
+
+-- Name of the parser whose result was stored (template, table_aware,
+-- vision). Bulk reprocessing selects invoices by it, e.g. everything a
+-- fixed vendor template produced. NULL for invoices parsed before this
+-- migration.
+
+ALTER TABLE invoices ADD COLUMN parser_name TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_invoices_parser ON invoices(parser_name);
+
+-- ============================================================
+-- Record migration
+-- ============================================================
+
+INSERT OR IGNORE INTO schema_migrations (version, name)
+VALUES ('014', 'invoice_parser_name');
@@ -0,0 +1,69 @@
+-- Migration: v015_hot_query_indexes
+-- Description: Composite, covering and partial indexes for the hottest query shapes
+-- Version: 1.9.1
+-- Created: 2026-10-18
+-- Dependencies: v002_price_history, v014_invoice_parser_name
+
+-- tests/infrastructure/storage/sqlite/test_query_plans.py snapshots the
+-- EXPLAIN QUERY PLAN of each query below; update it with this file.
+
+-- ============================================================
+-- Latest-version flags
+-- ============================================================
+
+-- idx_invoices_latest and idx_documents_latest index a single value
+-- (is_latest WHERE is_latest = 1). The planner still prefers them for
+-- "is_latest = 1", then sorts every latest row to apply ORDER BY ...
+-- LIMIT. Without them get_chunks_for_indexing walks doc_chunks by id
+-- from the watermark and looks documents up by primary key, stopping at
+-- LIMIT. FTSSearcher.search_items and get_items_for_indexing already
+-- join invoices by primary key and check is_latest on that row, which
+-- no index improves.
+
+DROP INDEX IF EXISTS idx_invoices_latest;
+DROP INDEX IF EXISTS idx_documents_latest;
+
+-- list_invoices / count_invoices: newest latest invoices, optionally for
+-- one company, read in index order with no sort.
+CREATE INDEX IF NOT EXISTS idx_invoices_latest_created
+    ON invoices(created_at DESC) WHERE is_latest = 1;
+CREATE INDEX IF NOT EXISTS idx_invoices_latest_company_created
+    ON invoices(company_key, created_at DESC) WHERE is_latest = 1;
+
+-- list_documents, optionally by status.
+CREATE INDEX IF NOT EXISTS idx_documents_latest_created
+    ON documents(created_at DESC) WHERE is_latest = 1;
+CREATE INDEX IF NOT EXISTS idx_documents_latest_status_created
+    ON documents(status, created_at DESC) WHERE is_latest = 1;
+
+-- ============================================================
+-- Price history
+-- ============================================================
+
+-- get_price_history filters item_name_normalized and seller_name with
+-- LIKE '%x%', which no B-tree can seek. This index holds every selected
+-- column in invoice_date DESC order, so the query scans the index alone
+-- (never the table), evaluates LIKE on index entries and stops at LIMIT.
+-- It replaces idx_price_history_date, its leading column.
+CREATE INDEX IF NOT EXISTS idx_price_history_recent ON item_price_history(
+    invoice_date DESC, item_name_normalized, seller_name, hs_code,
+    quantity, unit_price, currency
+);
+DROP INDEX IF EXISTS idx_price_history_date;
+
+-- get_price_stats reads v_item_price_stats, which groups by
+-- (item_name_normalized, hs_code, seller_name, currency). In that order
+-- with the aggregated columns appended, the GROUP BY is computed from the
+-- index without a temporary B-tree. Replaces idx_price_history_item.
+CREATE INDEX IF NOT EXISTS idx_price_history_stats ON item_price_history(
+    item_name_normalized, hs_code, seller_name, currency,
+    unit_price, invoice_date
+);
+DROP INDEX IF EXISTS idx_price_history_item;
+
+-- ============================================================
+-- Record migration
+-- ============================================================
+
+INSERT OR IGNORE INTO schema_migrations (version, name)
+VALUES ('015', 'hot_query_indexes');
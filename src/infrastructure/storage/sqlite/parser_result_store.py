@@ -0,0 +1,107 @@
+"""
+SQLite storage for cached invoice parser results.
+
+Backs CachedParserRegistry with the v013 parser_result_cache table.
+"""
+
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from src.config import get_logger
+from src.infrastructure.storage.sqlite.connection import get_connection, get_transaction
+
+logger = get_logger(__name__)
+
+
+class SQLiteParserResultStore:
+    """Content-addressed parser result cache with a size cap."""
+
+    async def get(self, cache_key: str) -> str | None:
+        """Get a cached result as JSON, or None if missing."""
+        async with get_transaction() as conn:
+            cursor = await conn.execute(
+                "SELECT result_json FROM parser_result_cache WHERE cache_key = ?",
+                (cache_key,),
+            )
+            row = await cursor.fetchone()
+            if not row:
+                return None
+
+            await conn.execute(
+                """
+                UPDATE parser_result_cache
+                SET hits = hits + 1, last_used_at = ?
+                WHERE cache_key = ?
+                """,
+                (time.time(), cache_key),
+            )
+        return str(row["result_json"])
+
+    async def put(
+        self,
+        cache_key: str,
+        parser_name: str,
+        template_id: str | None,
+        result_json: str,
+        max_entries: int,
+    ) -> None:
+        """Store a result, evicting least recently used entries over the cap."""
+        now = time.time()
+        async with get_transaction() as conn:
+            await conn.execute(
+                """
+                INSERT OR REPLACE INTO parser_result_cache (
+                    cache_key, parser_name, template_id, result_json,
+                    created_at, last_used_at, hits
+                )
+                VALUES (?, ?, ?, ?, ?, ?, 0)
+                """,
+                (cache_key, parser_name, template_id, result_json, now, now),
+            )
+            cursor = await conn.execute(
+                """
+                DELETE FROM parser_result_cache
+                WHERE cache_key IN (
+                    SELECT cache_key FROM parser_result_cache
+                    ORDER BY last_used_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (max_entries,),
+            )
+            if cursor.rowcount:
+                logger.info("parser_cache_evicted", entries=cursor.rowcount)
+
+    async def invalidate_templates(self, template_ids: Iterable[str]) -> int:
+        """Delete results parsed with any of the templates. Returns the number removed."""
+        ids = list(template_ids)
+        if not ids:
+            return 0
+        placeholders = ", ".join("?" for _ in ids)
+        async with get_transaction() as conn:
+            cursor = await conn.execute(
+                f"DELETE FROM parser_result_cache WHERE template_id IN ({placeholders})",
+                ids,
+            )
+            return cursor.rowcount
+
+    async def clear(self) -> int:
+        """Delete all cached results. Returns the number removed."""
+        async with get_transaction() as conn:
+            cursor = await conn.execute("DELETE FROM parser_result_cache")
+            return cursor.rowcount
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Entry count and total hits."""
+        async with get_connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT COUNT(*) AS entries, COALESCE(SUM(hits), 0) AS hits
+                FROM parser_result_cache
+                """
+            )
+            row = await cursor.fetchone()
+            if row is None:
+                return {"entries": 0, "hits": 0}
+            return {"entries": row["entries"], "hits": row["hits"]}
@@ -37,9 +37,10 @@ class SQLiteSessionStore(ISessionStore):
                     session_id, title, status, company_key,
                     active_doc_ids_json, active_invoice_ids_json,
                     conversation_summary, summary_message_count,
+                    summary_last_message_id,
                     total_tokens, max_context_tokens, system_prompt,
                     temperature, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     session.session_id,
@@ -50,6 +51,7 @@ class SQLiteSessionStore(ISessionStore):
                     json.dumps(session.active_invoice_ids),
                     session.conversation_summary,
                     session.summary_message_count,
+                    session.summary_last_message_id,
                     session.total_tokens,
                     session.max_context_tokens,
                     session.system_prompt,
@@ -62,6 +64,16 @@ class SQLiteSessionStore(ISessionStore):
             logger.info("session_created", session_id=session.session_id)
             return session
 
+    async def get_session_header(self, session_id: str) -> ChatSession | None:
+        """Get session fields only - no messages or memory facts."""
+        async with get_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT * FROM chat_sessions WHERE session_id = ?",
+                (session_id,),
+            )
+            row = await cursor.fetchone()
+            return self._row_to_session(row) if row is not None else None
+
     async def get_session(self, session_id: str) -> ChatSession | None:
         """Get session by ID with messages."""
         async with get_connection() as conn:
@@ -80,7 +92,7 @@ class SQLiteSessionStore(ISessionStore):
                 """
                 SELECT * FROM chat_messages
                 WHERE session_id = ?
-                ORDER BY created_at
+                ORDER BY created_at, id
                 """,
                 (session_id,),
             )
@@ -107,6 +119,7 @@ class SQLiteSessionStore(ISessionStore):
                     title = ?, status = ?, company_key = ?,
                     active_doc_ids_json = ?, active_invoice_ids_json = ?,
                     conversation_summary = ?, summary_message_count = ?,
+                    summary_last_message_id = ?,
                     total_tokens = ?, system_prompt = ?, temperature = ?,
                     updated_at = ?, last_message_at = ?
                 WHERE session_id = ?
@@ -119,6 +132,7 @@ class SQLiteSessionStore(ISessionStore):
                     json.dumps(session.active_invoice_ids),
                     session.conversation_summary,
                     session.summary_message_count,
+                    session.summary_last_message_id,
                     session.total_tokens,
                     session.system_prompt,
                     session.temperature,
@@ -243,7 +257,7 @@ class SQLiteSessionStore(ISessionStore):
                 """
                 SELECT * FROM chat_messages
                 WHERE session_id = ?
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id DESC
                 LIMIT ? OFFSET ?
                 """,
                 (session_id, limit, offset),
@@ -252,6 +266,16 @@ class SQLiteSessionStore(ISessionStore):
             # Reverse to get chronological order
             return [self._row_to_message(row) for row in reversed(list(rows))]
 
+    async def count_messages(self, session_id: str) -> int:
+        """Count messages in a session."""
+        async with get_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT COUNT(*) FROM chat_messages WHERE session_id = ?",
+                (session_id,),
+            )
+            row = await cursor.fetchone()
+            return row[0] if row else 0
+
     # Memory operations
 
     async def save_memory_fact(self, fact: MemoryFact) -> MemoryFact:
@@ -277,33 +301,45 @@ class SQLiteSessionStore(ISessionStore):
                     ),
                 )
             else:
-                # Insert new
-                cursor = await conn.execute(
-                    """
-                    INSERT INTO memory_facts (
-                        session_id, fact_type, key, value, confidence,
-                        related_doc_ids_json, related_invoice_ids_json,
-                        access_count, created_at, updated_at, expires_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        fact.session_id,
-                        fact.fact_type.value,
-                        fact.key,
-                        fact.value,
-                        fact.confidence,
-                        json.dumps(fact.related_doc_ids),
-                        json.dumps(fact.related_invoice_ids),
-                        fact.access_count,
-                        fact.created_at.isoformat(),
-                        fact.updated_at.isoformat(),
-                        fact.expires_at.isoformat() if fact.expires_at else None,
-                    ),
-                )
-                fact.id = cursor.lastrowid
+                await self._insert_fact(conn, fact)
 
             return fact
 
+    async def save_memory_facts(self, facts: list[MemoryFact]) -> list[MemoryFact]:
+        """Insert new memory facts in a single transaction."""
+        if not facts:
+            return facts
+        async with get_transaction() as conn:
+            for fact in facts:
+                await self._insert_fact(conn, fact)
+        return facts
+
+    @staticmethod
+    async def _insert_fact(conn: aiosqlite.Connection, fact: MemoryFact) -> None:
+        cursor = await conn.execute(
+            """
+            INSERT INTO memory_facts (
+                session_id, fact_type, key, value, confidence,
+                related_doc_ids_json, related_invoice_ids_json,
+                access_count, created_at, updated_at, expires_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                fact.session_id,
+                fact.fact_type.value,
+                fact.key,
+                fact.value,
+                fact.confidence,
+                json.dumps(fact.related_doc_ids),
+                json.dumps(fact.related_invoice_ids),
+                fact.access_count,
+                fact.created_at.isoformat(),
+                fact.updated_at.isoformat(),
+                fact.expires_at.isoformat() if fact.expires_at else None,
+            ),
+        )
+        fact.id = cursor.lastrowid
+
     async def get_memory_facts(
         self,
         session_id: str | None = None,
@@ -362,6 +398,7 @@ class SQLiteSessionStore(ISessionStore):
             else [],
             conversation_summary=row["conversation_summary"],
             summary_message_count=row["summary_message_count"],
+            summary_last_message_id=row["summary_last_message_id"],
             total_tokens=row["total_tokens"],
             max_context_tokens=row["max_context_tokens"],
             system_prompt=row["system_prompt"],
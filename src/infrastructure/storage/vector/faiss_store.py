@@ -2,18 +2,26 @@
 FAISS vector store implementation.
 
 Manages FAISS indexes for document chunks and invoice items.
-Supports both CPU and GPU backends.
+Supports both CPU and GPU backends, with rebuilds published as new
+index generations that are hot-swapped without interrupting search.
 """
 
 import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import numpy as np
 
 from src.config import get_logger, get_settings
-from src.core.exceptions import IndexNotReadyError
-from src.core.interfaces import IVectorStore
+from src.core.entities.document import IndexingState
+from src.core.exceptions import IndexingError, IndexNotReadyError
+from src.core.interfaces import IIndexingStateStore, IVectorStore
+from src.core.services.document_indexer import item_embedding_text
 from src.infrastructure.storage.sqlite.connection import get_connection, get_transaction
 
 logger = get_logger(__name__)
@@ -27,6 +35,165 @@ except ImportError:
     FAISS_AVAILABLE = False
     faiss = None
 
+T = TypeVar("T")
+
+# (index_name, rows_indexed) progress callback for rebuilds
+ProgressCallback = Callable[[str, int], None]
+
+
+class StagedIndexBuild:
+    """
+    An index being rebuilt off to the side of the live one.
+
+    Vectors are appended in batches to an in-memory flat index. A
+    checkpoint appends only the rows added since the previous one: their
+    entity IDs to ``<index>.building.ids`` and their vectors to
+    ``<index>.building.vecs`` (raw float32 rows after an int64 dimension
+    header), so checkpoint I/O stays linear over a rebuild. Rows arrive in
+    ascending entity-ID order, so the last checkpointed ID doubles as the
+    resume cursor after an interruption.
+    """
+
+    _HEADER_BYTES = np.dtype(np.int64).itemsize
+
+    def __init__(self, index_name: str, target_path: Path, resume: bool = True):
+        self.index_name = index_name
+        self.target_path = target_path
+        self.vectors_path = target_path.with_name(target_path.name + ".building.vecs")
+        self.ids_path = target_path.with_name(target_path.name + ".building.ids")
+
+        self.index: Any = None
+        self.last_id = 0
+        self._pending_ids: list[int] = []
+        self._checkpointed = 0
+
+        if resume and self.vectors_path.exists() and self.ids_path.exists():
+            self._load_checkpoint()
+        else:
+            self.discard()
+
+    @property
+    def count(self) -> int:
+        """Rows added so far (checkpointed or not)."""
+        return int(self.index.ntotal) if self.index is not None else 0
+
+    @property
+    def resumed(self) -> bool:
+        """Whether this build picked up from an earlier checkpoint."""
+        return self.last_id > 0
+
+    def _load_checkpoint(self) -> None:
+        """Rebuild the partial index from its vector log and trim both logs to match."""
+        with open(self.vectors_path, "rb") as f:
+            header = np.fromfile(f, dtype=np.int64, count=1)
+            vectors = np.fromfile(f, dtype=np.float32)
+        if len(header) == 0:
+            self.discard()
+            return
+
+        dimension = int(header[0])
+        rows = len(vectors) // dimension
+        if len(vectors) != rows * dimension:
+            # Drop a row torn by an interrupted write
+            os.truncate(self.vectors_path, self._HEADER_BYTES + rows * dimension * 4)
+        ids = np.fromfile(self.ids_path, dtype=np.int64)
+
+        # IDs are flushed before the vectors, so the sidecar can only run ahead
+        if len(ids) > rows:
+            ids = ids[:rows]
+            ids.tofile(self.ids_path)
+        elif len(ids) < rows:
+            raise ValueError(
+                f"Corrupt rebuild checkpoint for {self.index_name}: "
+                f"{rows} vectors but {len(ids)} ids"
+            )
+
+        self.index = faiss.IndexFlatIP(dimension)
+        if rows:
+            # Logged vectors are already normalized
+            self.index.add(vectors[: rows * dimension].reshape(rows, dimension))
+        self._checkpointed = rows
+        self.last_id = int(ids[-1]) if len(ids) else 0
+        logger.info(
+            "rebuild_resumed",
+            index_name=self.index_name,
+            rows=self._checkpointed,
+            last_id=self.last_id,
+        )
+
+    def add(self, embeddings: np.ndarray, ids: Sequence[int]) -> None:
+        """Append a batch of vectors (normalized for cosine similarity)."""
+        if len(ids) == 0:
+            return
+
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if self.index is None:
+            self.index = faiss.IndexFlatIP(embeddings.shape[1])
+
+        faiss.normalize_L2(embeddings)
+        self.index.add(embeddings)
+        self._pending_ids.extend(int(i) for i in ids)
+        self.last_id = int(ids[-1])
+
+    @property
+    def rows_since_checkpoint(self) -> int:
+        """Rows added since the last on-disk checkpoint."""
+        return self.count - self._checkpointed
+
+    def checkpoint(self) -> None:
+        """Append the IDs, then the vectors, of rows added since the last checkpoint."""
+        added = self.rows_since_checkpoint
+        if self.index is None or added == 0:
+            return
+
+        with open(self.ids_path, "ab") as f:
+            np.asarray(self._pending_ids, dtype=np.int64).tofile(f)
+        self._pending_ids = []
+
+        vectors = self.index.reconstruct_n(self._checkpointed, added)
+        with open(self.vectors_path, "ab") as f:
+            if f.tell() == 0:
+                np.asarray([self.index.d], dtype=np.int64).tofile(f)
+            np.ascontiguousarray(vectors, dtype=np.float32).tofile(f)
+        self._checkpointed = self.count
+
+    def entity_ids(self) -> np.ndarray:
+        """All entity IDs in FAISS-ID order (requires a fresh checkpoint)."""
+        if not self.ids_path.exists():
+            return np.zeros(0, dtype=np.int64)
+        return np.fromfile(self.ids_path, dtype=np.int64)
+
+    def publish(self, path: Path) -> None:
+        """Write the finished index to ``path`` atomically and drop the checkpoint files."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        faiss.write_index(self.index, str(tmp_path))
+        os.replace(tmp_path, path)
+        for checkpoint_path in (self.vectors_path, self.ids_path):
+            checkpoint_path.unlink(missing_ok=True)
+
+    def discard(self) -> None:
+        """Remove any checkpoint files for this build."""
+        for path in (self.vectors_path, self.ids_path):
+            path.unlink(missing_ok=True)
+        self.index = None
+        self.last_id = 0
+        self._pending_ids = []
+        self._checkpointed = 0
+
+
+@dataclass(frozen=True)
+class IndexGeneration:
+    """
+    Immutable snapshot of a live index.
+
+    Searches read the snapshot once and use it throughout, so a rebuild can
+    swap in a new generation without readers ever seeing a partial index.
+    """
+
+    index: Any
+    generation: int
+    path: Path
+
 
 class FAISSVectorStore(IVectorStore):
     """
@@ -35,6 +202,12 @@ class FAISSVectorStore(IVectorStore):
     Manages two indexes:
     - chunks: Document chunks for RAG
     - items: Invoice line items for search
+
+    Each rebuild produces a new generation written to its own versioned
+    file (``faiss_chunks.g000002.bin``) with its own ID mappings. The
+    in-memory reference is swapped only once the generation is complete,
+    and the previous generation is kept for one more rebuild so in-flight
+    searches can still resolve their IDs.
     """
 
     def __init__(self, use_gpu: bool = False):
@@ -46,7 +219,11 @@ class FAISSVectorStore(IVectorStore):
         self.settings = get_settings()
         self.use_gpu = use_gpu and self._check_gpu()
 
-        self._indexes: dict[str, faiss.Index] = {}
+        self._generations: dict[str, IndexGeneration] = {}
+        # Held while an index is appended to or written out in a thread
+        self._write_locks: dict[str, asyncio.Lock] = {}
+        self._last_refresh: dict[str, float] = {}
+        self._refresh_interval = self.settings.storage.index_refresh_seconds
         self._index_paths = {
             "chunks": self.settings.storage.chunks_index_path,
             "items": self.settings.storage.items_index_path,
@@ -59,25 +236,118 @@ class FAISSVectorStore(IVectorStore):
         except Exception:
             return False
 
-    def _get_index(self, index_name: str) -> faiss.Index | None:
-        """Get an index by name, loading from disk if needed."""
-        if index_name in self._indexes:
-            return self._indexes[index_name]
+    # Generation management
 
-        # Try to load from disk
+    def _base_path(self, index_name: str) -> Path:
         path = self._index_paths.get(index_name)
-        if path and path.exists():
-            try:
-                index = faiss.read_index(str(path))
-                if self.use_gpu:
-                    index = faiss.index_cpu_to_gpu(faiss.StandardGpuResources(), 0, index)
-                self._indexes[index_name] = index
-                logger.info("index_loaded", index_name=index_name, size=index.ntotal)
-                return index
-            except Exception as e:
-                logger.error("index_load_failed", index_name=index_name, error=str(e))
+        if not path:
+            raise ValueError(f"Unknown index: {index_name}")
+        return path
+
+    def _generation_path(self, index_name: str, generation: int) -> Path:
+        """File for a generation (generation 0 is the legacy unversioned file)."""
+        base = self._base_path(index_name)
+        if generation == 0:
+            return base
+        return base.with_name(f"{base.stem}.g{generation:06d}{base.suffix}")
+
+    def _generations_on_disk(self, index_name: str) -> dict[int, Path]:
+        """All index generations present on disk."""
+        base = self._base_path(index_name)
+        found: dict[int, Path] = {}
+        if base.exists():
+            found[0] = base
+        for path in base.parent.glob(f"{base.stem}.g*{base.suffix}"):
+            suffix = path.name[len(base.stem) + 2 : -len(base.suffix) or None]
+            if suffix.isdigit():
+                found[int(suffix)] = path
+        return found
+
+    async def _current(self, index_name: str) -> IndexGeneration | None:
+        """
+        Get the live generation of an index.
+
+        Periodically checks disk for a newer generation (e.g. written by the
+        ``srg-index`` CLI in another process) and swaps it in. The file is
+        read in a worker thread; searches keep using the old generation
+        until the new one is fully loaded.
+        """
+        snapshot = self._generations.get(index_name)
+        now = time.monotonic()
+        if snapshot is not None and now - self._last_refresh.get(index_name, 0.0) < self._refresh_interval:
+            return snapshot
+        self._last_refresh[index_name] = now
+
+        on_disk = self._generations_on_disk(index_name)
+        if not on_disk:
+            return snapshot
+
+        generation = max(on_disk)
+        if snapshot is not None and snapshot.generation >= generation:
+            return snapshot
+
+        path = on_disk[generation]
+        try:
+            index = await asyncio.to_thread(self._read, path)
+        except Exception as e:
+            logger.error("index_load_failed", index_name=index_name, error=str(e))
+            return snapshot
+
+        # A commit or another refresh may have swapped in a newer one meanwhile
+        latest = self._generations.get(index_name)
+        if latest is not None and latest.generation >= generation:
+            return latest
+
+        loaded = IndexGeneration(index=index, generation=generation, path=path)
+        self._generations[index_name] = loaded
+        logger.info(
+            "index_loaded",
+            index_name=index_name,
+            size=index.ntotal,
+            generation=generation,
+        )
+        return loaded
 
-        return None
+    def _read(self, path: Path) -> Any:
+        """Read an index from disk, moving it to the GPU if enabled."""
+        index = faiss.read_index(str(path))
+        if self.use_gpu:
+            index = faiss.index_cpu_to_gpu(faiss.StandardGpuResources(), 0, index)
+        return index
+
+    async def _get_index(self, index_name: str) -> faiss.Index | None:
+        """Get an index by name, loading from disk if needed."""
+        snapshot = await self._current(index_name)
+        return snapshot.index if snapshot else None
+
+    async def get_generation(self, index_name: str) -> int | None:
+        """Generation number of the live index, or None if there is none."""
+        snapshot = await self._current(index_name)
+        return snapshot.generation if snapshot else None
+
+    def _write_lock(self, index_name: str) -> asyncio.Lock:
+        return self._write_locks.setdefault(index_name, asyncio.Lock())
+
+    def _write(self, index: Any, path: Path) -> None:
+        """Write an index to disk atomically."""
+        if self.use_gpu:
+            index = faiss.index_gpu_to_cpu(index)
+        tmp_path = path.with_name(path.name + ".tmp")
+        faiss.write_index(index, str(tmp_path))
+        os.replace(tmp_path, path)
+
+    async def _retire_generations(self, index_name: str, keep_from: int) -> None:
+        """Remove files and ID mappings of generations older than ``keep_from``."""
+        table, _ = self._map_table(index_name)
+        async with get_transaction() as conn:
+            await conn.execute(f"DELETE FROM {table} WHERE generation < ?", (keep_from,))
+
+        for generation, path in self._generations_on_disk(index_name).items():
+            if generation < keep_from:
+                path.unlink(missing_ok=True)
+                logger.info("index_generation_retired", index_name=index_name, generation=generation)
+
+    # IVectorStore
 
     async def build_index(
         self,
@@ -86,12 +356,10 @@ class FAISSVectorStore(IVectorStore):
         ids: list[int],
         force_rebuild: bool = False,
     ) -> bool:
-        """Build or rebuild a FAISS index."""
-        path = self._index_paths.get(index_name)
-        if not path:
-            raise ValueError(f"Unknown index: {index_name}")
+        """Build or rebuild a FAISS index as a new generation."""
+        self._base_path(index_name)
 
-        if path.exists() and not force_rebuild:
+        if await self._current(index_name) is not None and not force_rebuild:
             logger.info("index_exists_skipping", index_name=index_name)
             return True
 
@@ -106,47 +374,44 @@ class FAISSVectorStore(IVectorStore):
             dimension=embeddings.shape[1],
         )
 
-        # Create index (IndexFlatIP for cosine similarity with normalized vectors)
-        dimension = embeddings.shape[1]
-        index = faiss.IndexFlatIP(dimension)
-
-        # Add vectors
-        embeddings = embeddings.astype("float32")
-        faiss.normalize_L2(embeddings)  # Normalize for cosine similarity
-        index.add(embeddings)
-
-        # Save index
-        faiss.write_index(index, str(path))
-        logger.info("index_saved", index_name=index_name, path=str(path))
-
-        # Store ID mappings
-        await self._save_id_mappings(index_name, ids)
-
-        # Cache in memory
-        if self.use_gpu:
-            index = faiss.index_cpu_to_gpu(faiss.StandardGpuResources(), 0, index)
-        self._indexes[index_name] = index
-
-        return True
+        build = self.begin_staged_build(index_name, resume=False)
+        build.add(embeddings, ids)
+        return await self.commit_staged_build(build) > 0
 
     async def add_vectors(
         self,
         index_name: str,
         embeddings: np.ndarray,
         ids: list[int],
+        persist: bool = True,
     ) -> bool:
-        """Add vectors to existing index (incremental), creating index if needed."""
+        """Append vectors to the live generation (incremental), creating it if needed."""
         if len(embeddings) == 0:
             return True
 
-        index = self._get_index(index_name)
+        async with self._write_lock(index_name):
+            snapshot = await self._append(index_name, embeddings, ids)
+            if persist:
+                await asyncio.to_thread(self._write, snapshot.index, snapshot.path)
 
-        # Create index if it doesn't exist
-        if index is None:
-            path = self._index_paths.get(index_name)
-            if not path:
-                raise ValueError(f"Unknown index: {index_name}")
+        logger.info(
+            "vectors_added",
+            index_name=index_name,
+            added=len(embeddings),
+            total=snapshot.index.ntotal,
+            generation=snapshot.generation,
+        )
+
+        return True
 
+    async def _append(
+        self, index_name: str, embeddings: np.ndarray, ids: list[int]
+    ) -> IndexGeneration:
+        """Add vectors and their ID mappings to the live generation, in memory."""
+        snapshot = await self._current(index_name)
+
+        # Create index if it doesn't exist
+        if snapshot is None:
             dimension = embeddings.shape[1]
             index = faiss.IndexFlatIP(dimension)
             logger.info(
@@ -157,36 +422,27 @@ class FAISSVectorStore(IVectorStore):
 
             if self.use_gpu:
                 index = faiss.index_cpu_to_gpu(faiss.StandardGpuResources(), 0, index)
-            self._indexes[index_name] = index
+            snapshot = IndexGeneration(
+                index=index,
+                generation=0,
+                path=self._generation_path(index_name, 0),
+            )
+            self._generations[index_name] = snapshot
+
+        index = snapshot.index
 
         # Get current size for FAISS ID offset
         start_id = index.ntotal
 
-        # Add vectors
+        # Map IDs before the vectors become searchable
+        await self._save_id_mappings(
+            index_name, ids, generation=snapshot.generation, start_faiss_id=start_id
+        )
+
         embeddings = embeddings.astype("float32")
         faiss.normalize_L2(embeddings)
         index.add(embeddings)
-
-        # Save ID mappings with offset
-        await self._save_id_mappings(index_name, ids, start_faiss_id=start_id)
-
-        # Save updated index
-        path = self._index_paths[index_name]
-        if self.use_gpu:
-            # Convert back to CPU for saving
-            cpu_index = faiss.index_gpu_to_cpu(index)
-            faiss.write_index(cpu_index, str(path))
-        else:
-            faiss.write_index(index, str(path))
-
-        logger.info(
-            "vectors_added",
-            index_name=index_name,
-            added=len(embeddings),
-            total=index.ntotal,
-        )
-
-        return True
+        return snapshot
 
     async def search(
         self,
@@ -195,9 +451,10 @@ class FAISSVectorStore(IVectorStore):
         top_k: int = 10,
     ) -> list[tuple[int, float]]:
         """Search index for similar vectors."""
-        index = self._get_index(index_name)
-        if index is None:
+        snapshot = await self._current(index_name)
+        if snapshot is None:
             raise IndexNotReadyError(index_name)
+        index = snapshot.index
 
         # Prepare query
         query = query_vector.astype("float32").reshape(1, -1)
@@ -207,11 +464,12 @@ class FAISSVectorStore(IVectorStore):
         k = min(top_k, index.ntotal)
         scores, faiss_ids = index.search(query, k)
 
-        # Get entity IDs
+        # Resolve entity IDs against the generation that was searched
         valid_results = []
         entity_ids = await self.get_entity_ids(
             index_name,
             [int(fid) for fid in faiss_ids[0] if fid >= 0],
+            generation=snapshot.generation,
         )
 
         for score, fid in zip(scores[0], faiss_ids[0]):
@@ -225,92 +483,164 @@ class FAISSVectorStore(IVectorStore):
 
     def count(self) -> int:
         """Get total vector count across all indexes."""
-        total = 0
-        for index in self._indexes.values():
-            if index is not None:
-                total += index.ntotal
-        return total
+        return sum(snapshot.index.ntotal for snapshot in self._generations.values())
 
     async def get_index_stats(self, index_name: str) -> dict[str, Any]:
         """Get index statistics."""
-        index = self._get_index(index_name)
-        if index is None:
+        snapshot = await self._current(index_name)
+        if snapshot is None:
             return {
                 "loaded": False,
-                "exists": self._index_paths.get(index_name, Path()).exists(),
+                "exists": bool(self._generations_on_disk(index_name)),
+                "generation": None,
             }
 
         return {
             "loaded": True,
-            "size": index.ntotal,
-            "dimension": index.d,
+            "size": snapshot.index.ntotal,
+            "dimension": snapshot.index.d,
             "is_gpu": self.use_gpu,
-            "path": str(self._index_paths.get(index_name)),
+            "path": str(snapshot.path),
+            "generation": snapshot.generation,
         }
 
     def save(self) -> None:
         """Save all indexes to disk (synchronous)."""
-        for index_name, index in self._indexes.items():
-            if index is None:
-                continue
-            path = self._index_paths.get(index_name)
-            if not path:
-                continue
+        for index_name, snapshot in self._generations.items():
             try:
-                if self.use_gpu:
-                    cpu_index = faiss.index_gpu_to_cpu(index)
-                    faiss.write_index(cpu_index, str(path))
-                else:
-                    faiss.write_index(index, str(path))
+                self._write(snapshot.index, snapshot.path)
                 logger.info("index_saved", index_name=index_name)
             except Exception as e:
                 logger.warning("index_save_failed", index_name=index_name, error=str(e))
 
     async def save_index(self, index_name: str) -> bool:
         """Save index to disk."""
-        index = self._indexes.get(index_name)
-        if index is None:
+        snapshot = self._generations.get(index_name)
+        if snapshot is None:
             return False
 
-        path = self._index_paths.get(index_name)
-        if not path:
-            return False
-
-        if self.use_gpu:
-            cpu_index = faiss.index_gpu_to_cpu(index)
-            faiss.write_index(cpu_index, str(path))
-        else:
-            faiss.write_index(index, str(path))
+        # Appends wait for the write, so the thread never sees a half-added batch
+        async with self._write_lock(index_name):
+            await asyncio.to_thread(self._write, snapshot.index, snapshot.path)
 
         logger.info("index_saved", index_name=index_name)
         return True
 
     async def load_index(self, index_name: str) -> bool:
         """Load index from disk."""
-        index = self._get_index(index_name)
+        index = await self._get_index(index_name)
         return index is not None
 
+    # Rebuilds
+
+    def begin_staged_build(self, index_name: str, resume: bool = True) -> StagedIndexBuild:
+        """Start (or resume) a streaming rebuild of an index."""
+        return StagedIndexBuild(index_name, self._base_path(index_name), resume=resume)
+
+    async def commit_staged_build(self, build: StagedIndexBuild) -> int:
+        """
+        Publish a completed staged build as the next generation.
+
+        The build is written to a new versioned file with its own ID
+        mappings, then the in-memory reference is swapped in one step.
+        Searches already running against the old generation finish
+        normally; generations older than the previous one are retired.
+
+        Returns:
+            The new generation number, or 0 if the build was empty
+        """
+        if build.index is None or build.count == 0:
+            logger.warning("no_embeddings_to_index", index_name=build.index_name)
+            build.discard()
+            return 0
+
+        current = await self._current(build.index_name)
+        known = list(self._generations_on_disk(build.index_name))
+        if current is not None:
+            known.append(current.generation)
+        generation = max(known, default=0) + 1
+
+        await asyncio.to_thread(build.checkpoint)
+        await self._save_id_mappings(
+            build.index_name,
+            (await asyncio.to_thread(build.entity_ids)).tolist(),
+            generation=generation,
+        )
+
+        path = self._generation_path(build.index_name, generation)
+        await asyncio.to_thread(build.publish, path)
+
+        index = build.index
+        if self.use_gpu:
+            index = faiss.index_cpu_to_gpu(faiss.StandardGpuResources(), 0, index)
+
+        # The swap: readers pick up the new generation on their next lookup
+        self._generations[build.index_name] = IndexGeneration(
+            index=index,
+            generation=generation,
+            path=path,
+        )
+        logger.info(
+            "index_generation_swapped",
+            index_name=build.index_name,
+            generation=generation,
+            size=index.ntotal,
+            path=str(path),
+        )
+
+        await self._retire_generations(build.index_name, keep_from=generation - 1)
+        return generation
+
+    async def begin_rebuild(self, index_name: str, resume: bool = False) -> StagedIndexBuild:
+        """Start building a new generation of an index off to the side."""
+        return await asyncio.to_thread(self.begin_staged_build, index_name, resume)
+
+    async def stage_vectors(
+        self,
+        build: StagedIndexBuild,
+        embeddings: np.ndarray,
+        ids: list[int],
+    ) -> None:
+        """Append vectors to a rebuild, checkpointing it periodically."""
+        build.add(embeddings, ids)
+        if build.rows_since_checkpoint >= self.settings.storage.rebuild_checkpoint_rows:
+            await asyncio.to_thread(build.checkpoint)
+
+    async def commit_rebuild(self, build: StagedIndexBuild) -> int:
+        """Swap a finished rebuild in as the live generation."""
+        return await self.commit_staged_build(build)
+
+    # ID mappings
+
+    @staticmethod
+    def _map_table(index_name: str) -> tuple[str, str]:
+        """(table, entity id column) holding FAISS ID mappings for an index."""
+        if index_name == "chunks":
+            return "doc_chunks_faiss_map", "chunk_id"
+        return "line_items_faiss_map", "item_id"
+
     async def _save_id_mappings(
         self,
         index_name: str,
         entity_ids: list[int],
+        generation: int,
         start_faiss_id: int = 0,
     ) -> None:
-        """Save FAISS ID to entity ID mappings."""
-        table = "doc_chunks_faiss_map" if index_name == "chunks" else "line_items_faiss_map"
-        id_col = "chunk_id" if index_name == "chunks" else "item_id"
+        """Save FAISS ID to entity ID mappings for a generation."""
+        table, id_col = self._map_table(index_name)
 
         async with get_transaction() as conn:
             if start_faiss_id == 0:
-                # Full rebuild - clear existing mappings
-                await conn.execute(f"DELETE FROM {table}")
-
-            for i, entity_id in enumerate(entity_ids):
-                faiss_id = start_faiss_id + i
-                await conn.execute(
-                    f"INSERT OR REPLACE INTO {table} (faiss_id, {id_col}) VALUES (?, ?)",
-                    (faiss_id, entity_id),
-                )
+                # Fresh generation - clear any stale mappings left for it
+                await conn.execute(f"DELETE FROM {table} WHERE generation = ?", (generation,))
+
+            await conn.executemany(
+                f"INSERT OR REPLACE INTO {table} (generation, faiss_id, {id_col}) VALUES (?, ?, ?)",
+                (
+                    (generation, start_faiss_id + i, entity_id)
+                    for i, entity_id in enumerate(entity_ids)
+                ),
+            )
 
     async def save_id_mapping(
         self,
@@ -318,14 +648,14 @@ class FAISSVectorStore(IVectorStore):
         faiss_id: int,
         entity_id: int,
     ) -> None:
-        """Save a single FAISS ID to entity ID mapping."""
-        table = "doc_chunks_faiss_map" if index_name == "chunks" else "line_items_faiss_map"
-        id_col = "chunk_id" if index_name == "chunks" else "item_id"
+        """Save a single FAISS ID to entity ID mapping in the live generation."""
+        table, id_col = self._map_table(index_name)
+        generation = await self.get_generation(index_name) or 0
 
         async with get_transaction() as conn:
             await conn.execute(
-                f"INSERT OR REPLACE INTO {table} (faiss_id, {id_col}) VALUES (?, ?)",
-                (faiss_id, entity_id),
+                f"INSERT OR REPLACE INTO {table} (generation, faiss_id, {id_col}) VALUES (?, ?, ?)",
+                (generation, faiss_id, entity_id),
             )
 
     async def get_entity_id(
@@ -341,19 +671,23 @@ class FAISSVectorStore(IVectorStore):
         self,
         index_name: str,
         faiss_ids: list[int],
+        generation: int | None = None,
     ) -> dict[int, int]:
-        """Get multiple entity IDs from FAISS IDs."""
+        """Get multiple entity IDs from FAISS IDs (live generation by default)."""
         if not faiss_ids:
             return {}
 
-        table = "doc_chunks_faiss_map" if index_name == "chunks" else "line_items_faiss_map"
-        id_col = "chunk_id" if index_name == "chunks" else "item_id"
+        if generation is None:
+            generation = await self.get_generation(index_name) or 0
+
+        table, id_col = self._map_table(index_name)
 
         async with get_connection() as conn:
             placeholders = ",".join("?" * len(faiss_ids))
             cursor = await conn.execute(
-                f"SELECT faiss_id, {id_col} FROM {table} WHERE faiss_id IN ({placeholders})",
-                faiss_ids,
+                f"SELECT faiss_id, {id_col} FROM {table} "
+                f"WHERE generation = ? AND faiss_id IN ({placeholders})",
+                [generation, *faiss_ids],
             )
             rows = await cursor.fetchall()
             return {row[0]: row[1] for row in rows}
@@ -377,39 +711,225 @@ def reset_vector_store() -> None:
     _vector_store = None
 
 
-async def rebuild_indexes() -> None:
-    """CLI command to rebuild all indexes."""
-    from src.infrastructure.embeddings.bge_m3 import get_embedding_provider
-    from src.infrastructure.storage.sqlite import SQLiteDocumentStore, SQLiteInvoiceStore
+async def _stream_rebuild(
+    store: FAISSVectorStore,
+    index_name: str,
+    fetch_page: Callable[[int, int], Awaitable[list[T]]],
+    row_id: Callable[[T], int | None],
+    row_text: Callable[[T], str],
+    embed: Callable[[list[str]], Awaitable[np.ndarray]],
+    batch_size: int,
+    checkpoint_rows: int,
+    resume: bool,
+    progress: ProgressCallback | None,
+    heartbeat: Callable[[], Awaitable[None]] | None = None,
+) -> tuple[int, int]:
+    """
+    Page through rows by ID cursor, embedding and appending batch by batch.
+
+    ``heartbeat`` is awaited after every batch so the build lock stays fresh.
+
+    Returns:
+        (rows indexed, last entity ID seen)
+    """
+    build = await asyncio.to_thread(store.begin_staged_build, index_name, resume)
+    started = time.monotonic()
+    start_count = build.count
+    cursor = build.last_id
+
+    while True:
+        rows = await fetch_page(cursor, batch_size)
+        if not rows:
+            break
+
+        batch = [(rid, row_text(row)) for row in rows if (rid := row_id(row)) is not None]
+        if not batch:
+            break
+        cursor = max(rid for rid, _ in batch)
+        embeddings = await embed([text for _, text in batch])
+        build.add(embeddings, [rid for rid, _ in batch])
+
+        if build.rows_since_checkpoint >= checkpoint_rows:
+            await asyncio.to_thread(build.checkpoint)
+
+        elapsed = time.monotonic() - started
+        logger.info(
+            "rebuild_progress",
+            index_name=index_name,
+            rows=build.count,
+            last_id=cursor,
+            rows_per_sec=round((build.count - start_count) / elapsed, 1) if elapsed > 0 else None,
+        )
+        if progress is not None:
+            progress(index_name, build.count)
+        if heartbeat is not None:
+            await heartbeat()
+
+    rows_indexed = build.count
+    await store.commit_staged_build(build)
+    return rows_indexed, cursor
+
+
+async def _acquire_build_lock(
+    state_store: IIndexingStateStore,
+    index_name: str,
+    stale_after: float,
+) -> IndexingState:
+    """
+    Take the ``is_building`` lock of an index for a rebuild.
+
+    A lock whose holder has not updated the state for ``stale_after``
+    seconds belongs to an interrupted run and is taken over.
+
+    Raises:
+        IndexingError: If the lock is held by a build that is still running
+    """
+    state = await state_store.get_state(index_name) or IndexingState(index_name=index_name)
+    if state.is_building:
+        idle = (datetime.utcnow() - state.updated_at).total_seconds()
+        if idle < stale_after:
+            raise IndexingError(f"Index {index_name} is already being built")
+        logger.warning("rebuild_taking_over_lock", index_name=index_name, idle_seconds=int(idle))
+    state.is_building = True
+    return await state_store.update_state(state)
+
+
+async def rebuild_indexes(
+    batch_size: int | None = None,
+    resume: bool = True,
+    progress: ProgressCallback | None = None,
+) -> dict[str, int]:
+    """
+    Rebuild all indexes by streaming rows from SQLite.
+
+    Rows are paged by ID cursor and embedded in fixed-size batches, so
+    memory stays bounded by the index itself plus one batch, and there is
+    no cap on the number of rows. Partial builds are checkpointed next to
+    the live index and picked up again on the next run unless
+    ``resume=False``. The live index keeps serving until the new one is
+    complete, then the new generation is hot-swapped in.
+
+    Each index is locked through ``IndexingState.is_building``, refreshed
+    after every batch. A lock left idle for longer than
+    ``rebuild_lock_stale_seconds`` (an interrupted run) is taken over;
+    a live one makes the rebuild fail with IndexingError.
+
+    Args:
+        batch_size: Rows embedded per batch (defaults to settings)
+        resume: Continue an interrupted rebuild from its last checkpoint
+        progress: Optional callback receiving (index_name, rows_indexed)
+
+    Returns:
+        Rows indexed per index name
+
+    Raises:
+        IndexingError: If another build of an index is still running
+    """
+    from src.infrastructure.embeddings.bge_m3 import (
+        get_embedding_provider,
+        get_inference_executor,
+    )
+    from src.infrastructure.storage.sqlite import (
+        SQLiteDocumentStore,
+        SQLiteIndexingStateStore,
+        SQLiteInvoiceStore,
+    )
+
+    settings = get_settings()
+    batch_size = batch_size or settings.storage.rebuild_batch_size
+    checkpoint_rows = settings.storage.rebuild_checkpoint_rows
 
     store = get_vector_store()
     doc_store = SQLiteDocumentStore()
     invoice_store = SQLiteInvoiceStore()
+    state_store = SQLiteIndexingStateStore()
     embedder = get_embedding_provider()
+    loop = asyncio.get_running_loop()
+
+    async def embed(texts: list[str]) -> np.ndarray:
+        return await loop.run_in_executor(get_inference_executor(), embedder.embed_batch, texts)
 
-    # Rebuild chunks index
-    logger.info("rebuilding_chunks_index")
-    chunks = await doc_store.get_chunks_for_indexing(limit=100000)
-    if chunks:
-        texts = [c.embedding_text for c in chunks]
-        chunk_ids = [c.id for c in chunks if c.id is not None]
-        embeddings = embedder.embed_batch(texts)
-        await store.build_index("chunks", embeddings, chunk_ids, force_rebuild=True)
-
-    # Rebuild items index
-    logger.info("rebuilding_items_index")
-    items = await invoice_store.get_items_for_indexing(limit=100000)
-    if items:
-        texts = [
-            f"{item['item_name']} {item.get('hs_code', '')} {item.get('brand', '')} {item.get('model', '')}"
-            for item in items
-        ]
-        item_ids: list[int] = [item["id"] for item in items]
-        embeddings = embedder.embed_batch(texts)
-        await store.build_index("items", embeddings, item_ids, force_rebuild=True)
-
-    logger.info("index_rebuild_complete")
+    async def fetch_chunks(last_id: int, limit: int) -> list[Any]:
+        return await doc_store.get_chunks_for_indexing(last_chunk_id=last_id, limit=limit)
+
+    async def fetch_items(last_id: int, limit: int) -> list[dict[str, Any]]:
+        return await invoice_store.get_items_for_indexing(last_item_id=last_id, limit=limit)
+
+    specs: dict[str, tuple[Callable[[int, int], Awaitable[list[Any]]], Any, Any]] = {
+        "chunks": (fetch_chunks, lambda chunk: chunk.id, lambda chunk: chunk.embedding_text),
+        "items": (fetch_items, lambda item: item["id"], item_embedding_text),
+    }
+    counts: dict[str, int] = {}
+
+    for index_name, (fetch_page, row_id, row_text) in specs.items():
+        # Pause incremental indexing so it doesn't append to the outgoing generation
+        state = await _acquire_build_lock(
+            state_store, index_name, settings.storage.rebuild_lock_stale_seconds
+        )
+
+        async def heartbeat() -> None:
+            await state_store.update_state(state)
+
+        logger.info("rebuilding_index", index_name=index_name, batch_size=batch_size)
+        try:
+            rows, last_id = await _stream_rebuild(
+                store,
+                index_name,
+                fetch_page=fetch_page,
+                row_id=row_id,
+                row_text=row_text,
+                embed=embed,
+                batch_size=batch_size,
+                checkpoint_rows=checkpoint_rows,
+                resume=resume,
+                progress=progress,
+                heartbeat=heartbeat,
+            )
+        except Exception as e:
+            state.is_building = False
+            state.last_error = str(e)
+            await state_store.update_state(state)
+            raise
+
+        # Point incremental indexing at the end of what was just rebuilt
+        if rows:
+            if index_name == "chunks":
+                state.last_chunk_id = last_id
+            else:
+                state.last_item_id = last_id
+            state.total_indexed = rows
+        state.is_building = False
+        state.last_error = None
+        state.last_run_at = datetime.now()
+        await state_store.update_state(state)
+        counts[index_name] = rows
+
+    logger.info("index_rebuild_complete", **counts)
+    return counts
+
+
+def main() -> None:
+    """CLI entry point for rebuilding the FAISS indexes."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SRG FAISS index rebuild")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Rows embedded per batch (default: STORAGE_REBUILD_BATCH_SIZE)",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Discard any interrupted rebuild and start from scratch",
+    )
+    args = parser.parse_args()
+
+    counts = asyncio.run(rebuild_indexes(batch_size=args.batch_size, resume=not args.no_resume))
+    for index_name, rows in counts.items():
+        print(f"{index_name}: {rows} vectors")
 
 
 if __name__ == "__main__":
-    asyncio.run(rebuild_indexes())
+    main()
@@ -0,0 +1,61 @@
+"""
+Tests for client-disconnect handling in the chat streaming route.
+
+Tests:
+- Chunks are relayed until the stream ends
+- A disconnect cancels the pending upstream read
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.routes import chat as chat_routes
+
+
+class FakeRequest:
+    """Request whose connection drops when ``disconnect`` is set."""
+
+    def __init__(self):
+        self.disconnect = asyncio.Event()
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnect.is_set()
+
+
+@pytest.fixture(autouse=True)
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(chat_routes, "DISCONNECT_POLL_INTERVAL", 0.01)
+
+
+async def test_relays_until_stream_ends():
+    async def stream():
+        for chunk in ["Hello", " world"]:
+            yield chunk
+
+    relay = chat_routes._until_disconnected(FakeRequest(), stream())
+
+    assert [c async for c in relay] == ["Hello", " world"]
+
+
+async def test_disconnect_cancels_upstream():
+    request = FakeRequest()
+    upstream_cancelled = asyncio.Event()
+
+    async def stream():
+        yield "first"
+        try:
+            await asyncio.sleep(10)
+            yield "never"
+        except asyncio.CancelledError:
+            upstream_cancelled.set()
+            raise
+
+    relay = chat_routes._until_disconnected(request, stream())
+    assert await anext(relay) == "first"
+
+    request.disconnect.set()
+    rest = [c async for c in relay]
+
+    assert rest == []
+    assert upstream_cancelled.is_set()
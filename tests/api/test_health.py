@@ -37,3 +37,13 @@ async def test_detailed_health_async(async_client, api_prefix: str):
         assert "status" in data
         # Response has individual provider fields, not a single "providers" dict
         assert "version" in data
+
+
+def test_parser_health(client: TestClient, api_prefix: str):
+    """Parser stats report the vision fallback rate."""
+    response = client.get(f"{api_prefix}/health/parsers")
+    assert response.status_code == 200
+
+    details = response.json()["parsers"]["details"]
+    assert "vision_fallback_rate" in details
+    assert "by_parser" in details
@@ -264,3 +264,47 @@ class TestProformaPreview:
         data = response.json()
         detail = data.get("detail") or data.get("message") or ""
         assert "not found" in detail.lower()
+
+
+@pytest.fixture
+async def reprocess_client():
+    """Async client whose reprocess use case uses mocked stores."""
+    from src.api.dependencies import get_reprocess_invoices_use_case
+    from src.application.use_cases import ReprocessInvoicesUseCase
+
+    invoice_store = AsyncMock()
+    invoice_store.find_invoice_ids.return_value = []
+    use_case = ReprocessInvoicesUseCase(invoice_store=invoice_store)
+    app.dependency_overrides[get_reprocess_invoices_use_case] = lambda: use_case
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    app.dependency_overrides.pop(get_reprocess_invoices_use_case, None)
+
+
+class TestReprocessInvoices:
+    """Tests for POST /api/invoices/reprocess and its status endpoint."""
+
+    async def test_reprocess_returns_job(self, reprocess_client: AsyncClient):
+        """Test that reprocess accepts the job and its status can be polled."""
+        response = await reprocess_client.post(
+            "/api/invoices/reprocess", json={"parser_name": "vision", "dry_run": True}
+        )
+        assert response.status_code == 202
+        job = response.json()
+        assert job["dry_run"] is True
+        assert job["total"] == 0
+
+        status_response = await reprocess_client.get(f"/api/invoices/reprocess/{job['job_id']}")
+        assert status_response.status_code == 200
+        assert status_response.json()["status"] == "completed"
+
+    async def test_reprocess_requires_selection(self, reprocess_client: AsyncClient):
+        """Test that reprocess rejects a request without ids or filters."""
+        response = await reprocess_client.post("/api/invoices/reprocess", json={"dry_run": True})
+        assert response.status_code == 422
+
+    async def test_reprocess_status_not_found(self, reprocess_client: AsyncClient):
+        """Test that an unknown job returns 404."""
+        response = await reprocess_client.get("/api/invoices/reprocess/unknown")
+        assert response.status_code == 404
@@ -143,6 +143,14 @@ class TestILLMProviderInterface:
         actual_methods = set(ILLMProvider.__abstractmethods__)
         assert abstract_methods == actual_methods
 
+    def test_count_tokens_defaults_to_no_tokenizer(self):
+        """Providers without a local tokenizer report None, not an error."""
+
+        class Minimal(ILLMProvider):
+            generate = generate_stream = chat = check_health = is_available = None
+
+        assert Minimal().count_tokens(["abc"]) is None
+
 
 class TestIVisionProviderInterface:
     """Tests for IVisionProvider abstract interface."""
@@ -174,6 +182,7 @@ class TestIEmbeddingProviderInterface:
             "embed_batch",
             "get_dimension",
             "is_loaded",
+            "count_tokens",
         }
         actual_methods = set(IEmbeddingProvider.__abstractmethods__)
         assert abstract_methods == actual_methods
@@ -117,6 +117,8 @@ class TestIInvoiceStoreInterface:
             "delete_invoice",
             "list_invoices",
             "search_invoices",
+            "find_invoice_ids",
+            "replace_invoice",
             "create_audit_result",
             "get_audit_result",
             "list_audit_results",
@@ -153,6 +155,7 @@ class TestISessionStoreInterface:
         message_methods = {
             "add_message",
             "get_messages",
+            "count_messages",
         }
         actual = set(ISessionStore.__abstractmethods__)
         assert message_methods.issubset(actual)
@@ -176,6 +179,7 @@ class TestISessionStoreInterface:
             "list_sessions",
             "add_message",
             "get_messages",
+            "count_messages",
             "save_memory_fact",
             "get_memory_facts",
             "delete_memory_fact",
@@ -225,6 +229,9 @@ class TestIVectorStoreInterface:
             "get_index_stats",
             "save_index",
             "load_index",
+            "begin_rebuild",
+            "stage_vectors",
+            "commit_rebuild",
             "save_id_mapping",
             "get_entity_id",
             "get_entity_ids",
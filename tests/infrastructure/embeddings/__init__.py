@@ -0,0 +1 @@
+"""Unit tests for embedding provider infrastructure."""
@@ -0,0 +1,65 @@
+"""
+Unit tests for BGEM3EmbeddingProvider token counting.
+
+Tests:
+- Tokenizing uses its own tokenizer, not the embedding model
+- The tokenizer is loaded once and never used by two threads at a time
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infrastructure.embeddings import bge_m3
+
+
+class FakeTokenizer:
+    """Stands in for a fast tokenizer and fails if used concurrently."""
+
+    loads: list[str] = []
+
+    def __init__(self) -> None:
+        self._busy = threading.Lock()
+
+    @classmethod
+    def from_pretrained(cls, name: str) -> "FakeTokenizer":
+        cls.loads.append(name)
+        return cls()
+
+    def __call__(self, texts: list[str], **kwargs) -> dict[str, list[list[int]]]:
+        if not self._busy.acquire(blocking=False):
+            raise RuntimeError("Already borrowed")
+        try:
+            time.sleep(0.01)
+            return {"input_ids": [list(range(len(text.split()))) for text in texts]}
+        finally:
+            self._busy.release()
+
+
+@pytest.fixture
+def provider(monkeypatch: pytest.MonkeyPatch):
+    FakeTokenizer.loads = []
+    monkeypatch.setattr(bge_m3, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr(bge_m3, "AutoTokenizer", FakeTokenizer)
+    return bge_m3.BGEM3EmbeddingProvider()
+
+
+class TestCountTokens:
+    """Tests for the dedicated tokenizer."""
+
+    def test_does_not_load_the_model(self, provider):
+        """Counting loads the tokenizer files only."""
+        assert provider.count_tokens(["one two", "three"]) == [2, 1]
+
+        assert FakeTokenizer.loads == [provider.model_name]
+        assert provider._model is None
+
+    def test_concurrent_callers_share_one_tokenizer(self, provider):
+        """Calls from several threads load once and never overlap."""
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            counts = list(pool.map(provider.count_tokens, [["a b c"]] * 8))
+
+        assert counts == [[3]] * 8
+        assert len(FakeTokenizer.loads) == 1
@@ -0,0 +1 @@
+"""Unit tests for LLM provider infrastructure."""
@@ -0,0 +1,197 @@
+"""
+Unit tests for the LLM response cache.
+
+Tests:
+- CachedLLMProvider hit/miss, key composition and opt-out
+- SQLiteLLMCacheStore TTL expiry and LRU size cap
+"""
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import aiosqlite
+import pytest
+
+from src.core.interfaces import ILLMProvider, LLMPriority, LLMResponse, no_llm_cache
+from src.infrastructure.llm.cache import CachedLLMProvider
+from src.infrastructure.llm.scheduler import LLMScheduler, ScheduledLLMProvider
+from src.infrastructure.storage.sqlite import llm_cache_store
+from src.infrastructure.storage.sqlite.llm_cache_store import SQLiteLLMCacheStore
+
+MIGRATION = (
+    Path(__file__).parents[3] / "src/infrastructure/storage/sqlite/migrations/v011_llm_cache.sql"
+)
+
+
+@pytest.fixture
+async def store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Cache store on a temporary database migrated with v011."""
+    conn = await aiosqlite.connect(tmp_path / "cache.db")
+    conn.row_factory = aiosqlite.Row
+    await conn.execute("CREATE TABLE schema_migrations (version TEXT PRIMARY KEY, name TEXT)")
+    await conn.executescript(MIGRATION.read_text())
+
+    @asynccontextmanager
+    async def use_conn():
+        yield conn
+        await conn.commit()
+
+    monkeypatch.setattr(llm_cache_store, "get_connection", use_conn)
+    monkeypatch.setattr(llm_cache_store, "get_transaction", use_conn)
+    yield SQLiteLLMCacheStore()
+    await conn.close()
+
+
+@pytest.fixture
+def inner() -> MagicMock:
+    """Wrapped provider returning a fixed response."""
+    provider = MagicMock(spec=ILLMProvider)
+    provider.model = "llama3.1:8b"
+    provider.generate = AsyncMock(return_value=LLMResponse(text="[]", model="llama3.1:8b"))
+    provider.chat = AsyncMock(return_value=LLMResponse(text="hi", model="llama3.1:8b"))
+    return provider
+
+
+def _cached(inner, store, **kwargs) -> CachedLLMProvider:
+    return CachedLLMProvider(
+        inner, store=store, ttl_seconds=3600, max_entries=100, max_temperature=0.3, **kwargs
+    )
+
+
+class TestCachedLLMProvider:
+    """Tests for the caching decorator."""
+
+    async def test_repeat_generate_served_from_cache(self, inner, store):
+        """The second identical low-temperature call skips the model."""
+        llm = _cached(inner, store)
+
+        first = await llm.generate("audit this", max_tokens=500, temperature=0.1)
+        second = await llm.generate("audit this", max_tokens=500, temperature=0.1)
+
+        assert inner.generate.await_count == 1
+        assert second.text == first.text
+        stats = await llm.get_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    async def test_key_covers_request_parameters(self, inner, store):
+        """Changing prompt, system prompt or max_tokens is a different entry."""
+        llm = _cached(inner, store)
+
+        await llm.generate("p", temperature=0.1, max_tokens=100)
+        await llm.generate("p", temperature=0.1, max_tokens=200)
+        await llm.generate("p", system_prompt="s", temperature=0.1, max_tokens=100)
+        await llm.generate("q", temperature=0.1, max_tokens=100)
+
+        assert inner.generate.await_count == 4
+
+    async def test_key_uses_innermost_provider(self, inner, store):
+        """The scheduler layer does not change the key or the stored provider."""
+        scheduler = LLMScheduler(
+            max_concurrency=1,
+            limits={},
+            deadlines={p: 5.0 for p in LLMPriority},
+            max_queue=10,
+        )
+        scheduled = _cached(ScheduledLLMProvider(inner, scheduler), store)
+        direct = _cached(inner, store)
+
+        await scheduled.generate("p", temperature=0.1)
+        await direct.generate("p", temperature=0.1)
+
+        assert inner.generate.await_count == 1
+        assert scheduled._cache_key("generate", prompt="p") == direct._cache_key(
+            "generate", prompt="p"
+        )
+
+    async def test_default_temperature_passed_through(self, inner, store):
+        """Omitted sampling settings reach the provider as None, uncached."""
+        llm = _cached(inner, store)
+
+        await llm.generate("p")
+        await llm.chat([{"role": "user", "content": "hi"}])
+
+        assert inner.generate.await_args.kwargs["temperature"] is None
+        assert inner.generate.await_args.kwargs["max_tokens"] is None
+        assert inner.chat.await_args.kwargs == {"temperature": None, "max_tokens": None}
+        assert (await store.get_stats())["entries"] == 0
+
+    async def test_high_temperature_not_cached(self, inner, store):
+        """Sampling calls above the threshold always reach the model."""
+        llm = _cached(inner, store)
+
+        await llm.generate("chat", temperature=0.7)
+        await llm.generate("chat", temperature=0.7)
+
+        assert inner.generate.await_count == 2
+        assert (await store.get_stats())["entries"] == 0
+
+    async def test_opt_out_per_call(self, inner, store):
+        """Calls inside no_llm_cache() neither read nor write the cache."""
+        llm = _cached(inner, store)
+        await llm.generate("p", temperature=0.1)
+
+        with no_llm_cache():
+            await llm.generate("p", temperature=0.1)
+
+        assert inner.generate.await_count == 2
+
+    async def test_chat_cached(self, inner, store):
+        """Chat completions are cached by message list."""
+        llm = _cached(inner, store)
+        messages = [{"role": "user", "content": "hello"}]
+
+        await llm.chat(messages, temperature=0.0)
+        await llm.chat(messages, temperature=0.0)
+
+        assert inner.chat.await_count == 1
+
+    async def test_store_failure_falls_through(self, inner):
+        """A broken cache store never fails the call."""
+        broken = MagicMock()
+        broken.get = AsyncMock(side_effect=RuntimeError("db locked"))
+        broken.put = AsyncMock(side_effect=RuntimeError("db locked"))
+        llm = _cached(inner, broken)
+
+        response = await llm.generate("p", temperature=0.1)
+
+        assert response.text == "[]"
+
+    async def test_delegates_provider_extras(self, inner, store):
+        """Provider-specific attributes stay reachable through the wrapper."""
+        inner.pool_stats = MagicMock(return_value={"requests": 3})
+        llm = _cached(inner, store)
+
+        assert llm.model == "llama3.1:8b"
+        assert llm.pool_stats() == {"requests": 3}
+
+
+class TestSQLiteLLMCacheStore:
+    """Tests for cache persistence."""
+
+    async def test_expired_entry_is_a_miss(self, store):
+        """Entries older than the TTL are dropped on read."""
+        await store.put("k", "Ollama", LLMResponse(text="x", model="m"), max_entries=10)
+
+        assert await store.get("k", ttl_seconds=3600) is not None
+        assert await store.get("k", ttl_seconds=-1) is None
+        assert (await store.get_stats())["entries"] == 0
+
+    async def test_size_cap_evicts_least_recently_used(self, store):
+        """Over the cap, the least recently used entries are evicted."""
+        for key in ("a", "b"):
+            await store.put(key, "Ollama", LLMResponse(text=key, model="m"), max_entries=2)
+        await store.get("a", ttl_seconds=3600)
+
+        await store.put("c", "Ollama", LLMResponse(text="c", model="m"), max_entries=2)
+
+        assert await store.get("b", ttl_seconds=3600) is None
+        assert (await store.get("a", ttl_seconds=3600)).text == "a"
+        assert (await store.get("c", ttl_seconds=3600)).text == "c"
+
+    async def test_clear(self, store):
+        """clear() removes everything."""
+        await store.put("k", "Ollama", LLMResponse(text="x", model="m"), max_entries=10)
+
+        assert await store.clear() == 1
+        assert (await store.get_stats())["entries"] == 0
@@ -0,0 +1,67 @@
+"""
+Unit tests for LlamaCppProvider token counting.
+
+Tests:
+- Tokenizing uses a vocabulary-only instance, not the decoding model
+- The tokenizer instance is loaded once and never via the model executor
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.llm import llama_cpp
+
+
+class FakeLlama:
+    """Stands in for llama_cpp.Llama and records how it was constructed."""
+
+    instances: list["FakeLlama"] = []
+
+    def __init__(self, model_path: str, **kwargs):
+        self.model_path = model_path
+        self.kwargs = kwargs
+        FakeLlama.instances.append(self)
+
+    def tokenize(self, text: bytes, add_bos: bool = True, special: bool = False) -> list[int]:
+        return list(range(len(text.split())))
+
+
+@pytest.fixture
+def provider(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    FakeLlama.instances = []
+    monkeypatch.setattr(llama_cpp, "LLAMA_CPP_AVAILABLE", True)
+    monkeypatch.setattr(llama_cpp, "Llama", FakeLlama)
+    model = tmp_path / "model.gguf"
+    model.write_bytes(b"")
+    provider = llama_cpp.LlamaCppProvider(model_path=str(model))
+    yield provider
+    provider._executor.shutdown(wait=False)
+
+
+class TestCountTokens:
+    """Tests for the vocabulary-only tokenizer."""
+
+    def test_uses_vocab_only_instance(self, provider):
+        """Counting never loads the decoding model."""
+        assert provider.count_tokens(["one two", "three"]) == [2, 1]
+
+        assert len(FakeLlama.instances) == 1
+        assert FakeLlama.instances[0].kwargs["vocab_only"] is True
+        assert provider._model is None
+
+    def test_tokenizer_loaded_once_off_the_executor(self, provider, monkeypatch):
+        """Later calls reuse the tokenizer and never queue on the model thread."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("tokenizing must not use the model executor")
+
+        monkeypatch.setattr(provider._executor, "submit", fail)
+        provider.count_tokens(["a"])
+        provider.count_tokens(["b c"])
+
+        assert len(FakeLlama.instances) == 1
+
+    def test_empty_input_skips_loading(self, provider):
+        assert provider.count_tokens([]) == []
+        assert FakeLlama.instances == []
@@ -0,0 +1,168 @@
+"""
+Unit tests for the llama.cpp worker pool.
+
+Tests:
+- Parallel leasing up to the worker count, FIFO queueing beyond it
+- Per-worker token and throughput stats
+- Stream close returns the worker
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.interfaces import HealthStatus, LLMResponse
+from src.infrastructure.llm.llama_pool import LlamaCppWorkerPool, threads_per_worker
+
+
+class FakeWorker:
+    """Stands in for a LlamaCppProvider with one model instance."""
+
+    def __init__(self, name: str, release: asyncio.Event | None = None):
+        self.name = name
+        self.model_path = "/models/test.gguf"
+        self.release = release
+        self.active = 0
+        self.peak = 0
+        self.prompts: list[str] = []
+
+    async def generate(
+        self, prompt, system_prompt=None, temperature=None, max_tokens=None, stop=None
+    ):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.prompts.append(prompt)
+        try:
+            if self.release is not None:
+                await self.release.wait()
+            return LLMResponse(text=f"{self.name}:{prompt}", model="test", completion_tokens=5)
+        finally:
+            self.active -= 1
+
+    async def chat(self, messages, temperature=None, max_tokens=None):
+        return await self.generate(messages[-1]["content"])
+
+    async def generate_stream(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
+        for token in ("a", "b", "c"):
+            yield token
+
+    async def chat_stream(self, messages, temperature=None, max_tokens=None):
+        for token in ("x", "y"):
+            yield token
+
+    def count_tokens(self, texts):
+        return [len(t) for t in texts]
+
+    async def check_health(self):
+        return HealthStatus(available=True, provider="llama_cpp")
+
+    def is_available(self):
+        return True
+
+
+class TestLlamaCppWorkerPool:
+    """Tests for request leasing and stats."""
+
+    def test_requires_a_worker(self):
+        with pytest.raises(ValueError):
+            LlamaCppWorkerPool([])
+
+    async def test_runs_requests_in_parallel_across_workers(self):
+        release = asyncio.Event()
+        workers = [FakeWorker("w0", release), FakeWorker("w1", release)]
+        pool = LlamaCppWorkerPool(workers)
+
+        tasks = [asyncio.create_task(pool.generate(f"p{i}")) for i in range(2)]
+        await asyncio.sleep(0.01)
+
+        assert [w.active for w in workers] == [1, 1]
+        release.set()
+        results = await asyncio.gather(*tasks)
+        assert sorted(r.text for r in results) == ["w0:p0", "w1:p1"]
+
+    async def test_excess_requests_wait_in_arrival_order(self):
+        release = asyncio.Event()
+        worker = FakeWorker("w0", release)
+        pool = LlamaCppWorkerPool([worker])
+
+        tasks = [asyncio.create_task(pool.generate(f"p{i}")) for i in range(3)]
+        await asyncio.sleep(0.01)
+
+        assert worker.peak == 1
+        assert pool.worker_stats()["waiting"] == 2
+        release.set()
+        await asyncio.gather(*tasks)
+        assert worker.prompts == ["p0", "p1", "p2"]
+
+    async def test_idle_workers_take_turns(self):
+        workers = [FakeWorker("w0"), FakeWorker("w1")]
+        pool = LlamaCppWorkerPool(workers)
+
+        for i in range(4):
+            await pool.generate(f"p{i}")
+
+        assert workers[0].prompts == ["p0", "p2"]
+        assert workers[1].prompts == ["p1", "p3"]
+
+    async def test_worker_stats_report_tokens(self):
+        pool = LlamaCppWorkerPool([FakeWorker("w0")])
+
+        await pool.generate("p")
+        chunks = [c async for c in pool.generate_stream("p")]
+
+        stats = pool.worker_stats()
+        worker = stats["per_worker"][0]
+        assert chunks == ["a", "b", "c"]
+        assert worker["requests"] == 2
+        assert worker["completion_tokens"] == 8
+        assert worker["busy"] is False
+        assert stats["idle"] == 1
+
+    async def test_closed_stream_returns_worker(self):
+        pool = LlamaCppWorkerPool([FakeWorker("w0")])
+
+        stream = pool.chat_stream([{"role": "user", "content": "hi"}])
+        assert await anext(stream) == "x"
+        await stream.aclose()
+
+        stats = pool.worker_stats()
+        assert stats["idle"] == 1
+        assert stats["per_worker"][0]["completion_tokens"] == 1
+        response = await pool.chat([{"role": "user", "content": "again"}])
+        assert response.text == "w0:again"
+
+    async def test_failure_is_counted_and_worker_released(self):
+        worker = FakeWorker("w0")
+        pool = LlamaCppWorkerPool([worker])
+
+        async def boom(*args, **kwargs):
+            raise RuntimeError("decode failed")
+
+        worker.generate = boom
+        with pytest.raises(RuntimeError):
+            await pool.generate("p")
+
+        stats = pool.worker_stats()
+        assert stats["per_worker"][0]["failures"] == 1
+        assert stats["idle"] == 1
+
+    async def test_health_and_tokens_use_first_worker(self):
+        pool = LlamaCppWorkerPool([FakeWorker("w0"), FakeWorker("w1")])
+
+        health = await pool.check_health()
+
+        assert health.provider == "llama_cpp_pool"
+        assert pool.count_tokens(["abc"]) == [3]
+        assert pool.model_path == "/models/test.gguf"
+
+
+class TestThreadsPerWorker:
+    """Tests for CPU thread allotment."""
+
+    def test_configured_value_wins(self):
+        assert threads_per_worker(4, configured=3) == 3
+
+    def test_splits_cores(self, monkeypatch):
+        monkeypatch.setattr("os.cpu_count", lambda: 16)
+        assert threads_per_worker(4) == 4
+        assert threads_per_worker(32) == 1
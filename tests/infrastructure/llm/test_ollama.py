@@ -0,0 +1,139 @@
+"""
+Unit tests for OllamaProvider's pooled HTTP client.
+
+Tests:
+- One client shared across generate, stream and health calls
+- Per-endpoint timeouts
+- Pool metrics and shutdown
+- Chat API requests with keep_alive and token counts
+"""
+
+import json
+
+import httpx
+import pytest
+
+from src.infrastructure.llm.ollama import OllamaProvider
+
+
+def _handler(seen: list[httpx.Request]):
+    def handle(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/api/tags":
+            return httpx.Response(200, json={"models": [{"name": "llama3.1:8b"}]})
+        payload = json.loads(request.content)
+        if request.url.path == "/api/chat":
+            if payload.get("stream"):
+                lines = [{"message": {"content": t}, "done": False} for t in ["Hi", "!"]]
+                lines.append({"message": {"content": ""}, "done": True, "prompt_eval_count": 3})
+                return httpx.Response(200, text="\n".join(json.dumps(line) for line in lines))
+            return httpx.Response(200, json={
+                "message": {"role": "assistant", "content": "Hi!"},
+                "done": True,
+                "prompt_eval_count": 12,
+                "eval_count": 2,
+            })
+        if payload.get("stream"):
+            lines = "\n".join(json.dumps({"response": t}) for t in ["He", "llo"])
+            return httpx.Response(200, text=lines)
+        return httpx.Response(200, json={"response": "ok", "done": True})
+
+    return handle
+
+
+@pytest.fixture
+def provider():
+    """Provider whose shared client talks to an in-memory transport."""
+    seen: list[httpx.Request] = []
+    provider = OllamaProvider()
+    provider.model = "llama3.1:8b"
+    provider._client = httpx.AsyncClient(
+        base_url=provider.host,
+        transport=httpx.MockTransport(_handler(seen)),
+    )
+    provider.seen = seen
+    return provider
+
+
+class TestSharedClient:
+    """Tests for the provider-owned connection pool."""
+
+    @pytest.mark.asyncio
+    async def test_all_calls_share_one_client(self, provider):
+        """Generate, stream and health checks reuse the same client."""
+        client = provider.client
+
+        await provider.generate("hi")
+        tokens = [t async for t in provider.generate_stream("hi")]
+        health = await provider.check_health()
+
+        assert provider.client is client
+        assert tokens == ["He", "llo"]
+        assert health.available is True
+        assert len(provider.seen) == 3
+
+    @pytest.mark.asyncio
+    async def test_per_endpoint_timeouts(self, provider):
+        """Health probes use the short timeout, vision the long one."""
+        await provider.check_health()
+        await provider.analyze_image_base64("aW1n", "describe")
+
+        health, vision = (r.extensions["timeout"] for r in provider.seen)
+        assert health["read"] == provider.health_timeout
+        assert vision["read"] == provider.vision_timeout
+        assert health["connect"] == vision["connect"] == provider.connect_timeout
+
+    @pytest.mark.asyncio
+    async def test_pool_stats_track_requests(self, provider):
+        """Pool metrics count requests and return to zero in flight."""
+        await provider.generate("one")
+        await provider.generate("two")
+
+        stats = provider.pool_stats()
+        assert stats["requests"] == 2
+        assert stats["in_flight"] == 0
+        assert stats["peak_in_flight"] == 1
+        assert stats["open"] is True
+        assert stats["max_connections"] == provider.limits.max_connections
+
+    @pytest.mark.asyncio
+    async def test_close_releases_client(self, provider):
+        """close() shuts the pool; the next call opens a fresh one."""
+        client = provider.client
+
+        await provider.close()
+
+        assert client.is_closed
+        assert provider.pool_stats()["open"] is False
+        assert provider.client is not client
+        await provider.close()
+
+
+class TestChatAPI:
+    """Tests for structured chat requests."""
+
+    @pytest.mark.asyncio
+    async def test_chat_sends_messages_with_keep_alive(self, provider):
+        """Chat posts the messages unchanged and asks Ollama to stay loaded."""
+        messages = [
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "Hello"},
+        ]
+
+        response = await provider.chat(messages)
+
+        payload = json.loads(provider.seen[0].content)
+        assert provider.seen[0].url.path == "/api/chat"
+        assert payload["messages"] == messages
+        assert payload["keep_alive"] == provider.keep_alive
+        assert response.text == "Hi!"
+        assert response.prompt_tokens == 12
+        assert response.total_tokens == 14
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_yields_message_content(self, provider):
+        """Streaming chat yields content deltas until done."""
+        chunks = [c async for c in provider.chat_stream([{"role": "user", "content": "Hello"}])]
+
+        assert chunks == ["Hi", "!"]
+        assert json.loads(provider.seen[0].content)["stream"] is True
@@ -0,0 +1,293 @@
+"""
+Unit tests for the LLM request scheduler.
+
+Tests:
+- Priority ordering and per-class concurrency caps
+- Deadline and queue-length load shedding
+- ScheduledLLMProvider routing and priority tagging
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.exceptions import LLMOverloadedError
+from src.core.interfaces import LLMPriority, LLMResponse, VisionResponse, llm_priority
+from src.infrastructure.llm import scheduler as scheduler_module
+from src.infrastructure.llm.scheduler import LLMScheduler, ScheduledLLMProvider
+
+
+def _scheduler(max_concurrency: int = 1, deadline: float = 5.0, max_queue: int = 10, **limits):
+    return LLMScheduler(
+        max_concurrency=max_concurrency,
+        limits={LLMPriority(k): v for k, v in limits.items()},
+        deadlines={p: deadline for p in LLMPriority},
+        max_queue=max_queue,
+    )
+
+
+class TestLLMScheduler:
+    """Tests for slot scheduling."""
+
+    async def test_higher_priority_runs_first(self):
+        """Queued interactive work overtakes earlier background work."""
+        scheduler = _scheduler()
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def job(priority: LLMPriority, name: str, hold: bool = False):
+            async with scheduler.slot(priority):
+                order.append(name)
+                if hold:
+                    await release.wait()
+
+        first = asyncio.create_task(job(LLMPriority.INGEST, "ingest", hold=True))
+        await asyncio.sleep(0.01)
+        queued = [
+            asyncio.create_task(job(LLMPriority.BACKGROUND, "background")),
+            asyncio.create_task(job(LLMPriority.INTERACTIVE, "interactive")),
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(first, *queued)
+
+        assert order == ["ingest", "interactive", "background"]
+
+    async def test_class_cap_leaves_room_for_others(self):
+        """A class at its cap doesn't block another class from a free slot."""
+        scheduler = _scheduler(max_concurrency=2, ingest=1)
+        release = asyncio.Event()
+        running: list[str] = []
+
+        async def job(priority: LLMPriority, name: str):
+            async with scheduler.slot(priority):
+                running.append(name)
+                await release.wait()
+
+        tasks = [
+            asyncio.create_task(job(LLMPriority.INGEST, "ingest-1")),
+            asyncio.create_task(job(LLMPriority.INGEST, "ingest-2")),
+            asyncio.create_task(job(LLMPriority.INTERACTIVE, "chat")),
+        ]
+        await asyncio.sleep(0.01)
+
+        assert running == ["ingest-1", "chat"]
+        assert scheduler.get_stats()["classes"]["ingest"]["queued"] == 1
+        release.set()
+        await asyncio.gather(*tasks)
+
+    async def test_sheds_after_deadline(self):
+        """A request that can't start within its deadline is shed."""
+        scheduler = _scheduler(deadline=0.01)
+        release = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot(LLMPriority.INTERACTIVE):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(LLMOverloadedError) as exc_info:
+            async with scheduler.slot(LLMPriority.BACKGROUND):
+                pass
+
+        assert exc_info.value.code == "LLM_OVERLOADED"
+        stats = scheduler.get_stats()["classes"]["background"]
+        assert stats["shed"] == 1
+        assert stats["queued"] == 0
+        release.set()
+        await holder
+
+    async def test_grant_at_deadline_returns_slot(self, monkeypatch):
+        """A slot granted in the same tick as the deadline is given back."""
+        scheduler = _scheduler()
+        holder = scheduler.slot(LLMPriority.INTERACTIVE)
+        await holder.__aenter__()
+
+        async def granted_at_deadline(waiter, timeout):
+            await holder.__aexit__(None, None, None)
+            assert waiter.done() and not waiter.cancelled()
+            raise TimeoutError
+
+        monkeypatch.setattr(asyncio, "wait_for", granted_at_deadline)
+        with pytest.raises(LLMOverloadedError):
+            async with scheduler.slot(LLMPriority.BACKGROUND):
+                pass
+        monkeypatch.undo()
+
+        stats = scheduler.get_stats()
+        assert stats["running"] == 0
+        assert stats["classes"]["background"]["running"] == 0
+        assert stats["classes"]["background"]["shed"] == 1
+        async with scheduler.slot(LLMPriority.INTERACTIVE):
+            assert scheduler.get_stats()["running"] == 1
+
+    async def test_sheds_when_queue_full(self):
+        """Arrivals beyond max_queue are rejected immediately."""
+        scheduler = _scheduler(max_queue=1)
+        release = asyncio.Event()
+
+        async def hold(priority: LLMPriority):
+            async with scheduler.slot(priority):
+                await release.wait()
+
+        tasks = [
+            asyncio.create_task(hold(LLMPriority.INGEST)),
+            asyncio.create_task(hold(LLMPriority.INGEST)),
+        ]
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(LLMOverloadedError):
+            async with scheduler.slot(LLMPriority.INGEST):
+                pass
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    async def test_cancelled_waiter_frees_its_place(self):
+        """Cancelling a queued call leaves the scheduler consistent."""
+        scheduler = _scheduler()
+        release = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot(LLMPriority.INTERACTIVE):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        release.set()
+        await holder
+
+        stats = scheduler.get_stats()
+        assert stats["running"] == 0
+        assert stats["classes"]["interactive"]["queued"] == 0
+        assert stats["classes"]["interactive"]["completed"] == 1
+
+    async def test_records_queue_wait(self):
+        """Completed calls report queue-wait metrics."""
+        scheduler = _scheduler()
+
+        async with scheduler.slot(LLMPriority.INGEST):
+            pass
+
+        stats = scheduler.get_stats()["classes"]["ingest"]
+        assert stats["completed"] == 1
+        assert stats["wait_ms_max"] >= 0
+
+
+class TestGetLLMScheduler:
+    """Tests for sizing the shared scheduler from settings."""
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        scheduler_module.reset_llm_scheduler()
+        yield
+        scheduler_module.reset_llm_scheduler()
+
+    def _settings(self, monkeypatch, provider: str, workers: int) -> None:
+        settings = MagicMock()
+        settings.llm.provider = provider
+        settings.llm.llama_workers = workers
+        settings.llm.scheduler_max_concurrency = 1
+        settings.llm.scheduler_interactive_concurrency = 1
+        settings.llm.scheduler_ingest_concurrency = 1
+        settings.llm.scheduler_background_concurrency = 1
+        settings.llm.scheduler_max_queue = 8
+        monkeypatch.setattr(scheduler_module, "get_settings", lambda: settings)
+
+    def test_llama_pool_raises_slots_to_pool_size(self, monkeypatch):
+        """Each pool worker gets a slot, in every class."""
+        self._settings(monkeypatch, "llama_cpp", workers=3)
+
+        stats = scheduler_module.get_llm_scheduler().get_stats()
+
+        assert stats["max_concurrency"] == 3
+        assert {c["limit"] for c in stats["classes"].values()} == {3}
+
+    def test_ollama_keeps_configured_slots(self, monkeypatch):
+        self._settings(monkeypatch, "ollama", workers=3)
+
+        stats = scheduler_module.get_llm_scheduler().get_stats()
+
+        assert stats["max_concurrency"] == 1
+        assert {c["limit"] for c in stats["classes"].values()} == {1}
+
+
+class TestScheduledLLMProvider:
+    """Tests for routing provider calls through the scheduler."""
+
+    @pytest.fixture
+    def inner(self) -> MagicMock:
+        provider = MagicMock()
+        provider.generate = AsyncMock(return_value=LLMResponse(text="ok", model="m"))
+        provider.analyze_image_base64 = AsyncMock(return_value=VisionResponse(text="v", model="m"))
+        return provider
+
+    async def test_untagged_text_is_interactive(self, inner):
+        """Plain generate calls run in the interactive class."""
+        scheduler = _scheduler()
+        llm = ScheduledLLMProvider(inner, scheduler)
+
+        await llm.generate("hi")
+
+        assert scheduler.get_stats()["classes"]["interactive"]["completed"] == 1
+
+    async def test_tagged_call_uses_its_class(self, inner):
+        """llm_priority() picks the class for calls inside the block."""
+        scheduler = _scheduler()
+        llm = ScheduledLLMProvider(inner, scheduler)
+
+        with llm_priority(LLMPriority.BACKGROUND):
+            await llm.generate("facts")
+        await llm.analyze_image_base64("aW1n", "read")
+
+        classes = scheduler.get_stats()["classes"]
+        assert classes["background"]["completed"] == 1
+        assert classes["ingest"]["completed"] == 1
+
+    async def test_stream_holds_slot_until_done(self):
+        """A stream keeps its slot until fully consumed."""
+        scheduler = _scheduler()
+
+        async def stream(*args, **kwargs):
+            assert scheduler.get_stats()["running"] == 1
+            yield "a"
+            yield "b"
+
+        inner = MagicMock()
+        inner.generate_stream = stream
+        llm = ScheduledLLMProvider(inner, scheduler)
+
+        chunks = [c async for c in llm.generate_stream("hi")]
+
+        assert chunks == ["a", "b"]
+        assert scheduler.get_stats()["running"] == 0
+
+    async def test_closed_stream_frees_slot(self):
+        """Closing a stream early closes the provider stream and frees the slot."""
+        scheduler = _scheduler()
+        closed = asyncio.Event()
+
+        async def stream(*args, **kwargs):
+            try:
+                for token in ["a", "b", "c"]:
+                    yield token
+            finally:
+                closed.set()
+
+        inner = MagicMock()
+        inner.chat_stream = stream
+        llm = ScheduledLLMProvider(inner, scheduler)
+
+        chunks = llm.chat_stream([{"role": "user", "content": "hi"}])
+        assert await anext(chunks) == "a"
+        await chunks.aclose()
+
+        assert closed.is_set()
+        assert scheduler.get_stats()["running"] == 0
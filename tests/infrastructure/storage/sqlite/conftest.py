@@ -149,6 +149,7 @@ async def initialized_db(temp_db_path: Path) -> AsyncGenerator[Path, None]:
                 confidence REAL DEFAULT 0,
                 template_confidence REAL DEFAULT 0,
                 parser_version TEXT,
+                parser_name TEXT,
                 template_id TEXT,
                 parsing_status TEXT DEFAULT 'pending',
                 error_message TEXT,
@@ -230,6 +231,7 @@ async def initialized_db(temp_db_path: Path) -> AsyncGenerator[Path, None]:
                 active_invoice_ids_json TEXT DEFAULT '[]',
                 conversation_summary TEXT,
                 summary_message_count INTEGER DEFAULT 0,
+                summary_last_message_id INTEGER,
                 total_tokens INTEGER DEFAULT 0,
                 max_context_tokens INTEGER DEFAULT 8000,
                 system_prompt TEXT,
@@ -1,5 +1,6 @@
 """Unit tests for SQLiteInvoiceStore."""
 
+from datetime import date
 from unittest.mock import patch
 
 import pytest
@@ -16,6 +17,7 @@ from src.core.entities import (
     ParsingStatus,
     RowType,
 )
+from src.core.exceptions import InvoiceNotLatestError
 from src.infrastructure.storage.sqlite.invoice_store import SQLiteInvoiceStore
 
 
@@ -467,6 +469,136 @@ class TestSQLiteInvoiceStoreCountInvoices:
             await close_pool()
 
 
+class TestSQLiteInvoiceStoreReprocessing:
+    """Tests for find_invoice_ids() and replace_invoice()."""
+
+    @pytest.mark.asyncio
+    async def test_find_invoice_ids_filters(self, initialized_db, mock_settings):
+        """find_invoice_ids() applies every filter to the latest invoices."""
+        import src.infrastructure.storage.sqlite.connection as conn_module
+
+        conn_module._pool = None
+        mock_settings.storage.db_path = initialized_db
+
+        with patch.object(conn_module, "get_settings", return_value=mock_settings):
+            from src.infrastructure.storage.sqlite.document_store import (
+                SQLiteDocumentStore,
+            )
+
+            doc_store = SQLiteDocumentStore()
+            store = SQLiteInvoiceStore()
+
+            ids = []
+            for i, (seller, parser) in enumerate(
+                [("ACME Trading", "table_aware"), ("Beta LLC", "table_aware"), ("ACME Trading", "vision")]
+            ):
+                doc = Document(filename=f"doc_{i}.pdf", original_filename=f"doc_{i}.pdf", file_path=f"/uploads/doc_{i}.pdf")
+                created_doc = await doc_store.create_document(doc)
+                invoice = await store.create_invoice(
+                    Invoice(
+                        doc_id=created_doc.id,
+                        invoice_no=f"INV-{i}",
+                        invoice_date=f"2024-0{i + 1}-15",
+                        seller_name=seller,
+                        parser_name=parser,
+                    )
+                )
+                ids.append(invoice.id)
+
+            assert await store.find_invoice_ids(seller_name="acme") == [ids[0], ids[2]]
+            assert await store.find_invoice_ids(parser_name="table_aware") == ids[:2]
+            assert await store.find_invoice_ids(
+                date_from=date(2024, 2, 1), date_to=date(2024, 3, 31)
+            ) == ids[1:]
+            assert await store.find_invoice_ids(seller_name="acme", limit=1) == [ids[0]]
+
+            from src.infrastructure.storage.sqlite.connection import close_pool
+
+            await close_pool()
+
+    @pytest.mark.asyncio
+    async def test_replace_invoice_keeps_old_version(self, initialized_db, mock_settings):
+        """replace_invoice() stores a new latest version and keeps the old one."""
+        import src.infrastructure.storage.sqlite.connection as conn_module
+
+        conn_module._pool = None
+        mock_settings.storage.db_path = initialized_db
+
+        with patch.object(conn_module, "get_settings", return_value=mock_settings):
+            from src.infrastructure.storage.sqlite.document_store import (
+                SQLiteDocumentStore,
+            )
+
+            doc_store = SQLiteDocumentStore()
+            store = SQLiteInvoiceStore()
+
+            doc = Document(filename="test.pdf", original_filename="test.pdf", file_path="/uploads/test.pdf")
+            created_doc = await doc_store.create_document(doc)
+            old = await store.create_invoice(
+                Invoice(doc_id=created_doc.id, invoice_no="INV-1", total_amount=100.0)
+            )
+
+            new = await store.replace_invoice(
+                old.id,
+                Invoice(
+                    doc_id=created_doc.id,
+                    invoice_no="INV-1",
+                    total_amount=120.0,
+                    parser_name="table_aware",
+                    items=[LineItem(item_name="Valve", quantity=2, unit_price=60, total_price=120)],
+                ),
+            )
+
+            assert new.id != old.id
+            latest = await store.get_invoice_by_doc_id(created_doc.id)
+            assert latest.id == new.id
+            assert latest.parser_name == "table_aware"
+            assert len(latest.items) == 1
+            assert (await store.get_invoice(old.id)).total_amount == 100.0
+            assert await store.find_invoice_ids(parser_name="table_aware") == [new.id]
+            assert await store.count_invoices() == 1
+
+            from src.infrastructure.storage.sqlite.connection import close_pool
+
+            await close_pool()
+
+    @pytest.mark.asyncio
+    async def test_replace_superseded_invoice_fails(self, initialized_db, mock_settings):
+        """replace_invoice() on an old version raises and stores nothing."""
+        import src.infrastructure.storage.sqlite.connection as conn_module
+
+        conn_module._pool = None
+        mock_settings.storage.db_path = initialized_db
+
+        with patch.object(conn_module, "get_settings", return_value=mock_settings):
+            from src.infrastructure.storage.sqlite.document_store import (
+                SQLiteDocumentStore,
+            )
+
+            doc_store = SQLiteDocumentStore()
+            store = SQLiteInvoiceStore()
+
+            doc = Document(filename="test.pdf", original_filename="test.pdf", file_path="/uploads/test.pdf")
+            created_doc = await doc_store.create_document(doc)
+            old = await store.create_invoice(Invoice(doc_id=created_doc.id, invoice_no="INV-1"))
+            first = await store.replace_invoice(
+                old.id, Invoice(doc_id=created_doc.id, invoice_no="INV-1", total_amount=120.0)
+            )
+
+            with pytest.raises(InvoiceNotLatestError):
+                await store.replace_invoice(
+                    old.id, Invoice(doc_id=created_doc.id, invoice_no="INV-1", total_amount=130.0)
+                )
+
+            assert (await store.get_invoice(old.id)).is_latest is False
+            assert (await store.get_invoice_by_doc_id(created_doc.id)).id == first.id
+            assert await store.count_invoices() == 1
+
+            from src.infrastructure.storage.sqlite.connection import close_pool
+
+            await close_pool()
+
+
 class TestSQLiteInvoiceStoreSearchInvoices:
     """Tests for SQLiteInvoiceStore.search_invoices()."""
 
@@ -0,0 +1,192 @@
+"""
+Query plan snapshots for the hottest SQLite queries.
+
+Each query is the shape a store method runs, planned against a database
+built by the real migrations. A changed index or query that makes SQLite
+fall back to a table scan or an extra sort changes the snapshot; update
+it together with the migration that explains why.
+"""
+
+import asyncio
+import re
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.storage.sqlite.migrations.migrator import initialize_database
+
+# name -> (query, expected plan details)
+PLANS: dict[str, tuple[str, list[str]]] = {
+    # FTSSearcher.search_items
+    "fts_search_items": (
+        """
+        SELECT ii.id, ii.item_name, ii.hs_code, ii.quantity, ii.unit_price,
+               ii.total_price, inv.invoice_no, inv.invoice_date, inv.seller_name,
+               bm25(invoice_items_fts) AS score
+        FROM invoice_items_fts fts
+        INNER JOIN invoice_items ii ON fts.rowid = ii.id
+        LEFT JOIN invoices inv ON ii.invoice_id = inv.id AND inv.is_latest = 1
+        WHERE invoice_items_fts MATCH ?
+        ORDER BY bm25(invoice_items_fts)
+        LIMIT ?
+        """,
+        [
+            "SEARCH ii USING INTEGER PRIMARY KEY (rowid=?)",
+            "SEARCH inv USING INTEGER PRIMARY KEY (rowid=?) LEFT-JOIN",
+            "USE TEMP B-TREE FOR ORDER BY",
+        ],
+    ),
+    # SQLiteDocumentStore.get_chunks_for_indexing
+    "get_chunks_for_indexing": (
+        """
+        SELECT c.* FROM doc_chunks c
+        INNER JOIN documents d ON c.doc_id = d.id
+        WHERE c.id > ? AND d.is_latest = 1
+        ORDER BY c.id
+        LIMIT ?
+        """,
+        [
+            "SEARCH c USING INTEGER PRIMARY KEY (rowid>?)",
+            "SEARCH d USING INTEGER PRIMARY KEY (rowid=?)",
+        ],
+    ),
+    # SQLiteInvoiceStore.get_items_for_indexing
+    "get_items_for_indexing": (
+        """
+        SELECT ii.id, ii.item_name, ii.hs_code, ii.unit, ii.brand, ii.model,
+               ii.quantity, ii.unit_price
+        FROM invoice_items ii
+        INNER JOIN invoices inv ON ii.invoice_id = inv.id
+        WHERE ii.id > ? AND ii.row_type = 'line_item' AND inv.is_latest = 1
+        ORDER BY ii.id
+        LIMIT ?
+        """,
+        [
+            "SEARCH ii USING INDEX idx_items_type (row_type=? AND rowid>?)",
+            "SEARCH inv USING INTEGER PRIMARY KEY (rowid=?)",
+        ],
+    ),
+    # SQLitePriceHistoryStore.get_price_history(item_name=...)
+    "get_price_history": (
+        """
+        SELECT item_name_normalized AS item_name, hs_code, seller_name,
+               invoice_date, quantity, unit_price, currency
+        FROM item_price_history
+        WHERE item_name_normalized LIKE ?
+        ORDER BY invoice_date DESC
+        LIMIT ? OFFSET ?
+        """,
+        ["SCAN item_price_history USING COVERING INDEX idx_price_history_recent"],
+    ),
+    # SQLitePriceHistoryStore.get_price_history(item_name=..., seller=..., date_from=...)
+    "get_price_history_filtered": (
+        """
+        SELECT item_name_normalized AS item_name, hs_code, seller_name,
+               invoice_date, quantity, unit_price, currency
+        FROM item_price_history
+        WHERE item_name_normalized LIKE ? AND seller_name LIKE ? AND invoice_date >= ?
+        ORDER BY invoice_date DESC
+        LIMIT ? OFFSET ?
+        """,
+        [
+            "SEARCH item_price_history USING COVERING INDEX idx_price_history_recent"
+            " (invoice_date>?)"
+        ],
+    ),
+    # SQLitePriceHistoryStore.get_price_stats
+    "get_price_stats": (
+        """
+        SELECT item_name_normalized AS item_name, hs_code, seller_name, currency,
+               occurrence_count, min_price, max_price, avg_price, price_trend
+        FROM v_item_price_stats
+        WHERE item_name_normalized LIKE ?
+        ORDER BY occurrence_count DESC
+        """,
+        [
+            "CO-ROUTINE v_item_price_stats",
+            "SCAN item_price_history USING COVERING INDEX idx_price_history_stats",
+            "SCAN v_item_price_stats",
+            "USE TEMP B-TREE FOR ORDER BY",
+        ],
+    ),
+    # SQLiteInvoiceStore.list_invoices
+    "list_invoices": (
+        """
+        SELECT * FROM invoices
+        WHERE is_latest = 1
+        ORDER BY created_at DESC
+        LIMIT ? OFFSET ?
+        """,
+        ["SCAN invoices USING INDEX idx_invoices_latest_created"],
+    ),
+    # SQLiteInvoiceStore.list_invoices(company_key=...)
+    "list_invoices_by_company": (
+        """
+        SELECT * FROM invoices
+        WHERE is_latest = 1 AND company_key = ?
+        ORDER BY created_at DESC
+        LIMIT ? OFFSET ?
+        """,
+        [
+            "SEARCH invoices USING INDEX idx_invoices_latest_company_created (company_key=?)",
+        ],
+    ),
+    # SQLiteDocumentStore.list_documents
+    "list_documents": (
+        """
+        SELECT * FROM documents
+        WHERE is_latest = 1
+        ORDER BY created_at DESC
+        LIMIT ? OFFSET ?
+        """,
+        ["SCAN documents USING INDEX idx_documents_latest_created"],
+    ),
+    # SQLiteDocumentStore.list_documents(status=...)
+    "list_documents_by_status": (
+        """
+        SELECT * FROM documents
+        WHERE is_latest = 1 AND status = ?
+        ORDER BY created_at DESC
+        LIMIT ? OFFSET ?
+        """,
+        ["SEARCH documents USING INDEX idx_documents_latest_status_created (status=?)"],
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory) -> sqlite3.Connection:
+    """Database with every migration applied."""
+    db_path: Path = tmp_path_factory.mktemp("plans") / "plans.db"
+    asyncio.run(initialize_database(db_path, create_backup_before=False))
+    conn = sqlite3.connect(db_path)
+    yield conn
+    conn.close()
+
+
+def query_plan(conn: sqlite3.Connection, query: str) -> list[str]:
+    """Plan details, without virtual table steps and older SQLite's 'TABLE' wording."""
+    params = (None,) * query.count("?")
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+    return [
+        re.sub(r"^(SCAN|SEARCH) TABLE ", r"\1 ", row[3])
+        for row in rows
+        if "VIRTUAL TABLE" not in row[3]
+    ]
+
+
+@pytest.mark.parametrize("name", list(PLANS))
+def test_query_plan_snapshot(db, name):
+    query, expected = PLANS[name]
+
+    assert query_plan(db, query) == expected
+
+
+@pytest.mark.parametrize("name", list(PLANS))
+def test_no_full_table_scan(db, name):
+    query, _ = PLANS[name]
+
+    scans = [step for step in query_plan(db, query) if re.fullmatch(r"SCAN \w+", step)]
+
+    assert scans in ([], ["SCAN v_item_price_stats"])
@@ -143,6 +143,35 @@ class TestSQLiteSessionStoreGetSession:
 
             await close_pool()
 
+    @pytest.mark.asyncio
+    async def test_get_session_header_skips_messages(
+        self, initialized_db, sample_session, sample_message, mock_settings
+    ):
+        """get_session_header() returns session fields without messages; count_messages() counts them."""
+        import src.infrastructure.storage.sqlite.connection as conn_module
+
+        conn_module._pool = None
+        mock_settings.storage.db_path = initialized_db
+
+        with patch.object(conn_module, "get_settings", return_value=mock_settings):
+            store = SQLiteSessionStore()
+            sample_session.summary_last_message_id = 7
+            created = await store.create_session(sample_session)
+            sample_message.session_id = created.session_id
+            await store.add_message(sample_message)
+
+            result = await store.get_session_header(created.session_id)
+            assert result.title == sample_session.title
+            assert result.summary_last_message_id == 7
+            assert result.messages == []
+            assert await store.get_session_header("missing") is None
+            assert await store.count_messages(created.session_id) == 1
+            assert await store.count_messages("missing") == 0
+
+            from src.infrastructure.storage.sqlite.connection import close_pool
+
+            await close_pool()
+
     @pytest.mark.asyncio
     async def test_get_session_loads_memory_facts(
         self, initialized_db, sample_session, sample_memory_fact, mock_settings
@@ -614,6 +643,39 @@ class TestSQLiteSessionStoreMemoryFactOperations:
 
             await close_pool()
 
+    @pytest.mark.asyncio
+    async def test_save_memory_facts_inserts_batch(
+        self, initialized_db, sample_session, mock_settings
+    ):
+        """save_memory_facts() inserts every fact and assigns ids."""
+        import src.infrastructure.storage.sqlite.connection as conn_module
+
+        conn_module._pool = None
+        mock_settings.storage.db_path = initialized_db
+
+        with patch.object(conn_module, "get_settings", return_value=mock_settings):
+            store = SQLiteSessionStore()
+            session = await store.create_session(sample_session)
+
+            facts = [
+                MemoryFact(
+                    session_id=session.session_id,
+                    fact_type=MemoryFactType.ENTITY,
+                    key=f"extracted_{i}",
+                    value=f"Fact number {i}",
+                )
+                for i in range(3)
+            ]
+            result = await store.save_memory_facts(facts)
+
+            assert len({f.id for f in result}) == 3
+            stored = await store.get_memory_facts(session_id=session.session_id)
+            assert sorted(f.value for f in stored) == [f"Fact number {i}" for i in range(3)]
+
+            from src.infrastructure.storage.sqlite.connection import close_pool
+
+            await close_pool()
+
     @pytest.mark.asyncio
     async def test_save_memory_fact_updates_existing(
         self, initialized_db, sample_session, sample_memory_fact, mock_settings
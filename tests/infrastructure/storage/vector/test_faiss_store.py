@@ -0,0 +1,414 @@
+"""Unit tests for streaming FAISS index rebuilds and generation swaps."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from src.core.entities.document import IndexingState
+from src.core.exceptions import IndexingError
+from src.infrastructure.storage.vector.faiss_store import (
+    StagedIndexBuild,
+    _acquire_build_lock,
+    _stream_rebuild,
+)
+
+
+def _vectors(n: int, dim: int = 8) -> np.ndarray:
+    rng = np.random.default_rng(n)
+    return rng.random((n, dim), dtype=np.float32)
+
+
+class TestStagedIndexBuild:
+    """Tests for checkpointing and resuming a staged build."""
+
+    def test_fresh_build_has_no_cursor(self, tmp_path: Path):
+        """A new build starts empty with cursor 0."""
+        build = StagedIndexBuild("chunks", tmp_path / "faiss_chunks.bin")
+
+        assert build.count == 0
+        assert build.last_id == 0
+        assert not build.resumed
+
+    def test_checkpoint_and_resume(self, tmp_path: Path):
+        """A resumed build reloads rows and the last entity ID."""
+        target = tmp_path / "faiss_chunks.bin"
+        build = StagedIndexBuild("chunks", target)
+        build.add(_vectors(3), [10, 11, 12])
+        build.checkpoint()
+        build.add(_vectors(2), [13, 14])  # never checkpointed
+
+        resumed = StagedIndexBuild("chunks", target, resume=True)
+
+        assert resumed.count == 3
+        assert resumed.last_id == 12
+        assert resumed.entity_ids().tolist() == [10, 11, 12]
+
+    def test_checkpoint_appends_only_new_rows(self, tmp_path: Path):
+        """Each checkpoint writes just the rows added since the previous one."""
+        target = tmp_path / "faiss_chunks.bin"
+        build = StagedIndexBuild("chunks", target)
+        build.add(_vectors(3), [1, 2, 3])
+        build.checkpoint()
+        first_size = build.vectors_path.stat().st_size
+        build.add(_vectors(2), [4, 5])
+        build.checkpoint()
+
+        assert build.vectors_path.stat().st_size - first_size == 2 * 8 * 4
+        resumed = StagedIndexBuild("chunks", target, resume=True)
+        assert resumed.count == 5
+        assert resumed.entity_ids().tolist() == [1, 2, 3, 4, 5]
+        np.testing.assert_allclose(
+            resumed.index.reconstruct_n(0, 5), build.index.reconstruct_n(0, 5)
+        )
+
+    def test_resume_drops_torn_vector_row(self, tmp_path: Path):
+        """A partially written vector row is truncated away on resume."""
+        target = tmp_path / "faiss_items.bin"
+        build = StagedIndexBuild("items", target)
+        build.add(_vectors(2), [1, 2])
+        build.checkpoint()
+        with open(build.ids_path, "ab") as f:
+            np.asarray([3], dtype=np.int64).tofile(f)
+        with open(build.vectors_path, "ab") as f:
+            np.zeros(3, dtype=np.float32).tofile(f)
+
+        resumed = StagedIndexBuild("items", target, resume=True)
+
+        assert resumed.count == 2
+        assert resumed.entity_ids().tolist() == [1, 2]
+        assert build.vectors_path.stat().st_size == 8 + 2 * 8 * 4
+
+    def test_resume_trims_ids_ahead_of_index(self, tmp_path: Path):
+        """IDs flushed without a matching index write are discarded."""
+        target = tmp_path / "faiss_items.bin"
+        build = StagedIndexBuild("items", target)
+        build.add(_vectors(2), [1, 2])
+        build.checkpoint()
+        with open(build.ids_path, "ab") as f:
+            np.asarray([3, 4], dtype=np.int64).tofile(f)
+
+        resumed = StagedIndexBuild("items", target, resume=True)
+
+        assert resumed.count == 2
+        assert resumed.entity_ids().tolist() == [1, 2]
+
+    def test_no_resume_discards_checkpoint(self, tmp_path: Path):
+        """resume=False starts over and removes stale files."""
+        target = tmp_path / "faiss_chunks.bin"
+        build = StagedIndexBuild("chunks", target)
+        build.add(_vectors(2), [1, 2])
+        build.checkpoint()
+
+        fresh = StagedIndexBuild("chunks", target, resume=False)
+
+        assert fresh.count == 0
+        assert not fresh.vectors_path.exists()
+        assert not fresh.ids_path.exists()
+
+
+class TestStreamRebuild:
+    """Tests for the paged rebuild loop."""
+
+    @pytest.fixture
+    def rows(self) -> list[dict]:
+        return [{"id": i, "text": f"row {i}"} for i in range(1, 8)]
+
+    def _store(self, tmp_path: Path) -> MagicMock:
+        store = MagicMock()
+        store.begin_staged_build.side_effect = lambda name, resume: StagedIndexBuild(
+            name, tmp_path / f"faiss_{name}.bin", resume=resume
+        )
+        store.commit_staged_build = AsyncMock(return_value=True)
+        return store
+
+    @pytest.mark.asyncio
+    async def test_pages_by_cursor_in_batches(self, tmp_path: Path, rows: list[dict]):
+        """Should fetch by ID cursor and embed one batch at a time."""
+        store = self._store(tmp_path)
+        cursors: list[int] = []
+        batches: list[int] = []
+
+        async def fetch(last_id: int, limit: int) -> list[dict]:
+            cursors.append(last_id)
+            return [r for r in rows if r["id"] > last_id][:limit]
+
+        async def embed(texts: list[str]) -> np.ndarray:
+            batches.append(len(texts))
+            return _vectors(len(texts))
+
+        progress = MagicMock()
+        count, last_id = await _stream_rebuild(
+            store,
+            "items",
+            fetch_page=fetch,
+            row_id=lambda r: r["id"],
+            row_text=lambda r: r["text"],
+            embed=embed,
+            batch_size=3,
+            checkpoint_rows=100,
+            resume=True,
+            progress=progress,
+        )
+
+        assert (count, last_id) == (7, 7)
+        assert cursors == [0, 3, 6, 7]
+        assert batches == [3, 3, 1]
+        assert progress.call_count == 3
+        build = store.commit_staged_build.await_args.args[0]
+        assert build.count == 7
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_interruption(self, tmp_path: Path, rows: list[dict]):
+        """A second run continues from the last checkpoint."""
+        embedded: list[str] = []
+
+        async def fetch(last_id: int, limit: int) -> list[dict]:
+            return [r for r in rows if r["id"] > last_id][:limit]
+
+        async def failing_embed(texts: list[str]) -> np.ndarray:
+            if "row 5" in texts:
+                raise RuntimeError("interrupted")
+            return _vectors(len(texts))
+
+        async def embed(texts: list[str]) -> np.ndarray:
+            embedded.extend(texts)
+            return _vectors(len(texts))
+
+        kwargs = dict(
+            fetch_page=fetch,
+            row_id=lambda r: r["id"],
+            row_text=lambda r: r["text"],
+            batch_size=2,
+            checkpoint_rows=2,
+            resume=True,
+            progress=None,
+        )
+
+        with pytest.raises(RuntimeError):
+            await _stream_rebuild(self._store(tmp_path), "chunks", embed=failing_embed, **kwargs)
+
+        store = self._store(tmp_path)
+        count, _ = await _stream_rebuild(store, "chunks", embed=embed, **kwargs)
+
+        assert count == 7
+        assert embedded == ["row 5", "row 6", "row 7"]
+        build = store.commit_staged_build.await_args.args[0]
+        build.checkpoint()
+        assert build.entity_ids().tolist() == list(range(1, 8))
+
+
+class TestBuildLock:
+    """Tests for taking the is_building lock before a rebuild."""
+
+    def _state_store(self, state: IndexingState | None) -> MagicMock:
+        state_store = MagicMock()
+        state_store.get_state = AsyncMock(return_value=state)
+        state_store.update_state = AsyncMock(side_effect=lambda s: s)
+        return state_store
+
+    @pytest.mark.asyncio
+    async def test_takes_free_lock(self):
+        """An index nobody is building is locked."""
+        state_store = self._state_store(None)
+
+        state = await _acquire_build_lock(state_store, "chunks", stale_after=600)
+
+        assert state.is_building
+        state_store.update_state.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refuses_live_lock(self):
+        """A lock refreshed recently belongs to a running build."""
+        held = IndexingState(index_name="chunks", is_building=True, updated_at=datetime.utcnow())
+        state_store = self._state_store(held)
+
+        with pytest.raises(IndexingError):
+            await _acquire_build_lock(state_store, "chunks", stale_after=600)
+
+        state_store.update_state.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_takes_over_stale_lock(self):
+        """A lock left idle past the threshold is taken over."""
+        held = IndexingState(
+            index_name="items",
+            is_building=True,
+            updated_at=datetime.utcnow() - timedelta(hours=1),
+        )
+        state_store = self._state_store(held)
+
+        state = await _acquire_build_lock(state_store, "items", stale_after=600)
+
+        assert state.is_building
+        state_store.update_state.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_rebuild_heartbeats_every_batch(self, tmp_path: Path):
+        """The rebuild loop refreshes the lock after each batch."""
+        store = MagicMock()
+        store.begin_staged_build.side_effect = lambda name, resume: StagedIndexBuild(
+            name, tmp_path / f"faiss_{name}.bin", resume=resume
+        )
+        store.commit_staged_build = AsyncMock(return_value=1)
+        rows = [{"id": i} for i in range(1, 6)]
+        heartbeat = AsyncMock()
+
+        async def fetch(last_id: int, limit: int) -> list[dict]:
+            return [r for r in rows if r["id"] > last_id][:limit]
+
+        async def embed(texts: list[str]) -> np.ndarray:
+            return _vectors(len(texts))
+
+        await _stream_rebuild(
+            store,
+            "chunks",
+            fetch_page=fetch,
+            row_id=lambda r: r["id"],
+            row_text=lambda r: str(r["id"]),
+            embed=embed,
+            batch_size=2,
+            checkpoint_rows=100,
+            resume=False,
+            progress=None,
+            heartbeat=heartbeat,
+        )
+
+        assert heartbeat.await_count == 3
+
+
+class TestGenerationSwap:
+    """Tests for hot-swapping rebuilt index generations."""
+
+    @pytest.fixture
+    async def store(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        import aiosqlite
+
+        from src.infrastructure.storage.vector import faiss_store
+
+        conn = await aiosqlite.connect(tmp_path / "map.db")
+        for table, col in (("doc_chunks_faiss_map", "chunk_id"), ("line_items_faiss_map", "item_id")):
+            await conn.execute(
+                f"CREATE TABLE {table} (generation INTEGER NOT NULL DEFAULT 0, "
+                f"faiss_id INTEGER NOT NULL, {col} INTEGER NOT NULL, "
+                f"PRIMARY KEY (generation, faiss_id))"
+            )
+
+        @asynccontextmanager
+        async def use_conn():
+            yield conn
+            await conn.commit()
+
+        monkeypatch.setattr(faiss_store, "get_connection", use_conn)
+        monkeypatch.setattr(faiss_store, "get_transaction", use_conn)
+
+        vector_store = faiss_store.FAISSVectorStore()
+        vector_store._index_paths = {
+            "chunks": tmp_path / "faiss_chunks.bin",
+            "items": tmp_path / "faiss_items.bin",
+        }
+        yield vector_store
+        await conn.close()
+
+    async def _rebuild(self, store, ids: list[int]) -> int:
+        build = await store.begin_rebuild("chunks")
+        await store.stage_vectors(build, _vectors(len(ids)), ids)
+        return await store.commit_rebuild(build)
+
+    @pytest.mark.asyncio
+    async def test_commit_publishes_new_generation(self, store, tmp_path: Path):
+        """Each rebuild gets a new versioned file and generation number."""
+        assert await self._rebuild(store, [1, 2, 3]) == 1
+        assert await self._rebuild(store, [4, 5]) == 2
+
+        stats = await store.get_index_stats("chunks")
+        assert stats["generation"] == 2
+        assert stats["size"] == 2
+        assert (tmp_path / "faiss_chunks.g000002.bin").exists()
+
+    @pytest.mark.asyncio
+    async def test_search_serves_old_generation_during_rebuild(self, store):
+        """Staged vectors are invisible to search until commit."""
+        vectors = _vectors(3)
+        await store.add_vectors("chunks", vectors, [10, 11, 12])
+
+        build = await store.begin_rebuild("chunks")
+        await store.stage_vectors(build, _vectors(2), [20, 21])
+
+        results = await store.search("chunks", vectors[0], top_k=3)
+        assert {entity_id for entity_id, _ in results} == {10, 11, 12}
+
+        await store.commit_rebuild(build)
+        results = await store.search("chunks", vectors[0], top_k=3)
+        assert {entity_id for entity_id, _ in results} == {20, 21}
+
+    @pytest.mark.asyncio
+    async def test_add_without_persist_leaves_write_to_save(self, store, tmp_path: Path):
+        """persist=False appends in memory; save_index() writes the file."""
+        from src.infrastructure.storage.vector.faiss_store import faiss
+
+        await store.add_vectors("chunks", _vectors(2), [1, 2], persist=False)
+        assert not (tmp_path / "faiss_chunks.bin").exists()
+
+        await store.save_index("chunks")
+
+        assert faiss.read_index(str(tmp_path / "faiss_chunks.bin")).ntotal == 2
+
+    @pytest.mark.asyncio
+    async def test_previous_generation_kept_for_one_swap(self, store, tmp_path: Path):
+        """In-flight lookups on the previous generation still resolve."""
+        await self._rebuild(store, [1])
+        await self._rebuild(store, [2])
+
+        assert await store.get_entity_ids("chunks", [0], generation=1) == {0: 1}
+
+        await self._rebuild(store, [3])
+
+        assert await store.get_entity_ids("chunks", [0], generation=1) == {}
+        assert not (tmp_path / "faiss_chunks.g000001.bin").exists()
+
+    @pytest.mark.asyncio
+    async def test_picks_up_generation_written_by_another_process(self, store, tmp_path: Path):
+        """A newer generation on disk replaces the in-memory one on refresh."""
+        from src.infrastructure.storage.vector import faiss_store
+
+        await self._rebuild(store, [1, 2])
+
+        other = faiss_store.FAISSVectorStore()
+        other._index_paths = store._index_paths
+        await self._rebuild(other, [7])
+
+        store._last_refresh.clear()
+        assert await store.get_generation("chunks") == 2
+
+    @pytest.mark.asyncio
+    async def test_new_generation_loads_off_the_event_loop(self, store, monkeypatch):
+        """The swap happens only after the file was read in a worker thread."""
+        import threading
+
+        from src.infrastructure.storage.vector import faiss_store
+
+        await self._rebuild(store, [1, 2])
+        other = faiss_store.FAISSVectorStore()
+        other._index_paths = store._index_paths
+        await self._rebuild(other, [7])
+
+        loop_thread = threading.get_ident()
+        read_threads: list[int] = []
+        generations_while_reading: list[int] = []
+        read_index = faiss_store.faiss.read_index
+
+        def tracking_read(path: str):
+            read_threads.append(threading.get_ident())
+            generations_while_reading.append(store._generations["chunks"].generation)
+            return read_index(path)
+
+        monkeypatch.setattr(faiss_store.faiss, "read_index", tracking_read)
+        store._last_refresh.clear()
+
+        assert await store.get_generation("chunks") == 2
+        assert read_threads and loop_thread not in read_threads
+        assert generations_while_reading == [1]
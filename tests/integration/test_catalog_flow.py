@@ -70,6 +70,7 @@ async def full_db(tmp_path: Path):
                 confidence REAL DEFAULT 0,
                 template_confidence REAL DEFAULT 0,
                 parser_version TEXT,
+                parser_name TEXT,
                 template_id TEXT,
                 parsing_status TEXT DEFAULT 'pending',
                 error_message TEXT,
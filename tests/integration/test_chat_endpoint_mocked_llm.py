@@ -12,6 +12,7 @@ from fastapi.testclient import TestClient
 
 from src.api.main import app
 from src.core.entities.session import ChatSession, MessageRole
+from src.core.services import SessionInfo
 
 
 @pytest.fixture
@@ -47,6 +48,11 @@ def mock_chat_service(mock_session, mock_message):
     """Create a mock chat service."""
     service = MagicMock()
     service.get_session = AsyncMock(return_value=mock_session)
+    service.get_session_info = AsyncMock(
+        return_value=SessionInfo(
+            session_id=mock_session.session_id, title=mock_session.title, message_count=2
+        )
+    )
     service.create_session = AsyncMock(return_value=mock_session)
     service.list_sessions = AsyncMock(return_value=[mock_session])
     service.delete_session = AsyncMock(return_value=True)
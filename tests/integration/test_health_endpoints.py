@@ -86,6 +86,15 @@ class TestHealthEndpoints:
             assert "name" in data["vector_store"]
             assert "available" in data["vector_store"]
 
+    def test_search_health_reports_index_generations(self, client):
+        """Test /api/health/search exposes the live index generation per index."""
+        response = client.get("/api/health/search")
+
+        assert response.status_code == 200
+        vector_store = response.json()["vector_store"]
+        if vector_store and vector_store["available"]:
+            assert set(vector_store["details"]["generations"]) == {"chunks", "items"}
+
     def test_full_health_check(self, client):
         """Test full health check returns all components."""
         response = client.get("/api/health/full")
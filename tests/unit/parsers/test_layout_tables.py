@@ -0,0 +1,146 @@
+"""
+Unit tests for layout-aware table extraction.
+
+Tests:
+- Row grouping, cell merging and column clustering from word boxes
+- TableAwareParser falling back to word boxes when plain text misaligns
+"""
+
+import pytest
+
+from src.infrastructure.parsers.layout import (
+    PYMUPDF_AVAILABLE,
+    LayoutRow,
+    Word,
+    aligned_cells,
+    cluster_columns,
+    group_rows,
+    split_cells,
+    table_columns,
+)
+from src.infrastructure.parsers.table_aware_parser import TableAwareParser
+
+
+def _word(x0, y0, text, width=None, height=10.0):
+    return Word(x0, y0, x0 + (width or 5.0 * len(text)), y0 + height, text)
+
+
+class TestLayoutGeometry:
+    """Tests for word box grouping."""
+
+    def test_group_rows_by_vertical_centre(self):
+        words = [_word(100, 20.5, "b"), _word(10, 20, "a"), _word(10, 40, "c")]
+
+        rows = group_rows(words)
+
+        assert [[w.text for w in row] for row in rows] == [["a", "b"], ["c"]]
+
+    def test_split_cells_on_wide_gaps(self):
+        row = [_word(10, 0, "Steel"), _word(38, 0, "pipe"), _word(200, 0, "4")]
+
+        cells = split_cells(row, gap=8.0)
+
+        assert [text for _, _, text in cells] == ["Steel pipe", "4"]
+
+    def test_cluster_overlapping_spans(self):
+        assert cluster_columns([(10, 50), (40, 90), (120, 140), (125, 150)]) == [
+            (10, 90),
+            (120, 150),
+        ]
+
+    def test_aligned_cells_snap_to_columns(self):
+        rows = [
+            LayoutRow(1, [(10, 60, "Description"), (200, 220, "Qty")]),
+            LayoutRow(1, [(10, 120, "Steel pipe"), (205, 215, "4")]),
+        ]
+        columns = table_columns(rows)
+
+        cells = aligned_cells(rows[1], columns)
+
+        assert [(c["text"], c["column"]) for c in cells] == [("Steel pipe", 0), ("4", 1)]
+        assert cells[1]["start_pos"] == 200
+
+
+@pytest.mark.skipif(not PYMUPDF_AVAILABLE, reason="PyMuPDF not installed")
+class TestLayoutParsing:
+    """Tests for TableAwareParser's word-box pass."""
+
+    ROWS = [
+        ("Description", "Qty", "Unit Price", "Amount"),
+        ("Steel pipe 2in", "4", "10.00", "40.00"),
+        ("galvanized, 6m lengths", "", "", ""),
+        ("Gate valve", "2", "12.50", "25.00"),
+    ]
+
+    @staticmethod
+    def _write_pdf(path, rows, footer=()):
+        import pymupdf
+
+        doc = pymupdf.open()
+        page = doc.new_page()
+        columns = (50, 300, 380, 470)
+        for i, row in enumerate(rows):
+            y = 120 + i * 18
+            for x, text in zip(columns, row):
+                if text:
+                    page.insert_text((x, y), text, fontname="helv", fontsize=10)
+        for i, (x, text) in enumerate(footer):
+            page.insert_text((x, 120 + (len(rows) + i) * 18), text, fontname="helv", fontsize=10)
+        doc.save(path)
+        text = page.get_text()
+        doc.close()
+        return str(path), text
+
+    @pytest.fixture
+    def pdf_path(self, tmp_path):
+        return self._write_pdf(tmp_path / "invoice.pdf", self.ROWS, [(380, "Total  65.00")])
+
+    async def test_text_pass_fails_layout_pass_recovers(self, pdf_path):
+        path, text = pdf_path
+        parser = TableAwareParser()
+
+        assert not (await parser.parse(text, "invoice.pdf")).success
+
+        result = await parser.parse(text, "invoice.pdf", hints={"pdf_path": path})
+
+        assert result.success
+        assert result.metadata["layout"] == "words"
+        assert [(i.item_name, i.quantity, i.unit_price, i.total_price) for i in result.items] == [
+            ("Steel pipe 2in galvanized, 6m lengths", 4.0, 10.0, 40.0),
+            ("Gate valve", 2.0, 12.5, 25.0),
+        ]
+
+    async def test_totals_row_and_footer_are_not_items(self, tmp_path):
+        rows = [
+            *self.ROWS,
+            ("TOTAL", "", "", "65.00"),
+            ("Warranty 12 months", "", "", ""),
+            ("Delivery 7 days", "1", "", "15.00"),
+        ]
+        path, text = self._write_pdf(tmp_path / "invoice.pdf", rows)
+        parser = TableAwareParser()
+
+        result = await parser.parse(text, "invoice.pdf", hints={"pdf_path": path})
+
+        assert result.success
+        assert [(i.item_name, i.total_price) for i in result.items] == [
+            ("Steel pipe 2in galvanized, 6m lengths", 40.0),
+            ("Gate valve", 25.0),
+        ]
+
+    def test_can_parse_with_pdf_hint(self, pdf_path):
+        path, text = pdf_path
+        parser = TableAwareParser()
+
+        assert parser.can_parse(text, {"pdf_path": path}) >= 0.5
+
+    async def test_missing_pdf_keeps_text_result(self, tmp_path, pdf_path):
+        _, text = pdf_path
+        parser = TableAwareParser()
+
+        result = await parser.parse(
+            text, "invoice.pdf", hints={"pdf_path": str(tmp_path / "gone.pdf")}
+        )
+
+        assert not result.success
+        assert "layout" not in result.metadata
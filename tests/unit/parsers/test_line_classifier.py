@@ -0,0 +1,119 @@
+"""
+Unit tests for the single-pass line classifier.
+
+Tests:
+- Typed tokens and their spans
+- Bank and summary classification, matching is_bank_line/is_summary_or_meta_line
+- Parsed values (numbers, HS code, date, currency)
+- Per-line caching
+"""
+
+import pytest
+
+from src.infrastructure.parsers.base import (
+    TokenKind,
+    classify_line,
+    is_bank_line,
+    is_summary_or_meta_line,
+)
+
+ITEM_LINE = "1  Gate valve DN50 PN16   8481.80.90   24 pcs   145.00   3,480.00 USD"
+
+
+class TestTokens:
+    """Tests for tokenization."""
+
+    def test_item_line_tokens(self):
+        info = classify_line(ITEM_LINE)
+
+        assert [(t.kind, t.text) for t in info.tokens] == [
+            (TokenKind.NUMBER, "1"),
+            (TokenKind.HS_CODE, "8481.80.90"),
+            (TokenKind.NUMBER, "24"),
+            (TokenKind.NUMBER, "145.00"),
+            (TokenKind.NUMBER, "3,480.00"),
+            (TokenKind.CURRENCY, "USD"),
+        ]
+        for token in info.tokens:
+            assert ITEM_LINE[token.start : token.end] == token.text
+
+    def test_currency_sign_before_amount(self):
+        info = classify_line("Total: $1,200.00")
+
+        assert [t.kind for t in info.tokens] == [TokenKind.CURRENCY, TokenKind.NUMBER]
+        assert info.currency == "USD"
+        assert info.numbers == [1200.0]
+
+    @pytest.mark.parametrize(
+        "line",
+        ["Date: 15/01/2024", "Date: 2024-01-15", "Date: 15 January 2024", "Date: Jan 15, 2024."],
+    )
+    def test_dates(self, line):
+        info = classify_line(line)
+
+        assert info.of_kind(TokenKind.DATE)
+        assert info.date == "2024-01-15"
+        assert info.numbers == []
+
+    def test_iban_and_swift(self):
+        info = classify_line("IBAN AE070331234567890123456 SWIFT NBADAEAA")
+
+        assert [t.kind for t in info.tokens] == [TokenKind.IBAN, TokenKind.SWIFT]
+
+
+class TestClassification:
+    """Tests for bank and summary flags."""
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "Bank: Emirates NBD",
+            "Beneficiary: ACME Trading",
+            "AE070331234567890123456",
+            "Code NBADAEAA",
+            ITEM_LINE,
+            "Total: 1,200.00",
+            "ab",
+        ],
+    )
+    def test_matches_line_helpers(self, line):
+        info = classify_line(line)
+
+        assert info.is_bank == is_bank_line(line)
+        assert info.is_summary == is_summary_or_meta_line(line)
+
+    def test_item_line_is_neither(self):
+        info = classify_line(ITEM_LINE)
+
+        assert not info.is_bank
+        assert not info.is_summary
+
+
+class TestValues:
+    """Tests for values parsed from tokens."""
+
+    def test_dotted_hs_code(self):
+        assert classify_line(ITEM_LINE).hs_code == "84818090"
+
+    def test_plain_hs_code(self):
+        assert classify_line("54075200  Polyester fabric  3200").hs_code == "54075200"
+
+    def test_short_numbers_are_not_hs_codes(self):
+        assert classify_line("Steel pipe 4 40.00").hs_code is None
+
+    def test_no_currency(self):
+        assert classify_line("Steel pipe 4 40.00").currency is None
+
+
+class TestCache:
+    """Tests for per-line caching."""
+
+    def test_same_line_classified_once(self):
+        line = "Cached line 12 34.50"
+        before = classify_line.cache_info().hits
+
+        first = classify_line(line)
+        second = classify_line(line)
+
+        assert first is second
+        assert classify_line.cache_info().hits == before + 1
@@ -0,0 +1,84 @@
+"""
+Unit tests for the parser benchmark harness.
+
+Tests:
+- Field scoring against golden JSON
+- Headless runs over the corpus with the stubbed vision model
+"""
+
+from benchmarks.parser_throughput import (
+    CORPUS_DIR,
+    load_corpus,
+    run,
+    score,
+    synthetic_corpus,
+)
+from src.config import get_settings
+from src.core.entities import Invoice, LineItem
+from src.core.interfaces import ParserResult
+
+GOLDEN = {
+    "invoice_no": "INV-1",
+    "invoice_date": "2024-03-01",
+    "currency": None,
+    "total_amount": 50.0,
+    "items": [
+        {"hs_code": "73063000", "quantity": 4, "unit_price": 10.0, "total_price": 40.0},
+        {"hs_code": "84818090", "quantity": 1, "unit_price": 10.0, "total_price": 10.0},
+    ],
+}
+
+
+class TestScore:
+    """Tests for field-level scoring."""
+
+    def test_items_matched_by_total_regardless_of_order(self):
+        result = ParserResult(
+            success=True,
+            invoice=Invoice(invoice_no="inv-1", invoice_date="2024-03-01", total_amount=50),
+            items=[
+                LineItem(
+                    item_name="Valve", hs_code="84818090", quantity=1, unit_price=10, total_price=10
+                ),
+                LineItem(
+                    item_name="Pipe", hs_code="73069000", quantity=4, unit_price=10, total_price=40
+                ),
+            ],
+        )
+
+        scores = score(GOLDEN, result)
+
+        assert scores["invoice_no"] == (1, 1)
+        assert scores["invoice_date"] == (1, 1)
+        assert "currency" not in scores
+        assert scores["items"] == (2, 2)
+        assert scores["item.hs_code"] == (1, 2)
+
+    def test_failed_result_scores_nothing(self):
+        scores = score(GOLDEN, ParserResult(success=False, error="no table"))
+
+        assert scores["total_amount"] == (0, 1)
+        assert scores["items"] == (0, 2)
+
+
+class TestRun:
+    """Tests for headless benchmark runs."""
+
+    async def test_corpus_has_golden_files(self):
+        documents = load_corpus(CORPUS_DIR)
+
+        assert documents
+        assert all(d.golden is not None for d in documents)
+
+    async def test_report(self, monkeypatch):
+        monkeypatch.setattr(get_settings().cache, "vision_cache_enabled", False)
+        documents = load_corpus(CORPUS_DIR) + list(synthetic_corpus(5))
+
+        report = (await run(documents)).to_dict()
+
+        assert report["documents"] == len(documents)
+        assert "table_aware" in report["parsers"]
+        assert report["parsers"]["table_aware"]["p95_ms"] > 0
+        assert 0 <= report["early_stop_rate"] <= 1
+        assert 0 <= report["vision_fallback_rate"] <= 1
+        assert report["accuracy"]["items"] > 0.5
@@ -0,0 +1,208 @@
+"""
+Unit tests for running parsers in worker processes.
+
+Tests:
+- CPU-bound parsers dispatched to the pool, others kept on the loop
+- Per-parser time budgets, in the pool and on the loop
+- Queued tasks kept off the clock; overruns replace only their worker
+- Worker factories of the built-in parsers
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+import yaml
+
+from src.core.entities import Invoice
+from src.core.interfaces import IInvoiceParser, ParserResult
+from src.infrastructure.parsers.parser_pool import ParserPool
+from src.infrastructure.parsers.registry import ParserRegistry
+from src.infrastructure.parsers.table_aware_parser import TableAwareParser
+from src.infrastructure.parsers.template_parser import TemplateDetector, TemplateParser
+
+
+class WorkerParser(IInvoiceParser):
+    """CPU-bound parser reporting the process it ran in; sleeps on 'slow' and 'nap'."""
+
+    @property
+    def name(self) -> str:
+        return "worker"
+
+    @property
+    def priority(self) -> int:
+        return 80
+
+    def worker_factory(self):
+        return WorkerParser
+
+    def can_parse(self, text, hints=None) -> float:
+        return 0.9
+
+    async def parse(self, text, filename, hints=None) -> ParserResult:
+        if text == "slow":
+            time.sleep(30)
+        elif text.startswith("nap"):
+            time.sleep(0.6)
+        return ParserResult(
+            success=True,
+            invoice=Invoice(invoice_no=text),
+            confidence=0.9,
+            parser_name=self.name,
+            metadata={"pid": os.getpid()},
+        )
+
+
+class LoopParser(IInvoiceParser):
+    """I/O-bound parser without a worker factory."""
+
+    def __init__(self, delay: float = 0.0):
+        self._delay = delay
+
+    @property
+    def name(self) -> str:
+        return "vision"
+
+    @property
+    def priority(self) -> int:
+        return 60
+
+    def can_parse(self, text, hints=None) -> float:
+        return 0.9
+
+    async def parse(self, text, filename, hints=None) -> ParserResult:
+        await asyncio.sleep(self._delay)
+        return ParserResult(
+            success=True, confidence=0.9, parser_name=self.name, metadata={"pid": os.getpid()}
+        )
+
+
+@pytest.fixture
+def pool():
+    pool = ParserPool(workers=1)
+    yield pool
+    pool.shutdown()
+
+
+class TestPoolDispatch:
+    """Tests for choosing between the pool and the event loop."""
+
+    async def test_cpu_bound_parser_runs_in_worker(self, pool):
+        registry = ParserRegistry(pool=pool, budgets={})
+        registry.register(WorkerParser())
+
+        result = await registry.parse("INV-7", "a.pdf")
+
+        assert result.success
+        assert result.invoice.invoice_no == "INV-7"
+        assert result.metadata["pid"] != os.getpid()
+
+    async def test_parser_without_factory_stays_on_loop(self, pool):
+        registry = ParserRegistry(pool=pool, budgets={})
+        registry.register(LoopParser())
+
+        result = await registry.parse("text", "a.pdf")
+
+        assert result.metadata["pid"] == os.getpid()
+
+    async def test_no_pool_parses_on_loop(self):
+        registry = ParserRegistry(budgets={})
+        registry.register(WorkerParser())
+
+        result = await registry.parse("INV-7", "a.pdf")
+
+        assert result.metadata["pid"] == os.getpid()
+
+
+class TestBudgets:
+    """Tests for per-parser time budgets."""
+
+    async def test_overrun_in_pool_kills_worker_and_falls_back(self, pool):
+        registry = ParserRegistry(pool=pool, budgets={"worker": 0.5})
+        registry.register(WorkerParser())
+        registry.register(LoopParser())
+
+        start = time.monotonic()
+        result = await registry.parse("slow", "a.pdf")
+
+        assert time.monotonic() - start < 10
+        assert result.parser_name == "vision"
+        assert result.metadata["timings"][0]["success"] is False
+        stats = registry.get_stats()
+        assert stats["budget_exceeded"] == {"worker": 1}
+        assert stats["pool"]["restarts"] == 1
+
+        # The next document gets a fresh worker
+        again = await registry.parse("INV-8", "b.pdf")
+        assert again.parser_name == "worker"
+
+    async def test_overrun_retries_queued_tasks(self, pool):
+        slow = pool.run(WorkerParser, "slow", "a.pdf", {}, budget=0.5)
+        queued = [pool.run(WorkerParser, f"INV-{i}", "b.pdf", {}) for i in range(5)]
+
+        results = await asyncio.gather(slow, *queued, return_exceptions=True)
+
+        assert isinstance(results[0], TimeoutError)
+        assert [r.invoice.invoice_no for r in results[1:]] == [f"INV-{i}" for i in range(5)]
+        assert pool.get_stats()["restarts"] >= 1
+
+    async def test_queued_tasks_are_not_on_the_clock(self, pool):
+        """More tasks than workers: waiting for the worker doesn't eat the budget."""
+        results = await asyncio.gather(
+            *(pool.run(WorkerParser, f"nap-{i}", "a.pdf", {}, budget=1.0) for i in range(3))
+        )
+
+        assert [r.invoice.invoice_no for r in results] == ["nap-0", "nap-1", "nap-2"]
+        assert pool.get_stats()["restarts"] == 0
+
+    async def test_overrun_replaces_only_its_worker(self):
+        """A running neighbour survives another task's overrun."""
+        pool = ParserPool(workers=2)
+        try:
+            warm = await asyncio.gather(
+                *(pool.run(WorkerParser, f"nap-{i}", "a.pdf", {}) for i in range(2))
+            )
+            pids = {r.metadata["pid"] for r in warm}
+            slow = pool.run(WorkerParser, "slow", "a.pdf", {}, budget=0.3)
+            napping = pool.run(WorkerParser, "nap", "b.pdf", {}, budget=5)
+
+            results = await asyncio.gather(slow, napping, return_exceptions=True)
+
+            assert isinstance(results[0], TimeoutError)
+            assert results[1].invoice.invoice_no == "nap"
+            assert results[1].metadata["pid"] in pids
+            assert pool.get_stats()["restarts"] == 1
+        finally:
+            pool.shutdown()
+
+    async def test_overrun_on_loop(self):
+        registry = ParserRegistry(budgets={"vision": 0.05})
+        registry.register(LoopParser(delay=5))
+
+        result = await registry.parse("text", "a.pdf")
+
+        assert not result.success
+        assert "time budget" in result.error
+        assert registry.get_stats()["budget_exceeded"] == {"vision": 1}
+
+
+class TestWorkerFactories:
+    """Tests for the built-in parsers' worker factories."""
+
+    def test_template_parser_factory_loads_same_dirs(self, tmp_path):
+        (tmp_path / "acme.yaml").write_text(
+            yaml.safe_dump({"company_name": "ACME", "detection_patterns": [r"ACME\s+Trading"]}),
+            encoding="utf-8",
+        )
+        detector = TemplateDetector(reload_interval=0)
+        detector.load_templates(str(tmp_path))
+
+        factory = TemplateParser(detector).worker_factory()
+        worker = factory()
+
+        assert worker is factory()
+        assert worker.can_parse("ACME Trading LLC") == 1.0
+
+    def test_table_parser_factory(self):
+        assert isinstance(TableAwareParser().worker_factory()(), TableAwareParser)
@@ -284,6 +284,39 @@ class TestTimingInformation:
         assert timings[1]["success"] is True
 
 
+class TestOutcomeStats:
+    """Tests for per-parser outcome counts."""
+
+    @pytest.mark.asyncio
+    async def test_vision_fallback_rate(self):
+        """Winning parsers are counted, layout tables as avoided vision calls."""
+
+        class LayoutTableParser(MockParser):
+            async def parse(self, text, filename, hints=None):
+                result = await super().parse(text, filename, hints)
+                if result.success and text == "layout":
+                    result.metadata = {"layout": "words"}
+                return result
+
+        registry = ParserRegistry()
+        registry.register(LayoutTableParser("table_aware", 80, parse_confidence=0.8))
+        registry.register(MockParser("vision", 60, parse_confidence=0.9))
+
+        await registry.parse("layout", "a.pdf")
+        await registry.parse("plain", "b.pdf")
+        registry.get_parser("table_aware")._parse_success = False
+        await registry.parse("scan", "c.pdf")
+        registry.get_parser("vision")._parse_success = False
+        await registry.parse("scan", "d.pdf")
+
+        stats = registry.get_stats()
+        assert stats["documents"] == 4
+        assert stats["by_parser"] == {"table_aware": 2, "vision": 1, "failed": 1}
+        assert stats["layout_tables"] == 1
+        assert stats["vision_fallback_rate"] == 0.25
+        assert stats["vision_fallback_rate_without_layout"] == 0.5
+
+
 class TestErrorHandling:
     """Tests for error handling in registry."""
 
@@ -0,0 +1,294 @@
+"""
+Unit tests for the parser result cache.
+
+Tests:
+- CachedParserRegistry hit/miss, key composition and bypass
+- Only accepted, complete results are cached
+- Invalidation of entries when a template is edited
+- SQLiteParserResultStore LRU size cap
+"""
+
+import threading
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import aiosqlite
+import pytest
+import yaml
+
+from src.core.entities import Invoice, LineItem
+from src.core.interfaces import IInvoiceParser, ParserResult
+from src.infrastructure.parsers import result_cache
+from src.infrastructure.parsers.registry import ParserRegistry
+from src.infrastructure.parsers.result_cache import CachedParserRegistry, hints_digest
+from src.infrastructure.parsers.template_parser import TemplateDetector
+from src.infrastructure.parsers.vision_cache import hash_image
+from src.infrastructure.storage.sqlite import parser_result_store
+from src.infrastructure.storage.sqlite.parser_result_store import SQLiteParserResultStore
+
+MIGRATION = (
+    Path(__file__).parents[3]
+    / "src/infrastructure/storage/sqlite/migrations/v013_parser_result_cache.sql"
+)
+
+ACME_TEXT = "ACME Trading LLC\nTRN: 100234\nInvoice No: A-17\n"
+
+
+@pytest.fixture
+async def store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Result store on a temporary database migrated with v013."""
+    conn = await aiosqlite.connect(tmp_path / "cache.db")
+    conn.row_factory = aiosqlite.Row
+    await conn.execute("CREATE TABLE schema_migrations (version TEXT PRIMARY KEY, name TEXT)")
+    await conn.executescript(MIGRATION.read_text())
+
+    @asynccontextmanager
+    async def use_conn():
+        yield conn
+        await conn.commit()
+
+    monkeypatch.setattr(parser_result_store, "get_connection", use_conn)
+    monkeypatch.setattr(parser_result_store, "get_transaction", use_conn)
+    yield SQLiteParserResultStore()
+    await conn.close()
+
+
+class CountingParser(IInvoiceParser):
+    """Parser returning one item and counting its calls."""
+
+    def __init__(
+        self,
+        name: str = "table_aware",
+        version: str = "1",
+        success: bool = True,
+        confidence: float = 0.9,
+        metadata: dict | None = None,
+    ):
+        self._name = name
+        self._version = version
+        self._success = success
+        self._confidence = confidence
+        self._metadata = metadata
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def priority(self) -> int:
+        return 80
+
+    @property
+    def version(self) -> str:
+        return self._version
+
+    def can_parse(self, text, hints=None) -> float:
+        return 0.9
+
+    async def parse(self, text, filename, hints=None) -> ParserResult:
+        self.calls += 1
+        if not self._success:
+            return ParserResult(success=False, parser_name=self._name, error="no table")
+        return ParserResult(
+            success=True,
+            invoice=Invoice(invoice_no="INV-1", invoice_date="2024-03-01", total_amount=40),
+            items=[LineItem(item_name="Steel pipe", quantity=4, unit_price=10, total_price=40)],
+            confidence=self._confidence,
+            parser_name=self._name,
+            metadata=dict(self._metadata or {}),
+        )
+
+
+def _cached(store, *parsers, detector=None) -> CachedParserRegistry:
+    registry = ParserRegistry()
+    for parser in parsers:
+        registry.register(parser)
+    return CachedParserRegistry(registry, store=store, detector=detector, max_entries=100)
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    directory = tmp_path / "templates"
+    directory.mkdir()
+    (directory / "acme.yaml").write_text(
+        yaml.safe_dump({"company_name": "ACME", "detection_patterns": [r"ACME\s+Trading"]}),
+        encoding="utf-8",
+    )
+    return directory
+
+
+class TestCachedParserRegistry:
+    """Tests for the caching decorator."""
+
+    async def test_repeat_parse_served_from_cache(self, store):
+        parser = CountingParser()
+        registry = _cached(store, parser)
+
+        first = await registry.parse("Invoice text", "a.pdf", {"doc_id": 1})
+        second = await registry.parse("Invoice text", "b.pdf", {"doc_id": 2})
+
+        assert parser.calls == 1
+        assert second.metadata["parser_cache_hit"] is True
+        assert second.parser_name == first.parser_name
+        assert second.invoice.invoice_no == "INV-1"
+        assert str(second.invoice.invoice_date) == "2024-03-01"
+        assert second.items[0].item_name == "Steel pipe"
+        assert second.items[0].total_price == 40
+        assert registry.get_stats()["cache"] == {"hits": 1, "misses": 1, "invalidated": 0}
+
+    async def test_key_covers_text_hints_and_parser_version(self, store):
+        parser = CountingParser()
+        registry = _cached(store, parser)
+
+        await registry.parse("Invoice text", "a.pdf")
+        await registry.parse("Other text", "a.pdf")
+        await registry.parse("Invoice text", "a.pdf", {"prefer_vision": True})
+        assert parser.calls == 3
+
+        registry.unregister("table_aware")
+        bumped = CountingParser(version="2")
+        registry.register(bumped)
+        await registry.parse("Invoice text", "a.pdf")
+        assert bumped.calls == 1
+
+    async def test_file_hints_hash_content(self, store, tmp_path):
+        a, b = tmp_path / "a.pdf", tmp_path / "b.pdf"
+        a.write_bytes(b"%PDF same")
+        b.write_bytes(b"%PDF same")
+
+        assert hints_digest({"pdf_path": str(a)}) == hints_digest({"pdf_path": str(b)})
+        b.write_bytes(b"%PDF edited")
+        assert hints_digest({"pdf_path": str(a)}) != hints_digest({"pdf_path": str(b)})
+
+    async def test_key_computed_off_the_loop(self, store, tmp_path, monkeypatch):
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF body")
+        threads = []
+
+        def record_thread(path):
+            threads.append(threading.get_ident())
+            return hash_image(path)
+
+        monkeypatch.setattr(result_cache, "hash_image", record_thread)
+        registry = _cached(store, CountingParser())
+
+        await registry.parse("Invoice text", "a.pdf", {"pdf_path": str(pdf)})
+
+        assert threads and threading.get_ident() not in threads
+
+    async def test_detection_runs_on_the_loop(self, store, template_dir, monkeypatch):
+        detector = TemplateDetector(reload_interval=0)
+        detector.load_templates(str(template_dir))
+        threads = []
+        detect = detector.detect
+
+        def record_thread(text):
+            threads.append(threading.get_ident())
+            return detect(text)
+
+        monkeypatch.setattr(detector, "detect", record_thread)
+        registry = _cached(store, CountingParser(), detector=detector)
+
+        await registry.parse(ACME_TEXT, "a.pdf")
+
+        assert threads and set(threads) == {threading.get_ident()}
+
+    async def test_failures_are_not_cached(self, store):
+        parser = CountingParser(success=False)
+        registry = _cached(store, parser)
+
+        await registry.parse("Invoice text", "a.pdf")
+        result = await registry.parse("Invoice text", "a.pdf")
+
+        assert parser.calls == 2
+        assert not result.success
+
+    async def test_results_below_threshold_are_not_cached(self, store):
+        parser = CountingParser(confidence=0.5)
+        registry = _cached(store, parser)
+
+        await registry.parse("Invoice text", "a.pdf")
+        await registry.parse("Invoice text", "a.pdf")
+
+        assert parser.calls == 2
+        assert (await store.get_stats())["entries"] == 0
+
+    async def test_results_with_failed_pages_are_not_cached(self, store):
+        pages = [{"page": 1, "source": "vision"}, {"page": 2, "source": "vision", "error": "shed"}]
+        parser = CountingParser(metadata={"pages": pages})
+        registry = _cached(store, parser)
+
+        await registry.parse("Invoice text", "a.pdf")
+        await registry.parse("Invoice text", "a.pdf")
+
+        assert parser.calls == 2
+        assert (await store.get_stats())["entries"] == 0
+
+    async def test_no_cache_hint_refreshes_entry(self, store):
+        parser = CountingParser()
+        registry = _cached(store, parser)
+
+        await registry.parse("Invoice text", "a.pdf")
+        result = await registry.parse("Invoice text", "a.pdf", {"no_cache": True})
+        await registry.parse("Invoice text", "a.pdf")
+
+        assert parser.calls == 2
+        assert "parser_cache_hit" not in result.metadata
+
+    async def test_unreadable_file_hint_skips_cache(self, store, tmp_path):
+        parser = CountingParser()
+        registry = _cached(store, parser)
+        hints = {"pdf_path": str(tmp_path / "missing.pdf")}
+
+        await registry.parse("Invoice text", "a.pdf", hints)
+        await registry.parse("Invoice text", "a.pdf", hints)
+
+        assert parser.calls == 2
+        assert (await store.get_stats())["entries"] == 0
+
+    async def test_template_edit_invalidates_entries(self, store, template_dir):
+        detector = TemplateDetector(reload_interval=0)
+        detector.load_templates(str(template_dir))
+        parser = CountingParser()
+        registry = _cached(store, parser, detector=detector)
+
+        await registry.parse(ACME_TEXT, "a.pdf")
+        await registry.parse("No template here", "b.pdf")
+        assert (await store.get_stats())["entries"] == 2
+
+        (template_dir / "acme.yaml").write_text(
+            yaml.safe_dump({"company_name": "ACME v2", "detection_patterns": [r"ACME\s+Trading"]}),
+            encoding="utf-8",
+        )
+        detector.reload()
+        await registry.parse(ACME_TEXT, "a.pdf")
+
+        assert parser.calls == 3
+        assert registry.get_stats()["cache"]["invalidated"] == 1
+        assert (await store.get_stats())["entries"] == 2
+
+
+class TestSQLiteParserResultStore:
+    """Tests for the SQLite result store."""
+
+    async def test_size_cap_evicts_least_recently_used(self, store):
+        for key in ("a", "b"):
+            await store.put(key, "table_aware", None, f'"{key}"', max_entries=2)
+        await store.get("a")
+
+        await store.put("c", "table_aware", None, '"c"', max_entries=2)
+
+        assert await store.get("b") is None
+        assert await store.get("a") == '"a"'
+        assert await store.get("c") == '"c"'
+
+    async def test_invalidate_templates(self, store):
+        await store.put("a", "template", "acme", "{}", max_entries=10)
+        await store.put("b", "template", "gulf", "{}", max_entries=10)
+        await store.put("c", "table_aware", None, "{}", max_entries=10)
+
+        assert await store.invalidate_templates({"acme"}) == 1
+        assert await store.invalidate_templates(set()) == 0
+        assert await store.get("b") == "{}"
+        assert await store.clear() == 2
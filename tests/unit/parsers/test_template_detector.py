@@ -0,0 +1,220 @@
+"""
+Unit tests for TemplateDetector.
+
+Tests:
+- Required-literal extraction for the prefilter
+- Detection scoring and tie-breaking
+- Bounded detection cache
+- Hot reload when template files change
+"""
+
+import os
+import re
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.infrastructure.parsers.template_parser import (
+    TemplateDetector,
+    TemplateParser,
+    required_literal,
+)
+
+
+def _write(template_dir, template_id, **data):
+    path = template_dir / f"{template_id}.yaml"
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    directory = tmp_path / "templates"
+    directory.mkdir()
+    _write(
+        directory,
+        "acme",
+        company_name="ACME Trading",
+        company_key="acme",
+        detection_patterns=[r"ACME\s+Trading", r"TRN:\s*100\d+", r"Dubai|Sharjah"],
+        field_patterns={"invoice_no": r"Invoice\s+No[:.]?\s*(\S+)"},
+        item_pattern=r"^(?P<description>[A-Za-z ]+?)\s+(?P<quantity>\d+)\s+(?P<total_price>[\d.]+)$",
+    )
+    _write(
+        directory,
+        "gulf",
+        company_name="Gulf Supplies",
+        company_key="gulf",
+        detection_patterns=[r"Gulf\s+Supplies", r"PO\s+Box\s+\d+"],
+    )
+    return directory
+
+
+ACME_TEXT = "ACME  Trading LLC\nTRN: 100234\nDubai\nInvoice No: A-17\nSteel pipe 4 40.00\n"
+
+
+class TestRequiredLiteral:
+    """Tests for literal prefilter extraction."""
+
+    def test_longest_top_level_run(self):
+        assert required_literal(r"Invoice\s+No[:.]") == "invoice"
+
+    def test_casefolded(self):
+        assert required_literal(r"TRN:\s*\d+") == "trn:"
+
+    def test_alternation_has_no_literal(self):
+        assert required_literal(r"Dubai|Sharjah") is None
+
+    def test_short_or_invalid_pattern(self):
+        assert required_literal(r"No\d+") is None
+        assert required_literal(r"([unclosed") is None
+
+    def test_literal_is_necessary(self):
+        """Whenever the pattern matches, its literal is in the folded text."""
+        pattern = r"Total\s+Amount:?\s*[\d,.]+"
+        literal = required_literal(pattern)
+        for text in ("TOTAL AMOUNT 12.00", "total\tamount: 5", "Grand Total Amount 9"):
+            assert re.search(pattern, text, re.IGNORECASE)
+            assert literal in text.casefold()
+
+
+class TestTemplateDetector:
+    """Tests for template detection."""
+
+    def test_detects_best_template(self, template_dir):
+        detector = TemplateDetector(reload_interval=0)
+        assert detector.load_templates(str(template_dir)) == 2
+
+        match = detector.detect(ACME_TEXT)
+
+        assert match.template_id == "acme"
+        assert match.confidence == 1.0
+        assert match.company_key == "acme"
+
+    def test_below_threshold_returns_none(self, template_dir):
+        detector = TemplateDetector(reload_interval=0)
+        detector.load_templates(str(template_dir))
+
+        assert detector.detect("Gulf Supplies\nno address") is None
+
+    def test_invalid_pattern_counts_against_score(self, tmp_path):
+        _write(tmp_path, "broken", detection_patterns=[r"Foo\s+Corp", r"([unclosed"])
+        detector = TemplateDetector(reload_interval=0)
+        detector.load_templates(str(tmp_path))
+
+        with patch("src.infrastructure.parsers.template_parser.get_settings") as settings:
+            settings.return_value.parser.template_min_confidence = 0.5
+            match = detector.detect("Foo Corp")
+
+        assert match.confidence == 0.5
+
+    def test_ties_keep_load_order(self, tmp_path):
+        _write(tmp_path, "a_first", detection_patterns=[r"Shared\s+Name", r"Only\s+First"])
+        _write(tmp_path, "b_second", detection_patterns=[r"Shared\s+Name"])
+        detector = TemplateDetector(reload_interval=0)
+        detector.load_templates(str(tmp_path))
+
+        with patch("src.infrastructure.parsers.template_parser.get_settings") as settings:
+            settings.return_value.parser.template_min_confidence = 0.5
+            assert detector.detect("Shared Name").template_id == "b_second"
+            assert detector.detect("Shared Name, Only First").template_id == "a_first"
+
+    def test_prefilter_skips_regex(self, template_dir):
+        """Templates whose literals are absent are never regex-searched."""
+        detector = TemplateDetector(reload_interval=0)
+        detector.load_templates(str(template_dir))
+        gulf = detector.get_compiled_template("gulf")
+        gulf.detection = [(_ExplodingPattern(), literal) for _, literal in gulf.detection]
+
+        assert detector.detect(ACME_TEXT).template_id == "acme"
+
+    def test_cache_is_bounded(self, template_dir):
+        detector = TemplateDetector(cache_size=2, reload_interval=0)
+        detector.load_templates(str(template_dir))
+
+        for i in range(5):
+            detector.detect(f"{ACME_TEXT}\n{i}")
+
+        assert detector.get_stats()["cached_detections"] == 2
+
+    def test_cache_keys_on_full_text(self, template_dir):
+        """Texts sharing a long header are still told apart."""
+        detector = TemplateDetector(reload_interval=0)
+        detector.load_templates(str(template_dir))
+        header = "x" * 1000
+
+        assert detector.detect(header) is None
+        assert detector.detect(header + ACME_TEXT).template_id == "acme"
+
+
+class _ExplodingPattern:
+    def search(self, text):
+        raise AssertionError("prefiltered pattern was searched")
+
+
+class TestTemplateHotReload:
+    """Tests for reloading changed template files."""
+
+    def test_changed_file_is_reloaded(self, template_dir):
+        detector = TemplateDetector(reload_interval=0.001)
+        detector.load_templates(str(template_dir))
+        assert detector.detect("Globex Industries\nPO Box 12") is None
+
+        path = _write(
+            template_dir,
+            "gulf",
+            company_name="Globex",
+            detection_patterns=[r"Globex\s+Industries", r"PO\s+Box\s+\d+"],
+        )
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        with patch("src.infrastructure.parsers.template_parser.time.monotonic", return_value=1e9):
+            match = detector.detect("Globex Industries\nPO Box 12")
+
+        assert match.template_id == "gulf"
+        assert match.template_name == "Globex"
+
+    def test_removed_file_is_dropped(self, template_dir):
+        detector = TemplateDetector(reload_interval=0.001)
+        detector.load_templates(str(template_dir))
+
+        (template_dir / "acme.yaml").unlink()
+        with patch("src.infrastructure.parsers.template_parser.time.monotonic", return_value=1e9):
+            assert detector.detect(ACME_TEXT) is None
+
+        assert detector.get_template("acme") is None
+
+    def test_reload_reports_edited_and_removed_templates(self, template_dir):
+        detector = TemplateDetector(reload_interval=0)
+        detector.load_templates(str(template_dir))
+        changes: list[set[str]] = []
+        detector.add_change_listener(changes.append)
+        acme_revision = detector.template_revision("acme")
+
+        _write(template_dir, "gulf", company_name="Gulf Supplies v2",
+               detection_patterns=[r"Gulf\s+Supplies"])
+        _write(template_dir, "new", company_name="New Co", detection_patterns=[r"New\s+Co"])
+        detector.reload()
+        (template_dir / "gulf.yaml").unlink()
+        detector.reload()
+
+        assert changes == [{"gulf"}, {"gulf"}]
+        assert detector.template_revision("acme") == acme_revision
+        assert detector.template_revision("gulf") is None
+
+
+class TestTemplateParser:
+    """Tests for extraction with compiled templates."""
+
+    async def test_parse_uses_compiled_patterns(self, template_dir):
+        detector = TemplateDetector(reload_interval=0)
+        detector.load_templates(str(template_dir))
+        parser = TemplateParser(detector)
+
+        result = await parser.parse(ACME_TEXT, "acme.pdf")
+
+        assert result.success
+        assert result.invoice.invoice_no == "A-17"
+        assert [(i.item_name, i.quantity) for i in result.items] == [("Steel pipe", 4.0)]
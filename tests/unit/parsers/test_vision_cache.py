@@ -0,0 +1,163 @@
+"""
+Unit tests for the vision response cache.
+
+Tests:
+- Round trip keyed by image hash, model and prompt version
+- Size-based LRU eviction and hit metrics
+- VisionParser skipping the vision call on a cache hit
+"""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.parsers.vision_cache import VisionResponseCache, hash_image
+from src.infrastructure.parsers.vision_parser import VisionInvoiceResponse, VisionParser
+
+VISION_JSON = """{
+    "invoice_no": "INV-7",
+    "seller_name": "Scan Co",
+    "total_amount": 300,
+    "items": [{"description": "Bolt", "quantity": 3, "unit_price": 100, "total_price": 300}]
+}"""
+
+
+def _response(invoice_no: str = "INV-7") -> VisionInvoiceResponse:
+    return VisionInvoiceResponse(invoice_no=invoice_no, items=[{"description": "Bolt"}])
+
+
+class TestVisionResponseCache:
+    """Tests for the disk store."""
+
+    async def test_round_trip(self, tmp_path):
+        cache = VisionResponseCache(tmp_path, max_bytes=1 << 20)
+
+        assert await cache.get("abc", "llava") is None
+        await cache.put("abc", "llava", _response())
+        cached = await cache.get("abc", "llava")
+
+        assert cached is not None
+        assert cached.invoice_no == "INV-7"
+        assert cached.items[0].description == "Bolt"
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+
+    async def test_key_includes_model_and_prompt_version(self, tmp_path):
+        cache = VisionResponseCache(tmp_path, max_bytes=1 << 20)
+        await cache.put("abc", "llava", _response())
+
+        assert await cache.get("abc", "other-model") is None
+        newer_prompt = VisionResponseCache(tmp_path, max_bytes=1 << 20, prompt_version="v2")
+        assert await newer_prompt.get("abc", "llava") is None
+
+    async def test_evicts_least_recently_used_over_cap(self, tmp_path):
+        cache = VisionResponseCache(tmp_path, max_bytes=1 << 20)
+        await cache.put("old", "llava", _response("OLD"))
+        await cache.put("new", "llava", _response("NEW"))
+        old_path = cache._path(cache.cache_key("old", "llava"))
+        os.utime(old_path, (1, 1))
+
+        size = old_path.stat().st_size
+        cache._max_bytes = size + size // 2
+        await cache.put("newest", "llava", _response("NEWEST"))
+
+        assert await cache.get("old", "llava") is None
+        assert await cache.get("newest", "llava") is not None
+        assert cache.get_stats()["evictions"] == 2
+
+    async def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = VisionResponseCache(tmp_path, max_bytes=1 << 20)
+        await cache.put("abc", "llava", _response())
+        cache._path(cache.cache_key("abc", "llava")).write_text("{not json")
+
+        assert await cache.get("abc", "llava") is None
+
+    async def test_clear(self, tmp_path):
+        cache = VisionResponseCache(tmp_path, max_bytes=1 << 20)
+        await cache.put("a", "llava", _response())
+        await cache.put("b", "llava", _response())
+
+        assert await cache.clear() == 2
+        assert cache.get_stats()["entries"] == 0
+
+    def test_hash_image(self, tmp_path):
+        image = tmp_path / "scan.png"
+        image.write_bytes(b"\x89PNG fake")
+        assert hash_image(image) == hash_image(str(image))
+        assert len(hash_image(image)) == 64
+
+
+class TestVisionParserCaching:
+    """Tests for cache use in VisionParser.parse."""
+
+    @pytest.fixture
+    def image(self, tmp_path):
+        path = tmp_path / "scan.png"
+        path.write_bytes(b"\x89PNG scanned invoice")
+        return str(path)
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = VisionResponseCache(tmp_path / "cache", max_bytes=1 << 20)
+        with patch("src.infrastructure.parsers.vision_cache.get_vision_cache", return_value=cache):
+            yield cache
+
+    @pytest.fixture
+    def provider(self):
+        provider = AsyncMock()
+        provider.vision_model = "llava:13b"
+        response = MagicMock(error=None, model="llava:13b", text=VISION_JSON)
+        provider.analyze_image.return_value = response
+        with patch(
+            "src.infrastructure.parsers.vision_parser.get_vision_provider",
+            return_value=provider,
+        ):
+            yield provider
+
+    async def test_second_parse_is_served_from_cache(self, image, cache, provider):
+        parser = VisionParser()
+
+        first = await parser.parse("", "scan.pdf", hints={"image_path": image})
+        second = await parser.parse("", "scan.pdf", hints={"image_path": image})
+
+        assert provider.analyze_image.await_count == 1
+        assert first.metadata["cache_hit"] is False
+        assert second.metadata["cache_hit"] is True
+        assert second.invoice.invoice_no == "INV-7"
+        assert len(second.items) == 1
+        assert second.confidence == first.confidence
+
+    async def test_invalid_response_is_not_cached(self, image, cache, provider):
+        provider.analyze_image.return_value.text = "no json here"
+        parser = VisionParser()
+
+        await parser.parse("", "scan.pdf", hints={"image_path": image})
+        await parser.parse("", "scan.pdf", hints={"image_path": image})
+
+        assert provider.analyze_image.await_count == 2
+        assert cache.get_stats()["entries"] == 0
+
+    async def test_empty_extraction_is_a_failure_and_not_cached(self, image, cache, provider):
+        provider.analyze_image.return_value.text = '{"currency": "EUR", "items": []}'
+        parser = VisionParser()
+
+        result = await parser.parse("", "scan.pdf", hints={"image_path": image})
+        await parser.parse("", "scan.pdf", hints={"image_path": image})
+
+        assert not result.success
+        assert "no invoice data" in result.error
+        assert provider.analyze_image.await_count == 2
+        assert cache.get_stats()["entries"] == 0
+
+    async def test_disabled_cache_always_calls_vision(self, image, cache, provider):
+        parser = VisionParser()
+        with patch("src.infrastructure.parsers.vision_parser.get_settings") as settings:
+            settings.return_value.parser.vision_enabled = True
+            settings.return_value.cache.vision_cache_enabled = False
+            await parser.parse("", "scan.pdf", hints={"image_path": image})
+            await parser.parse("", "scan.pdf", hints={"image_path": image})
+
+        assert provider.analyze_image.await_count == 2
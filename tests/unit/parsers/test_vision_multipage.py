@@ -0,0 +1,269 @@
+"""
+Unit tests for multi-page vision parsing.
+
+Tests:
+- Page text splitting and cross-page item merging
+- Rendering and concurrent vision calls per PDF page
+- Text-layer pages short-circuiting the vision model
+"""
+
+import asyncio
+import json
+import re
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.entities import Invoice, LineItem
+from src.core.interfaces import ParserResult
+from src.infrastructure.parsers.page_renderer import PYMUPDF_AVAILABLE, PageRenderer
+from src.infrastructure.parsers.vision_cache import VisionResponseCache
+from src.infrastructure.parsers.vision_parser import (
+    VisionInvoiceResponse,
+    VisionParser,
+    merge_page_extractions,
+    split_page_texts,
+)
+
+
+def _page(**data) -> VisionInvoiceResponse:
+    return VisionInvoiceResponse.model_validate(data)
+
+
+class TestSplitPageTexts:
+    """Tests for page marker splitting."""
+
+    def test_splits_on_markers(self):
+        text = "--- Page 1 ---\nfirst\n\n--- Page 2 ---\nsecond"
+        assert split_page_texts(text) == {1: "first", 2: "second"}
+
+    def test_no_markers(self):
+        assert split_page_texts("plain text") == {}
+
+
+class TestMergePageExtractions:
+    """Tests for combining page results."""
+
+    def test_header_from_first_totals_from_last(self):
+        merged = merge_page_extractions([
+            (2, _page(total_amount=500, items=[{"description": "B", "quantity": 1}])),
+            (1, _page(invoice_no="INV-1", seller_name="ACME", currency="EUR",
+                      items=[{"description": "A", "quantity": 1}])),
+        ])
+
+        assert merged.invoice_no == "INV-1"
+        assert merged.seller_name == "ACME"
+        assert merged.currency == "EUR"
+        assert merged.total_amount == 500
+        assert [i.description for i in merged.items] == ["A", "B"]
+
+    def test_description_only_row_continues_previous_item(self):
+        merged = merge_page_extractions([
+            (1, _page(items=[{"description": "Steel pipe 2in", "quantity": 4, "total_price": 40}])),
+            (2, _page(items=[
+                {"description": "galvanized, 6m lengths"},
+                {"description": "Valve", "quantity": 1, "total_price": 9},
+            ])),
+        ])
+
+        assert [i.description for i in merged.items] == [
+            "Steel pipe 2in galvanized, 6m lengths",
+            "Valve",
+        ]
+        assert merged.items[0].quantity == 4
+
+    def test_repeated_row_at_page_break_is_dropped(self):
+        row = {"description": "Bolt M8", "quantity": 100, "total_price": 25}
+        merged = merge_page_extractions([
+            (1, _page(items=[row])),
+            (2, _page(items=[row, {"description": "Nut M8", "quantity": 100, "total_price": 10}])),
+        ])
+
+        assert [i.description for i in merged.items] == ["Bolt M8", "Nut M8"]
+
+    def test_carried_forward_rows_are_dropped(self):
+        merged = merge_page_extractions([
+            (1, _page(items=[
+                {"description": "Bolt", "quantity": 1, "total_price": 5},
+                {"description": "Carried forward", "total_price": 5},
+            ])),
+            (2, _page(items=[
+                {"description": "Brought forward", "total_price": 5},
+                {"description": "Nut", "quantity": 1, "total_price": 2},
+            ])),
+        ])
+
+        assert [i.description for i in merged.items] == ["Bolt", "Nut"]
+
+
+def _page_json(page_no: int) -> str:
+    data: dict = {"items": [{
+        "description": f"Item from page {page_no}",
+        "quantity": page_no,
+        "unit_price": 10,
+        "total_price": 10 * page_no,
+    }]}
+    if page_no == 1:
+        data.update(invoice_no="INV-SCAN", invoice_date="2024-02-01", seller_name="Scan Co")
+    if page_no == 3:
+        data["total_amount"] = 60
+    return json.dumps(data)
+
+
+class PageVision:
+    """Vision provider answering with the JSON for the rendered page."""
+
+    vision_model = "llava:test"
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.pages: list[int] = []
+
+    async def analyze_image(self, image_path, prompt, max_tokens=2048):
+        page_no = int(re.search(r"page_(\d+)", Path(image_path).name).group(1))
+        assert Path(image_path).exists()
+        self.pages.append(page_no)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return MagicMock(error=None, model=self.vision_model, text=_page_json(page_no))
+
+
+@pytest.mark.skipif(not PYMUPDF_AVAILABLE, reason="PyMuPDF not installed")
+class TestParsePdf:
+    """Tests for VisionParser.parse with a pdf_path hint."""
+
+    @pytest.fixture
+    def pdf_path(self, tmp_path):
+        import pymupdf
+
+        doc = pymupdf.open()
+        for page_no in range(1, 4):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"scanned page {page_no}")
+        path = tmp_path / "scan.pdf"
+        doc.save(path)
+        doc.close()
+        return str(path)
+
+    @pytest.fixture
+    def renderer(self):
+        renderer = PageRenderer(workers=1, dpi=30)
+        yield renderer
+        renderer.shutdown()
+
+    @pytest.fixture
+    def vision(self, tmp_path):
+        vision = PageVision()
+        cache = VisionResponseCache(tmp_path / "cache", max_bytes=1 << 20)
+        with (
+            patch("src.infrastructure.parsers.vision_parser.get_vision_provider", return_value=vision),
+            patch("src.infrastructure.parsers.vision_cache.get_vision_cache", return_value=cache),
+        ):
+            yield vision
+
+    async def test_page_count_on_render_pool(self, pdf_path, renderer):
+        assert await renderer.page_count(pdf_path) == 3
+        assert renderer._pool is not None
+
+    async def test_parses_every_page_concurrently(self, pdf_path, renderer, vision):
+        parser = VisionParser(renderer=renderer)
+
+        result = await parser.parse("", "scan.pdf", hints={"pdf_path": pdf_path})
+
+        assert result.success
+        assert sorted(vision.pages) == [1, 2, 3]
+        assert vision.peak > 1
+        assert result.invoice.invoice_no == "INV-SCAN"
+        assert result.invoice.total_amount == 60
+        assert [i.item_name for i in result.items] == [
+            "Item from page 1", "Item from page 2", "Item from page 3",
+        ]
+        assert [p["source"] for p in result.metadata["pages"]] == ["vision"] * 3
+        assert result.metadata["pages_total"] == 3
+
+    async def test_reparse_is_served_from_cache(self, pdf_path, renderer, vision):
+        parser = VisionParser(renderer=renderer)
+
+        await parser.parse("", "scan.pdf", hints={"pdf_path": pdf_path})
+        result = await parser.parse("", "scan.pdf", hints={"pdf_path": pdf_path})
+
+        assert len(vision.pages) == 3
+        assert result.metadata["cache_hit"] is True
+        assert [p["source"] for p in result.metadata["pages"]] == ["cache"] * 3
+
+    async def test_text_pages_skip_vision(self, pdf_path, renderer, vision):
+        text_parser = MagicMock()
+        text_parser.can_parse.return_value = 0.9
+
+        async def parse_text(text, filename, hints=None):
+            if "TABLE" not in text:
+                return ParserResult(success=False, parser_name="table_aware")
+            return ParserResult(
+                success=True,
+                invoice=Invoice(invoice_no="INV-TEXT"),
+                items=[LineItem(item_name="Text item", description="Text item",
+                                quantity=2, unit_price=5, total_price=10)],
+                confidence=0.9,
+                parser_name="table_aware",
+            )
+
+        text_parser.parse = parse_text
+        text = "\n\n".join([
+            "--- Page 1 ---\n" + "Description Qty Price Total TABLE rows here " * 5,
+            "--- Page 2 ---\n@@##$$%%^^",
+        ])
+        parser = VisionParser(renderer=renderer, text_parser=text_parser)
+
+        result = await parser.parse(text, "scan.pdf", hints={"pdf_path": pdf_path})
+
+        assert sorted(vision.pages) == [2, 3]
+        assert [p["source"] for p in result.metadata["pages"]] == ["text", "vision", "vision"]
+        assert result.invoice.invoice_no == "INV-TEXT"
+        assert [i.item_name for i in result.items] == [
+            "Text item", "Item from page 2", "Item from page 3",
+        ]
+
+    async def test_failed_page_fails_the_parse(self, pdf_path, renderer, vision):
+        """A page the model could not answer makes the whole invoice fail."""
+        answer = vision.analyze_image
+
+        async def flaky(image_path, prompt, max_tokens=2048):
+            if int(re.search(r"page_(\d+)", Path(image_path).name).group(1)) == 2:
+                raise TimeoutError("shed by scheduler")
+            return await answer(image_path, prompt, max_tokens)
+
+        vision.analyze_image = flaky
+        parser = VisionParser(renderer=renderer)
+
+        result = await parser.parse("", "scan.pdf", hints={"pdf_path": pdf_path})
+
+        assert not result.success
+        assert result.invoice is None
+        assert "1 of 3 pages" in result.error
+        assert [("error" in p) for p in result.metadata["pages"]] == [False, True, False]
+
+    async def test_max_pages(self, pdf_path, renderer, vision):
+        parser = VisionParser(renderer=renderer)
+        with patch("src.infrastructure.parsers.vision_parser.get_settings") as settings:
+            settings.return_value.parser.vision_enabled = True
+            settings.return_value.parser.vision_max_pages = 2
+            settings.return_value.parser.vision_page_concurrency = 4
+            settings.return_value.cache.vision_cache_enabled = False
+            result = await parser.parse("", "scan.pdf", hints={"pdf_path": pdf_path})
+
+        assert sorted(vision.pages) == [1, 2]
+        assert result.metadata["pages_total"] == 3
+
+    async def test_unreadable_pdf_fails_cleanly(self, tmp_path, renderer, vision):
+        parser = VisionParser(renderer=renderer)
+
+        result = await parser.parse(
+            "", "missing.pdf", hints={"pdf_path": str(tmp_path / "missing.pdf")}
+        )
+
+        assert not result.success
+        assert vision.pages == []
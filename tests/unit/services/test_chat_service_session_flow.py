@@ -10,7 +10,8 @@ Tests:
 - Error handling and graceful degradation
 """
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -18,6 +19,7 @@ from src.core.entities.session import ChatSession, MemoryFact, Message, MessageR
 from src.core.exceptions import ChatError
 from src.core.interfaces.llm import LLMResponse
 from src.core.services.chat_service import ChatService
+from src.core.services.memory_extractor import MemoryFactExtractor
 from src.core.services.search_service import SearchContext
 
 
@@ -43,6 +45,10 @@ class MockSessionStore:
     async def get_session(self, session_id: str) -> ChatSession | None:
         return self.sessions.get(session_id)
 
+    async def get_session_header(self, session_id: str) -> ChatSession | None:
+        self.header_loads = getattr(self, "header_loads", 0) + 1
+        return self.sessions.get(session_id)
+
     async def update_session(self, session: ChatSession) -> ChatSession:
         self.sessions[session.session_id] = session
         return session
@@ -71,6 +77,9 @@ class MockSessionStore:
         msgs = self.messages.get(session_id, [])
         return msgs[offset : offset + limit]
 
+    async def count_messages(self, session_id: str) -> int:
+        return len(self.messages.get(session_id, []))
+
     async def save_memory_fact(self, fact: MemoryFact) -> MemoryFact:
         self._fact_counter += 1
         fact.id = self._fact_counter
@@ -79,6 +88,10 @@ class MockSessionStore:
         self.facts[fact.session_id].append(fact)
         return fact
 
+    async def save_memory_facts(self, facts: list[MemoryFact]) -> list[MemoryFact]:
+        self.fact_batches = getattr(self, "fact_batches", 0) + 1
+        return [await self.save_memory_fact(fact) for fact in facts]
+
     async def get_memory_facts(self, session_id: str | None = None, fact_type: str | None = None) -> list[MemoryFact]:
         if session_id:
             return self.facts.get(session_id, [])
@@ -103,6 +116,7 @@ class MockLLMProvider:
         self.response = response
         self.generate_called = False
         self.prompts = []  # Track all prompts
+        self.chats = []  # Track structured chat requests
 
     @property
     def last_prompt(self):
@@ -125,6 +139,19 @@ class MockLLMProvider:
         for word in self.response.split():
             yield word + " "
 
+    async def chat(self, messages: list[dict[str, str]], max_tokens: int = 2048, temperature: float = 0.7) -> LLMResponse:
+        self.chats.append(messages)
+        return await self.generate(self._render(messages))
+
+    async def chat_stream(self, messages: list[dict[str, str]], max_tokens: int = 2048, temperature: float = 0.7):
+        self.chats.append(messages)
+        async for chunk in self.generate_stream(self._render(messages)):
+            yield chunk
+
+    @staticmethod
+    def _render(messages: list[dict[str, str]]) -> str:
+        return "\n".join(f"{m['role'].capitalize()}: {m['content']}" for m in messages)
+
     async def is_available(self) -> bool:
         return True
 
@@ -342,6 +369,89 @@ class TestRAGIntegration:
         assert response is not None
 
 
+class TestTurnPipeline:
+    """Tests for the concurrent pre-generation stages of a chat turn."""
+
+    @pytest.mark.asyncio
+    async def test_retrieval_overlaps_session_load_and_insert(self):
+        """Retrieval runs while the session loads and the user message is saved."""
+        store = MockSessionStore()
+        session = await store.create_session(ChatSession())
+        events = []
+
+        class SlowSearch(MockSearchService):
+            async def search_for_rag(self, query, top_k=5):
+                events.append("retrieval_start")
+                await asyncio.sleep(0.05)
+                events.append("retrieval_end")
+                return await super().search_for_rag(query, top_k)
+
+        real_add = store.add_message
+
+        async def add_message(message):
+            events.append(f"add_{message.role.value}")
+            return await real_add(message)
+
+        store.add_message = add_message
+        service = ChatService(session_store=store, llm_provider=MockLLMProvider(), search_service=SlowSearch())
+
+        result = await service.chat("Hello", session_id=session.session_id)
+
+        assert events.index("add_user") < events.index("retrieval_end")
+        assert "Test context from documents." in result.metadata["context_used"]
+
+    @pytest.mark.asyncio
+    async def test_stage_timings_in_metadata(self):
+        """The assistant message records per-stage timings."""
+        store = MockSessionStore()
+        service = ChatService(
+            session_store=store, llm_provider=MockLLMProvider(), search_service=MockSearchService()
+        )
+
+        result = await service.chat("Hello")
+
+        timings = result.metadata["timings_ms"]
+        assert {"session", "retrieval", "persist", "prompt_ready", "generation", "total"} <= set(timings)
+        assert timings["total"] >= timings["prompt_ready"]
+
+    @pytest.mark.asyncio
+    async def test_stream_records_first_token(self):
+        """Streamed answers record time to first token."""
+        store = MockSessionStore()
+        service = ChatService(session_store=store, llm_provider=MockLLMProvider())
+        session = await service.create_session()
+
+        async for _ in service.chat_stream("Hello", session_id=session.session_id, use_rag=False):
+            pass
+
+        saved = store.messages[session.session_id][-1]
+        timings = saved.metadata["timings_ms"]
+        assert "retrieval" not in timings
+        assert timings["prompt_ready"] <= timings["first_token"] <= timings["total"]
+        assert "generation" in timings
+
+    @pytest.mark.asyncio
+    async def test_missing_session_cancels_retrieval(self):
+        """A failed session load doesn't leave retrieval running."""
+        finished = []
+
+        class SlowSearch(MockSearchService):
+            async def search_for_rag(self, query, top_k=5):
+                await asyncio.sleep(0.05)
+                finished.append(query)
+                return await super().search_for_rag(query, top_k)
+
+        service = ChatService(
+            session_store=MockSessionStore(), llm_provider=MockLLMProvider(), search_service=SlowSearch()
+        )
+
+        with pytest.raises(ChatError, match="Session not found"):
+            await service.chat("Hello", session_id="missing")
+        await asyncio.sleep(0.1)
+
+        assert finished == []
+
+
 class TestStreamingChat:
     """Tests for streaming chat responses."""
 
@@ -380,6 +490,54 @@ class TestStreamingChat:
         assert len(assistant_msgs) == 1
         assert "Complete" in assistant_msgs[0].content
 
+    @pytest.mark.asyncio
+    async def test_chat_stream_closed_early_keeps_partial(self):
+        """Closing the stream mid-answer stops the provider and saves what was sent."""
+        store = MockSessionStore()
+        llm = MockLLMProvider(response="one two three four")
+        service = ChatService(session_store=store, llm_provider=llm)
+        session = await service.create_session()
+
+        stream = service.chat_stream("Hi", session_id=session.session_id, use_rag=False)
+        received = [await anext(stream), await anext(stream)]
+        await stream.aclose()
+
+        saved = store.messages[session.session_id][-1]
+        assert saved.role == MessageRole.ASSISTANT
+        assert saved.content == "".join(received)
+        assert saved.metadata["partial"] is True
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_cancelled_keeps_partial(self):
+        """Cancelling the consuming task also records the partial answer."""
+        store = MockSessionStore()
+        llm = MockLLMProvider()
+        first_chunk = asyncio.Event()
+
+        async def slow_stream(messages, max_tokens=2048, temperature=0.7):
+            yield "Partial "
+            first_chunk.set()
+            await asyncio.sleep(10)
+            yield "never"
+
+        llm.chat_stream = slow_stream
+        service = ChatService(session_store=store, llm_provider=llm)
+        session = await service.create_session()
+
+        async def consume():
+            async for _ in service.chat_stream("Hi", session_id=session.session_id, use_rag=False):
+                pass
+
+        task = asyncio.create_task(consume())
+        await first_chunk.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        saved = store.messages[session.session_id][-1]
+        assert saved.content == "Partial "
+        assert saved.metadata["partial"] is True
+
     @pytest.mark.asyncio
     async def test_chat_stream_empty_message_raises(self):
         """Should raise for empty message in stream."""
@@ -426,6 +584,48 @@ class TestMemoryFacts:
         assert len(facts) == 2
 
 
+class TestBackgroundFactExtraction:
+    """Tests for memory fact extraction off the chat path."""
+
+    @pytest.mark.asyncio
+    async def test_chat_returns_before_extraction(self):
+        """Chat makes a single LLM call; extraction happens later."""
+        store = MockSessionStore()
+        llm = MockLLMProvider(response="- Supplier is Acme Trading LLC")
+        extractor = MemoryFactExtractor(store, llm, coalesce_delay=0)
+        service = ChatService(session_store=store, llm_provider=llm, memory_extractor=extractor)
+
+        response = await service.chat("Who is the supplier?", use_rag=False)
+
+        assert len(llm.prompts) == 1
+        assert store.facts == {}
+
+        await service.flush_memory_extraction()
+
+        facts = await service.get_session_facts(response.session_id)
+        assert [f.value for f in facts] == ["Supplier is Acme Trading LLC"]
+
+    @pytest.mark.asyncio
+    async def test_rapid_messages_coalesce(self):
+        """Messages in one session before the worker runs share one extraction."""
+        store = MockSessionStore()
+        llm = MockLLMProvider(response="- Total amount is 1,250 AED")
+        extractor = MemoryFactExtractor(store, llm, coalesce_delay=0)
+        service = ChatService(session_store=store, llm_provider=llm, memory_extractor=extractor)
+        session = await service.create_session()
+
+        for text in ("First", "Second", "Third"):
+            await service.chat(text, session_id=session.session_id, use_rag=False)
+        await service.flush_memory_extraction()
+
+        extraction_prompts = [p for p in llm.prompts if p.startswith("Extract key facts")]
+        assert len(extraction_prompts) == 1
+        assert "User: First" in extraction_prompts[0]
+        assert "User: Third" in extraction_prompts[0]
+        assert store.fact_batches == 1
+        assert len(store.facts[session.session_id]) == 1
+
+
 class TestSessionSummary:
     """Tests for session summary generation."""
 
@@ -473,19 +673,154 @@ class TestPromptBuilding:
         # Second message
         await service.chat("Second message", session_id=session.session_id, use_rag=False)
 
-        # History should be in the chat prompt for second message
-        # Use prompts[2] since first chat generates 2 prompts (chat + fact extraction)
-        second_chat_prompt = llm.prompts[2] if len(llm.prompts) > 2 else llm.chat_prompt
-        assert "First message" in second_chat_prompt or "Previous conversation" in second_chat_prompt
+        # Fact extraction runs in the background, so chats[1] is the second chat
+        second_chat = llm.chats[1]
+        assert [m["role"] for m in second_chat] == ["system", "user", "assistant", "user"]
+        assert second_chat[1]["content"] == "First message"
+        assert second_chat[-1]["content"] == "Second message"
 
     @pytest.mark.asyncio
     async def test_prompt_format(self):
-        """Should format prompt correctly."""
+        """Should send a system prompt followed by the user turn."""
         store = MockSessionStore()
         llm = MockLLMProvider()
         service = ChatService(session_store=store, llm_provider=llm)
 
         await service.chat("Test question", use_rag=False)
 
-        assert "User: Test question" in llm.chat_prompt
-        assert "Assistant:" in llm.chat_prompt
+        assert llm.chats[0][0]["role"] == "system"
+        assert llm.chats[0][-1] == {"role": "user", "content": "Test question"}
+
+    @pytest.mark.asyncio
+    async def test_consecutive_turns_share_prefix(self):
+        """Each turn resends the previous request unchanged, plus the new exchange."""
+        store = MockSessionStore()
+        llm = MockLLMProvider()
+        search = MockSearchService(context="Invoice 42 context.")
+        service = ChatService(session_store=store, llm_provider=llm, search_service=search)
+        session = await service.create_session()
+
+        for i in range(3):
+            await service.chat(f"Question {i}", session_id=session.session_id)
+
+        for previous, current in zip(llm.chats, llm.chats[1:]):
+            # Everything before the previous turn's user message is reused
+            assert current[: len(previous) - 1] == previous[:-1]
+            assert "Invoice 42 context." in current[-1]["content"]
+            assert all("Invoice 42" not in m["content"] for m in current[1:-1])
+
+    @pytest.mark.asyncio
+    async def test_history_window_advances_in_steps(self):
+        """The window keeps its anchor until it outgrows max_history."""
+        store = MockSessionStore()
+        store.get_messages = AsyncMock(side_effect=lambda sid, limit=100, offset=0: store.messages[sid][-limit:])
+        llm = MockLLMProvider()
+        service = ChatService(session_store=store, llm_provider=llm, max_history_messages=4)
+        session = await service.create_session()
+
+        for i in range(5):
+            await service.chat(f"Question {i}", session_id=session.session_id, use_rag=False)
+
+        firsts = [chat[1]["content"] if len(chat) > 2 else None for chat in llm.chats]
+        assert firsts == [None, "Question 0", "Question 0", "Question 2", "Question 2"]
+
+    @pytest.mark.asyncio
+    async def test_summary_rides_on_system_prompt(self):
+        """The rolling summary is appended to the system prompt."""
+        store = MockSessionStore()
+        llm = MockLLMProvider()
+        service = ChatService(session_store=store, llm_provider=llm)
+        session = await service.create_session()
+        session.conversation_summary = "User is checking invoice INV-9."
+
+        await service.chat("And the total?", session_id=session.session_id, use_rag=False)
+
+        assert "User is checking invoice INV-9." in llm.chats[0][0]["content"]
+
+    @pytest.mark.asyncio
+    async def test_dropped_messages_go_to_summarizer(self):
+        """Messages left behind by a window jump are submitted for summarizing."""
+        store = MockSessionStore()
+        llm = MockLLMProvider()
+        summarizer = MagicMock()
+        summarizer.flush = AsyncMock()
+        service = ChatService(
+            session_store=store, llm_provider=llm, max_history_messages=4, summarizer=summarizer
+        )
+        session = await service.create_session()
+
+        for i in range(4):
+            await service.chat(f"Question {i}", session_id=session.session_id, use_rag=False)
+
+        summarizer.submit.assert_called_once()
+        dropped = summarizer.submit.call_args.args[1]
+        assert [m.content for m in dropped] == ["Question 0", llm.response, "Question 1", llm.response]
+
+
+class TestSessionWindow:
+    """Tests for the in-memory session window."""
+
+    @pytest.mark.asyncio
+    async def test_session_loaded_once(self):
+        """Later turns reuse the cached header and messages."""
+        store = MockSessionStore()
+        session = await store.create_session(ChatSession())
+        store.get_messages = AsyncMock(return_value=[])
+        service = ChatService(session_store=store, llm_provider=MockLLMProvider())
+
+        for i in range(3):
+            await service.chat(f"Question {i}", session_id=session.session_id, use_rag=False)
+
+        assert store.header_loads == 1
+        store.get_messages.assert_awaited_once()
+        assert store.get_messages.call_args.kwargs["limit"] == 2 * service._max_history
+
+    @pytest.mark.asyncio
+    async def test_session_info_counts_messages_from_window(self):
+        """Session info comes from the window, counting earlier and new messages."""
+        store = MockSessionStore()
+        session = await store.create_session(ChatSession(title="Counting"))
+        for i in range(3):
+            await store.add_message(
+                Message(session_id=session.session_id, role=MessageRole.USER, content=f"Old {i}")
+            )
+        service = ChatService(session_store=store, llm_provider=MockLLMProvider())
+
+        await service.chat("Question", session_id=session.session_id, use_rag=False)
+        store.get_session = AsyncMock()
+        store.count_messages = AsyncMock()
+        info = await service.get_session_info(session.session_id)
+
+        assert info.session_id == session.session_id
+        assert info.title == "Counting"
+        assert info.message_count == 5
+        store.get_session.assert_not_awaited()
+        store.count_messages.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_session_info_for_untracked_session(self):
+        """Untracked sessions read the header and a count, not the messages."""
+        store = MockSessionStore()
+        session = await store.create_session(ChatSession(title="Cold"))
+        await store.add_message(Message(session_id=session.session_id, role=MessageRole.USER, content="Hi"))
+        store.get_messages = AsyncMock()
+        service = ChatService(session_store=store, llm_provider=MockLLMProvider())
+
+        info = await service.get_session_info(session.session_id)
+
+        assert (info.title, info.message_count) == ("Cold", 1)
+        store.get_messages.assert_not_awaited()
+        assert await service.get_session_info("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_window_reloaded_after_delete(self):
+        """Deleting a session drops its cached window."""
+        store = MockSessionStore()
+        service = ChatService(session_store=store, llm_provider=MockLLMProvider())
+        session = await service.create_session()
+        await service.chat("Hello", session_id=session.session_id, use_rag=False)
+
+        await service.delete_session(session.session_id)
+
+        with pytest.raises(ChatError):
+            await service.chat("Again", session_id=session.session_id, use_rag=False)
@@ -0,0 +1,116 @@
+"""
+Unit tests for the document chunkers.
+
+Tests:
+- split_sentences() boundary handling
+- CharChunker character-budget splitting
+- TokenChunker token-budget packing and overlap
+"""
+
+from src.core.services.chunking import CharChunker, TokenChunker, split_sentences
+
+
+def word_count(texts: list[str]) -> list[int]:
+    """Stand-in tokenizer: one token per whitespace-separated word."""
+    return [len(t.split()) for t in texts]
+
+
+class TestSplitSentences:
+    """Tests for sentence splitting."""
+
+    def test_roundtrips_text(self):
+        """Pieces keep their trailing whitespace and rebuild the text."""
+        text = "One two. Three four!\nFive six? Seven"
+
+        pieces = split_sentences(text)
+
+        assert "".join(pieces) == text
+        assert [p.strip() for p in pieces] == ["One two.", "Three four!", "Five six?", "Seven"]
+
+    def test_splits_cjk_and_arabic(self):
+        """CJK full stops and the Arabic question mark end sentences."""
+        assert len(split_sentences("发票已收到。请付款。")) == 2
+        assert len(split_sentences("هل دفعت؟ نعم")) == 2
+
+    def test_keeps_decimals_together(self):
+        """A period inside a number is not a sentence boundary."""
+        assert split_sentences("Total 1,250.00 USD") == ["Total 1,250.00 USD"]
+
+
+class TestCharChunker:
+    """Tests for character-budget chunking."""
+
+    def test_small_text_single_chunk(self):
+        """Small text should stay in one chunk."""
+        assert CharChunker(100, 10).split("Short text.") == ["Short text."]
+
+    def test_long_text_overlaps(self):
+        """Each chunk after the first starts with the tail of the previous one."""
+        text = (
+            "First sentence here. Second sentence here. Third sentence here. Fourth sentence here."
+        )
+
+        chunks = CharChunker(50, 10).split(text)
+
+        assert len(chunks) >= 2
+        assert chunks[1].startswith(chunks[0][-10:].strip())
+
+    def test_respects_sentences(self):
+        """Without overlap, chunks are whole sentences and never empty."""
+        text = "This is sentence one. This is sentence two. This is sentence three."
+
+        chunks = CharChunker(50, 0).split(text)
+
+        assert all(c.strip() for c in chunks)
+        assert all(c.endswith(".") for c in chunks)
+
+
+class TestTokenChunker:
+    """Tests for token-budget chunking."""
+
+    def test_packs_to_token_budget(self):
+        """Sentences are packed until the next one would exceed the budget."""
+        text = "a b c. d e f. g h i. j k l."
+        chunker = TokenChunker(word_count, max_tokens=6, overlap_tokens=0)
+
+        assert chunker.split_batch([text]) == [["a b c. d e f.", "g h i. j k l."]]
+
+    def test_overlap_repeats_trailing_sentences(self):
+        """Trailing sentences within the overlap budget start the next chunk."""
+        text = "a b. c d. e f. g h."
+        chunker = TokenChunker(word_count, max_tokens=4, overlap_tokens=2)
+
+        chunks = chunker.split_batch([text])[0]
+
+        assert chunks == ["a b. c d.", "c d. e f.", "e f. g h."]
+
+    def test_tokenizes_batch_in_one_call(self):
+        """All pages of a batch share a single tokenizer call."""
+        calls = []
+
+        def counting(texts: list[str]) -> list[int]:
+            calls.append(texts)
+            return word_count(texts)
+
+        result = TokenChunker(counting, max_tokens=10).split_batch(["One. Two.", "Three."])
+
+        assert len(calls) == 1
+        assert result == [["One. Two."], ["Three."]]
+
+    def test_cuts_oversized_sentence(self):
+        """A sentence above the budget is cut into parts that fit."""
+        text = " ".join(f"w{i}" for i in range(10))
+
+        chunks = TokenChunker(word_count, max_tokens=4, overlap_tokens=0).split_batch([text])[0]
+
+        assert all(len(c.split()) <= 4 for c in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+    def test_fewer_chunks_than_char_budget(self):
+        """Short-token text packs into fewer chunks than a 512-char budget."""
+        text = " ".join(f"Item {i} qty 1." for i in range(200))
+
+        by_tokens = TokenChunker(word_count, max_tokens=512).split_batch([text])[0]
+        by_chars = CharChunker(512, 50).split(text)
+
+        assert len(by_tokens) < len(by_chars)
@@ -0,0 +1,151 @@
+"""
+Unit tests for ContextPacker.
+
+Tests:
+- Adjacent chunks of a page merged with overlap removed
+- Near-duplicate passages dropped
+- Token budget respected without cutting passages
+- SearchService.search_for_rag uses the packer
+"""
+
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+from src.core.entities.document import SearchResult
+from src.core.services.context_packer import ContextPacker, stitch
+from src.core.services.search_service import SearchService
+
+
+def _result(chunk_id: int, text: str, doc_id: int = 1, page_no: int = 1) -> SearchResult:
+    return SearchResult(chunk_id=chunk_id, doc_id=doc_id, page_no=page_no, text=text)
+
+
+def _words(texts: list[str]) -> list[int]:
+    return [len(t.split()) for t in texts]
+
+
+class TestStitch:
+    """Tests for joining consecutive chunks."""
+
+    def test_removes_shared_overlap(self):
+        first = "Invoice 1001 from Gulf Traders. Payment due within 30 days."
+        second = "Payment due within 30 days. Delivery by sea freight."
+
+        assert stitch(first, second) == (
+            "Invoice 1001 from Gulf Traders. Payment due within 30 days. Delivery by sea freight."
+        )
+
+    def test_joins_with_space_without_overlap(self):
+        assert stitch("First part.", "Second part.") == "First part. Second part."
+
+
+class TestContextPacker:
+    """Tests for context packing."""
+
+    def test_merges_adjacent_chunks_of_same_page(self):
+        """Consecutive chunks become one passage at the better rank's position."""
+        results = [
+            _result(11, "Payment due within 30 days of delivery. Goods shipped by sea."),
+            _result(40, "Warranty covers manufacturing defects for twelve months.", page_no=2),
+            _result(10, "Invoice 1001 from Gulf Traders. Payment due within 30 days of delivery."),
+        ]
+
+        packed = ContextPacker(_words).pack(results)
+
+        assert packed.text.startswith(
+            "[1] Invoice 1001 from Gulf Traders. Payment due within 30 days of delivery. "
+            "Goods shipped by sea."
+        )
+        assert "[2] Warranty" in packed.text
+        assert packed.text.count("Payment due") == 1
+
+    def test_bridging_chunk_joins_two_passages(self):
+        """A middle chunk ranked last links its neighbours into one passage."""
+        results = [
+            _result(1, "alpha beta gamma delta"),
+            _result(3, "iota kappa lambda mu"),
+            _result(2, "epsilon zeta eta theta"),
+        ]
+
+        packed = ContextPacker(_words).pack(results)
+
+        assert packed.text == "[1] alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu"
+        assert len(packed.results) == 3
+
+    def test_drops_near_duplicates(self):
+        """A passage mostly contained in a better one is dropped."""
+        results = [
+            _result(1, "Steel pipes 2 inch galvanized, 500 pieces at 12.50 USD each", doc_id=1),
+            _result(7, "Steel pipes 2 inch galvanized, 500 pieces at 12.50 USD", doc_id=2),
+            _result(9, "Copper cable 4mm, 200 rolls", doc_id=3),
+        ]
+
+        packed = ContextPacker(_words).pack(results)
+
+        assert packed.dropped_duplicates == 1
+        assert "[2] Copper cable" in packed.text
+
+    def test_respects_token_budget_without_cutting(self):
+        """Passages that don't fit are skipped whole; smaller later ones still fit."""
+        results = [
+            _result(1, " ".join(["first"] * 10), doc_id=1),
+            _result(2, " ".join(["second"] * 30), doc_id=2),
+            _result(3, " ".join(["third"] * 5), doc_id=3),
+        ]
+
+        packed = ContextPacker(_words, max_tokens=25).pack(results)
+
+        assert "second" not in packed.text
+        assert "third" in packed.text
+        assert packed.tokens <= 25
+        assert packed.dropped_over_budget == 1
+
+    def test_trims_oversized_top_passage(self):
+        """The best passage is trimmed rather than leaving the context empty."""
+        packed = ContextPacker(_words, max_tokens=14).pack([_result(1, " ".join(["word"] * 40))])
+
+        assert packed.text.endswith("...")
+        assert packed.tokens == 14
+
+    def test_falls_back_to_estimate_when_counter_fails(self):
+        """Tokenizer errors don't break packing."""
+        counter = MagicMock(side_effect=RuntimeError("no tokenizer"))
+
+        packed = ContextPacker(counter).pack([_result(1, "Some passage text here")])
+
+        assert packed.text == "[1] Some passage text here"
+
+
+class TestSearchForRag:
+    """Tests for SearchService.search_for_rag."""
+
+    async def test_uses_packer_budget(self):
+        """The packed context and its token count are returned."""
+        searcher = MagicMock()
+        searcher.search = AsyncMock(return_value=[
+            _result(1, "Invoice 1001 total 950 USD", doc_id=1),
+            _result(2, "Invoice 1002 total 1200 USD", doc_id=2),
+        ])
+        service = SearchService(searcher=searcher, context_packer=ContextPacker(_words))
+
+        context = await service.search_for_rag("invoice total", max_context_tokens=9)
+
+        assert context.formatted_context == "[1] Invoice 1001 total 950 USD"
+        assert context.context_tokens == 9
+        assert context.total_chunks == 2
+
+    async def test_counts_tokens_off_the_loop(self):
+        """The token counter runs in a worker thread."""
+        threads = []
+
+        def counter(texts: list[str]) -> list[int]:
+            threads.append(threading.get_ident())
+            return _words(texts)
+
+        searcher = MagicMock()
+        searcher.search = AsyncMock(return_value=[_result(1, "Invoice 1001")])
+        service = SearchService(searcher=searcher, context_packer=ContextPacker(counter))
+
+        await service.search_for_rag("invoice")
+
+        assert threads and threading.get_ident() not in threads
@@ -0,0 +1,100 @@
+"""
+Unit tests for ConversationSummarizer.
+
+Tests:
+- Messages folded into the summary and the watermark advanced
+- Already summarized messages skipped
+- Submissions for one session coalesced into one LLM call
+- LLM failures don't escape the worker
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.entities.session import ChatSession, Message, MessageRole
+from src.core.interfaces.llm import LLMResponse
+from src.core.services.conversation_summarizer import ConversationSummarizer
+
+
+@pytest.fixture
+def store() -> MagicMock:
+    store = MagicMock()
+    store.update_session = AsyncMock(side_effect=lambda session: session)
+    return store
+
+
+def _llm(text: str) -> MagicMock:
+    llm = MagicMock()
+    llm.generate = AsyncMock(return_value=LLMResponse(text=text, model="mock"))
+    return llm
+
+
+def _messages(session: ChatSession, *ids: int) -> list[Message]:
+    return [
+        Message(
+            id=i,
+            session_id=session.session_id,
+            role=MessageRole.USER if i % 2 else MessageRole.ASSISTANT,
+            content=f"message {i}",
+        )
+        for i in ids
+    ]
+
+
+class TestConversationSummarizer:
+    """Tests for rolling summary updates."""
+
+    async def test_summarize_updates_session(self, store):
+        """The summary, message count and watermark are saved together."""
+        llm = _llm("User asked about invoice INV-7.")
+        summarizer = ConversationSummarizer(store, llm)
+        session = ChatSession(conversation_summary="Earlier talk.")
+
+        summary = await summarizer.summarize(session, _messages(session, 1, 2))
+
+        assert summary == "User asked about invoice INV-7."
+        assert session.conversation_summary == summary
+        assert session.summary_message_count == 2
+        assert session.summary_last_message_id == 2
+        assert "Earlier talk." in llm.generate.call_args.args[0]
+        store.update_session.assert_awaited_once_with(session)
+
+    async def test_summarized_messages_are_skipped(self, store):
+        """Messages at or below the watermark don't trigger an LLM call."""
+        llm = _llm("unused")
+        summarizer = ConversationSummarizer(store, llm)
+        session = ChatSession(conversation_summary="Done.", summary_last_message_id=4)
+
+        assert await summarizer.summarize(session, _messages(session, 3, 4)) == "Done."
+        llm.generate.assert_not_called()
+        store.update_session.assert_not_called()
+
+    async def test_submissions_coalesce_per_session(self, store):
+        """Messages queued before the worker runs share one LLM call."""
+        llm = _llm("Summary.")
+        summarizer = ConversationSummarizer(store, llm)
+        session = ChatSession()
+
+        summarizer.submit(session, _messages(session, 1, 2))
+        summarizer.submit(session, _messages(session, 3, 4))
+        assert summarizer.pending == 1
+
+        await summarizer.flush()
+        llm.generate.assert_awaited_once()
+        assert session.summary_last_message_id == 4
+        assert session.summary_message_count == 4
+
+    async def test_failure_is_swallowed(self, store):
+        """LLM errors are logged and the session is left unchanged."""
+        llm = MagicMock()
+        llm.generate = AsyncMock(side_effect=RuntimeError("down"))
+        summarizer = ConversationSummarizer(store, llm)
+        session = ChatSession()
+
+        summarizer.submit(session, _messages(session, 1))
+        await summarizer.flush()
+
+        assert session.conversation_summary is None
+        assert session.summary_last_message_id is None
+        assert summarizer.pending == 0
@@ -5,9 +5,10 @@ Tests:
 - index_document() single document indexing
 - index_pending() incremental batch indexing
 - rebuild_index() full rebuild
+- index_pending_items() / background item indexing
 - State tracking and locking
 - Error handling and recovery
-- Chunk creation and text splitting
+- Chunk creation
 """
 
 from unittest.mock import MagicMock
@@ -73,8 +74,12 @@ class MockVectorStore:
         self.vectors = {}
         self.id_mappings = {}
         self.saved = False
+        self.writes = 0
 
-    async def add_vectors(self, index_name: str, embeddings: list, ids: list[int]) -> bool:
+    async def add_vectors(
+        self, index_name: str, embeddings: list, ids: list[int], persist: bool = True
+    ) -> bool:
+        self.writes += persist
         if index_name not in self.vectors:
             self.vectors[index_name] = []
         for emb, id_ in zip(embeddings, ids):
@@ -88,6 +93,7 @@ class MockVectorStore:
 
     async def save_index(self, index_name: str) -> bool:
         self.saved = True
+        self.writes += 1
         return True
 
     async def get_index_stats(self, index_name: str) -> dict:
@@ -96,6 +102,31 @@ class MockVectorStore:
             "vector_count": len(self.vectors.get(index_name, [])),
         }
 
+    async def begin_rebuild(self, index_name: str, resume: bool = False) -> dict:
+        return {"index_name": index_name, "vectors": []}
+
+    async def stage_vectors(self, build: dict, embeddings: list, ids: list[int]) -> None:
+        build["vectors"].extend(zip(ids, embeddings))
+
+    async def commit_rebuild(self, build: dict) -> int:
+        self.generation = getattr(self, "generation", 0) + 1
+        self.vectors[build["index_name"]] = build["vectors"]
+        return self.generation
+
+
+class MockInvoiceStore:
+    """Mock of the IInvoiceStore item-indexing query."""
+
+    def __init__(self, items: list[dict] | None = None):
+        self.items = items or []
+
+    async def get_items_for_indexing(self, last_item_id: int = 0, limit: int = 1000) -> list[dict]:
+        return [i for i in self.items if i["id"] > last_item_id][:limit]
+
+
+def _item(item_id: int) -> dict:
+    return {"id": item_id, "item_name": f"Item {item_id}", "hs_code": None, "brand": None, "model": None}
+
 
 class MockEmbeddingProvider:
     """Mock implementation of IEmbeddingProvider."""
@@ -236,7 +267,7 @@ class TestIndexPending:
         result = await service.index_pending()
 
         assert result["chunks_indexed"] == 0
-        assert vec_store.saved  # Still saves index
+        assert not vec_store.saved  # Nothing new to write
 
     @pytest.mark.asyncio
     async def test_index_pending_tracks_state(self, indexer):
@@ -299,6 +330,119 @@ class TestIndexPending:
         assert updated_state.last_chunk_id == 7
 
 
+class TestIndexPendingPipeline:
+    """Tests for the reader/embedder/writer pipeline in index_pending()."""
+
+    def _make_service(self, doc_store, vec_store, state_store, **kwargs):
+        return DocumentIndexerService(
+            document_store=doc_store,
+            vector_store=vec_store,
+            embedding_provider=MockEmbeddingProvider(),
+            indexing_state_store=state_store,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_processes_all_batches_in_order(self):
+        """Should index every batch and checkpoint the highest chunk ID."""
+        doc_store = MockDocumentStore()
+        vec_store = MockVectorStore()
+        state_store = MockIndexingStateStore()
+        doc_store.chunks[1] = [
+            Chunk(id=i, doc_id=1, page_id=1, chunk_index=i, chunk_text=f"Chunk {i}", metadata={})
+            for i in range(1, 11)
+        ]
+        service = self._make_service(doc_store, vec_store, state_store, pipeline_depth=1)
+
+        result = await service.index_pending(batch_size=3)
+
+        assert result["chunks_indexed"] == 10
+        assert result["last_chunk_id"] == 10
+        assert [id_ for id_, _ in vec_store.vectors["chunks"]] == list(range(1, 11))
+        state = await state_store.get_state("chunks")
+        assert state.last_chunk_id == 10
+        assert state.total_indexed == 10
+        # One index write for the whole run, not one per batch
+        assert vec_store.writes == 1
+
+    @pytest.mark.asyncio
+    async def test_saves_every_persist_rows(self):
+        """The index is saved every persist_rows rows and once at the end."""
+        doc_store = MockDocumentStore()
+        vec_store = MockVectorStore()
+        state_store = MockIndexingStateStore()
+        doc_store.chunks[1] = [
+            Chunk(id=i, doc_id=1, page_id=1, chunk_index=i, chunk_text=f"Chunk {i}", metadata={})
+            for i in range(1, 11)
+        ]
+        saved_sizes = []
+
+        async def record_save(index_name: str) -> bool:
+            saved_sizes.append(len(vec_store.vectors[index_name]))
+            return True
+
+        vec_store.save_index = record_save
+        service = self._make_service(doc_store, vec_store, state_store, persist_rows=6)
+
+        await service.index_pending(batch_size=3)
+
+        assert saved_sizes == [6, 10]
+
+    @pytest.mark.asyncio
+    async def test_reuses_existing_embeddings(self):
+        """Chunks carrying an embedding should not be re-embedded."""
+        doc_store = MockDocumentStore()
+        vec_store = MockVectorStore()
+        state_store = MockIndexingStateStore()
+        embedder = MockEmbeddingProvider(dimension=4)
+        doc_store.chunks[1] = [
+            Chunk(id=1, doc_id=1, page_id=1, chunk_index=0, chunk_text="Has one",
+                  metadata={"embedding": [1.0, 0.0, 0.0, 0.0]}),
+            Chunk(id=2, doc_id=1, page_id=1, chunk_index=1, chunk_text="Needs one", metadata={}),
+        ]
+        service = DocumentIndexerService(
+            document_store=doc_store,
+            vector_store=vec_store,
+            embedding_provider=embedder,
+            indexing_state_store=state_store,
+        )
+
+        await service.index_pending()
+
+        assert embedder.calls == [["Needs one"]]
+        assert list(vec_store.vectors["chunks"][0][1]) == [1.0, 0.0, 0.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_waits_for_durable_vectors(self):
+        """A batch whose index save fails must not advance last_chunk_id."""
+        doc_store = MockDocumentStore()
+        vec_store = MockVectorStore()
+        state_store = MockIndexingStateStore()
+        doc_store.chunks[1] = [
+            Chunk(id=i, doc_id=1, page_id=1, chunk_index=i, chunk_text=f"Chunk {i}", metadata={})
+            for i in range(1, 5)
+        ]
+
+        saves = 0
+
+        async def flaky_save(index_name: str) -> bool:
+            nonlocal saves
+            saves += 1
+            if saves >= 2:
+                raise OSError("disk full")
+            return True
+
+        vec_store.save_index = flaky_save
+        service = self._make_service(doc_store, vec_store, state_store, persist_rows=2)
+
+        with pytest.raises(IndexingError, match="disk full"):
+            await service.index_pending(batch_size=2)
+
+        state = await state_store.get_state("chunks")
+        assert state.last_chunk_id == 2
+        assert state.is_building is False
+
+
 class TestRebuildIndex:
     """Tests for rebuild_index() full rebuild."""
 
@@ -329,6 +473,164 @@ class TestRebuildIndex:
         assert new_state.total_indexed == 0 or new_state is None
 
 
+    @pytest.mark.asyncio
+    async def test_rebuild_swaps_in_new_generation(self):
+        """Live vectors stay untouched until the rebuilt generation is committed."""
+        doc_store = MockDocumentStore()
+        vec_store = MockVectorStore()
+        state_store = MockIndexingStateStore()
+        vec_store.vectors["chunks"] = [(99, [0.0])]
+        doc_store.chunks[1] = [
+            Chunk(id=i, doc_id=1, page_id=1, chunk_index=i, chunk_text=f"Chunk {i}", metadata={})
+            for i in range(1, 4)
+        ]
+
+        live_during_build = []
+        original_stage = vec_store.stage_vectors
+
+        async def spy_stage(build, embeddings, ids):
+            live_during_build.append(list(vec_store.vectors["chunks"]))
+            await original_stage(build, embeddings, ids)
+
+        vec_store.stage_vectors = spy_stage
+        service = DocumentIndexerService(
+            document_store=doc_store,
+            vector_store=vec_store,
+            embedding_provider=MockEmbeddingProvider(),
+            indexing_state_store=state_store,
+        )
+
+        result = await service.rebuild_index(batch_size=2)
+
+        assert all(live == [(99, [0.0])] for live in live_during_build)
+        assert [id_ for id_, _ in vec_store.vectors["chunks"]] == [1, 2, 3]
+        assert result["generation"] == 1
+        state = await state_store.get_state("chunks")
+        assert state.last_chunk_id == 3
+        assert state.is_building is False
+
+    @pytest.mark.asyncio
+    async def test_rebuild_refuses_while_building(self):
+        """Should not start a rebuild while incremental indexing holds the lock."""
+        state_store = MockIndexingStateStore()
+        await state_store.update_state(IndexingState(index_name="chunks", is_building=True))
+        service = DocumentIndexerService(
+            document_store=MockDocumentStore(),
+            vector_store=MockVectorStore(),
+            embedding_provider=MockEmbeddingProvider(),
+            indexing_state_store=state_store,
+        )
+
+        with pytest.raises(IndexingError, match="already being built"):
+            await service.rebuild_index()
+
+
+class TestItemIndexing:
+    """Tests for incremental invoice item indexing."""
+
+    def _make_service(self, invoice_store, vec_store, state_store):
+        return DocumentIndexerService(
+            document_store=MockDocumentStore(),
+            vector_store=vec_store,
+            embedding_provider=MockEmbeddingProvider(),
+            indexing_state_store=state_store,
+            invoice_store=invoice_store,
+        )
+
+    @pytest.mark.asyncio
+    async def test_indexes_items_after_cursor(self):
+        """Only items past last_item_id are embedded; the cursor advances."""
+        vec_store = MockVectorStore()
+        state_store = MockIndexingStateStore()
+        await state_store.update_state(IndexingState(index_name="items", last_item_id=2, total_indexed=2))
+        service = self._make_service(MockInvoiceStore([_item(i) for i in range(1, 6)]), vec_store, state_store)
+
+        result = await service.index_pending_items(batch_size=2)
+
+        assert result["items_indexed"] == 3
+        assert [id_ for id_, _ in vec_store.vectors["items"]] == [3, 4, 5]
+        state = await state_store.get_state("items")
+        assert state.last_item_id == 5
+        assert state.total_indexed == 5
+        assert state.is_building is False
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_keeps_appended_items(self):
+        """Items appended before a failure are saved and checkpointed."""
+        vec_store = MockVectorStore()
+        state_store = MockIndexingStateStore()
+        service = self._make_service(MockInvoiceStore([_item(i) for i in range(1, 6)]), vec_store, state_store)
+        embed_batch = service._embedder.embed_batch
+        calls = 0
+
+        def flaky_embed(texts):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise RuntimeError("model crashed")
+            return embed_batch(texts)
+
+        service._embedder.embed_batch = flaky_embed
+
+        with pytest.raises(IndexingError, match="model crashed"):
+            await service.index_pending_items(batch_size=2)
+
+        state = await state_store.get_state("items")
+        assert state.last_item_id == 2
+        assert state.total_indexed == 2
+        assert vec_store.writes == 1
+
+    @pytest.mark.asyncio
+    async def test_requires_invoice_store(self):
+        """Item indexing is unavailable without an invoice store."""
+        service = self._make_service(None, MockVectorStore(), MockIndexingStateStore())
+
+        with pytest.raises(IndexingError, match="invoice store"):
+            await service.index_pending_items()
+
+        service.schedule_item_indexing()
+        await service.flush_item_indexing()
+
+    @pytest.mark.asyncio
+    async def test_scheduled_runs_coalesce(self):
+        """Saves arriving during a run are picked up by a single follow-up run."""
+        invoice_store = MockInvoiceStore([_item(1)])
+        vec_store = MockVectorStore()
+        service = self._make_service(invoice_store, vec_store, MockIndexingStateStore())
+
+        runs = 0
+        original = service.index_pending_items
+
+        async def counting_run(batch_size: int = 100):
+            nonlocal runs
+            runs += 1
+            if runs == 1:
+                invoice_store.items.append(_item(2))
+                service.schedule_item_indexing()
+                service.schedule_item_indexing()
+            return await original(batch_size)
+
+        service.index_pending_items = counting_run
+        service.schedule_item_indexing()
+        await service.flush_item_indexing()
+
+        assert runs == 2
+        assert [id_ for id_, _ in vec_store.vectors["items"]] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_scheduled_run_skips_while_rebuilding(self):
+        """A rebuild holding the items lock makes the background run back off."""
+        state_store = MockIndexingStateStore()
+        await state_store.update_state(IndexingState(index_name="items", is_building=True))
+        vec_store = MockVectorStore()
+        service = self._make_service(MockInvoiceStore([_item(1)]), vec_store, state_store)
+
+        service.schedule_item_indexing()
+        await service.flush_item_indexing()
+
+        assert "items" not in vec_store.vectors
+
+
 class TestChunkCreation:
     """Tests for text chunking logic."""
 
@@ -389,34 +691,6 @@ class TestChunkCreation:
         assert chunks[0].metadata["page_type"] == "invoice"
         assert chunks[0].metadata["filename"] == "invoice.pdf"
 
-    def test_split_text_small(self, indexer):
-        """Small text should stay in one chunk."""
-        text = "Short text."
-
-        chunks = indexer._split_text(text, chunk_size=100, overlap=10)
-
-        assert len(chunks) == 1
-        assert chunks[0] == "Short text."
-
-    def test_split_text_with_overlap(self, indexer):
-        """Should create overlapping chunks for long text."""
-        text = "First sentence here. Second sentence here. Third sentence here. Fourth sentence here."
-
-        chunks = indexer._split_text(text, chunk_size=50, overlap=10)
-
-        assert len(chunks) >= 2
-        # Check some overlap exists (last chars of previous in next)
-
-    def test_split_text_respects_sentences(self, indexer):
-        """Should try to split on sentence boundaries."""
-        text = "This is sentence one. This is sentence two. This is sentence three."
-
-        chunks = indexer._split_text(text, chunk_size=50, overlap=0)
-
-        # Chunks should roughly align with sentences
-        for chunk in chunks:
-            assert chunk.strip()  # No empty chunks
-
 
 class TestErrorHandling:
     """Tests for error handling and recovery."""
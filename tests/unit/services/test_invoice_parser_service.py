@@ -0,0 +1,93 @@
+"""
+Unit tests for InvoiceParserService persistence.
+
+Tests:
+- Saved invoices schedule background line-item indexing
+- Unsaved parses leave the indexer alone
+- The application factory wires the indexer regardless of startup order
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application import services
+from src.core.entities.invoice import Invoice
+from src.core.interfaces import ParserResult
+from src.core.services.invoice_parser import InvoiceParserService
+
+
+@pytest.fixture
+def registry() -> MagicMock:
+    registry = MagicMock()
+    registry.parse = AsyncMock(
+        return_value=ParserResult(success=True, invoice=Invoice(invoice_no="INV-1"), parser_name="text")
+    )
+    return registry
+
+
+@pytest.fixture
+def invoice_store() -> MagicMock:
+    store = MagicMock()
+    store.create_invoice = AsyncMock(side_effect=lambda invoice: invoice)
+    return store
+
+
+class TestItemIndexingOnSave:
+    """Tests for scheduling item indexing after create_invoice."""
+
+    @pytest.mark.asyncio
+    async def test_saved_invoice_schedules_item_indexing(self, registry, invoice_store):
+        indexer = MagicMock()
+        service = InvoiceParserService(
+            registry, invoice_store=invoice_store, item_indexer=AsyncMock(return_value=indexer)
+        )
+
+        await service.parse_invoice("Invoice INV-1", "inv.pdf")
+
+        invoice_store.create_invoice.assert_awaited_once()
+        indexer.schedule_item_indexing.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_unsaved_parse_does_not_schedule(self, registry, invoice_store):
+        provider = AsyncMock()
+        service = InvoiceParserService(registry, invoice_store=invoice_store, item_indexer=provider)
+
+        await service.parse_invoice("Invoice INV-1", "inv.pdf", save_result=False)
+
+        invoice_store.create_invoice.assert_not_awaited()
+        provider.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_indexer_failure_does_not_fail_the_save(self, registry, invoice_store):
+        provider = AsyncMock(side_effect=RuntimeError("embedding model missing"))
+        service = InvoiceParserService(registry, invoice_store=invoice_store, item_indexer=provider)
+
+        result = await service.parse_invoice("Invoice INV-1", "inv.pdf")
+
+        assert result.success
+        invoice_store.create_invoice.assert_awaited_once()
+
+
+class TestFactoryWiring:
+    """Tests for get_invoice_parser_service wiring the save hook."""
+
+    @pytest.mark.asyncio
+    async def test_indexer_created_after_parser_service(
+        self, registry, invoice_store, monkeypatch: pytest.MonkeyPatch
+    ):
+        service = services.get_invoice_parser_service(
+            parser_registry=registry, invoice_store=invoice_store
+        )
+        # The indexer singleton only comes into being after the parser service
+        indexer = MagicMock()
+        monkeypatch.setattr(services, "_document_indexer_service", indexer)
+
+        await service.parse_invoice("Invoice INV-1", "inv.pdf")
+
+        indexer.schedule_item_indexing.assert_called_once_with()
+
+    def test_default_service_has_an_invoice_store(self, registry):
+        service = services.get_invoice_parser_service(parser_registry=registry)
+
+        assert service._invoice_store is not None
@@ -0,0 +1,89 @@
+"""
+Unit tests for MemoryFactExtractor.
+
+Tests:
+- Bounded queue drops new sessions when full
+- One coalescing wait per drain cycle, not per session
+- Facts parsed, de-duplicated and saved in one batch
+- LLM failures don't escape the worker
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.interfaces.llm import LLMResponse
+from src.core.services.memory_extractor import MemoryFactExtractor
+
+
+@pytest.fixture
+def store() -> MagicMock:
+    store = MagicMock()
+    store.save_memory_facts = AsyncMock(side_effect=lambda facts: facts)
+    return store
+
+
+def _llm(text: str) -> MagicMock:
+    llm = MagicMock()
+    llm.generate = AsyncMock(return_value=LLMResponse(text=text, model="mock"))
+    return llm
+
+
+class TestMemoryFactExtractor:
+    """Tests for background fact extraction."""
+
+    async def test_extract_saves_one_batch(self, store):
+        """Parsed facts are de-duplicated and stored together."""
+        llm = _llm("- Seller is Gulf Traders\n- Seller is Gulf Traders\n- tiny\n- Invoice total 980 USD")
+        extractor = MemoryFactExtractor(store, llm)
+
+        facts = await extractor.extract("s1", [("hi", "hello")])
+
+        assert [f.value for f in facts] == ["Seller is Gulf Traders", "Invoice total 980 USD"]
+        store.save_memory_facts.assert_awaited_once()
+
+    async def test_none_response_saves_nothing(self, store):
+        """A NONE answer produces no facts."""
+        extractor = MemoryFactExtractor(store, _llm("NONE"))
+
+        assert await extractor.extract("s1", [("hi", "hello")]) == []
+        store.save_memory_facts.assert_not_called()
+
+    async def test_full_queue_drops_new_sessions(self, store):
+        """Sessions beyond max_pending are dropped; queued ones still coalesce."""
+        extractor = MemoryFactExtractor(store, _llm("NONE"), max_pending=1, coalesce_delay=0)
+
+        assert extractor.submit("s1", "a", "b") is True
+        assert extractor.submit("s2", "c", "d") is False
+        assert extractor.submit("s1", "e", "f") is True
+        assert extractor.pending == 1
+        assert extractor.dropped == 1
+
+        await extractor.flush()
+        assert extractor.pending == 0
+
+    async def test_failure_is_swallowed(self, store):
+        """LLM errors are logged and the worker keeps draining."""
+        llm = MagicMock()
+        llm.generate = AsyncMock(side_effect=[RuntimeError("down"), LLMResponse(text="NONE", model="m")])
+        extractor = MemoryFactExtractor(store, llm, coalesce_delay=0)
+
+        extractor.submit("s1", "a", "b")
+        extractor.submit("s2", "c", "d")
+        await extractor.flush()
+
+        assert llm.generate.await_count == 2
+        assert extractor.pending == 0
+
+    async def test_coalesce_delay_once_per_batch(self, store):
+        """All sessions queued during the wait are extracted after a single sleep."""
+        llm = _llm("NONE")
+        extractor = MemoryFactExtractor(store, llm, coalesce_delay=0.5)
+
+        with patch("src.core.services.memory_extractor.asyncio.sleep", new=AsyncMock()) as sleep:
+            for session_id in ("s1", "s2", "s3"):
+                extractor.submit(session_id, "a", "b")
+            await extractor.flush()
+
+        sleep.assert_awaited_once_with(0.5)
+        assert llm.generate.await_count == 3
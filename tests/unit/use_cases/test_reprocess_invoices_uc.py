@@ -0,0 +1,268 @@
+"""Tests for ReprocessInvoicesUseCase."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pydantic import ValidationError
+
+from src.application.dto.requests import ReprocessInvoicesRequest
+from src.application.use_cases import reprocess_invoices
+from src.application.use_cases.reprocess_invoices import (
+    ReprocessInvoicesUseCase,
+    get_reprocess_job,
+)
+from src.core.entities.document import Document, Page
+from src.core.entities.invoice import AuditResult, Invoice, LineItem
+from src.core.exceptions import InvoiceNotLatestError, ParserError
+from src.core.interfaces import ParserResult
+
+
+def _invoice(invoice_id=None, total=100.0, items=None):
+    return Invoice(
+        id=invoice_id,
+        doc_id=7,
+        invoice_no="INV-1",
+        invoice_date="2024-03-01",
+        total_amount=total,
+        items=items
+        if items is not None
+        else [LineItem(item_name="Valve", quantity=2, unit_price=50, total_price=100)],
+    )
+
+
+def _parsed(invoice):
+    invoice.parser_name = "table_aware"
+    return ParserResult(success=True, invoice=invoice, parser_name="table_aware")
+
+
+@pytest.fixture
+def mock_invoice_store():
+    store = AsyncMock()
+    store.get_invoice.side_effect = lambda invoice_id: _invoice(invoice_id)
+    store.replace_invoice.side_effect = lambda invoice_id, inv: inv.model_copy(
+        update={"id": invoice_id + 100}
+    )
+    return store
+
+
+@pytest.fixture
+def mock_document_store():
+    store = AsyncMock()
+    store.get_document.return_value = Document(
+        id=7, filename="a.pdf", original_filename="a.pdf", file_path="/tmp/a.pdf"
+    )
+    store.get_pages.return_value = [Page(doc_id=7, page_no=1, text="invoice text")]
+    return store
+
+
+@pytest.fixture
+def mock_parser():
+    parser = Mock()
+    parser.parse_document = AsyncMock(side_effect=lambda *a, **k: _parsed(_invoice(total=120.0)))
+    return parser
+
+
+@pytest.fixture
+def mock_indexer():
+    return Mock()
+
+
+@pytest.fixture
+def use_case(mock_parser, mock_invoice_store, mock_document_store, mock_indexer):
+    return ReprocessInvoicesUseCase(
+        parser_service=mock_parser,
+        auditor_service=AsyncMock(),
+        invoice_store=mock_invoice_store,
+        document_store=mock_document_store,
+        indexer_service=mock_indexer,
+    )
+
+
+async def _run(use_case, **kwargs):
+    request = ReprocessInvoicesRequest(**kwargs)
+    job = await use_case.start(request)
+    return await use_case.run(job, request)
+
+
+class TestReprocessInvoicesRequest:
+    def test_selection_required(self):
+        """Test that a request without ids or filters is rejected."""
+        with pytest.raises(ValidationError):
+            ReprocessInvoicesRequest(dry_run=True)
+
+
+class TestReprocessInvoicesUseCase:
+    async def test_changed_invoice_replaced(
+        self, use_case, mock_parser, mock_invoice_store, mock_indexer
+    ):
+        """Test a changed result is stored as a new version."""
+        job = await _run(use_case, invoice_ids=[1])
+
+        result = job.results[0]
+        assert job.status == "completed"
+        assert result.status == "changed"
+        assert result.new_invoice_id == 101
+        assert result.changes == {"total_amount": {"old": 100.0, "new": 120.0}}
+        assert result.parser_name == "table_aware"
+        mock_invoice_store.replace_invoice.assert_called_once()
+        mock_indexer.schedule_item_indexing.assert_called_once()
+        # Re-parsed from stored pages only, bypassing the parser cache
+        args, kwargs = mock_parser.parse_document.call_args
+        assert args[2] == {"no_cache": True, "pdf_path": None}
+        assert kwargs["save_result"] is False
+
+    async def test_read_source_file_opt_in(self, use_case, mock_parser):
+        """Test the source PDF is only passed on when requested."""
+        await _run(use_case, invoice_ids=[1], read_source_file=True)
+
+        assert mock_parser.parse_document.call_args[0][2] == {"no_cache": True}
+
+    async def test_superseded_invoice_skipped(self, use_case, mock_parser, mock_invoice_store):
+        """Test an old invoice version is skipped without parsing."""
+        mock_invoice_store.get_invoice.side_effect = lambda invoice_id: _invoice(
+            invoice_id
+        ).model_copy(update={"is_latest": False})
+
+        job = await _run(use_case, invoice_ids=[1])
+
+        response = use_case.to_response(job)
+        assert (response.skipped, response.changed) == (1, 0)
+        assert response.results[0].status == "skipped"
+        mock_parser.parse_document.assert_not_called()
+        mock_invoice_store.replace_invoice.assert_not_called()
+
+    async def test_replaced_during_job_skipped(self, use_case, mock_invoice_store, mock_indexer):
+        """Test an invoice replaced by an overlapping job is reported as skipped."""
+        mock_invoice_store.replace_invoice.side_effect = InvoiceNotLatestError(1)
+
+        job = await _run(use_case, invoice_ids=[1], re_audit=True)
+
+        result = job.results[0]
+        assert result.status == "skipped"
+        assert result.new_invoice_id is None
+        use_case._auditor.audit_invoice.assert_not_called()
+        mock_indexer.schedule_item_indexing.assert_not_called()
+
+    async def test_dry_run_reports_without_writing(
+        self, use_case, mock_invoice_store, mock_indexer
+    ):
+        """Test dry run reports differences but stores nothing."""
+        job = await _run(use_case, invoice_ids=[1], dry_run=True)
+
+        response = use_case.to_response(job)
+        assert response.dry_run is True
+        assert response.changed == 1
+        assert response.results[0].new_invoice_id is None
+        mock_invoice_store.replace_invoice.assert_not_called()
+        mock_indexer.schedule_item_indexing.assert_not_called()
+
+    async def test_item_differences_counted(self, use_case, mock_parser):
+        """Test added and removed line items are counted."""
+        mock_parser.parse_document.side_effect = lambda *a, **k: _parsed(
+            _invoice(
+                items=[
+                    LineItem(item_name="Valve", quantity=2, unit_price=50, total_price=100),
+                    LineItem(item_name="Pipe", quantity=1, unit_price=20, total_price=20),
+                ]
+            )
+        )
+
+        job = await _run(use_case, invoice_ids=[1], dry_run=True)
+
+        result = job.results[0]
+        assert result.status == "changed"
+        assert result.changes == {}
+        assert (result.items_added, result.items_removed) == (1, 0)
+
+    async def test_unchanged_invoice_skipped(self, use_case, mock_parser, mock_invoice_store):
+        """Test an identical result is not stored again."""
+        mock_parser.parse_document.side_effect = lambda *a, **k: _parsed(_invoice())
+
+        job = await _run(use_case, invoice_ids=[1])
+
+        assert job.results[0].status == "unchanged"
+        mock_invoice_store.replace_invoice.assert_not_called()
+
+    async def test_failures_recorded(self, use_case, mock_parser, mock_invoice_store):
+        """Test failed invoices are reported and the rest still run."""
+        mock_invoice_store.get_invoice.side_effect = lambda invoice_id: (
+            None if invoice_id == 2 else _invoice(invoice_id)
+        )
+
+        async def parse(document, pages, hints, save_result):
+            if mock_parser.parse_document.call_count == 1:
+                raise ParserError("All parsers failed")
+            return _parsed(_invoice(total=120.0))
+
+        mock_parser.parse_document.side_effect = parse
+
+        job = await _run(use_case, invoice_ids=[1, 2, 3], workers=1)
+
+        response = use_case.to_response(job)
+        assert (response.processed, response.failed, response.changed) == (3, 2, 1)
+        errors = {r.invoice_id: r.error for r in response.results}
+        assert errors[1] == "All parsers failed"
+        assert errors[2] == "Invoice not found"
+
+    async def test_re_audit_saves_result(self, use_case, mock_invoice_store):
+        """Test re-audit runs on the new version and is saved."""
+        use_case._auditor.audit_invoice.return_value = AuditResult(invoice_id=101, passed=False)
+
+        job = await _run(use_case, invoice_ids=[1], re_audit=True)
+
+        audited = use_case._auditor.audit_invoice.call_args[0][0]
+        assert audited.id == 101
+        assert job.results[0].audit_passed is False
+        mock_invoice_store.create_audit_result.assert_called_once()
+
+    async def test_filters_select_invoices(self, use_case, mock_invoice_store):
+        """Test filters are passed to the store when no ids are given."""
+        mock_invoice_store.find_invoice_ids.return_value = [4, 5]
+
+        job = await _run(use_case, parser_name="vision", limit=10, dry_run=True)
+
+        mock_invoice_store.find_invoice_ids.assert_called_once_with(
+            company_key=None,
+            seller_name=None,
+            date_from=None,
+            date_to=None,
+            parser_name="vision",
+            limit=10,
+        )
+        assert job.invoice_ids == [4, 5]
+        assert get_reprocess_job(job.job_id) is job
+
+    async def test_running_jobs_not_evicted(self, use_case, monkeypatch):
+        """Test only finished jobs are dropped when the job list is full."""
+        monkeypatch.setattr(reprocess_invoices, "MAX_JOBS", 2)
+        monkeypatch.setattr(reprocess_invoices, "_jobs", reprocess_invoices.OrderedDict())
+        request = ReprocessInvoicesRequest(invoice_ids=[1])
+
+        running = await use_case.start(request)
+        finished = await use_case.start(request)
+        await use_case.run(finished, request)
+        newest = await use_case.start(request)
+
+        assert get_reprocess_job(running.job_id) is running
+        assert get_reprocess_job(finished.job_id) is None
+        assert get_reprocess_job(newest.job_id) is newest
+
+    async def test_workers_bounded(self, use_case, mock_parser):
+        """Test no more than `workers` invoices are parsed at once."""
+        running = peak = 0
+
+        async def parse(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _parsed(_invoice())
+
+        mock_parser.parse_document.side_effect = parse
+
+        job = await _run(use_case, invoice_ids=list(range(1, 9)), workers=3)
+
+        assert len(job.results) == 8
+        assert peak == 3
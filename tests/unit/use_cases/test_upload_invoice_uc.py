@@ -158,6 +158,7 @@ class TestUploadInvoiceUseCase:
 
         # Verify service calls
         mock_indexer_service.index_document.assert_called_once()
+        mock_indexer_service.schedule_item_indexing.assert_called_once()
         mock_invoice_store.save_invoice.assert_called_once()
         mock_auditor_service.audit_invoice.assert_called_once()
         mock_invoice_store.save_audit_result.assert_called_once()